@@ -0,0 +1,11 @@
+from griptape.drivers import LocalCacheDriver, OpenAiEmbeddingDriver, SqliteCacheDriver, TieredCacheDriver
+
+cache_driver = TieredCacheDriver(
+    cache_drivers=[LocalCacheDriver(), SqliteCacheDriver(path="griptape_cache.db")],
+)
+embedding_driver = OpenAiEmbeddingDriver(cache_driver=cache_driver)
+
+embedding_driver.embed_strings(["Hello Griptape!", "Hello World!"])
+embedding_driver.embed_string("Hello Griptape!")
+
+print(f"Hits: {cache_driver.hits}, Misses: {cache_driver.misses}")
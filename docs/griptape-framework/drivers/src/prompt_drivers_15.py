@@ -0,0 +1,18 @@
+from griptape.drivers import LocalCacheDriver, OpenAiChatPromptDriver, SqliteCacheDriver, TieredCacheDriver
+from griptape.events import EventBus, EventListener, PromptCacheHitEvent, PromptCacheMissEvent
+from griptape.structures import Agent
+
+cache_driver = TieredCacheDriver(
+    cache_drivers=[LocalCacheDriver(), SqliteCacheDriver(path="griptape_cache.db")],
+)
+EventBus.add_event_listener(
+    EventListener(
+        lambda event: print(type(event).__name__, event.cache_key),
+        event_types=[PromptCacheHitEvent, PromptCacheMissEvent],
+    )
+)
+
+agent = Agent(prompt_driver=OpenAiChatPromptDriver(model="gpt-4o", temperature=0, cache_driver=cache_driver))
+
+agent.run("What is the capital of France?")
+agent.run("What is the capital of France?")
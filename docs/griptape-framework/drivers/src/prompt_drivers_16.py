@@ -0,0 +1,17 @@
+from griptape.drivers import LocalVectorStoreDriver, OpenAiChatPromptDriver, OpenAiEmbeddingDriver
+from griptape.engines import SemanticCacheEngine
+from griptape.structures import Agent
+
+semantic_cache_engine = SemanticCacheEngine(
+    vector_store_driver=LocalVectorStoreDriver(embedding_driver=OpenAiEmbeddingDriver()),
+    similarity_threshold=0.9,
+    ttl=60 * 60,
+)
+
+agent = Agent(prompt_driver=OpenAiChatPromptDriver(model="gpt-4o", semantic_cache_engine=semantic_cache_engine))
+
+agent.run("What is the capital of France?")
+agent.run("Which city is the capital of France?")
+
+# Stop reusing responses, e.g. after the underlying data changed.
+semantic_cache_engine.invalidate()
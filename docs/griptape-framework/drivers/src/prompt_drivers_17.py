@@ -0,0 +1,18 @@
+from griptape.drivers import OpenAiChatPromptDriver, OpenAiEmbeddingDriver
+from griptape.structures import Agent
+from griptape.utils import RateLimiterRegistry
+
+rate_limiter = RateLimiterRegistry.get_rate_limiter(
+    "openai", "gpt-4o", requests_per_minute=500, tokens_per_minute=30_000
+)
+embedding_rate_limiter = RateLimiterRegistry.get_rate_limiter(
+    "openai", "text-embedding-3-small", requests_per_minute=3_000, tokens_per_minute=1_000_000
+)
+
+prompt_driver = OpenAiChatPromptDriver(model="gpt-4o", max_tokens=256, rate_limiter=rate_limiter)
+embedding_driver = OpenAiEmbeddingDriver(model="text-embedding-3-small", rate_limiter=embedding_rate_limiter)
+
+agent = Agent(prompt_driver=prompt_driver)
+agent.run("What is the capital of France?")
+
+print(f"Waited {rate_limiter.total_wait_time:.2f}s over {rate_limiter.request_count} requests")
@@ -0,0 +1,16 @@
+from griptape.drivers import AnthropicPromptDriver, HedgedPromptDriver, OpenAiChatPromptDriver
+from griptape.structures import Agent
+
+prompt_driver = HedgedPromptDriver(
+    prompt_drivers=[
+        OpenAiChatPromptDriver(model="gpt-4o"),
+        AnthropicPromptDriver(model="claude-3-5-sonnet-20240620"),
+    ],
+    hedge_percentile=95,
+    timeout=30,
+)
+
+agent = Agent(prompt_driver=prompt_driver)
+agent.run("What is the capital of France?")
+
+print(f"p95 latency of the first driver: {prompt_driver.latency_histograms[0].percentile(95)}")
@@ -0,0 +1,7 @@
+import os
+
+from griptape.tokenizers import GoogleTokenizer
+
+tokenizer = GoogleTokenizer(model="gemini-pro", api_key=os.environ["GOOGLE_API_KEY"], offline=True)
+
+print(tokenizer.count_tokens("Hello world!"))
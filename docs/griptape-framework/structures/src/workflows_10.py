@@ -0,0 +1,12 @@
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask
+
+topics = ["volcanoes", "glaciers", "deserts", "rainforests", "coral reefs"]
+
+summary_task = PromptTask("Combine these facts into a short paragraph:\n{{ parents_output_text }}")
+fact_tasks = [PromptTask(f"Write one fact about {topic}", child_ids=[summary_task.id]) for topic in topics]
+
+# At most two fact Tasks run at the same time.
+workflow = Workflow(tasks=[*fact_tasks, summary_task], max_concurrency=2)
+
+workflow.run()
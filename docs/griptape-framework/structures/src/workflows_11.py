@@ -0,0 +1,13 @@
+from concurrent import futures
+
+from griptape.structures import Workflow
+from griptape.utils import FuturesExecutorRegistry
+
+# Allow up to 128 Tasks across all Workflows to call LLMs at the same time.
+FuturesExecutorRegistry.set_max_workers("llm", 128)
+
+# This Workflow gets its own pool, which is shut down when the Workflow is garbage collected.
+workflow = Workflow(futures_executor_fn=lambda: futures.ThreadPoolExecutor(max_workers=4))
+
+# Shut down all shared pools, e.g. before the application exits.
+FuturesExecutorRegistry.shutdown()
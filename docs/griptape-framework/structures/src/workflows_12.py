@@ -0,0 +1,18 @@
+import asyncio
+
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask
+
+
+async def main() -> None:
+    workflows = [
+        Workflow(tasks=[PromptTask(f"Write a haiku about {topic}")]) for topic in ["skateboards", "programming", "tea"]
+    ]
+
+    await asyncio.gather(*(workflow.run_async() for workflow in workflows))
+
+    for workflow in workflows:
+        print(workflow.output)
+
+
+asyncio.run(main())
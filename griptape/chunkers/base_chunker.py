@@ -36,63 +36,107 @@ class BaseChunker(ABC):
     def chunk(self, text: TextArtifact | ListArtifact | str) -> list[TextArtifact]:
         text = text.to_text() if isinstance(text, (TextArtifact, ListArtifact)) else text
 
-        return [TextArtifact(c) for c in self._chunk_recursively(text)]
+        return [TextArtifact(c) for c in self._chunk(text)]
+
+    def _chunk(self, text: str) -> list[str]:
+        """Splits text into chunks of at most `max_tokens` tokens.
+
+        Chunks that are too large are split in two on the first separator that divides them, at the point that best
+        balances the token counts of both halves. The halves are then split further using that separator and the ones
+        after it. If no separator divides a chunk, it is split at its character midpoint.
+
+        Chunks are split one level at a time and token counts are shared across levels, so every distinct string
+        is tokenized at most once.
+
+        Args:
+            text: Text to chunk.
+
+        Returns:
+            Chunks in document order.
+        """
+        token_counts: dict[str, int] = {}
+        # Each node is a chunk and the separator to continue splitting it with, or None to use all separators.
+        nodes: list[tuple[str, Optional[ChunkSeparator]]] = [(text, None)]
+        leaves: list[bool] = [False]
+
+        while not all(leaves):
+            pending = [i for i, leaf in enumerate(leaves) if not leaf]
+            self.__count_tokens([nodes[i][0] for i in pending], token_counts)
+
+            splits: dict[int, tuple[ChunkSeparator, list[str], list[str]]] = {}
+            for i in pending:
+                chunk, current_separator = nodes[i]
+
+                if token_counts[chunk] <= self.max_tokens or len(chunk) <= 1:
+                    leaves[i] = True
+                    continue
+
+                # If a separator is provided, only use separators after it.
+                separators = (
+                    self.separators[self.separators.index(current_separator) :]
+                    if current_separator
+                    else self.separators
+                )
+
+                for separator in separators:
+                    subchunks = list(filter(None, chunk.split(separator.value)))
+
+                    if len(subchunks) > 1:
+                        pieces = [
+                            separator.value + subchunk if separator.is_prefix else subchunk + separator.value
+                            for subchunk in subchunks
+                        ]
+                        splits[i] = (separator, subchunks, pieces)
+                        break
+
+            self.__count_tokens([piece for _, _, pieces in splits.values() for piece in pieces], token_counts)
+
+            next_nodes: list[tuple[str, Optional[ChunkSeparator]]] = []
+            next_leaves: list[bool] = []
+            for i, (node, leaf) in enumerate(zip(nodes, leaves)):
+                if leaf:
+                    next_nodes.append(node)
+                    next_leaves.append(True)
+                elif i in splits:
+                    separator, subchunks, pieces = splits[i]
+                    balance_index = self.__get_balance_index(
+                        [token_counts[piece] for piece in pieces], token_counts[node[0]] // 2
+                    )
+                    first_subchunk, second_subchunk = self.__get_subchunks(separator, subchunks, balance_index)
 
-    def _chunk_recursively(self, chunk: str, current_separator: Optional[ChunkSeparator] = None) -> list[str]:
-        token_count = self.tokenizer.count_tokens(chunk)
+                    next_nodes.extend([(first_subchunk.strip(), separator), (second_subchunk.strip(), separator)])
+                    next_leaves.extend([False, False])
+                else:
+                    # If none of the separators result in a balanced split, split the chunk in half.
+                    chunk = node[0]
+                    midpoint = len(chunk) // 2
 
-        if token_count <= self.max_tokens:
-            return [chunk]
-        else:
-            balance_index = -1
-            balance_diff = float("inf")
-            tokens_count = 0
-            half_token_count = token_count // 2
-
-            # If a separator is provided, only use separators after it.
-            separators = (
-                self.separators[self.separators.index(current_separator) :] if current_separator else self.separators
-            )
-
-            # Loop through available separators to find the best split.
-            for separator in separators:
-                # Split the chunk into subchunks using the current separator.
-                subchunks = list(filter(None, chunk.split(separator.value)))
-
-                # Check if the split resulted in more than one subchunk.
-                if len(subchunks) > 1:
-                    # Iterate through the subchunks and calculate token counts.
-                    for index, subchunk in enumerate(subchunks):
-                        if index < len(subchunks):
-                            subchunk = separator.value + subchunk if separator.is_prefix else subchunk + separator.value
-
-                        tokens_count += self.tokenizer.count_tokens(subchunk)
-
-                        # Update the best split if the current one is more balanced.
-                        if abs(tokens_count - half_token_count) < balance_diff:
-                            balance_index = index
-                            balance_diff = abs(tokens_count - half_token_count)
-
-                    # Create the two subchunks based on the best separator.
-                    first_subchunk, second_subchunk = self.__get_subchunks(separator, subchunks, balance_index)
+                    next_nodes.extend([(chunk[:midpoint], None), (chunk[midpoint:], None)])
+                    next_leaves.extend([False, False])
+
+            nodes, leaves = next_nodes, next_leaves
+
+        return [chunk for chunk, _ in nodes]
+
+    def __count_tokens(self, texts: list[str], token_counts: dict[str, int]) -> None:
+        missing_texts = list(dict.fromkeys(text for text in texts if text not in token_counts))
+
+        token_counts.update(zip(missing_texts, self.tokenizer.count_tokens_batch(missing_texts)))
+
+    def __get_balance_index(self, piece_token_counts: list[int], half_token_count: int) -> int:
+        # Find the split point where the running token count is closest to half of the chunk's tokens.
+        balance_index = -1
+        balance_diff = float("inf")
+        tokens_count = 0
+
+        for index, piece_token_count in enumerate(piece_token_counts):
+            tokens_count += piece_token_count
+
+            if abs(tokens_count - half_token_count) < balance_diff:
+                balance_index = index
+                balance_diff = abs(tokens_count - half_token_count)
 
-                    # Continue recursively chunking the subchunks.
-                    first_subchunk_rec = self._chunk_recursively(first_subchunk.strip(), separator)
-                    second_subchunk_rec = self._chunk_recursively(second_subchunk.strip(), separator)
-
-                    # Return the concatenated results of the subchunks if both are non-empty.
-                    if first_subchunk_rec and second_subchunk_rec:
-                        return first_subchunk_rec + second_subchunk_rec
-                    # If only one subchunk is non-empty, return it.
-                    elif first_subchunk_rec:
-                        return first_subchunk_rec
-                    elif second_subchunk_rec:
-                        return second_subchunk_rec
-                    else:
-                        return []
-            # If none of the separators result in a balanced split, split the chunk in half.
-            midpoint = len(chunk) // 2
-            return self._chunk_recursively(chunk[:midpoint]) + self._chunk_recursively(chunk[midpoint:])
+        return balance_index
 
     def __get_subchunks(self, separator: ChunkSeparator, subchunks: list[str], balance_index: int) -> tuple[str, str]:
         # Create the two subchunks based on the best separator.
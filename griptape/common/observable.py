@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import copy
 import functools
-from inspect import isfunction
+from inspect import iscoroutinefunction, isfunction
 from typing import Any, Callable, Optional, TypeVar, cast
 
 from attrs import Factory, define, field
@@ -50,24 +51,34 @@ class Observable:
             self.decorator_kwargs = kwargs
 
     def __get__(self, obj: Any, objtype: Any = None) -> Observable:
-        self._instance = obj
-        return self
+        if obj is None:
+            return self
+
+        # Binds a copy rather than this shared decorator, so that a lookup on another instance or thread can't swap the
+        # instance before the bound method is called.
+        bound = copy.copy(self)
+        bound._instance = obj
+        return bound
 
     def __call__(self, *args, **kwargs) -> Any:
         if self._func:
             # Parameterless call (self._func was a set in __init__)
             from griptape.observability.observability import Observability
 
-            return Observability.observe(
-                Observable.Call(
-                    func=self._func,
-                    instance=self._instance,
-                    args=args,
-                    kwargs=kwargs,
-                    decorator_args=self.decorator_args,
-                    decorator_kwargs=self.decorator_kwargs,
-                )
+            call = Observable.Call(
+                func=self._func,
+                instance=self._instance,
+                args=args,
+                kwargs=kwargs,
+                decorator_args=self.decorator_args,
+                decorator_kwargs=self.decorator_kwargs,
             )
+
+            # Coroutine functions are observed while they are awaited rather than while the coroutine is created.
+            if iscoroutinefunction(self._func):
+                return Observability.observe_async(call)
+
+            return Observability.observe(call)
         else:
             # Parameterized call, create and return the "real" observable decorator
             func = args[0]
@@ -15,8 +15,17 @@ if TYPE_CHECKING:
 class BaseMessage(ABC, SerializableMixin):
     @define
     class Usage(SerializableMixin):
+        """Token usage of a message.
+
+        Attributes:
+            input_tokens: Number of input tokens.
+            output_tokens: Number of output tokens.
+            cache_hit: Whether the message was reused from a Prompt Driver's cache, in which case no tokens were used.
+        """
+
         input_tokens: Optional[float] = field(kw_only=True, default=None, metadata={"serializable": True})
         output_tokens: Optional[float] = field(kw_only=True, default=None, metadata={"serializable": True})
+        cache_hit: bool = field(kw_only=True, default=False)
 
         @property
         def total_tokens(self) -> float:
@@ -1,144 +1,278 @@
-from .prompt.base_prompt_driver import BasePromptDriver
-from .prompt.openai_chat_prompt_driver import OpenAiChatPromptDriver
-from .prompt.azure_openai_chat_prompt_driver import AzureOpenAiChatPromptDriver
-from .prompt.cohere_prompt_driver import CoherePromptDriver
-from .prompt.huggingface_pipeline_prompt_driver import HuggingFacePipelinePromptDriver
-from .prompt.huggingface_hub_prompt_driver import HuggingFaceHubPromptDriver
-from .prompt.anthropic_prompt_driver import AnthropicPromptDriver
-from .prompt.amazon_sagemaker_jumpstart_prompt_driver import AmazonSageMakerJumpstartPromptDriver
-from .prompt.amazon_bedrock_prompt_driver import AmazonBedrockPromptDriver
-from .prompt.google_prompt_driver import GooglePromptDriver
-from .prompt.dummy_prompt_driver import DummyPromptDriver
-from .prompt.ollama_prompt_driver import OllamaPromptDriver
-
-from .memory.conversation.base_conversation_memory_driver import BaseConversationMemoryDriver
-from .memory.conversation.local_conversation_memory_driver import LocalConversationMemoryDriver
-from .memory.conversation.amazon_dynamodb_conversation_memory_driver import AmazonDynamoDbConversationMemoryDriver
-from .memory.conversation.redis_conversation_memory_driver import RedisConversationMemoryDriver
-from .memory.conversation.griptape_cloud_conversation_memory_driver import GriptapeCloudConversationMemoryDriver
-
-from .embedding.base_embedding_driver import BaseEmbeddingDriver
-from .embedding.openai_embedding_driver import OpenAiEmbeddingDriver
-from .embedding.azure_openai_embedding_driver import AzureOpenAiEmbeddingDriver
-from .embedding.amazon_sagemaker_jumpstart_embedding_driver import AmazonSageMakerJumpstartEmbeddingDriver
-from .embedding.amazon_bedrock_titan_embedding_driver import AmazonBedrockTitanEmbeddingDriver
-from .embedding.amazon_bedrock_cohere_embedding_driver import AmazonBedrockCohereEmbeddingDriver
-from .embedding.voyageai_embedding_driver import VoyageAiEmbeddingDriver
-from .embedding.huggingface_hub_embedding_driver import HuggingFaceHubEmbeddingDriver
-from .embedding.google_embedding_driver import GoogleEmbeddingDriver
-from .embedding.dummy_embedding_driver import DummyEmbeddingDriver
-from .embedding.cohere_embedding_driver import CohereEmbeddingDriver
-from .embedding.ollama_embedding_driver import OllamaEmbeddingDriver
-
-from .vector.base_vector_store_driver import BaseVectorStoreDriver
-from .vector.local_vector_store_driver import LocalVectorStoreDriver
-from .vector.pinecone_vector_store_driver import PineconeVectorStoreDriver
-from .vector.marqo_vector_store_driver import MarqoVectorStoreDriver
-from .vector.mongodb_atlas_vector_store_driver import MongoDbAtlasVectorStoreDriver
-from .vector.redis_vector_store_driver import RedisVectorStoreDriver
-from .vector.opensearch_vector_store_driver import OpenSearchVectorStoreDriver
-from .vector.amazon_opensearch_vector_store_driver import AmazonOpenSearchVectorStoreDriver
-from .vector.pgvector_vector_store_driver import PgVectorVectorStoreDriver
-from .vector.azure_mongodb_vector_store_driver import AzureMongoDbVectorStoreDriver
-from .vector.dummy_vector_store_driver import DummyVectorStoreDriver
-from .vector.qdrant_vector_store_driver import QdrantVectorStoreDriver
-from .vector.astradb_vector_store_driver import AstraDbVectorStoreDriver
-from .vector.griptape_cloud_vector_store_driver import GriptapeCloudVectorStoreDriver
-
-from .sql.base_sql_driver import BaseSqlDriver
-from .sql.amazon_redshift_sql_driver import AmazonRedshiftSqlDriver
-from .sql.snowflake_sql_driver import SnowflakeSqlDriver
-from .sql.sql_driver import SqlDriver
-
-from .image_generation_model.base_image_generation_model_driver import BaseImageGenerationModelDriver
-from .image_generation_model.bedrock_stable_diffusion_image_generation_model_driver import (
-    BedrockStableDiffusionImageGenerationModelDriver,
-)
-from .image_generation_model.bedrock_titan_image_generation_model_driver import BedrockTitanImageGenerationModelDriver
-
-from .image_generation_pipeline.base_image_generation_pipeline_driver import (
-    BaseDiffusionImageGenerationPipelineDriver,
-)
-from .image_generation_pipeline.stable_diffusion_3_image_generation_pipeline_driver import (
-    StableDiffusion3ImageGenerationPipelineDriver,
-)
-from .image_generation_pipeline.stable_diffusion_3_img_2_img_image_generation_pipeline_driver import (
-    StableDiffusion3Img2ImgImageGenerationPipelineDriver,
-)
-from .image_generation_pipeline.stable_diffusion_3_controlnet_image_generation_pipeline_driver import (
-    StableDiffusion3ControlNetImageGenerationPipelineDriver,
-)
-
-from .image_generation.base_image_generation_driver import BaseImageGenerationDriver
-from .image_generation.base_multi_model_image_generation_driver import BaseMultiModelImageGenerationDriver
-from .image_generation.openai_image_generation_driver import OpenAiImageGenerationDriver
-from .image_generation.leonardo_image_generation_driver import LeonardoImageGenerationDriver
-from .image_generation.amazon_bedrock_image_generation_driver import AmazonBedrockImageGenerationDriver
-from .image_generation.azure_openai_image_generation_driver import AzureOpenAiImageGenerationDriver
-from .image_generation.dummy_image_generation_driver import DummyImageGenerationDriver
-from .image_generation.huggingface_pipeline_image_generation_driver import (
-    HuggingFacePipelineImageGenerationDriver,
-)
-
-from .image_query_model.base_image_query_model_driver import BaseImageQueryModelDriver
-from .image_query_model.bedrock_claude_image_query_model_driver import BedrockClaudeImageQueryModelDriver
-
-from .image_query.base_image_query_driver import BaseImageQueryDriver
-from .image_query.base_multi_model_image_query_driver import BaseMultiModelImageQueryDriver
-from .image_query.dummy_image_query_driver import DummyImageQueryDriver
-from .image_query.openai_image_query_driver import OpenAiImageQueryDriver
-from .image_query.anthropic_image_query_driver import AnthropicImageQueryDriver
-from .image_query.azure_openai_image_query_driver import AzureOpenAiImageQueryDriver
-from .image_query.amazon_bedrock_image_query_driver import AmazonBedrockImageQueryDriver
-
-from .web_scraper.base_web_scraper_driver import BaseWebScraperDriver
-from .web_scraper.trafilatura_web_scraper_driver import TrafilaturaWebScraperDriver
-from .web_scraper.markdownify_web_scraper_driver import MarkdownifyWebScraperDriver
-from .web_scraper.proxy_web_scraper_driver import ProxyWebScraperDriver
-
-from .web_search.base_web_search_driver import BaseWebSearchDriver
-from .web_search.google_web_search_driver import GoogleWebSearchDriver
-from .web_search.duck_duck_go_web_search_driver import DuckDuckGoWebSearchDriver
-from .web_search.exa_web_search_driver import ExaWebSearchDriver
-from .web_search.tavily_web_search_driver import TavilyWebSearchDriver
-
-from .event_listener.base_event_listener_driver import BaseEventListenerDriver
-from .event_listener.amazon_sqs_event_listener_driver import AmazonSqsEventListenerDriver
-from .event_listener.webhook_event_listener_driver import WebhookEventListenerDriver
-from .event_listener.aws_iot_core_event_listener_driver import AwsIotCoreEventListenerDriver
-from .event_listener.griptape_cloud_event_listener_driver import GriptapeCloudEventListenerDriver
-from .event_listener.pusher_event_listener_driver import PusherEventListenerDriver
-
-from .file_manager.base_file_manager_driver import BaseFileManagerDriver
-from .file_manager.local_file_manager_driver import LocalFileManagerDriver
-from .file_manager.amazon_s3_file_manager_driver import AmazonS3FileManagerDriver
-
-from .rerank.base_rerank_driver import BaseRerankDriver
-from .rerank.cohere_rerank_driver import CohereRerankDriver
-
-from .ruleset.base_ruleset_driver import BaseRulesetDriver
-from .ruleset.local_ruleset_driver import LocalRulesetDriver
-from .ruleset.griptape_cloud_ruleset_driver import GriptapeCloudRulesetDriver
-
-from .text_to_speech.base_text_to_speech_driver import BaseTextToSpeechDriver
-from .text_to_speech.dummy_text_to_speech_driver import DummyTextToSpeechDriver
-from .text_to_speech.elevenlabs_text_to_speech_driver import ElevenLabsTextToSpeechDriver
-from .text_to_speech.openai_text_to_speech_driver import OpenAiTextToSpeechDriver
-from .text_to_speech.azure_openai_text_to_speech_driver import AzureOpenAiTextToSpeechDriver
-
-from .structure_run.base_structure_run_driver import BaseStructureRunDriver
-from .structure_run.griptape_cloud_structure_run_driver import GriptapeCloudStructureRunDriver
-from .structure_run.local_structure_run_driver import LocalStructureRunDriver
-
-from .audio_transcription.base_audio_transcription_driver import BaseAudioTranscriptionDriver
-from .audio_transcription.dummy_audio_transcription_driver import DummyAudioTranscriptionDriver
-from .audio_transcription.openai_audio_transcription_driver import OpenAiAudioTranscriptionDriver
-
-from .observability.base_observability_driver import BaseObservabilityDriver
-from .observability.no_op_observability_driver import NoOpObservabilityDriver
-from .observability.open_telemetry_observability_driver import OpenTelemetryObservabilityDriver
-from .observability.griptape_cloud_observability_driver import GriptapeCloudObservabilityDriver
-from .observability.datadog_observability_driver import DatadogObservabilityDriver
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .prompt.base_prompt_driver import BasePromptDriver
+    from .prompt.openai_chat_prompt_driver import OpenAiChatPromptDriver
+    from .prompt.azure_openai_chat_prompt_driver import AzureOpenAiChatPromptDriver
+    from .prompt.cohere_prompt_driver import CoherePromptDriver
+    from .prompt.huggingface_pipeline_prompt_driver import HuggingFacePipelinePromptDriver
+    from .prompt.huggingface_hub_prompt_driver import HuggingFaceHubPromptDriver
+    from .prompt.anthropic_prompt_driver import AnthropicPromptDriver
+    from .prompt.amazon_sagemaker_jumpstart_prompt_driver import AmazonSageMakerJumpstartPromptDriver
+    from .prompt.amazon_bedrock_prompt_driver import AmazonBedrockPromptDriver
+    from .prompt.google_prompt_driver import GooglePromptDriver
+    from .prompt.dummy_prompt_driver import DummyPromptDriver
+    from .prompt.ollama_prompt_driver import OllamaPromptDriver
+    from .prompt.hedged_prompt_driver import HedgedPromptDriver
+
+    from .memory.conversation.base_conversation_memory_driver import BaseConversationMemoryDriver
+    from .memory.conversation.local_conversation_memory_driver import LocalConversationMemoryDriver
+    from .memory.conversation.amazon_dynamodb_conversation_memory_driver import AmazonDynamoDbConversationMemoryDriver
+    from .memory.conversation.redis_conversation_memory_driver import RedisConversationMemoryDriver
+    from .memory.conversation.griptape_cloud_conversation_memory_driver import GriptapeCloudConversationMemoryDriver
+
+    from .cache.base_cache_driver import BaseCacheDriver
+    from .cache.local_cache_driver import LocalCacheDriver
+    from .cache.sqlite_cache_driver import SqliteCacheDriver
+    from .cache.tiered_cache_driver import TieredCacheDriver
+
+    from .embedding.base_embedding_driver import BaseEmbeddingDriver
+    from .embedding.openai_embedding_driver import OpenAiEmbeddingDriver
+    from .embedding.azure_openai_embedding_driver import AzureOpenAiEmbeddingDriver
+    from .embedding.amazon_sagemaker_jumpstart_embedding_driver import AmazonSageMakerJumpstartEmbeddingDriver
+    from .embedding.amazon_bedrock_titan_embedding_driver import AmazonBedrockTitanEmbeddingDriver
+    from .embedding.amazon_bedrock_cohere_embedding_driver import AmazonBedrockCohereEmbeddingDriver
+    from .embedding.voyageai_embedding_driver import VoyageAiEmbeddingDriver
+    from .embedding.huggingface_hub_embedding_driver import HuggingFaceHubEmbeddingDriver
+    from .embedding.google_embedding_driver import GoogleEmbeddingDriver
+    from .embedding.dummy_embedding_driver import DummyEmbeddingDriver
+    from .embedding.cohere_embedding_driver import CohereEmbeddingDriver
+    from .embedding.ollama_embedding_driver import OllamaEmbeddingDriver
+
+    from .vector.base_vector_store_driver import BaseVectorStoreDriver
+    from .vector.local_vector_store_driver import LocalVectorStoreDriver
+    from .vector.pinecone_vector_store_driver import PineconeVectorStoreDriver
+    from .vector.marqo_vector_store_driver import MarqoVectorStoreDriver
+    from .vector.mongodb_atlas_vector_store_driver import MongoDbAtlasVectorStoreDriver
+    from .vector.redis_vector_store_driver import RedisVectorStoreDriver
+    from .vector.opensearch_vector_store_driver import OpenSearchVectorStoreDriver
+    from .vector.amazon_opensearch_vector_store_driver import AmazonOpenSearchVectorStoreDriver
+    from .vector.pgvector_vector_store_driver import PgVectorVectorStoreDriver
+    from .vector.azure_mongodb_vector_store_driver import AzureMongoDbVectorStoreDriver
+    from .vector.dummy_vector_store_driver import DummyVectorStoreDriver
+    from .vector.qdrant_vector_store_driver import QdrantVectorStoreDriver
+    from .vector.astradb_vector_store_driver import AstraDbVectorStoreDriver
+    from .vector.griptape_cloud_vector_store_driver import GriptapeCloudVectorStoreDriver
+
+    from .sql.base_sql_driver import BaseSqlDriver
+    from .sql.amazon_redshift_sql_driver import AmazonRedshiftSqlDriver
+    from .sql.snowflake_sql_driver import SnowflakeSqlDriver
+    from .sql.sql_driver import SqlDriver
+
+    from .image_generation_model.base_image_generation_model_driver import BaseImageGenerationModelDriver
+    from .image_generation_model.bedrock_stable_diffusion_image_generation_model_driver import (
+        BedrockStableDiffusionImageGenerationModelDriver,
+    )
+    from .image_generation_model.bedrock_titan_image_generation_model_driver import (
+        BedrockTitanImageGenerationModelDriver,
+    )
+
+    from .image_generation_pipeline.base_image_generation_pipeline_driver import (
+        BaseDiffusionImageGenerationPipelineDriver,
+    )
+    from .image_generation_pipeline.stable_diffusion_3_image_generation_pipeline_driver import (
+        StableDiffusion3ImageGenerationPipelineDriver,
+    )
+    from .image_generation_pipeline.stable_diffusion_3_img_2_img_image_generation_pipeline_driver import (
+        StableDiffusion3Img2ImgImageGenerationPipelineDriver,
+    )
+    from .image_generation_pipeline.stable_diffusion_3_controlnet_image_generation_pipeline_driver import (
+        StableDiffusion3ControlNetImageGenerationPipelineDriver,
+    )
+
+    from .image_generation.base_image_generation_driver import BaseImageGenerationDriver
+    from .image_generation.base_multi_model_image_generation_driver import BaseMultiModelImageGenerationDriver
+    from .image_generation.openai_image_generation_driver import OpenAiImageGenerationDriver
+    from .image_generation.leonardo_image_generation_driver import LeonardoImageGenerationDriver
+    from .image_generation.amazon_bedrock_image_generation_driver import AmazonBedrockImageGenerationDriver
+    from .image_generation.azure_openai_image_generation_driver import AzureOpenAiImageGenerationDriver
+    from .image_generation.dummy_image_generation_driver import DummyImageGenerationDriver
+    from .image_generation.huggingface_pipeline_image_generation_driver import (
+        HuggingFacePipelineImageGenerationDriver,
+    )
+
+    from .image_query_model.base_image_query_model_driver import BaseImageQueryModelDriver
+    from .image_query_model.bedrock_claude_image_query_model_driver import BedrockClaudeImageQueryModelDriver
+
+    from .image_query.base_image_query_driver import BaseImageQueryDriver
+    from .image_query.base_multi_model_image_query_driver import BaseMultiModelImageQueryDriver
+    from .image_query.dummy_image_query_driver import DummyImageQueryDriver
+    from .image_query.openai_image_query_driver import OpenAiImageQueryDriver
+    from .image_query.anthropic_image_query_driver import AnthropicImageQueryDriver
+    from .image_query.azure_openai_image_query_driver import AzureOpenAiImageQueryDriver
+    from .image_query.amazon_bedrock_image_query_driver import AmazonBedrockImageQueryDriver
+
+    from .web_scraper.base_web_scraper_driver import BaseWebScraperDriver
+    from .web_scraper.trafilatura_web_scraper_driver import TrafilaturaWebScraperDriver
+    from .web_scraper.markdownify_web_scraper_driver import MarkdownifyWebScraperDriver
+    from .web_scraper.proxy_web_scraper_driver import ProxyWebScraperDriver
+
+    from .web_search.base_web_search_driver import BaseWebSearchDriver
+    from .web_search.google_web_search_driver import GoogleWebSearchDriver
+    from .web_search.duck_duck_go_web_search_driver import DuckDuckGoWebSearchDriver
+    from .web_search.exa_web_search_driver import ExaWebSearchDriver
+    from .web_search.tavily_web_search_driver import TavilyWebSearchDriver
+
+    from .event_listener.base_event_listener_driver import BaseEventListenerDriver
+    from .event_listener.amazon_sqs_event_listener_driver import AmazonSqsEventListenerDriver
+    from .event_listener.webhook_event_listener_driver import WebhookEventListenerDriver
+    from .event_listener.aws_iot_core_event_listener_driver import AwsIotCoreEventListenerDriver
+    from .event_listener.griptape_cloud_event_listener_driver import GriptapeCloudEventListenerDriver
+    from .event_listener.pusher_event_listener_driver import PusherEventListenerDriver
+
+    from .file_manager.base_file_manager_driver import BaseFileManagerDriver
+    from .file_manager.local_file_manager_driver import LocalFileManagerDriver
+    from .file_manager.amazon_s3_file_manager_driver import AmazonS3FileManagerDriver
+
+    from .rerank.base_rerank_driver import BaseRerankDriver
+    from .rerank.cohere_rerank_driver import CohereRerankDriver
+
+    from .ruleset.base_ruleset_driver import BaseRulesetDriver
+    from .ruleset.local_ruleset_driver import LocalRulesetDriver
+    from .ruleset.griptape_cloud_ruleset_driver import GriptapeCloudRulesetDriver
+
+    from .text_to_speech.base_text_to_speech_driver import BaseTextToSpeechDriver
+    from .text_to_speech.dummy_text_to_speech_driver import DummyTextToSpeechDriver
+    from .text_to_speech.elevenlabs_text_to_speech_driver import ElevenLabsTextToSpeechDriver
+    from .text_to_speech.openai_text_to_speech_driver import OpenAiTextToSpeechDriver
+    from .text_to_speech.azure_openai_text_to_speech_driver import AzureOpenAiTextToSpeechDriver
+
+    from .structure_run.base_structure_run_driver import BaseStructureRunDriver
+    from .structure_run.griptape_cloud_structure_run_driver import GriptapeCloudStructureRunDriver
+    from .structure_run.local_structure_run_driver import LocalStructureRunDriver
+
+    from .audio_transcription.base_audio_transcription_driver import BaseAudioTranscriptionDriver
+    from .audio_transcription.dummy_audio_transcription_driver import DummyAudioTranscriptionDriver
+    from .audio_transcription.openai_audio_transcription_driver import OpenAiAudioTranscriptionDriver
+
+    from .observability.base_observability_driver import BaseObservabilityDriver
+    from .observability.no_op_observability_driver import NoOpObservabilityDriver
+    from .observability.open_telemetry_observability_driver import OpenTelemetryObservabilityDriver
+    from .observability.griptape_cloud_observability_driver import GriptapeCloudObservabilityDriver
+    from .observability.datadog_observability_driver import DatadogObservabilityDriver
+
+# Drivers are imported on first access so that importing this package doesn't import every optional
+# dependency. Maps each public name to the module that defines it.
+_LAZY_IMPORTS = {
+    "BasePromptDriver": ".prompt.base_prompt_driver",
+    "OpenAiChatPromptDriver": ".prompt.openai_chat_prompt_driver",
+    "AzureOpenAiChatPromptDriver": ".prompt.azure_openai_chat_prompt_driver",
+    "CoherePromptDriver": ".prompt.cohere_prompt_driver",
+    "HuggingFacePipelinePromptDriver": ".prompt.huggingface_pipeline_prompt_driver",
+    "HuggingFaceHubPromptDriver": ".prompt.huggingface_hub_prompt_driver",
+    "AnthropicPromptDriver": ".prompt.anthropic_prompt_driver",
+    "AmazonSageMakerJumpstartPromptDriver": ".prompt.amazon_sagemaker_jumpstart_prompt_driver",
+    "AmazonBedrockPromptDriver": ".prompt.amazon_bedrock_prompt_driver",
+    "GooglePromptDriver": ".prompt.google_prompt_driver",
+    "DummyPromptDriver": ".prompt.dummy_prompt_driver",
+    "OllamaPromptDriver": ".prompt.ollama_prompt_driver",
+    "HedgedPromptDriver": ".prompt.hedged_prompt_driver",
+    "BaseConversationMemoryDriver": ".memory.conversation.base_conversation_memory_driver",
+    "LocalConversationMemoryDriver": ".memory.conversation.local_conversation_memory_driver",
+    "AmazonDynamoDbConversationMemoryDriver": ".memory.conversation.amazon_dynamodb_conversation_memory_driver",
+    "RedisConversationMemoryDriver": ".memory.conversation.redis_conversation_memory_driver",
+    "GriptapeCloudConversationMemoryDriver": ".memory.conversation.griptape_cloud_conversation_memory_driver",
+    "BaseCacheDriver": ".cache.base_cache_driver",
+    "LocalCacheDriver": ".cache.local_cache_driver",
+    "SqliteCacheDriver": ".cache.sqlite_cache_driver",
+    "TieredCacheDriver": ".cache.tiered_cache_driver",
+    "BaseEmbeddingDriver": ".embedding.base_embedding_driver",
+    "OpenAiEmbeddingDriver": ".embedding.openai_embedding_driver",
+    "AzureOpenAiEmbeddingDriver": ".embedding.azure_openai_embedding_driver",
+    "AmazonSageMakerJumpstartEmbeddingDriver": ".embedding.amazon_sagemaker_jumpstart_embedding_driver",
+    "AmazonBedrockTitanEmbeddingDriver": ".embedding.amazon_bedrock_titan_embedding_driver",
+    "AmazonBedrockCohereEmbeddingDriver": ".embedding.amazon_bedrock_cohere_embedding_driver",
+    "VoyageAiEmbeddingDriver": ".embedding.voyageai_embedding_driver",
+    "HuggingFaceHubEmbeddingDriver": ".embedding.huggingface_hub_embedding_driver",
+    "GoogleEmbeddingDriver": ".embedding.google_embedding_driver",
+    "DummyEmbeddingDriver": ".embedding.dummy_embedding_driver",
+    "CohereEmbeddingDriver": ".embedding.cohere_embedding_driver",
+    "OllamaEmbeddingDriver": ".embedding.ollama_embedding_driver",
+    "BaseVectorStoreDriver": ".vector.base_vector_store_driver",
+    "LocalVectorStoreDriver": ".vector.local_vector_store_driver",
+    "PineconeVectorStoreDriver": ".vector.pinecone_vector_store_driver",
+    "MarqoVectorStoreDriver": ".vector.marqo_vector_store_driver",
+    "MongoDbAtlasVectorStoreDriver": ".vector.mongodb_atlas_vector_store_driver",
+    "RedisVectorStoreDriver": ".vector.redis_vector_store_driver",
+    "OpenSearchVectorStoreDriver": ".vector.opensearch_vector_store_driver",
+    "AmazonOpenSearchVectorStoreDriver": ".vector.amazon_opensearch_vector_store_driver",
+    "PgVectorVectorStoreDriver": ".vector.pgvector_vector_store_driver",
+    "AzureMongoDbVectorStoreDriver": ".vector.azure_mongodb_vector_store_driver",
+    "DummyVectorStoreDriver": ".vector.dummy_vector_store_driver",
+    "QdrantVectorStoreDriver": ".vector.qdrant_vector_store_driver",
+    "AstraDbVectorStoreDriver": ".vector.astradb_vector_store_driver",
+    "GriptapeCloudVectorStoreDriver": ".vector.griptape_cloud_vector_store_driver",
+    "BaseSqlDriver": ".sql.base_sql_driver",
+    "AmazonRedshiftSqlDriver": ".sql.amazon_redshift_sql_driver",
+    "SnowflakeSqlDriver": ".sql.snowflake_sql_driver",
+    "SqlDriver": ".sql.sql_driver",
+    "BaseImageGenerationModelDriver": ".image_generation_model.base_image_generation_model_driver",
+    "BedrockStableDiffusionImageGenerationModelDriver": ".image_generation_model.bedrock_stable_diffusion_image_generation_model_driver",
+    "BedrockTitanImageGenerationModelDriver": ".image_generation_model.bedrock_titan_image_generation_model_driver",
+    "BaseDiffusionImageGenerationPipelineDriver": ".image_generation_pipeline.base_image_generation_pipeline_driver",
+    "StableDiffusion3ImageGenerationPipelineDriver": ".image_generation_pipeline.stable_diffusion_3_image_generation_pipeline_driver",
+    "StableDiffusion3Img2ImgImageGenerationPipelineDriver": ".image_generation_pipeline.stable_diffusion_3_img_2_img_image_generation_pipeline_driver",
+    "StableDiffusion3ControlNetImageGenerationPipelineDriver": ".image_generation_pipeline.stable_diffusion_3_controlnet_image_generation_pipeline_driver",
+    "BaseImageGenerationDriver": ".image_generation.base_image_generation_driver",
+    "BaseMultiModelImageGenerationDriver": ".image_generation.base_multi_model_image_generation_driver",
+    "OpenAiImageGenerationDriver": ".image_generation.openai_image_generation_driver",
+    "LeonardoImageGenerationDriver": ".image_generation.leonardo_image_generation_driver",
+    "AmazonBedrockImageGenerationDriver": ".image_generation.amazon_bedrock_image_generation_driver",
+    "AzureOpenAiImageGenerationDriver": ".image_generation.azure_openai_image_generation_driver",
+    "DummyImageGenerationDriver": ".image_generation.dummy_image_generation_driver",
+    "HuggingFacePipelineImageGenerationDriver": ".image_generation.huggingface_pipeline_image_generation_driver",
+    "BaseImageQueryModelDriver": ".image_query_model.base_image_query_model_driver",
+    "BedrockClaudeImageQueryModelDriver": ".image_query_model.bedrock_claude_image_query_model_driver",
+    "BaseImageQueryDriver": ".image_query.base_image_query_driver",
+    "BaseMultiModelImageQueryDriver": ".image_query.base_multi_model_image_query_driver",
+    "DummyImageQueryDriver": ".image_query.dummy_image_query_driver",
+    "OpenAiImageQueryDriver": ".image_query.openai_image_query_driver",
+    "AnthropicImageQueryDriver": ".image_query.anthropic_image_query_driver",
+    "AzureOpenAiImageQueryDriver": ".image_query.azure_openai_image_query_driver",
+    "AmazonBedrockImageQueryDriver": ".image_query.amazon_bedrock_image_query_driver",
+    "BaseWebScraperDriver": ".web_scraper.base_web_scraper_driver",
+    "TrafilaturaWebScraperDriver": ".web_scraper.trafilatura_web_scraper_driver",
+    "MarkdownifyWebScraperDriver": ".web_scraper.markdownify_web_scraper_driver",
+    "ProxyWebScraperDriver": ".web_scraper.proxy_web_scraper_driver",
+    "BaseWebSearchDriver": ".web_search.base_web_search_driver",
+    "GoogleWebSearchDriver": ".web_search.google_web_search_driver",
+    "DuckDuckGoWebSearchDriver": ".web_search.duck_duck_go_web_search_driver",
+    "ExaWebSearchDriver": ".web_search.exa_web_search_driver",
+    "TavilyWebSearchDriver": ".web_search.tavily_web_search_driver",
+    "BaseEventListenerDriver": ".event_listener.base_event_listener_driver",
+    "AmazonSqsEventListenerDriver": ".event_listener.amazon_sqs_event_listener_driver",
+    "WebhookEventListenerDriver": ".event_listener.webhook_event_listener_driver",
+    "AwsIotCoreEventListenerDriver": ".event_listener.aws_iot_core_event_listener_driver",
+    "GriptapeCloudEventListenerDriver": ".event_listener.griptape_cloud_event_listener_driver",
+    "PusherEventListenerDriver": ".event_listener.pusher_event_listener_driver",
+    "BaseFileManagerDriver": ".file_manager.base_file_manager_driver",
+    "LocalFileManagerDriver": ".file_manager.local_file_manager_driver",
+    "AmazonS3FileManagerDriver": ".file_manager.amazon_s3_file_manager_driver",
+    "BaseRerankDriver": ".rerank.base_rerank_driver",
+    "CohereRerankDriver": ".rerank.cohere_rerank_driver",
+    "BaseRulesetDriver": ".ruleset.base_ruleset_driver",
+    "LocalRulesetDriver": ".ruleset.local_ruleset_driver",
+    "GriptapeCloudRulesetDriver": ".ruleset.griptape_cloud_ruleset_driver",
+    "BaseTextToSpeechDriver": ".text_to_speech.base_text_to_speech_driver",
+    "DummyTextToSpeechDriver": ".text_to_speech.dummy_text_to_speech_driver",
+    "ElevenLabsTextToSpeechDriver": ".text_to_speech.elevenlabs_text_to_speech_driver",
+    "OpenAiTextToSpeechDriver": ".text_to_speech.openai_text_to_speech_driver",
+    "AzureOpenAiTextToSpeechDriver": ".text_to_speech.azure_openai_text_to_speech_driver",
+    "BaseStructureRunDriver": ".structure_run.base_structure_run_driver",
+    "GriptapeCloudStructureRunDriver": ".structure_run.griptape_cloud_structure_run_driver",
+    "LocalStructureRunDriver": ".structure_run.local_structure_run_driver",
+    "BaseAudioTranscriptionDriver": ".audio_transcription.base_audio_transcription_driver",
+    "DummyAudioTranscriptionDriver": ".audio_transcription.dummy_audio_transcription_driver",
+    "OpenAiAudioTranscriptionDriver": ".audio_transcription.openai_audio_transcription_driver",
+    "BaseObservabilityDriver": ".observability.base_observability_driver",
+    "NoOpObservabilityDriver": ".observability.no_op_observability_driver",
+    "OpenTelemetryObservabilityDriver": ".observability.open_telemetry_observability_driver",
+    "GriptapeCloudObservabilityDriver": ".observability.griptape_cloud_observability_driver",
+    "DatadogObservabilityDriver": ".observability.datadog_observability_driver",
+}
 
 __all__ = [
     "BasePromptDriver",
@@ -153,11 +287,16 @@ __all__ = [
     "GooglePromptDriver",
     "DummyPromptDriver",
     "OllamaPromptDriver",
+    "HedgedPromptDriver",
     "BaseConversationMemoryDriver",
     "LocalConversationMemoryDriver",
     "AmazonDynamoDbConversationMemoryDriver",
     "RedisConversationMemoryDriver",
     "GriptapeCloudConversationMemoryDriver",
+    "BaseCacheDriver",
+    "LocalCacheDriver",
+    "SqliteCacheDriver",
+    "TieredCacheDriver",
     "BaseEmbeddingDriver",
     "OpenAiEmbeddingDriver",
     "AzureOpenAiEmbeddingDriver",
@@ -252,3 +391,19 @@ __all__ = [
     "GriptapeCloudObservabilityDriver",
     "DatadogObservabilityDriver",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from attrs import Factory, define, field
+
+from griptape.mixins.serializable_mixin import SerializableMixin
+
+
+@define
+class BaseCacheDriver(SerializableMixin, ABC):
+    """Base class for key-value cache drivers.
+
+    Attributes:
+        hits: Number of keys found in the cache.
+        misses: Number of keys not found in the cache.
+    """
+
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _stats_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False, eq=False)
+
+    @property
+    def hit_rate(self) -> float:
+        with self._stats_lock:
+            hits, lookups = self.hits, self.hits + self.misses
+
+        return hits / lookups if lookups else 0.0
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        """Looks up multiple keys at once.
+
+        Args:
+            keys: Keys to look up.
+
+        Returns:
+            Values of the keys that were found.
+        """
+        values = self.try_get_many(keys) if keys else {}
+
+        with self._stats_lock:
+            self.hits += len(values)
+            self.misses += len(keys) - len(values)
+
+        return values
+
+    def set(self, key: str, value: bytes) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        if items:
+            self.try_set_many(items)
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+
+    @abstractmethod
+    def try_get_many(self, keys: list[str]) -> dict[str, bytes]: ...
+
+    @abstractmethod
+    def try_set_many(self, items: dict[str, bytes]) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from attrs import Factory, define, field
+
+from griptape.drivers import BaseCacheDriver
+
+
+@define
+class LocalCacheDriver(BaseCacheDriver):
+    """In-memory least-recently-used cache.
+
+    Attributes:
+        max_size: Maximum total size of cached keys and values in bytes. Least recently used items are evicted first.
+    """
+
+    DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+    max_size: int = field(default=DEFAULT_MAX_SIZE, kw_only=True, metadata={"serializable": True})
+    thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), kw_only=True)
+    _items: OrderedDict[str, bytes] = field(factory=OrderedDict, init=False)
+    _size: int = field(default=0, init=False)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def try_get_many(self, keys: list[str]) -> dict[str, bytes]:
+        values = {}
+
+        with self.thread_lock:
+            for key in keys:
+                value = self._items.get(key)
+
+                if value is not None:
+                    self._items.move_to_end(key)
+                    values[key] = value
+
+        return values
+
+    def try_set_many(self, items: dict[str, bytes]) -> None:
+        with self.thread_lock:
+            for key, value in items.items():
+                self.__remove(key)
+
+                if self.__item_size(key, value) <= self.max_size:
+                    self._items[key] = value
+                    self._size += self.__item_size(key, value)
+
+            while self._size > self.max_size:
+                self.__remove(next(iter(self._items)))
+
+    def delete(self, key: str) -> None:
+        with self.thread_lock:
+            self.__remove(key)
+
+    def clear(self) -> None:
+        with self.thread_lock:
+            self._items.clear()
+            self._size = 0
+
+    def __remove(self, key: str) -> None:
+        value = self._items.pop(key, None)
+
+        if value is not None:
+            self._size -= self.__item_size(key, value)
+
+    def __item_size(self, key: str, value: bytes) -> int:
+        return len(key) + len(value)
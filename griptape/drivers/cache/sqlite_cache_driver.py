@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+from attrs import Factory, define, field
+
+from griptape.drivers import BaseCacheDriver
+from griptape.utils.decorators import lazy_property
+
+
+@define
+class SqliteCacheDriver(BaseCacheDriver):
+    """On-disk cache backed by a SQLite database.
+
+    The database runs in write-ahead logging mode so that it can be shared by multiple processes.
+
+    Attributes:
+        path: Path to the SQLite database file. Created if it does not exist.
+        table_name: Name of the table that stores cached items.
+        timeout: Seconds to wait for a lock held by another connection before raising an error.
+    """
+
+    QUERY_BATCH_SIZE = 500
+
+    path: str = field(kw_only=True, metadata={"serializable": True})
+    table_name: str = field(default="griptape_cache", kw_only=True, metadata={"serializable": True})
+    timeout: float = field(default=30.0, kw_only=True, metadata={"serializable": True})
+    thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), kw_only=True)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+
+    @lazy_property()
+    def connection(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(f"CREATE TABLE IF NOT EXISTS {self.table_name} (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+        connection.commit()
+
+        return connection
+
+    def try_get_many(self, keys: list[str]) -> dict[str, bytes]:
+        values = {}
+
+        with self.thread_lock:
+            for i in range(0, len(keys), self.QUERY_BATCH_SIZE):
+                batch = keys[i : i + self.QUERY_BATCH_SIZE]
+                rows = self.connection.execute(
+                    f"SELECT key, value FROM {self.table_name} WHERE key IN ({','.join('?' * len(batch))})",  # noqa: S608
+                    batch,
+                )
+                values.update({key: bytes(value) for key, value in rows})
+
+        return values
+
+    def try_set_many(self, items: dict[str, bytes]) -> None:
+        with self.thread_lock, self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value) VALUES (?, ?)",  # noqa: S608
+                list(items.items()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self.thread_lock, self.connection:
+            self.connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))  # noqa: S608
+
+    def clear(self) -> None:
+        with self.thread_lock, self.connection:
+            self.connection.execute(f"DELETE FROM {self.table_name}")  # noqa: S608
+
+    def close(self) -> None:
+        with self.thread_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from attrs import define, field
+
+from griptape.drivers import BaseCacheDriver
+
+
+@define
+class TieredCacheDriver(BaseCacheDriver):
+    """Cache that looks up keys in several Cache Drivers, fastest first.
+
+    Values found in a slower tier are copied into the faster tiers that missed them. Writes go to every tier.
+
+    Attributes:
+        cache_drivers: Cache Drivers ordered from fastest to slowest, e.g. a `LocalCacheDriver` followed by a
+            `SqliteCacheDriver`.
+    """
+
+    cache_drivers: list[BaseCacheDriver] = field(kw_only=True, metadata={"serializable": True})
+
+    def try_get_many(self, keys: list[str]) -> dict[str, bytes]:
+        values = {}
+        remaining = keys
+
+        for i, cache_driver in enumerate(self.cache_drivers):
+            if not remaining:
+                break
+
+            found = cache_driver.get_many(remaining)
+
+            if found:
+                for faster_cache_driver in self.cache_drivers[:i]:
+                    faster_cache_driver.set_many(found)
+
+                values.update(found)
+                remaining = [key for key in remaining if key not in found]
+
+        return values
+
+    def try_set_many(self, items: dict[str, bytes]) -> None:
+        for cache_driver in self.cache_drivers:
+            cache_driver.set_many(items)
+
+    def delete(self, key: str) -> None:
+        for cache_driver in self.cache_drivers:
+            cache_driver.delete(key)
+
+    def clear(self) -> None:
+        for cache_driver in self.cache_drivers:
+            cache_driver.clear()
@@ -32,6 +32,7 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
     """
 
     DEFAULT_MODEL = "cohere.embed-english-v3"
+    DEFAULT_MAX_BATCH_SIZE = 96
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True)
     input_type: str = field(default="search_query", kw_only=True)
@@ -40,6 +41,7 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         default=Factory(lambda self: AmazonBedrockTokenizer(model=self.model), takes_self=True),
         kw_only=True,
     )
+    max_batch_size: int = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
     _client: BedrockClient = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
@@ -47,7 +49,10 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         return self.session.client("bedrock-runtime")
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        payload = {"input_type": self.input_type, "texts": [chunk]}
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        payload = {"input_type": self.input_type, "texts": chunks}
 
         response = self.client.invoke_model(
             body=json.dumps(payload),
@@ -57,4 +62,7 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         )
         response_body = json.loads(response.get("body").read())
 
-        return response_body.get("embeddings")[0]
+        return response_body.get("embeddings")
+
+    def _get_cache_key(self, string: str) -> str:
+        return f"{self.input_type}:{super()._get_cache_key(string)}"
@@ -22,6 +22,7 @@ class AzureOpenAiEmbeddingDriver(OpenAiEmbeddingDriver):
         api_version: An Azure OpenAi API version.
         tokenizer: An `OpenAiTokenizer`.
         client: An `openai.AzureOpenAI` client.
+        async_client: An `openai.AsyncAzureOpenAI` client, used by `embed_string_async`.
     """
 
     azure_deployment: str = field(
@@ -42,6 +43,9 @@ class AzureOpenAiEmbeddingDriver(OpenAiEmbeddingDriver):
         kw_only=True,
     )
     _client: openai.AzureOpenAI = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: openai.AsyncAzureOpenAI = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> openai.AzureOpenAI:
@@ -54,3 +58,15 @@ class AzureOpenAiEmbeddingDriver(OpenAiEmbeddingDriver):
             azure_ad_token=self.azure_ad_token,
             azure_ad_token_provider=self.azure_ad_token_provider,
         )
+
+    @lazy_property()
+    def async_client(self) -> openai.AsyncAzureOpenAI:
+        return openai.AsyncAzureOpenAI(
+            organization=self.organization,
+            api_key=self.api_key,
+            api_version=self.api_version,
+            azure_endpoint=self.azure_endpoint,
+            azure_deployment=self.azure_deployment,
+            azure_ad_token=self.azure_ad_token,
+            azure_ad_token_provider=self.azure_ad_token_provider,
+        )
@@ -9,10 +9,14 @@ from attrs import define, field
 from griptape.chunkers import BaseChunker, TextChunker
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.utils.futures import run_in_executor
+from griptape.utils.hash import str_to_hash
 
 if TYPE_CHECKING:
     from griptape.artifacts import TextArtifact
+    from griptape.drivers import BaseCacheDriver
     from griptape.tokenizers import BaseTokenizer
+    from griptape.utils import RateLimiter
 
 
 @define
@@ -22,10 +26,22 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     Attributes:
         model: The name of the model to use.
         tokenizer: An instance of `BaseTokenizer` to use when calculating tokens.
+        max_batch_size: Maximum number of inputs sent to the embedding API in a single request.
+        max_batch_tokens: Maximum number of tokens sent to the embedding API in a single request.
+            Only enforced when a `tokenizer` is available.
+        cache_driver: Optional Cache Driver for reusing embeddings of previously embedded strings.
+            Embeddings are keyed by model and a hash of the string.
+        rate_limiter: Optional Rate Limiter to wait on before each request, including retries. Share one from
+            `RateLimiterRegistry` between drivers that call the same provider and model. Tokens are counted with
+            `tokenizer` when available.
     """
 
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: Optional[BaseTokenizer] = field(default=None, kw_only=True)
+    max_batch_size: int = field(default=1, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=None, kw_only=True)
+    cache_driver: Optional[BaseCacheDriver] = field(default=None, kw_only=True)
+    rate_limiter: Optional[RateLimiter] = field(default=None, kw_only=True)
     chunker: Optional[BaseChunker] = field(init=False)
 
     def __attrs_post_init__(self) -> None:
@@ -35,31 +51,186 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         return self.embed_string(artifact.to_text())
 
     def embed_string(self, string: str) -> list[float]:
+        cached_embeddings = self._get_cached_embeddings([string])
+
+        if string in cached_embeddings:
+            return cached_embeddings[string]
+
+        embedding = self._embed_string(string)
+        self._set_cached_embeddings({string: embedding})
+
+        return embedding
+
+    async def embed_string_async(self, string: str) -> list[float]:
+        """Asynchronous version of `embed_string`."""
+        cached_embeddings = self._get_cached_embeddings([string])
+
+        if string in cached_embeddings:
+            return cached_embeddings[string]
+
+        embedding = await self._embed_string_async(string)
+        self._set_cached_embeddings({string: embedding})
+
+        return embedding
+
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Embeds a list of strings, packing them into as few requests as the driver's limits allow.
+
+        Duplicate strings and strings found in the `cache_driver` are not sent to the embedding API.
+        Strings that exceed the tokenizer's `max_input_tokens` are embedded individually.
+        Every request is retried with exponential backoff.
+
+        Args:
+            strings: Strings to embed.
+
+        Returns:
+            Embeddings in the same order as `strings`.
+        """
+        unique_strings = list(dict.fromkeys(strings))
+        embeddings = self._get_cached_embeddings(unique_strings)
+        missing_strings = [s for s in unique_strings if s not in embeddings]
+        missing_embeddings = dict(zip(missing_strings, self._embed_strings(missing_strings)))
+
+        self._set_cached_embeddings(missing_embeddings)
+        embeddings.update(missing_embeddings)
+
+        return [embeddings[s] for s in strings]
+
+    @abstractmethod
+    def try_embed_chunk(self, chunk: str) -> list[float]: ...
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        """Embeds a batch of chunks in a single request.
+
+        Drivers whose APIs accept multiple inputs per request should override this method and raise `max_batch_size`.
+
+        Args:
+            chunks: Chunks to embed. Never longer than `max_batch_size`.
+
+        Returns:
+            Embeddings in the same order as `chunks`.
+        """
+        return [self.try_embed_chunk(chunk) for chunk in chunks]
+
+    async def try_embed_chunk_async(self, chunk: str) -> list[float]:
+        """Asynchronous version of `try_embed_chunk`.
+
+        Drivers with an asynchronous client should override this method. By default, `try_embed_chunk` runs in the
+        shared `llm` pool of `FuturesExecutorRegistry`.
+        """
+        return await run_in_executor(self.try_embed_chunk, chunk)
+
+    def _embed_string(self, string: str) -> list[float]:
         for attempt in self.retrying():
             with attempt:
                 if self.tokenizer and self.tokenizer.count_tokens(string) > self.tokenizer.max_input_tokens:
                     return self._embed_long_string(string)
                 else:
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.acquire(self._estimate_rate_limit_tokens([string]))
+
                     return self.try_embed_chunk(string)
 
         else:
             raise RuntimeError("Failed to embed string.")
 
-    @abstractmethod
-    def try_embed_chunk(self, chunk: str) -> list[float]: ...
+    async def _embed_string_async(self, string: str) -> list[float]:
+        async for attempt in self.retrying_async():
+            with attempt:
+                if self.tokenizer and self.tokenizer.count_tokens(string) > self.tokenizer.max_input_tokens:
+                    return await run_in_executor(self._embed_long_string, string)
+                else:
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire_async(self._estimate_rate_limit_tokens([string]))
+
+                    return await self.try_embed_chunk_async(string)
+
+        else:
+            raise RuntimeError("Failed to embed string.")
+
+    def _embed_strings(self, strings: list[str]) -> list[list[float]]:
+        embeddings: list[list[float]] = [[] for _ in strings]
+        token_counts: list[Optional[int]] = (
+            list(self.tokenizer.count_tokens_batch(strings)) if self.tokenizer else [None] * len(strings)
+        )
+        indices = []
+
+        for i, (string, token_count) in enumerate(zip(strings, token_counts)):
+            if self.tokenizer and token_count is not None and token_count > self.tokenizer.max_input_tokens:
+                embeddings[i] = self._embed_string(string)
+            else:
+                indices.append(i)
+
+        for batch in self._pack_chunks([token_counts[i] for i in indices]):
+            batch_indices = [indices[j] for j in batch]
+
+            for i, embedding in zip(batch_indices, self._embed_chunks([strings[i] for i in batch_indices])):
+                embeddings[i] = embedding
+
+        return embeddings
+
+    def _embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        for attempt in self.retrying():
+            with attempt:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(self._estimate_rate_limit_tokens(chunks))
+
+                embeddings = self.try_embed_chunks(chunks)
+
+                if len(embeddings) != len(chunks):
+                    raise ValueError(f"Expected {len(chunks)} embeddings, got {len(embeddings)}.")
+
+                return embeddings
+        else:
+            raise RuntimeError("Failed to embed chunks.")
+
+    def _pack_chunks(self, token_counts: list[Optional[int]]) -> list[list[int]]:
+        """Greedily groups consecutive chunks into batches that respect `max_batch_size` and `max_batch_tokens`.
+
+        Args:
+            token_counts: Token count of each chunk, or `None` if unknown.
+
+        Returns:
+            Batches of chunk indices, in order.
+        """
+        batches: list[list[int]] = []
+        batch: list[int] = []
+        batch_tokens = 0
+
+        for i, token_count in enumerate(token_counts):
+            tokens = token_count or 0
+            exceeds_tokens = self.max_batch_tokens is not None and batch_tokens + tokens > self.max_batch_tokens
+
+            if batch and (len(batch) >= self.max_batch_size or exceeds_tokens):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+
+            batch.append(i)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+
+        return batches
 
     def _embed_long_string(self, string: str) -> list[float]:
         """Embeds a string that is too long to embed in one go.
 
         Adapted from: https://github.com/openai/openai-cookbook/blob/683e5f5a71bc7a1b0e5b7a35e087f53cc55fceea/examples/Embedding_long_inputs.ipynb
         """
-        chunks = self.chunker.chunk(string)
+        chunks = [chunk.value for chunk in self.chunker.chunk(string)]
+        token_counts: list[Optional[int]] = (
+            list(self.tokenizer.count_tokens_batch(chunks)) if self.tokenizer else [None] * len(chunks)
+        )
 
         embedding_chunks = []
-        length_chunks = []
-        for chunk in chunks:
-            embedding_chunks.append(self.try_embed_chunk(chunk.value))
-            length_chunks.append(len(chunk))
+        for batch in self._pack_chunks(token_counts):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(sum(token_counts[i] or 0 for i in batch))
+
+            embedding_chunks.extend(self.try_embed_chunks([chunks[i] for i in batch]))
+        length_chunks = [len(chunk) for chunk in chunks]
 
         # generate weighted averages
         embedding_chunks = np.average(embedding_chunks, axis=0, weights=length_chunks)
@@ -68,3 +239,35 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         embedding_chunks = embedding_chunks / np.linalg.norm(embedding_chunks)
 
         return embedding_chunks.tolist()
+
+    def _estimate_rate_limit_tokens(self, chunks: list[str]) -> int:
+        """Counts the tokens that `rate_limiter` counts for a request, or 0 if it doesn't limit tokens."""
+        if self.rate_limiter is None or self.rate_limiter.tokens_per_minute is None or self.tokenizer is None:
+            return 0
+
+        return sum(self.tokenizer.count_tokens_batch(chunks))
+
+    def _get_cache_key(self, string: str) -> str:
+        return f"{self.model}:{str_to_hash(string)}"
+
+    def _get_cached_embeddings(self, strings: list[str]) -> dict[str, list[float]]:
+        if self.cache_driver is None or not strings:
+            return {}
+
+        keys = {self._get_cache_key(string): string for string in strings}
+
+        return {
+            keys[key]: np.frombuffer(value, dtype=np.float64).tolist()
+            for key, value in self.cache_driver.get_many(list(keys)).items()
+        }
+
+    def _set_cached_embeddings(self, embeddings: dict[str, list[float]]) -> None:
+        if self.cache_driver is None or not embeddings:
+            return
+
+        self.cache_driver.set_many(
+            {
+                self._get_cache_key(string): np.asarray(embedding, dtype=np.float64).tobytes()
+                for string, embedding in embeddings.items()
+            }
+        )
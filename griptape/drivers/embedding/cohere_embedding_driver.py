@@ -26,9 +26,11 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
     """
 
     DEFAULT_MODEL = "models/embedding-001"
+    DEFAULT_MAX_BATCH_SIZE = 96
 
     api_key: str = field(kw_only=True, metadata={"serializable": False})
     input_type: str = field(kw_only=True, metadata={"serializable": True})
+    max_batch_size: int = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
     _client: Client = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
     tokenizer: CohereTokenizer = field(
         default=Factory(lambda self: CohereTokenizer(model=self.model, client=self.client), takes_self=True),
@@ -40,9 +42,15 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
         return import_optional_dependency("cohere").Client(self.api_key)
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        result = self.client.embed(texts=[chunk], model=self.model, input_type=self.input_type)
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        result = self.client.embed(texts=chunks, model=self.model, input_type=self.input_type)
 
         if isinstance(result.embeddings, list):
-            return result.embeddings[0]
+            return result.embeddings
         else:
             raise ValueError("Non-float embeddings are not supported.")
+
+    def _get_cache_key(self, string: str) -> str:
+        return f"{self.input_type}:{super()._get_cache_key(string)}"
@@ -26,6 +26,8 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
     """
 
     DEFAULT_MODEL = "voyage-large-2"
+    DEFAULT_MAX_BATCH_SIZE = 128
+    DEFAULT_MAX_BATCH_TOKENS = 120_000
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True, metadata={"serializable": True})
     api_key: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": False})
@@ -34,6 +36,8 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         kw_only=True,
     )
     input_type: str = field(default="document", kw_only=True, metadata={"serializable": True})
+    max_batch_size: int = field(default=DEFAULT_MAX_BATCH_SIZE, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=DEFAULT_MAX_BATCH_TOKENS, kw_only=True)
     _client: voyageai.Client = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
@@ -41,4 +45,10 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         return import_optional_dependency("voyageai").Client(api_key=self.api_key)
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        return self.client.embed([chunk], model=self.model, input_type=self.input_type).embeddings[0]
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return self.client.embed(chunks, model=self.model, input_type=self.input_type).embeddings
+
+    def _get_cache_key(self, string: str) -> str:
+        return f"{self.input_type}:{super()._get_cache_key(string)}"
@@ -3,9 +3,10 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING, Any, Optional
 
-from attrs import Factory, define, field
+from attrs import Attribute, Factory, define, field
 
 from griptape.drivers import BaseConversationMemoryDriver
+from griptape.schemas.codec import loads_json
 from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
@@ -18,6 +19,27 @@ if TYPE_CHECKING:
 
 @define
 class AmazonDynamoDbConversationMemoryDriver(BaseConversationMemoryDriver):
+    """A Conversation Memory Driver for Amazon DynamoDb.
+
+    When `sort_key` and a string `sort_key_value` are set, each run is stored as a separate item under the
+    conversation's partition key, with a sort key prefixed by `sort_key_value`, so that storing a conversation only
+    writes its new runs and loading the most recent runs is a single query. The conversation's metadata is stored in
+    the item identified by `sort_key_value`. Otherwise, the whole conversation is stored in a single item.
+
+    Attributes:
+        session: The boto3 Session.
+        table_name: The name of the DynamoDb table.
+        partition_key: The name of the table's partition key.
+        value_attribute_key: The name of the attribute to store the conversation, or a run, in.
+        partition_key_value: The partition key value of the conversation.
+        sort_key: The name of the table's sort key.
+        sort_key_value: The sort key value of the conversation.
+        max_runs: Maximum number of most recent runs to keep. When set, only the most recent runs are read on load and
+            older runs are deleted on store.
+    """
+
+    RUN_SORT_KEY_SEPARATOR = "#run#"
+
     session: boto3.Session = field(default=Factory(lambda: import_optional_dependency("boto3").Session()), kw_only=True)
     table_name: str = field(kw_only=True, metadata={"serializable": True})
     partition_key: str = field(kw_only=True, metadata={"serializable": True})
@@ -25,19 +47,42 @@ class AmazonDynamoDbConversationMemoryDriver(BaseConversationMemoryDriver):
     partition_key_value: str = field(kw_only=True, metadata={"serializable": True})
     sort_key: Optional[str] = field(default=None, metadata={"serializable": True})
     sort_key_value: Optional[str | int] = field(default=None, metadata={"serializable": True})
+    max_runs: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
     _table: Table = field(default=None, kw_only=True, alias="table", metadata={"serializable": False})
+    _stored_runs: Optional[list[tuple[str, str]]] = field(default=None, init=False, eq=False)
+    _next_run_index: int = field(default=0, init=False, eq=False)
+    _runs_trimmed: bool = field(default=False, init=False, eq=False)
+
+    @max_runs.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_max_runs(self, _: Attribute, max_runs: Optional[int]) -> None:
+        if max_runs is not None and max_runs < 1:
+            raise ValueError("max_runs must be at least 1")
 
     @lazy_property()
     def table(self) -> Table:
         return self.session.resource("dynamodb").Table(self.table_name)
 
+    @property
+    def stores_run_items(self) -> bool:
+        return self.sort_key is not None and isinstance(self.sort_key_value, str)
+
     def store(self, runs: list[Run], metadata: dict) -> None:
+        if self.max_runs is not None:
+            runs = runs[-self.max_runs :]
+
+        if self.stores_run_items:
+            self.__store_run_items(runs)
+
+            value = json.dumps({"metadata": metadata})
+        else:
+            value = json.dumps(self._to_params_dict(runs, metadata))
+
         self.table.update_item(
             Key=self._get_key(),
             UpdateExpression="set #attr = :value",
             ExpressionAttributeNames={"#attr": self.value_attribute_key},
             ExpressionAttributeValues={
-                ":value": json.dumps(self._to_params_dict(runs, metadata)),
+                ":value": value,
             },
         )
 
@@ -45,10 +90,114 @@ class AmazonDynamoDbConversationMemoryDriver(BaseConversationMemoryDriver):
         response = self.table.get_item(Key=self._get_key())
 
         if "Item" in response and self.value_attribute_key in response["Item"]:
-            memory_dict = json.loads(response["Item"][self.value_attribute_key])
-            return self._from_params_dict(memory_dict)
+            memory_dict = loads_json(response["Item"][self.value_attribute_key])
         else:
-            return [], {}
+            memory_dict = {}
+
+        if not self.stores_run_items or "runs" in memory_dict:
+            # The conversation is stored in a single item, with run items it's rewritten on the next store.
+            runs, metadata = self._from_params_dict(memory_dict)
+            self._stored_runs = None
+
+            return runs[-self.max_runs :] if self.max_runs is not None else runs, metadata
+        else:
+            return self.__load_run_items(), memory_dict.get("metadata", {})
+
+    def __store_run_items(self, runs: list[Run]) -> None:
+        dropped_count = (
+            self._count_dropped_runs([run_id for run_id, _ in self._stored_runs], runs)
+            if self._stored_runs is not None
+            else None
+        )
+
+        if dropped_count is None or self._stored_runs is None:
+            # The stored runs are unknown without a previous load, or don't match `runs`, so they're replaced.
+            kept_runs = []
+            stale_sort_keys = self.__query_run_sort_keys()
+            self._next_run_index = max(map(self.__run_index, stale_sort_keys), default=-1) + 1
+        else:
+            kept_runs = self._stored_runs[dropped_count:]
+            stale_sort_keys = [sort_key for _, sort_key in self._stored_runs[:dropped_count]]
+
+            if self._runs_trimmed:
+                # A load that only read the most recent runs left older runs behind, those are deleted too.
+                kept_sort_keys = {sort_key for _, sort_key in kept_runs}
+                stale_sort_keys = [key for key in self.__query_run_sort_keys() if key not in kept_sort_keys]
+
+        new_runs = runs[len(kept_runs) :]
+        new_sort_keys = [self.__run_sort_key(self._next_run_index + i) for i in range(len(new_runs))]
+
+        with self.table.batch_writer() as batch:
+            for sort_key in stale_sort_keys:
+                batch.delete_item(Key={self.partition_key: self.partition_key_value, str(self.sort_key): sort_key})
+
+            for run, sort_key in zip(new_runs, new_sort_keys):
+                batch.put_item(
+                    Item={
+                        self.partition_key: self.partition_key_value,
+                        str(self.sort_key): sort_key,
+                        self.value_attribute_key: json.dumps(run.to_dict()),
+                    }
+                )
+
+        self._stored_runs = [*kept_runs, *[(run.id, sort_key) for run, sort_key in zip(new_runs, new_sort_keys)]]
+        self._next_run_index += len(new_runs)
+        self._runs_trimmed = False
+
+    def __load_run_items(self) -> list[Run]:
+        from griptape.memory.structure import Run
+
+        items = self.__query_run_items(limit=self.max_runs)
+        items.reverse()
+        runs = [Run.from_dict(loads_json(item[self.value_attribute_key])) for item in items]
+
+        self._stored_runs = [(run.id, str(item[str(self.sort_key)])) for run, item in zip(runs, items)]
+        self._next_run_index = self.__run_index(self._stored_runs[-1][1]) + 1 if self._stored_runs else 0
+        self._runs_trimmed = self.max_runs is not None and len(items) >= self.max_runs
+
+        return runs
+
+    def __query_run_sort_keys(self) -> list[str]:
+        return [str(item[str(self.sort_key)]) for item in self.__query_run_items(projection=True)]
+
+    def __query_run_items(self, *, limit: Optional[int] = None, projection: bool = False) -> list[dict]:
+        # Queries run items newest first, so that the most recent runs can be read with a single page.
+        query_kwargs: dict[str, Any] = {
+            "KeyConditionExpression": "#pk = :pk AND begins_with(#sk, :prefix)",
+            "ExpressionAttributeNames": {"#pk": self.partition_key, "#sk": str(self.sort_key)},
+            "ExpressionAttributeValues": {
+                ":pk": self.partition_key_value,
+                ":prefix": self.__run_sort_key_prefix(),
+            },
+            "ScanIndexForward": False,
+        }
+
+        if projection:
+            query_kwargs["ProjectionExpression"] = "#sk"
+
+        items = []
+
+        while True:
+            if limit is not None:
+                query_kwargs["Limit"] = limit - len(items)
+
+            response = self.table.query(**query_kwargs)
+            items.extend(response["Items"])
+
+            if "LastEvaluatedKey" not in response or (limit is not None and len(items) >= limit):
+                return items
+
+            query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def __run_sort_key_prefix(self) -> str:
+        return f"{self.sort_key_value}{self.RUN_SORT_KEY_SEPARATOR}"
+
+    def __run_sort_key(self, index: int) -> str:
+        # Zero padded so that run items sort in the order they were stored.
+        return f"{self.__run_sort_key_prefix()}{index:012d}"
+
+    def __run_index(self, sort_key: str) -> int:
+        return int(sort_key.rsplit(self.RUN_SORT_KEY_SEPARATOR, 1)[1])
 
     def _get_key(self) -> dict[str, str | int]:
         key: dict[str, str | int] = {self.partition_key: self.partition_key_value}
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from griptape.mixins.serializable_mixin import SerializableMixin
 
@@ -23,3 +23,24 @@ class BaseConversationMemoryDriver(SerializableMixin, ABC):
         from griptape.memory.structure import Run
 
         return [Run.from_dict(run) for run in params_dict.get("runs", [])], params_dict.get("metadata", {})
+
+    def _count_dropped_runs(self, stored_run_ids: list[str], runs: list[Run]) -> Optional[int]:
+        """Counts the stored runs dropped from the start of the conversation.
+
+        Args:
+            stored_run_ids: Ids of the runs stored by the previous store or load.
+            runs: Runs to store.
+
+        Returns:
+            The number of stored runs to drop, or `None` if `runs` doesn't continue the stored runs and they must be
+                rewritten.
+        """
+        # Runs are only ever dropped from the start and appended to the end.
+        first_run_id = runs[0].id if runs else None
+        dropped_count = stored_run_ids.index(first_run_id) if first_run_id in stored_run_ids else len(stored_run_ids)
+        kept_count = len(stored_run_ids) - dropped_count
+
+        if [run.id for run in runs[:kept_count]] != stored_run_ids[dropped_count:]:
+            return None
+
+        return dropped_count
@@ -5,31 +5,272 @@ import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
-from attrs import define, field
+from attrs import Attribute, define, field
 
 from griptape.drivers import BaseConversationMemoryDriver
+from griptape.schemas.codec import loads_json
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from griptape.memory.structure import Run
 
 
 @define(kw_only=True)
 class LocalConversationMemoryDriver(BaseConversationMemoryDriver):
+    """Conversation Memory Driver that persists runs to the local file system.
+
+    Attributes:
+        persist_file: Optional JSON file to persist runs and metadata to. The whole file is rewritten on every store.
+        persist_dir: Optional directory to persist runs and metadata to using an append-only format: new runs are
+            appended to a JSON Lines log and metadata is written to a separate snapshot file when it changes.
+            Mutually exclusive with `persist_file`.
+        max_runs: Maximum number of most recent runs to keep in `persist_dir`. When set, only the tail of the log is
+            read on load and older runs are discarded on the next store.
+        compaction_threshold: Fraction of the `persist_dir` log taken up by discarded runs that triggers a compaction.
+    """
+
+    LOG_FILE_NAME = "runs.jsonl"
+    METADATA_FILE_NAME = "metadata.json"
+    READ_BLOCK_SIZE = 64 * 1024
+
     persist_file: Optional[str] = field(default=None, metadata={"serializable": True})
+    persist_dir: Optional[str] = field(default=None, metadata={"serializable": True})
+    max_runs: Optional[int] = field(default=None, metadata={"serializable": True})
+    compaction_threshold: float = field(default=0.5)
+    _log_runs: Optional[list[tuple[str, int]]] = field(default=None, init=False, eq=False)
+    _log_size: int = field(default=0, init=False, eq=False)
+    _log_metadata: Optional[str] = field(default=None, init=False, eq=False)
+    _log_trimmed: bool = field(default=False, init=False, eq=False)
+
+    @max_runs.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_max_runs(self, _: Attribute, max_runs: Optional[int]) -> None:
+        if max_runs is not None and max_runs < 1:
+            raise ValueError("max_runs must be at least 1")
+
+    def __attrs_post_init__(self) -> None:
+        if self.persist_file is not None and self.persist_dir is not None:
+            raise ValueError("Only one of persist_file and persist_dir can be set.")
 
     def store(self, runs: list[Run], metadata: dict[str, Any]) -> None:
         if self.persist_file is not None:
             Path(self.persist_file).write_text(json.dumps(self._to_params_dict(runs, metadata)))
 
+        if self.persist_dir is not None:
+            os.makedirs(self.persist_dir, exist_ok=True)
+
+            self.__store_log(runs[-self.max_runs :] if self.max_runs is not None else runs)
+            self.__store_metadata(metadata)
+
     def load(self) -> tuple[list[Run], dict[str, Any]]:
+        if self.persist_dir is not None:
+            try:
+                return self.__load_log(), self.__load_metadata()
+            except Exception as e:
+                raise ValueError(f"Unable to load data from {self.persist_dir}") from e
+
         if (
             self.persist_file is not None
             and os.path.exists(self.persist_file)
             and (loaded_str := Path(self.persist_file).read_text()) is not None
         ):
             try:
-                return self._from_params_dict(json.loads(loaded_str))
+                return self._from_params_dict(loads_json(loaded_str))
             except Exception as e:
                 raise ValueError(f"Unable to load data from {self.persist_file}") from e
 
         return [], {}
+
+    def compact(self, runs: list[Run]) -> None:
+        """Rewrites the `persist_dir` log so that it only contains the provided runs."""
+        if self.persist_dir is None:
+            return
+
+        log_path = self.__persist_path(self.LOG_FILE_NAME)
+        lines = [self.__run_record(run) for run in runs]
+
+        # The log is atomically replaced, so a crash leaves either the old or the new log intact.
+        with open(f"{log_path}.tmp", "wb") as file:
+            file.writelines(lines)
+
+        os.replace(f"{log_path}.tmp", log_path)
+
+        self._log_runs = [(run.id, len(line)) for run, line in zip(runs, lines)]
+        self._log_size = sum(len(line) for line in lines)
+        self._log_trimmed = False
+
+    def __store_log(self, runs: list[Run]) -> None:
+        if self._log_runs is None:
+            # Without a previous load, nothing is known about the log so it's replaced like `persist_file` is.
+            self.compact(runs)
+
+            return
+
+        dropped_count = self._count_dropped_runs([run_id for run_id, _ in self._log_runs], runs)
+
+        if dropped_count is None:
+            self.compact(runs)
+
+            return
+
+        kept_count = len(self._log_runs) - dropped_count
+
+        lines = []
+
+        # A tail read may have left older live runs in the log, those are discarded too.
+        if dropped_count > 0 or self._log_trimmed:
+            lines.append(self.__start_record(runs[0].id if kept_count > 0 else None))
+
+        new_runs = runs[kept_count:]
+        new_lines = [self.__run_record(run) for run in new_runs]
+        lines.extend(new_lines)
+
+        if lines:
+            with open(self.__persist_path(self.LOG_FILE_NAME), "ab") as file:
+                file.writelines(lines)
+
+        self._log_runs = [
+            *self._log_runs[dropped_count:],
+            *[(run.id, len(line)) for run, line in zip(new_runs, new_lines)],
+        ]
+        self._log_size += sum(len(line) for line in lines)
+        self._log_trimmed = False
+
+        dead_size = self._log_size - sum(size for _, size in self._log_runs)
+
+        if dead_size > 0 and dead_size >= self._log_size * self.compaction_threshold:
+            self.compact(runs)
+
+    def __store_metadata(self, metadata: dict[str, Any]) -> None:
+        metadata_json = json.dumps(metadata)
+
+        if metadata_json == self._log_metadata:
+            return
+
+        metadata_path = self.__persist_path(self.METADATA_FILE_NAME)
+
+        Path(f"{metadata_path}.tmp").write_text(metadata_json)
+        os.replace(f"{metadata_path}.tmp", metadata_path)
+
+        self._log_metadata = metadata_json
+
+    def __load_log(self) -> list[Run]:
+        from griptape.memory.structure import Run
+
+        log_path = self.__persist_path(self.LOG_FILE_NAME)
+
+        if not os.path.isfile(log_path):
+            self._log_runs = []
+            self._log_size = 0
+
+            return []
+
+        records = self.__read_run_records(log_path)
+
+        self._log_runs = [(record["run"]["id"], size) for record, size in records]
+        self._log_size = os.path.getsize(log_path)
+
+        return [Run.from_dict(record["run"]) for record, _ in records]
+
+    def __load_metadata(self) -> dict[str, Any]:
+        metadata_path = self.__persist_path(self.METADATA_FILE_NAME)
+
+        if not os.path.isfile(metadata_path):
+            return {}
+
+        self._log_metadata = Path(metadata_path).read_text()
+
+        return loads_json(self._log_metadata)
+
+    def __read_run_records(self, log_path: str) -> list[tuple[dict, int]]:
+        # Returns the live run records along with the size of their lines, in log order.
+        records: list[tuple[dict, int]] = []
+
+        if self.max_runs is None:
+            with open(log_path, "rb") as file:
+                for line in file:
+                    self.__apply_record(records, self.__parse_record(log_path, line), len(line))
+        else:
+            start_run_id = None
+            start_found = False
+            self._log_trimmed = True
+
+            # Reads the log backwards until enough runs are found or the start of the live runs is reached.
+            for line in self.__read_lines_reversed(log_path):
+                record = self.__parse_record(log_path, line)
+
+                if record["op"] == "start":
+                    if start_found:
+                        continue
+
+                    start_found = True
+                    start_run_id = record["run_id"]
+
+                    if start_run_id is None:
+                        self._log_trimmed = False
+
+                        break
+                elif record["op"] == "run":
+                    records.append((record, len(line)))
+
+                    if start_found and record["run"]["id"] == start_run_id:
+                        self._log_trimmed = False
+
+                        break
+
+                    if len(records) >= self.max_runs:
+                        break
+            else:
+                # The whole log was read, so no older live runs are left.
+                self._log_trimmed = False
+
+            records.reverse()
+
+        return records
+
+    def __apply_record(self, records: list[tuple[dict, int]], record: dict, size: int) -> None:
+        if record["op"] == "run":
+            records.append((record, size))
+        elif record["op"] == "start":
+            run_ids = [run_record["run"]["id"] for run_record, _ in records]
+            start_index = run_ids.index(record["run_id"]) if record["run_id"] is not None else len(records)
+
+            del records[:start_index]
+
+    def __parse_record(self, log_path: str, line: bytes) -> dict:
+        if not line.endswith(b"\n"):
+            # A partially written trailing record means the process crashed mid-append, drop it.
+            os.truncate(log_path, os.path.getsize(log_path) - len(line))
+
+            return {"op": "partial"}
+
+        return loads_json(line)
+
+    def __read_lines_reversed(self, log_path: str) -> Iterator[bytes]:
+        with open(log_path, "rb") as file:
+            position = file.seek(0, os.SEEK_END)
+            remainder = b""
+
+            while position > 0:
+                read_size = min(self.READ_BLOCK_SIZE, position)
+                position -= read_size
+                file.seek(position)
+
+                lines = (file.read(read_size) + remainder).splitlines(keepends=True)
+                # The first line may continue in the previous block.
+                remainder = lines.pop(0) if position > 0 else b""
+
+                yield from reversed(lines)
+
+            if remainder:
+                yield remainder
+
+    def __run_record(self, run: Run) -> bytes:
+        return json.dumps({"op": "run", "run": run.to_dict()}).encode() + b"\n"
+
+    def __start_record(self, run_id: Optional[str]) -> bytes:
+        # Marks every run before `run_id`, or before this record if `run_id` is `None`, as discarded.
+        return json.dumps({"op": "start", "run_id": run_id}).encode() + b"\n"
+
+    def __persist_path(self, file_name: str) -> str:
+        return os.path.join(str(self.persist_dir), file_name)
@@ -4,9 +4,10 @@ import json
 import uuid
 from typing import TYPE_CHECKING, Any, Optional
 
-from attrs import Factory, define, field
+from attrs import Attribute, Factory, define, field
 
 from griptape.drivers import BaseConversationMemoryDriver
+from griptape.schemas.codec import loads_json
 from griptape.utils import import_optional_dependency
 
 if TYPE_CHECKING:
@@ -19,9 +20,9 @@ if TYPE_CHECKING:
 class RedisConversationMemoryDriver(BaseConversationMemoryDriver):
     """A Conversation Memory Driver for Redis.
 
-    This driver interfaces with a Redis instance and utilizes the Redis hashes and RediSearch module to store,
-    retrieve, and query conversations in a structured manner.
-    Proper setup of the Redis instance and RediSearch is necessary for the driver to function correctly.
+    This driver interfaces with a Redis instance and stores each run of a conversation as an element of a Redis list,
+    so that storing a conversation only appends its new runs. The conversation's metadata is stored in a Redis hash.
+    Conversations stored as a single hash field by previous versions are still loaded and migrated on the next store.
 
     Attributes:
         host: The host of the Redis instance.
@@ -30,6 +31,8 @@ class RedisConversationMemoryDriver(BaseConversationMemoryDriver):
         password: The password of the Redis instance.
         index: The name of the index to use.
         conversation_id: The id of the conversation.
+        max_runs: Maximum number of most recent runs to keep. When set, only the most recent runs are read on load and
+            older runs are trimmed on store.
     """
 
     host: str = field(kw_only=True, metadata={"serializable": True})
@@ -38,6 +41,7 @@ class RedisConversationMemoryDriver(BaseConversationMemoryDriver):
     password: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": False})
     index: str = field(kw_only=True, metadata={"serializable": True})
     conversation_id: str = field(kw_only=True, default=uuid.uuid4().hex)
+    max_runs: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
 
     client: Redis = field(
         default=Factory(
@@ -52,11 +56,62 @@ class RedisConversationMemoryDriver(BaseConversationMemoryDriver):
         ),
     )
 
+    _stored_run_ids: Optional[list[str]] = field(default=None, init=False, eq=False)
+
+    @max_runs.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_max_runs(self, _: Attribute, max_runs: Optional[int]) -> None:
+        if max_runs is not None and max_runs < 1:
+            raise ValueError("max_runs must be at least 1")
+
+    @property
+    def runs_key(self) -> str:
+        return f"{self.index}:{self.conversation_id}:runs"
+
     def store(self, runs: list[Run], metadata: dict[str, Any]) -> None:
-        self.client.hset(self.index, self.conversation_id, json.dumps(self._to_params_dict(runs, metadata)))
+        if self.max_runs is not None:
+            runs = runs[-self.max_runs :]
+
+        dropped_count = (
+            self._count_dropped_runs(self._stored_run_ids, runs) if self._stored_run_ids is not None else None
+        )
+        pipeline = self.client.pipeline()
+
+        if dropped_count is None or self._stored_run_ids is None:
+            # The stored runs are unknown without a previous load, or don't match `runs`, so they're replaced.
+            pipeline.delete(self.runs_key)
+            new_runs = runs
+        else:
+            new_runs = runs[len(self._stored_run_ids) - dropped_count :]
+
+        if new_runs:
+            pipeline.rpush(self.runs_key, *[json.dumps(run.to_dict()) for run in new_runs])
+
+        if runs:
+            # Also trims runs left over by a load that only read the most recent runs.
+            pipeline.ltrim(self.runs_key, -len(runs), -1)
+        else:
+            pipeline.delete(self.runs_key)
+
+        pipeline.hset(self.index, self.conversation_id, json.dumps({"metadata": metadata}))
+        pipeline.execute()
+
+        self._stored_run_ids = [run.id for run in runs]
 
     def load(self) -> tuple[list[Run], dict[str, Any]]:
+        from griptape.memory.structure import Run
+
         memory_json = self.client.hget(self.index, self.conversation_id)
-        if memory_json is not None:
-            return self._from_params_dict(json.loads(memory_json))  # pyright: ignore[reportArgumentType] https://github.com/redis/redis-py/issues/2399
-        return [], {}
+        memory_dict = loads_json(memory_json) if memory_json is not None else {}  # pyright: ignore[reportArgumentType] https://github.com/redis/redis-py/issues/2399
+
+        if "runs" in memory_dict:
+            # The conversation was stored as a single hash field, it's rewritten as a list on the next store.
+            runs, metadata = self._from_params_dict(memory_dict)
+            self._stored_run_ids = None
+
+            return runs[-self.max_runs :] if self.max_runs is not None else runs, metadata
+
+        runs_json = self.client.lrange(self.runs_key, -self.max_runs if self.max_runs is not None else 0, -1)
+        runs = [Run.from_dict(loads_json(run_json)) for run_json in runs_json]  # pyright: ignore[reportGeneralTypeIssues]
+        self._stored_run_ids = [run.id for run in runs]
+
+        return runs, memory_dict.get("metadata", {})
@@ -27,5 +27,12 @@ class BaseObservabilityDriver(ABC):
     @abstractmethod
     def observe(self, call: Observable.Call) -> Any: ...
 
+    async def observe_async(self, call: Observable.Call) -> Any:
+        """Asynchronous version of `observe` for coroutine functions.
+
+        Drivers that record spans should override this method so that spans cover the awaited call.
+        """
+        return await call()
+
     @abstractmethod
     def get_span_id(self) -> Optional[str]: ...
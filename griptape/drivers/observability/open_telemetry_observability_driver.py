@@ -99,6 +99,27 @@ class OpenTelemetryObservabilityDriver(BaseObservabilityDriver):
                 span.record_exception(e)
                 raise e
 
+    async def observe_async(self, call: Observable.Call) -> Any:
+        open_telemetry_trace = import_optional_dependency("opentelemetry.trace")
+        func = call.func
+        instance = call.instance
+        tags = call.tags
+
+        class_name = f"{instance.__class__.__name__}." if instance else ""
+        span_name = f"{class_name}{func.__name__}()"
+        with self._tracer.start_as_current_span(span_name) as span:  # pyright: ignore[reportCallIssue]
+            if tags is not None:
+                span.set_attribute("tags", tags)
+
+            try:
+                result = await call()
+                span.set_status(open_telemetry_trace.Status(open_telemetry_trace.StatusCode.OK))
+                return result
+            except Exception as e:
+                span.set_status(open_telemetry_trace.Status(open_telemetry_trace.StatusCode.ERROR))
+                span.record_exception(e)
+                raise e
+
     def get_span_id(self) -> Optional[str]:
         opentelemetry_trace = import_optional_dependency("opentelemetry.trace")
         span = opentelemetry_trace.get_current_span()
@@ -37,10 +37,11 @@ from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
-    from anthropic import Client
-    from anthropic.types import ContentBlock, ContentBlockDeltaEvent, ContentBlockStartEvent
+    from anthropic import AsyncClient, Client
+    from anthropic.types import ContentBlock, ContentBlockDeltaEvent, ContentBlockStartEvent, RawMessageStreamEvent
+    from anthropic.types import Message as AnthropicMessage
 
     from griptape.tools.base_tool import BaseTool
 
@@ -56,6 +57,7 @@ class AnthropicPromptDriver(BasePromptDriver):
         api_key: Anthropic API key.
         model: Anthropic model name.
         client: Custom `Anthropic` client.
+        async_client: Custom `AsyncAnthropic` client used by `run_async`.
     """
 
     api_key: Optional[str] = field(kw_only=True, default=None, metadata={"serializable": False})
@@ -70,24 +72,25 @@ class AnthropicPromptDriver(BasePromptDriver):
     use_native_tools: bool = field(default=True, kw_only=True, metadata={"serializable": True})
     max_tokens: int = field(default=1000, kw_only=True, metadata={"serializable": True})
     _client: Client = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: AsyncClient = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> Client:
         return import_optional_dependency("anthropic").Anthropic(api_key=self.api_key)
 
+    @lazy_property()
+    def async_client(self) -> AsyncClient:
+        return import_optional_dependency("anthropic").AsyncAnthropic(api_key=self.api_key)
+
     @observable
     def try_run(self, prompt_stack: PromptStack) -> Message:
         params = self._base_params(prompt_stack)
         logger.debug(params)
         response = self.client.messages.create(**params)
 
-        logger.debug(response.model_dump())
-
-        return Message(
-            content=[self.__to_prompt_stack_message_content(content) for content in response.content],
-            role=Message.ASSISTANT_ROLE,
-            usage=Message.Usage(input_tokens=response.usage.input_tokens, output_tokens=response.usage.output_tokens),
-        )
+        return self.__to_message(response)
 
     @observable
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
@@ -96,13 +99,25 @@ class AnthropicPromptDriver(BasePromptDriver):
         events = self.client.messages.create(**params)
 
         for event in events:
-            logger.debug(event)
-            if event.type == "content_block_delta" or event.type == "content_block_start":
-                yield DeltaMessage(content=self.__to_prompt_stack_delta_message_content(event))
-            elif event.type == "message_start":
-                yield DeltaMessage(usage=DeltaMessage.Usage(input_tokens=event.message.usage.input_tokens))
-            elif event.type == "message_delta":
-                yield DeltaMessage(usage=DeltaMessage.Usage(output_tokens=event.usage.output_tokens))
+            if (message_delta := self.__to_delta_message(event)) is not None:
+                yield message_delta
+
+    @observable
+    async def try_run_async(self, prompt_stack: PromptStack) -> Message:
+        params = self._base_params(prompt_stack)
+        logger.debug(params)
+        response = await self.async_client.messages.create(**params)
+
+        return self.__to_message(response)
+
+    async def try_stream_async(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        params = {**self._base_params(prompt_stack), "stream": True}
+        logger.debug(params)
+        events = await self.async_client.messages.create(**params)
+
+        async for event in events:
+            if (message_delta := self.__to_delta_message(event)) is not None:
+                yield message_delta
 
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         messages = self.__to_anthropic_messages([i for i in prompt_stack.messages if not i.is_system()])
@@ -126,6 +141,26 @@ class AnthropicPromptDriver(BasePromptDriver):
             **({"system": system_message} if system_message else {}),
         }
 
+    def __to_message(self, response: AnthropicMessage) -> Message:
+        logger.debug(response.model_dump())
+
+        return Message(
+            content=[self.__to_prompt_stack_message_content(content) for content in response.content],
+            role=Message.ASSISTANT_ROLE,
+            usage=Message.Usage(input_tokens=response.usage.input_tokens, output_tokens=response.usage.output_tokens),
+        )
+
+    def __to_delta_message(self, event: RawMessageStreamEvent) -> Optional[DeltaMessage]:
+        logger.debug(event)
+        if event.type == "content_block_delta" or event.type == "content_block_start":
+            return DeltaMessage(content=self.__to_prompt_stack_delta_message_content(event))
+        elif event.type == "message_start":
+            return DeltaMessage(usage=DeltaMessage.Usage(input_tokens=event.message.usage.input_tokens))
+        elif event.type == "message_delta":
+            return DeltaMessage(usage=DeltaMessage.Usage(output_tokens=event.usage.output_tokens))
+        else:
+            return None
+
     def __to_anthropic_messages(self, messages: list[Message]) -> list[dict]:
         return [
             {"role": self.__to_anthropic_role(message), "content": self.__to_anthropic_content(message)}
@@ -23,6 +23,7 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
         azure_ad_token_provider: An optional Azure Active Directory token provider.
         api_version: An Azure OpenAi API version.
         client: An `openai.AzureOpenAI` client.
+        async_client: An `openai.AsyncAzureOpenAI` client used by `run_async`.
     """
 
     azure_deployment: str = field(
@@ -39,6 +40,9 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
     )
     api_version: str = field(default="2023-05-15", kw_only=True, metadata={"serializable": True})
     _client: openai.AzureOpenAI = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: openai.AsyncAzureOpenAI = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> openai.AzureOpenAI:
@@ -52,6 +56,18 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
             azure_ad_token_provider=self.azure_ad_token_provider,
         )
 
+    @lazy_property()
+    def async_client(self) -> openai.AsyncAzureOpenAI:
+        return openai.AsyncAzureOpenAI(
+            organization=self.organization,
+            api_key=self.api_key,
+            api_version=self.api_version,
+            azure_endpoint=self.azure_endpoint,
+            azure_deployment=self.azure_deployment,
+            azure_ad_token=self.azure_ad_token,
+            azure_ad_token_provider=self.azure_ad_token_provider,
+        )
+
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         params = super()._base_params(prompt_stack)
         # TODO: Add `seed` parameter once Azure supports it.
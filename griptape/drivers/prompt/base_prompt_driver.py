@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import functools
+import json
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+import attrs
 from attrs import Factory, define, field
 
 from griptape.common import (
@@ -16,14 +19,27 @@ from griptape.common import (
     TextMessageContent,
     observable,
 )
-from griptape.events import CompletionChunkEvent, EventBus, FinishPromptEvent, StartPromptEvent
+from griptape.events import (
+    CompletionChunkEvent,
+    EventBus,
+    FinishPromptEvent,
+    PromptCacheHitEvent,
+    PromptCacheMissEvent,
+    StartPromptEvent,
+)
 from griptape.mixins.exponential_backoff_mixin import ExponentialBackoffMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.schemas.codec import loads_json
+from griptape.utils.futures import iterate_in_executor, run_in_executor
+from griptape.utils.hash import str_to_hash
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
+    from griptape.drivers import BaseCacheDriver
+    from griptape.engines import SemanticCacheEngine
     from griptape.tokenizers import BaseTokenizer
+    from griptape.utils import RateLimiter
 
 
 @define(kw_only=True)
@@ -39,6 +55,17 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         tokenizer: An instance of `BaseTokenizer` to when calculating tokens.
         stream: Whether to stream the completion or not. `CompletionChunkEvent`s will be published to the `Structure` if one is provided.
         use_native_tools: Whether to use LLM's native function calling capabilities. Must be supported by the model.
+        cache_driver: Optional Cache Driver for reusing responses to previously run Prompt Stacks. Responses are keyed
+            by a hash of the Prompt Stack's messages and tools and the driver's serializable parameters, such as the
+            model and the temperature. Cached responses are replayed as `CompletionChunkEvent`s when streaming. Responses
+            from either cache report zero usage with `Message.Usage.cache_hit` set.
+        semantic_cache_engine: Optional Semantic Cache Engine for reusing text responses to similar prompts. The last
+            user message is compared to the last user messages of previous Prompt Stacks with the same system messages,
+            tools, and serializable parameters. Consulted after `cache_driver`. Prompt Stacks whose last message isn't
+            a text-only user message, such as action results, aren't cached.
+        rate_limiter: Optional Rate Limiter to wait on before each request, including retries. Share one from
+            `RateLimiterRegistry` between drivers that call the same provider and model. Tokens are estimated with
+            `tokenizer` from the Prompt Stack and `max_tokens`.
     """
 
     temperature: float = field(default=0.1, metadata={"serializable": True})
@@ -48,6 +75,10 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     tokenizer: BaseTokenizer
     stream: bool = field(default=False, kw_only=True, metadata={"serializable": True})
     use_native_tools: bool = field(default=False, kw_only=True, metadata={"serializable": True})
+    cache_driver: Optional[BaseCacheDriver] = field(default=None, kw_only=True)
+    semantic_cache_engine: Optional[SemanticCacheEngine] = field(default=None, kw_only=True)
+    rate_limiter: Optional[RateLimiter] = field(default=None, kw_only=True)
+    _cache_params: Optional[tuple[tuple, str]] = field(default=None, init=False, eq=False)
 
     def before_run(self, prompt_stack: PromptStack) -> None:
         EventBus.publish_event(StartPromptEvent(model=self.model, prompt_stack=prompt_stack))
@@ -64,13 +95,86 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
 
     @observable(tags=["PromptDriver.run()"])
     def run(self, prompt_stack: PromptStack) -> Message:
+        cache_key = self._get_cache_key(prompt_stack)
+        semantic_cache_key = self._get_semantic_cache_key(prompt_stack)
+        cached_result = self.__get_cached_result(cache_key)
+        semantic_cache_vector = None
+
+        if cached_result is None:
+            semantic_cache_vector = self.__get_semantic_cache_vector(semantic_cache_key)
+            cached_result = self.__get_semantic_cached_result(semantic_cache_key, semantic_cache_vector)
+
+        if cached_result is not None:
+            return self.__replay_result(prompt_stack, cached_result)
+
+        rate_limit_tokens = self._estimate_rate_limit_tokens(prompt_stack)
+
         for attempt in self.retrying():
             with attempt:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(rate_limit_tokens)
+
                 self.before_run(prompt_stack)
 
                 result = self.__process_stream(prompt_stack) if self.stream else self.__process_run(prompt_stack)
 
                 self.after_run(result)
+                self.__set_cached_result(cache_key, result)
+                self.__set_semantic_cached_result(semantic_cache_key, semantic_cache_vector, result)
+
+                return result
+        else:
+            raise Exception("prompt driver failed after all retry attempts")
+
+    @observable(tags=["PromptDriver.run_async()"])
+    async def run_async(self, prompt_stack: PromptStack) -> Message:
+        """Asynchronous version of `run`."""
+        cache_key = self._get_cache_key(prompt_stack)
+        semantic_cache_key = self._get_semantic_cache_key(prompt_stack)
+        # Cache Drivers may read from disk or the network, so they're called in the shared `io` pool.
+        cached_result = (
+            await run_in_executor(self.__get_cached_result, cache_key, executor_name="io")
+            if cache_key is not None
+            else None
+        )
+        semantic_cache_vector = None
+
+        if cached_result is None and semantic_cache_key is not None:
+            # Embedding the prompt calls the Embedding Driver, and the lookup calls the Vector Store Driver.
+            semantic_cache_vector = await run_in_executor(self.__get_semantic_cache_vector, semantic_cache_key)
+            cached_result = await run_in_executor(
+                self.__get_semantic_cached_result, semantic_cache_key, semantic_cache_vector, executor_name="io"
+            )
+
+        if cached_result is not None:
+            return self.__replay_result(prompt_stack, cached_result)
+
+        rate_limit_tokens = self._estimate_rate_limit_tokens(prompt_stack)
+
+        async for attempt in self.retrying_async():
+            with attempt:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(rate_limit_tokens)
+
+                self.before_run(prompt_stack)
+
+                result = (
+                    await self.__process_stream_async(prompt_stack)
+                    if self.stream
+                    else await self.try_run_async(prompt_stack)
+                )
+
+                self.after_run(result)
+                if cache_key is not None:
+                    await run_in_executor(self.__set_cached_result, cache_key, result, executor_name="io")
+                if semantic_cache_key is not None:
+                    await run_in_executor(
+                        self.__set_semantic_cached_result,
+                        semantic_cache_key,
+                        semantic_cache_vector,
+                        result,
+                        executor_name="io",
+                    )
 
                 return result
         else:
@@ -108,6 +212,198 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     @abstractmethod
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]: ...
 
+    @observable
+    async def try_run_async(self, prompt_stack: PromptStack) -> Message:
+        """Asynchronous version of `try_run`.
+
+        Drivers with an asynchronous client should override this method. By default, `try_run` runs in the shared
+        `llm` pool of `FuturesExecutorRegistry`.
+        """
+        return await run_in_executor(self.try_run, prompt_stack)
+
+    async def try_stream_async(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        """Asynchronous version of `try_stream`.
+
+        Drivers with an asynchronous client should override this method. By default, `try_stream` is iterated in the
+        shared `llm` pool of `FuturesExecutorRegistry`.
+        """
+        async for message_delta in iterate_in_executor(self.try_stream(prompt_stack)):
+            yield message_delta
+
+    def _estimate_rate_limit_tokens(self, prompt_stack: PromptStack) -> int:
+        """Estimates the tokens that `rate_limiter` counts for a request, or 0 if it doesn't limit tokens.
+
+        Providers count the requested `max_tokens` towards their limits before the response is generated.
+        """
+        if self.rate_limiter is None or self.rate_limiter.tokens_per_minute is None:
+            return 0
+
+        return self.tokenizer.count_tokens(self.prompt_stack_to_string(prompt_stack)) + (self.max_tokens or 0)
+
+    def _get_cache_key(self, prompt_stack: PromptStack) -> Optional[str]:
+        """Builds the `cache_driver` key of a Prompt Stack, or `None` if there is no `cache_driver`.
+
+        Artifact ids and message usage are left out, so that Prompt Stacks with the same content share a key.
+        Whether the driver streams is left out too, so that streamed and non-streamed responses are reused.
+        """
+        if self.cache_driver is None:
+            return None
+
+        messages = self.__get_cache_messages(prompt_stack.messages)
+
+        return f"{self.model}:{str_to_hash(self.__get_cache_scope(prompt_stack, messages))}"
+
+    def _get_semantic_cache_key(self, prompt_stack: PromptStack) -> Optional[tuple[str, str]]:
+        """Builds the `semantic_cache_engine` namespace and prompt of a Prompt Stack.
+
+        Returns `None` if there is no `semantic_cache_engine` or if the last message isn't a text-only user message.
+        The namespace is scoped by the system messages, the tools, and the driver's parameters, like `_get_cache_key`.
+        """
+        if self.semantic_cache_engine is None or not prompt_stack.messages:
+            return None
+
+        message = prompt_stack.messages[-1]
+
+        if not message.is_user() or not message.is_text():
+            return None
+
+        system_messages = self.__get_cache_messages([m for m in prompt_stack.messages if m.is_system()])
+        namespace = self.semantic_cache_engine.get_namespace(self.__get_cache_scope(prompt_stack, system_messages))
+
+        return namespace, message.to_text()
+
+    def __get_cache_messages(self, messages: list[Message]) -> list[dict]:
+        return [
+            {key: value for key, value in message.items() if key != "usage"}
+            for message in _strip_artifact_ids([message.to_dict() for message in messages])
+        ]
+
+    def __get_cache_scope(self, prompt_stack: PromptStack, messages: list[dict]) -> str:
+        tools = [
+            [activity_schema.json_schema(tool.name) for activity_schema in tool.activity_schemas()]
+            for tool in prompt_stack.tools
+        ]
+
+        return self.__get_cache_params() + json.dumps([messages, tools], sort_keys=True, default=str)
+
+    def __get_cache_params(self) -> str:
+        # The driver's parameters are only serialized again when one of them is reassigned.
+        values = tuple(getattr(self, name) for name in _get_serializable_field_names(type(self)))
+
+        if self._cache_params is None or self._cache_params[0] != values:
+            params = {key: value for key, value in self.to_dict().items() if key != "stream"}
+            self._cache_params = (values, json.dumps(params, sort_keys=True, default=str))
+
+        return self._cache_params[1]
+
+    def __get_cached_result(self, cache_key: Optional[str]) -> Optional[Message]:
+        if self.cache_driver is None or cache_key is None:
+            return None
+
+        value = self.cache_driver.get(cache_key)
+
+        if value is None:
+            EventBus.publish_event(PromptCacheMissEvent(model=self.model, cache_key=cache_key))
+
+            return None
+
+        EventBus.publish_event(PromptCacheHitEvent(model=self.model, cache_key=cache_key))
+
+        result = Message.from_dict(loads_json(value))
+        result.usage = Message.Usage(input_tokens=0, output_tokens=0, cache_hit=True)
+
+        return result
+
+    def __set_cached_result(self, cache_key: Optional[str], result: Message) -> None:
+        if self.cache_driver is None or cache_key is None:
+            return
+
+        # Artifact ids are left out so that every replay of the result gets new ones.
+        self.cache_driver.set(cache_key, json.dumps(_strip_artifact_ids(result.to_dict())).encode())
+
+    def __get_semantic_cache_vector(self, semantic_cache_key: Optional[tuple[str, str]]) -> Optional[list[float]]:
+        # The prompt is embedded once, for both the query and the upsert on a miss.
+        if self.semantic_cache_engine is None or semantic_cache_key is None:
+            return None
+
+        return self.semantic_cache_engine.embed(semantic_cache_key[1])
+
+    def __get_semantic_cached_result(
+        self, semantic_cache_key: Optional[tuple[str, str]], vector: Optional[list[float]]
+    ) -> Optional[Message]:
+        if self.semantic_cache_engine is None or semantic_cache_key is None:
+            return None
+
+        namespace, prompt = semantic_cache_key
+        entry = self.semantic_cache_engine.query(prompt, namespace=namespace, vector=vector)
+
+        if entry is None:
+            EventBus.publish_event(
+                PromptCacheMissEvent(
+                    model=self.model,
+                    cache_key=self.semantic_cache_engine.get_vector_id(prompt, namespace=namespace),
+                )
+            )
+
+            return None
+
+        EventBus.publish_event(PromptCacheHitEvent(model=self.model, cache_key=entry.id))
+
+        return Message(
+            entry.meta["response"],
+            role=Message.ASSISTANT_ROLE,
+            usage=Message.Usage(input_tokens=0, output_tokens=0, cache_hit=True),
+        )
+
+    def __set_semantic_cached_result(
+        self, semantic_cache_key: Optional[tuple[str, str]], vector: Optional[list[float]], result: Message
+    ) -> None:
+        if self.semantic_cache_engine is None or semantic_cache_key is None:
+            return
+
+        # Only text responses are reused, since action calls depend on more than the last user message.
+        if not result.content or not result.is_text():
+            return
+
+        namespace, prompt = semantic_cache_key
+        self.semantic_cache_engine.upsert(prompt, result.to_text(), namespace=namespace, vector=vector)
+
+    def __replay_result(self, prompt_stack: PromptStack, result: Message) -> Message:
+        self.before_run(prompt_stack)
+
+        if self.stream:
+            for message_delta in self._to_message_deltas(result):
+                self.__add_message_delta(message_delta, {})
+
+        self.after_run(result)
+
+        return result
+
+    def _to_message_deltas(self, message: Message) -> list[DeltaMessage]:
+        message_deltas = []
+
+        for index, content in enumerate(message.content):
+            if isinstance(content, TextMessageContent):
+                message_deltas.append(
+                    DeltaMessage(content=TextDeltaMessageContent(content.artifact.to_text(), index=index))
+                )
+            elif isinstance(content, ActionCallMessageContent):
+                action = content.artifact.value
+                message_deltas.extend(
+                    [
+                        DeltaMessage(
+                            content=ActionCallDeltaMessageContent(
+                                tag=action.tag, name=action.name, path=action.path, index=index
+                            )
+                        ),
+                        DeltaMessage(
+                            content=ActionCallDeltaMessageContent(partial_input=json.dumps(action.input), index=index)
+                        ),
+                    ]
+                )
+
+        return message_deltas
+
     def __process_run(self, prompt_stack: PromptStack) -> Message:
         return self.try_run(prompt_stack)
 
@@ -118,25 +414,40 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         # Aggregate all content deltas from the stream
         message_deltas = self.try_stream(prompt_stack)
         for message_delta in message_deltas:
-            usage += message_delta.usage
-            content = message_delta.content
-
-            if content is not None:
-                if content.index in delta_contents:
-                    delta_contents[content.index].append(content)
-                else:
-                    delta_contents[content.index] = [content]
-                if isinstance(content, TextDeltaMessageContent):
-                    EventBus.publish_event(CompletionChunkEvent(token=content.text))
-                elif isinstance(content, ActionCallDeltaMessageContent):
-                    if content.tag is not None and content.name is not None and content.path is not None:
-                        EventBus.publish_event(CompletionChunkEvent(token=str(content)))
-                    elif content.partial_input is not None:
-                        EventBus.publish_event(CompletionChunkEvent(token=content.partial_input))
+            usage += self.__add_message_delta(message_delta, delta_contents)
 
         # Build a complete content from the content deltas
         return self.__build_message(list(delta_contents.values()), usage)
 
+    async def __process_stream_async(self, prompt_stack: PromptStack) -> Message:
+        delta_contents: dict[int, list[BaseDeltaMessageContent]] = {}
+        usage = DeltaMessage.Usage()
+
+        async for message_delta in self.try_stream_async(prompt_stack):
+            usage += self.__add_message_delta(message_delta, delta_contents)
+
+        return self.__build_message(list(delta_contents.values()), usage)
+
+    def __add_message_delta(
+        self, message_delta: DeltaMessage, delta_contents: dict[int, list[BaseDeltaMessageContent]]
+    ) -> DeltaMessage.Usage:
+        content = message_delta.content
+
+        if content is not None:
+            if content.index in delta_contents:
+                delta_contents[content.index].append(content)
+            else:
+                delta_contents[content.index] = [content]
+            if isinstance(content, TextDeltaMessageContent):
+                EventBus.publish_event(CompletionChunkEvent(token=content.text))
+            elif isinstance(content, ActionCallDeltaMessageContent):
+                if content.tag is not None and content.name is not None and content.path is not None:
+                    EventBus.publish_event(CompletionChunkEvent(token=str(content)))
+                elif content.partial_input is not None:
+                    EventBus.publish_event(CompletionChunkEvent(token=content.partial_input))
+
+        return message_delta.usage
+
     def __build_message(
         self, delta_contents: list[list[BaseDeltaMessageContent]], usage: DeltaMessage.Usage
     ) -> Message:
@@ -155,3 +466,23 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
             role=Message.ASSISTANT_ROLE,
             usage=Message.Usage(input_tokens=usage.input_tokens, output_tokens=usage.output_tokens),
         )
+
+
+@functools.lru_cache
+def _get_serializable_field_names(cls: type) -> tuple[str, ...]:
+    return tuple(a.name for a in attrs.fields(cls) if a.metadata.get("serializable"))
+
+
+def _strip_artifact_ids(value: Any) -> Any:
+    if isinstance(value, dict):
+        if str(value.get("type", "")).endswith("Artifact") and "id" in value:
+            # Artifact names default to their ids.
+            value = {
+                key: item for key, item in value.items() if key != "id" and not (key == "name" and item == value["id"])
+            }
+
+        return {key: _strip_artifact_ids(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [_strip_artifact_ids(item) for item in value]
+    else:
+        return value
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+from collections import deque
+from concurrent import futures
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from attrs import Attribute, Factory, define, field
+
+from griptape.common import DeltaMessage, observable
+from griptape.drivers import BasePromptDriver
+from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
+from griptape.utils.futures import SharedFuturesExecutor
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Iterator
+
+    from griptape.common import Message, PromptStack
+    from griptape.tokenizers import BaseTokenizer
+
+
+@define
+class HedgedPromptDriver(BasePromptDriver, FuturesExecutorMixin):
+    """Prompt Driver that sends a Prompt Stack to an ordered list of Prompt Drivers to cut tail latency.
+
+    The first driver is sent the request. If it hasn't responded within the `hedge_percentile` of its recent
+    latencies, a duplicate request is sent to the next driver. If a request fails or exceeds `timeout`, the next driver
+    is sent the request right away. The first complete response wins and the requests that are still pending are
+    cancelled. Asynchronous requests are cancelled, while synchronous requests that already started are left to
+    finish in the background and their responses are discarded.
+
+    Requests are sent with each driver's `try_run` and its own parameters, such as its model, so that this driver's
+    retries, caches, and Rate Limiter apply to the hedged request as a whole. Streaming hedges whole responses and
+    streams the winning one once it's complete.
+
+    Synchronous requests are sent in the shared `llm` pool by default. They are never run inline on the calling thread
+    when the pool is saturated, since that would block `try_run` on a single request and skip hedging and `timeout`.
+
+    Attributes:
+        prompt_drivers: Prompt Drivers to send requests to, in order of preference.
+        hedge_percentile: Percentile of a driver's recent latencies after which a hedged request is sent to the next
+            driver.
+        hedge_delay: Seconds to wait before sending a hedged request while a driver has fewer than
+            `min_latency_samples` latencies. `None` disables hedging, so that the next driver is only sent the request
+            when a request fails or times out.
+        min_latency_samples: Number of latencies a driver needs before `hedge_percentile` is used instead of
+            `hedge_delay`.
+        latency_window: Number of most recent latencies kept per driver.
+        timeout: Optional number of seconds after which a request is abandoned and the next driver is sent the request.
+        latency_histograms: Recent latencies of each driver in `prompt_drivers`, including responses that lost.
+        futures_executor_name: Name of the shared pool to send synchronous requests in.
+    """
+
+    prompt_drivers: list[BasePromptDriver] = field(kw_only=True)
+    hedge_percentile: float = field(default=95, kw_only=True, metadata={"serializable": True})
+    hedge_delay: Optional[float] = field(default=1.0, kw_only=True, metadata={"serializable": True})
+    min_latency_samples: int = field(default=20, kw_only=True, metadata={"serializable": True})
+    latency_window: int = field(default=100, kw_only=True, metadata={"serializable": True})
+    timeout: Optional[float] = field(default=None, kw_only=True, metadata={"serializable": True})
+    model: str = field(
+        default=Factory(lambda self: self.prompt_drivers[0].model if self.prompt_drivers else None, takes_self=True),
+        kw_only=True,
+        metadata={"serializable": True},
+    )
+    tokenizer: BaseTokenizer = field(
+        default=Factory(
+            lambda self: self.prompt_drivers[0].tokenizer if self.prompt_drivers else None, takes_self=True
+        ),
+        kw_only=True,
+    )
+    max_attempts: int = field(default=1, kw_only=True)
+    futures_executor_name: str = field(default="llm", kw_only=True)
+    latency_histograms: list[HedgedPromptDriver.LatencyHistogram] = field(
+        default=Factory(
+            lambda self: [HedgedPromptDriver.LatencyHistogram(window=self.latency_window) for _ in self.prompt_drivers],
+            takes_self=True,
+        ),
+        init=False,
+        eq=False,
+    )
+
+    @define
+    class LatencyHistogram:
+        """Sliding window of a Prompt Driver's most recent latencies.
+
+        Attributes:
+            window: Number of most recent latencies to keep.
+        """
+
+        window: int = field(kw_only=True)
+        _latencies: deque[float] = field(
+            default=Factory(lambda self: deque(maxlen=self.window), takes_self=True), init=False, eq=False
+        )
+        _thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False, eq=False)
+
+        @property
+        def count(self) -> int:
+            return len(self._latencies)
+
+        def record(self, latency: float) -> None:
+            with self._thread_lock:
+                self._latencies.append(latency)
+
+        def percentile(self, percentile: float) -> Optional[float]:
+            """Returns the percentile of the recorded latencies in seconds, or `None` if there are none."""
+            with self._thread_lock:
+                latencies = list(self._latencies)
+
+            return float(np.percentile(latencies, percentile)) if latencies else None
+
+    @prompt_drivers.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_prompt_drivers(self, _: Attribute, prompt_drivers: list[BasePromptDriver]) -> None:
+        if not prompt_drivers:
+            raise ValueError("prompt_drivers must not be empty")
+
+    @hedge_percentile.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_hedge_percentile(self, _: Attribute, hedge_percentile: float) -> None:
+        if not 0 <= hedge_percentile <= 100:
+            raise ValueError("hedge_percentile must be between 0 and 100")
+
+    @latency_window.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_latency_window(self, _: Attribute, latency_window: int) -> None:
+        if latency_window < 1:
+            raise ValueError("latency_window must be at least 1")
+
+    def get_hedge_delay(self, index: int) -> Optional[float]:
+        """Returns the seconds to wait for `prompt_drivers[index]` before sending a hedged request to the next one.
+
+        Returns `None` if no hedged request should be sent.
+        """
+        if self.hedge_delay is None or index >= len(self.prompt_drivers) - 1:
+            return None
+
+        histogram = self.latency_histograms[index]
+
+        if histogram.count < self.min_latency_samples:
+            return self.hedge_delay
+
+        return histogram.percentile(self.hedge_percentile)
+
+    @observable
+    def try_run(self, prompt_stack: PromptStack) -> Message:
+        pending: dict[futures.Future, tuple[int, float]] = {}
+        next_index = 0
+        next_at = time.monotonic()
+        error: Optional[BaseException] = None
+
+        while True:
+            now = time.monotonic()
+
+            if next_index < len(self.prompt_drivers) and now >= next_at:
+                pending[self.__submit(next_index, prompt_stack)] = (next_index, now)
+                next_at = self.__get_next_at(next_index, now)
+                next_index += 1
+
+            if not pending:
+                raise error if error is not None else RuntimeError("Every Prompt Driver failed.")
+
+            done, _ = futures.wait(
+                pending,
+                timeout=self.__get_wait_timeout(pending.values(), next_index, next_at),
+                return_when=futures.FIRST_COMPLETED,
+            )
+
+            for future in done:
+                pending.pop(future)
+
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+
+                    return future.result()
+
+                error = future.exception()
+                # Fails over to the next driver right away.
+                next_at = time.monotonic()
+
+            for future, (_, started_at) in list(pending.items()):
+                if self.timeout is not None and time.monotonic() - started_at >= self.timeout:
+                    future.cancel()
+                    pending.pop(future)
+                    error = TimeoutError(f"Prompt Driver timed out after {self.timeout}s.")
+                    next_at = time.monotonic()
+
+    @observable
+    async def try_run_async(self, prompt_stack: PromptStack) -> Message:
+        pending: dict[asyncio.Task, tuple[int, float]] = {}
+        next_index = 0
+        next_at = time.monotonic()
+        error: Optional[BaseException] = None
+
+        try:
+            while True:
+                now = time.monotonic()
+
+                if next_index < len(self.prompt_drivers) and now >= next_at:
+                    task = asyncio.ensure_future(self.__run_async(next_index, prompt_stack))
+                    pending[task] = (next_index, now)
+                    next_at = self.__get_next_at(next_index, now)
+                    next_index += 1
+
+                if not pending:
+                    raise error if error is not None else RuntimeError("Every Prompt Driver failed.")
+
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self.__get_wait_timeout(pending.values(), next_index, next_at),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in done:
+                    pending.pop(task)
+
+                    if task.exception() is None:
+                        return task.result()
+
+                    error = task.exception()
+                    next_at = time.monotonic()
+
+                for task, (_, started_at) in list(pending.items()):
+                    if self.timeout is not None and time.monotonic() - started_at >= self.timeout:
+                        task.cancel()
+                        pending.pop(task)
+                        error = TimeoutError(f"Prompt Driver timed out after {self.timeout}s.")
+                        next_at = time.monotonic()
+        finally:
+            # Cancels the requests that lost, or every request if this one was cancelled.
+            for task in pending:
+                task.cancel()
+
+    @observable
+    def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
+        # Responses are hedged as a whole, so the winning response is streamed once it's complete.
+        yield from self.__to_stream(self.try_run(prompt_stack))
+
+    async def try_stream_async(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        for message_delta in self.__to_stream(await self.try_run_async(prompt_stack)):
+            yield message_delta
+
+    def __submit(self, index: int, prompt_stack: PromptStack) -> futures.Future:
+        executor = self.futures_executor
+        started_at = time.monotonic()
+
+        if isinstance(executor, SharedFuturesExecutor):
+            future = executor.submit_concurrently(self.prompt_drivers[index].try_run, prompt_stack)
+        else:
+            future = executor.submit(self.prompt_drivers[index].try_run, prompt_stack)
+
+        # Latencies of responses that lose are recorded too, so that slow drivers raise their hedge delay. The callback
+        # doesn't reference this driver, so that requests that lost don't keep it alive after `try_run` returns.
+        future.add_done_callback(functools.partial(self.__record_latency, self.latency_histograms[index], started_at))
+
+        return future
+
+    async def __run_async(self, index: int, prompt_stack: PromptStack) -> Message:
+        started_at = time.monotonic()
+        result = await self.prompt_drivers[index].try_run_async(prompt_stack)
+
+        self.latency_histograms[index].record(time.monotonic() - started_at)
+
+        return result
+
+    @staticmethod
+    def __record_latency(
+        histogram: HedgedPromptDriver.LatencyHistogram, started_at: float, future: futures.Future
+    ) -> None:
+        if not future.cancelled() and future.exception() is None:
+            histogram.record(time.monotonic() - started_at)
+
+    def __get_next_at(self, index: int, started_at: float) -> float:
+        hedge_delay = self.get_hedge_delay(index)
+
+        return float("inf") if hedge_delay is None else started_at + hedge_delay
+
+    def __get_wait_timeout(
+        self, pending: Iterable[tuple[int, float]], next_index: int, next_at: float
+    ) -> Optional[float]:
+        deadlines = [started_at + self.timeout for _, started_at in pending] if self.timeout is not None else []
+
+        if next_index < len(self.prompt_drivers):
+            deadlines.append(next_at)
+
+        deadlines = [deadline for deadline in deadlines if deadline != float("inf")]
+
+        return max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+
+    def __to_stream(self, message: Message) -> list[DeltaMessage]:
+        return [
+            *self._to_message_deltas(message),
+            DeltaMessage(
+                usage=DeltaMessage.Usage(
+                    input_tokens=message.usage.input_tokens, output_tokens=message.usage.output_tokens
+                )
+            ),
+        ]
@@ -30,9 +30,10 @@ from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
-    from openai.types.chat.chat_completion_chunk import ChoiceDelta
+    from openai.types.chat.chat_completion import ChatCompletion
+    from openai.types.chat.chat_completion_chunk import ChatCompletionChunk, ChoiceDelta
     from openai.types.chat.chat_completion_message import ChatCompletionMessage
 
     from griptape.tools import BaseTool
@@ -50,6 +51,7 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         api_key: An optional OpenAi API key. If not provided, the `OPENAI_API_KEY` environment variable will be used.
         organization: An optional OpenAI organization. If not provided, the `OPENAI_ORG_ID` environment variable will be used.
         client: An `openai.OpenAI` client.
+        async_client: An `openai.AsyncOpenAI` client used by `run_async`.
         model: An OpenAI model name.
         tokenizer: An `OpenAiTokenizer`.
         user: A user id. Can be used to track requests by user.
@@ -89,6 +91,9 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         kw_only=True,
     )
     _client: openai.OpenAI = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
+    _async_client: openai.AsyncOpenAI = field(
+        default=None, kw_only=True, alias="async_client", metadata={"serializable": False}
+    )
 
     @lazy_property()
     def client(self) -> openai.OpenAI:
@@ -98,26 +103,21 @@ class OpenAiChatPromptDriver(BasePromptDriver):
             organization=self.organization,
         )
 
+    @lazy_property()
+    def async_client(self) -> openai.AsyncOpenAI:
+        return openai.AsyncOpenAI(
+            base_url=self.base_url,
+            api_key=self.api_key,
+            organization=self.organization,
+        )
+
     @observable
     def try_run(self, prompt_stack: PromptStack) -> Message:
         params = self._base_params(prompt_stack)
         logger.debug(params)
         result = self.client.chat.completions.create(**params)
 
-        logger.debug(result.model_dump())
-        if len(result.choices) == 1:
-            message = result.choices[0].message
-
-            return Message(
-                content=self.__to_prompt_stack_message_content(message),
-                role=Message.ASSISTANT_ROLE,
-                usage=Message.Usage(
-                    input_tokens=result.usage.prompt_tokens,
-                    output_tokens=result.usage.completion_tokens,
-                ),
-            )
-        else:
-            raise Exception("Completion with more than one choice is not supported yet.")
+        return self.__to_message(result)
 
     @observable
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
@@ -126,19 +126,24 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         result = self.client.chat.completions.create(**params, stream=True)
 
         for chunk in result:
-            logger.debug(chunk.model_dump())
-            if chunk.usage is not None:
-                yield DeltaMessage(
-                    usage=DeltaMessage.Usage(
-                        input_tokens=chunk.usage.prompt_tokens,
-                        output_tokens=chunk.usage.completion_tokens,
-                    ),
-                )
-            if chunk.choices:
-                choice = chunk.choices[0]
-                delta = choice.delta
+            yield from self.__to_delta_messages(chunk)
 
-                yield DeltaMessage(content=self.__to_prompt_stack_delta_message_content(delta))
+    @observable
+    async def try_run_async(self, prompt_stack: PromptStack) -> Message:
+        params = self._base_params(prompt_stack)
+        logger.debug(params)
+        result = await self.async_client.chat.completions.create(**params)
+
+        return self.__to_message(result)
+
+    async def try_stream_async(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        params = self._base_params(prompt_stack)
+        logger.debug({"stream": True, **params})
+        result = await self.async_client.chat.completions.create(**params, stream=True)
+
+        async for chunk in result:
+            for message_delta in self.__to_delta_messages(chunk):
+                yield message_delta
 
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         params = {
@@ -170,6 +175,37 @@ class OpenAiChatPromptDriver(BasePromptDriver):
 
         return params
 
+    def __to_message(self, result: ChatCompletion) -> Message:
+        logger.debug(result.model_dump())
+        if len(result.choices) == 1:
+            message = result.choices[0].message
+
+            return Message(
+                content=self.__to_prompt_stack_message_content(message),
+                role=Message.ASSISTANT_ROLE,
+                usage=Message.Usage(
+                    input_tokens=result.usage.prompt_tokens,
+                    output_tokens=result.usage.completion_tokens,
+                ),
+            )
+        else:
+            raise Exception("Completion with more than one choice is not supported yet.")
+
+    def __to_delta_messages(self, chunk: ChatCompletionChunk) -> Iterator[DeltaMessage]:
+        logger.debug(chunk.model_dump())
+        if chunk.usage is not None:
+            yield DeltaMessage(
+                usage=DeltaMessage.Usage(
+                    input_tokens=chunk.usage.prompt_tokens,
+                    output_tokens=chunk.usage.completion_tokens,
+                ),
+            )
+        if chunk.choices:
+            choice = chunk.choices[0]
+            delta = choice.delta
+
+            yield DeltaMessage(content=self.__to_prompt_stack_delta_message_content(delta))
+
     def __to_openai_messages(self, messages: list[Message]) -> list[dict]:
         openai_messages = []
 
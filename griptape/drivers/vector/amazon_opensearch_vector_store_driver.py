@@ -58,3 +58,10 @@ class AmazonOpenSearchVectorStoreDriver(OpenSearchVectorStoreDriver):
             response = self.client.index(index=self.index_name, id=vector_id, body=doc)
 
         return response["_id"]
+
+    def _get_bulk_index_action(self, vector_id: str) -> dict:
+        # OpenSearch Serverless does not support custom document ids.
+        if self.service == "aoss":
+            return {"_index": self.index_name}
+        else:
+            return super()._get_bulk_index_action(vector_id)
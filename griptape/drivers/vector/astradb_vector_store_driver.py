@@ -58,7 +58,7 @@ class AstraDbVectorStoreDriver(BaseVectorStoreDriver):
             self.api_endpoint, token=self.token, namespace=self.astra_db_namespace
         ).get_collection(self.collection_name)
 
-    def delete_vector(self, vector_id: str) -> None:
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> None:
         """Delete a vector from Astra DB store.
 
         The method succeeds regardless of whether a vector with the provided ID
@@ -66,6 +66,7 @@ class AstraDbVectorStoreDriver(BaseVectorStoreDriver):
 
         Args:
             vector_id: ID of the vector to delete.
+            namespace: Unused, vector IDs are unique across namespaces.
         """
         self.collection.delete_one({"_id": vector_id})
 
@@ -147,12 +148,30 @@ class AstraDbVectorStoreDriver(BaseVectorStoreDriver):
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Embeds the query string with the Embedding Driver and searches like `query_vector`."""
+        return self.query_vector(
+            self.embedding_driver.embed_string(query),
+            count=count,
+            namespace=namespace,
+            include_vectors=include_vectors,
+            **kwargs,
+        )
+
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
         **kwargs: Any,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        """Run a similarity search on the Astra DB store, based on a query string.
+        """Run a similarity search on the Astra DB store, based on a query vector.
 
         Args:
-            query: the query string.
+            vector: the query vector.
             count: the maximum number of results to return. If omitted, defaults will apply.
             namespace: the namespace to filter results by.
             include_vectors: whether to include vector data in the results.
@@ -168,7 +187,6 @@ class AstraDbVectorStoreDriver(BaseVectorStoreDriver):
         find_filter_ns: dict[str, Any] = {} if namespace is None else {"namespace": namespace}
         find_filter = {**(query_filter or {}), **find_filter_ns}
         find_projection: Optional[dict[str, int]] = {"*": 1} if include_vectors else None
-        vector = self.embedding_driver.embed_string(query)
         ann_limit = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
         matches = self.collection.find(
             filter=find_filter,
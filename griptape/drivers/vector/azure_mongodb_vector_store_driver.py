@@ -11,9 +11,9 @@ from griptape.drivers import BaseVectorStoreDriver, MongoDbAtlasVectorStoreDrive
 class AzureMongoDbVectorStoreDriver(MongoDbAtlasVectorStoreDriver):
     """A Vector Store Driver for CosmosDB with MongoDB vCore API."""
 
-    def query(
+    def query_vector(
         self,
-        query: str,
+        vector: list[float],
         *,
         count: Optional[int] = None,
         namespace: Optional[str] = None,
@@ -21,15 +21,12 @@ class AzureMongoDbVectorStoreDriver(MongoDbAtlasVectorStoreDriver):
         offset: Optional[int] = None,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        """Queries the MongoDB collection for documents that match the provided query string.
+        """Queries the MongoDB collection for documents that match the provided vector.
 
         Results can be customized based on parameters like count, namespace, inclusion of vectors, offset, and index.
         """
         collection = self.get_collection()
 
-        # Using the embedding driver to convert the query string into a vector
-        vector = self.embedding_driver.embed_string(query)
-
         count = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
         offset = offset or 0
 
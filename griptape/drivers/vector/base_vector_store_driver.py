@@ -45,27 +45,12 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         **kwargs,
     ) -> list[str] | dict[str, list[str]]:
         if isinstance(artifacts, list):
-            return utils.execute_futures_list(
-                [
-                    self.futures_executor.submit(self.upsert_text_artifact, a, namespace=None, meta=meta, **kwargs)
-                    for a in artifacts
-                ],
-            )
+            return self._upsert_text_artifacts_batch(artifacts, namespace=None, meta=meta, **kwargs)
         else:
-            futures_dict = {}
-
-            for namespace, artifact_list in artifacts.items():
-                for a in artifact_list:
-                    if not futures_dict.get(namespace):
-                        futures_dict[namespace] = []
-
-                    futures_dict[namespace].append(
-                        self.futures_executor.submit(
-                            self.upsert_text_artifact, a, namespace=namespace, meta=meta, **kwargs
-                        )
-                    )
-
-            return utils.execute_futures_list_dict(futures_dict)
+            return {
+                namespace: self._upsert_text_artifacts_batch(artifact_list, namespace=namespace, meta=meta, **kwargs)
+                for namespace, artifact_list in artifacts.items()
+            }
 
     def upsert_text_artifact(
         self,
@@ -79,8 +64,7 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         meta = {} if meta is None else meta
 
         if vector_id is None:
-            value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
-            vector_id = self._get_default_vector_id(value)
+            vector_id = self._get_default_text_artifact_vector_id(artifact)
 
         if self.does_entry_exist(vector_id, namespace=namespace):
             return vector_id
@@ -110,6 +94,52 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         except Exception:
             return False
 
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        """Returns the subset of `vector_ids` that already exist in the store.
+
+        Drivers should override this with a single batched lookup when their backend supports one.
+        """
+        exists = utils.execute_futures_list(
+            [
+                self.futures_executor.submit(self.does_entry_exist, vector_id, namespace=namespace)
+                for vector_id in vector_ids
+            ]
+        )
+
+        return {vector_id for vector_id, e in zip(vector_ids, exists) if e}
+
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Inserts or updates multiple vectors in a single namespace.
+
+        Drivers should override this with a native bulk write when their backend supports one.
+
+        Args:
+            vectors: The vectors to upsert.
+            vector_ids: Optional ids for each vector.
+            namespace: Optional namespace for all vectors.
+            metas: Optional metadata for each vector.
+            kwargs: Additional keyword arguments passed to `upsert_vector`.
+
+        Returns:
+            The ids of the upserted vectors, in the same order as `vectors`.
+        """
+        return utils.execute_futures_list(
+            [
+                self.futures_executor.submit(
+                    self.upsert_vector, vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs
+                )
+                for vector, vector_id, meta in self._zip_vectors(vectors, vector_ids=vector_ids, metas=metas)
+            ]
+        )
+
     def load_artifacts(self, *, namespace: Optional[str] = None) -> ListArtifact:
         result = self.load_entries(namespace=namespace)
         artifacts = [r.to_artifact() for r in result]
@@ -117,7 +147,7 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         return ListArtifact([a for a in artifacts if isinstance(a, TextArtifact)])
 
     @abstractmethod
-    def delete_vector(self, vector_id: str) -> None: ...
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> None: ...
 
     @abstractmethod
     def upsert_vector(
@@ -147,5 +177,101 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         **kwargs,
     ) -> list[Entry]: ...
 
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[Entry]:
+        """Queries by an existing embedding instead of a query string.
+
+        Drivers should override this when their backend can search by vector, so that callers that already have an
+        embedding don't embed the query again.
+
+        Raises:
+            NotImplementedError: If the driver can only be queried by a query string.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support querying by vector.")
+
+    def _upsert_text_artifacts_batch(
+        self,
+        artifacts: list[TextArtifact],
+        *,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> list[str]:
+        if type(self).upsert_text_artifact is not BaseVectorStoreDriver.upsert_text_artifact:
+            # Subclasses that customize single artifact upserts keep getting each artifact.
+            return utils.execute_futures_list(
+                [
+                    self.futures_executor.submit(self.upsert_text_artifact, a, namespace=namespace, meta=meta, **kwargs)
+                    for a in artifacts
+                ]
+            )
+
+        vector_ids = [self._get_default_text_artifact_vector_id(a) for a in artifacts]
+        existing_vector_ids = self.find_existing_vector_ids(list(dict.fromkeys(vector_ids)), namespace=namespace)
+
+        # Artifacts that already exist or repeat an earlier artifact in the batch are skipped.
+        missing_artifacts = {}
+        for vector_id, artifact in zip(vector_ids, artifacts):
+            if vector_id not in existing_vector_ids and vector_id not in missing_artifacts:
+                missing_artifacts[vector_id] = artifact
+
+        if missing_artifacts:
+            self.upsert_vectors(
+                self._embed_text_artifacts(list(missing_artifacts.values())),
+                vector_ids=list(missing_artifacts.keys()),
+                namespace=namespace,
+                metas=[{**(meta or {}), "artifact": a.to_json()} for a in missing_artifacts.values()],
+                **kwargs,
+            )
+
+        return vector_ids
+
+    def _embed_text_artifacts(self, artifacts: list[TextArtifact]) -> list[list[float]]:
+        missing_artifacts = [a for a in artifacts if not a.embedding]
+        # Artifacts that customize their embedding generate it themselves, the rest are embedded in batches.
+        custom_artifacts = [
+            a for a in missing_artifacts if type(a).generate_embedding is not TextArtifact.generate_embedding
+        ]
+        batch_artifacts = [
+            a for a in missing_artifacts if type(a).generate_embedding is TextArtifact.generate_embedding
+        ]
+
+        for artifact in custom_artifacts:
+            artifact.generate_embedding(self.embedding_driver)
+
+        embeddings = self.embedding_driver.embed_strings([str(a.value) for a in batch_artifacts])
+
+        for artifact, embedding in zip(batch_artifacts, embeddings):
+            artifact.embedding = embedding
+
+        return [a.embedding or [] for a in artifacts]
+
+    def _zip_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+    ) -> list[tuple[list[float], Optional[str], Optional[dict]]]:
+        vector_ids = [None] * len(vectors) if vector_ids is None else vector_ids
+        metas = [None] * len(vectors) if metas is None else metas
+
+        if not len(vectors) == len(vector_ids) == len(metas):
+            raise ValueError("vectors, vector_ids, and metas must have the same length.")
+
+        return list(zip(vectors, vector_ids, metas))
+
+    def _get_default_text_artifact_vector_id(self, artifact: TextArtifact) -> str:
+        value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
+
+        return self._get_default_vector_id(value)
+
     def _get_default_vector_id(self, value: str) -> str:
         return str(uuid.uuid5(uuid.NAMESPACE_OID, value))
@@ -16,7 +16,7 @@ class DummyVectorStoreDriver(BaseVectorStoreDriver):
         metadata={"serializable": True},
     )
 
-    def delete_vector(self, vector_id: str) -> None:
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> None:
         raise DummyError(__class__.__name__, "delete_vector")
 
     def upsert_vector(
@@ -29,12 +29,37 @@ class DummyVectorStoreDriver(BaseVectorStoreDriver):
     ) -> str:
         raise DummyError(__class__.__name__, "upsert_vector")
 
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        raise DummyError(__class__.__name__, "upsert_vectors")
+
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        return set()
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         raise DummyError(__class__.__name__, "load_entry")
 
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
         raise DummyError(__class__.__name__, "load_entries")
 
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        raise DummyError(__class__.__name__, "query_vector")
+
     def query(
         self,
         query: str,
@@ -47,6 +47,15 @@ class GriptapeCloudVectorStoreDriver(BaseVectorStoreDriver):
     ) -> str:
         raise NotImplementedError(f"{self.__class__.__name__} does not support vector upsert.")
 
+    def upsert_text_artifacts(
+        self,
+        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        *,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> list[str] | dict[str, list[str]]:
+        raise NotImplementedError(f"{self.__class__.__name__} does not support text artifact upsert.")
+
     def upsert_text_artifact(
         self,
         artifact: TextArtifact,
@@ -107,5 +116,5 @@ class GriptapeCloudVectorStoreDriver(BaseVectorStoreDriver):
         entries = response.get("entries", [])
         return [BaseVectorStoreDriver.Entry.from_dict(entry) for entry in entries]
 
-    def delete_vector(self, vector_id: str) -> NoReturn:
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
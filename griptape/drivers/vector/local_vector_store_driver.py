@@ -1,28 +1,128 @@
 from __future__ import annotations
 
+import dataclasses
 import json
 import operator
 import os
 import threading
-from dataclasses import asdict
-from typing import Callable, NoReturn, Optional, TextIO
+from typing import IO, Any, Callable, Optional, TextIO, cast
 
+import numpy as np
 from attrs import Factory, define, field
-from numpy import dot
-from numpy.linalg import norm
 
 from griptape import utils
 from griptape.drivers import BaseVectorStoreDriver
+from griptape.schemas.codec import loads_json
+
+
+class _VersionedDict(dict):
+    """Dict that counts its modifications, so that the vector index can tell when entries were replaced directly."""
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other: Any) -> _VersionedDict:
+        self.update(other)
+
+        return self
+
+    def pop(self, *args) -> Any:
+        self.version += 1
+
+        return super().pop(*args)
+
+    def popitem(self) -> tuple:
+        self.version += 1
+
+        return super().popitem()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self.version += 1
+
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+
+def _to_versioned_dict(entries: dict) -> _VersionedDict:
+    return entries if isinstance(entries, _VersionedDict) else _VersionedDict(entries)
 
 
 @define(kw_only=True)
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
-    entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict)
+    """Vector Store Driver that keeps all entries in memory.
+
+    Vectors are additionally kept in a contiguous float32 matrix with precomputed norms so that queries are scored with
+    a single matrix-vector product and top-k selection is done with `numpy.argpartition`.
+
+    Attributes:
+        entries: Entries keyed by their namespaced vector id.
+        persist_file: Optional JSON file to persist entries to. The whole file is rewritten on every write.
+        persist_dir: Optional directory to persist entries to using an append-only format: entry metadata is appended
+            to a JSON Lines log and vectors are appended to a float32 file that is memory-mapped on startup.
+            Mutually exclusive with `persist_file`.
+        fsync_batch_size: Number of appended records after which `persist_dir` files are fsynced.
+        compaction_threshold: Fraction of dead vector rows (overwritten or deleted entries) in `persist_dir` that
+            triggers a compaction.
+        relatedness_fn: Optional custom relatedness function. When set, queries fall back to scoring every entry
+            with this function instead of the vectorized cosine similarity.
+        thread_lock: Lock guarding `entries` and the vector index.
+    """
+
+    INITIAL_INDEX_CAPACITY = 1024
+    LOG_FILE_NAME = "entries.jsonl"
+    LOG_FORMAT_VERSION = 1
+
+    entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict, converter=_to_versioned_dict)
     persist_file: Optional[str] = field(default=None)
-    relatedness_fn: Callable = field(default=lambda x, y: dot(x, y) / (norm(x) * norm(y)))
+    persist_dir: Optional[str] = field(default=None)
+    fsync_batch_size: int = field(default=100)
+    compaction_threshold: float = field(default=0.5)
+    relatedness_fn: Optional[Callable] = field(default=None)
     thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
+    _log_file: Optional[IO[bytes]] = field(default=None, init=False, eq=False)
+    _vectors_file: Optional[IO[bytes]] = field(default=None, init=False, eq=False)
+    _vectors_file_name: Optional[str] = field(default=None, init=False, eq=False)
+    _log_generation: int = field(default=0, init=False, eq=False)
+    _log_dimensions: Optional[int] = field(default=None, init=False, eq=False)
+    _log_rows: dict[str, int] = field(factory=dict, init=False, eq=False)
+    _log_row_count: int = field(default=0, init=False, eq=False)
+    _log_pending: int = field(default=0, init=False, eq=False)
+    _index_entries: Optional[dict[str, BaseVectorStoreDriver.Entry]] = field(default=None, init=False, eq=False)
+    _index_version: int = field(default=0, init=False, eq=False)
+    _index_rows: dict[str, int] = field(factory=dict, init=False, eq=False)
+    _index_keys: list[str] = field(factory=list, init=False, eq=False)
+    _index_namespaces: np.ndarray = field(default=Factory(lambda: np.empty(0, dtype=object)), init=False, eq=False)
+    _index_matrix: np.ndarray = field(default=Factory(lambda: np.empty((0, 0), dtype=np.float32)), init=False, eq=False)
+    _index_norms: np.ndarray = field(default=Factory(lambda: np.empty(0, dtype=np.float32)), init=False, eq=False)
 
     def __attrs_post_init__(self) -> None:
+        if self.persist_file is not None and self.persist_dir is not None:
+            raise ValueError("Only one of persist_file and persist_dir can be set.")
+
+        if self.persist_dir is not None:
+            os.makedirs(self.persist_dir, exist_ok=True)
+
+            with self.thread_lock:
+                self.__load_log()
+
         if self.persist_file is not None:
             directory = os.path.dirname(self.persist_file)
 
@@ -55,28 +155,82 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         **kwargs,
     ) -> str:
         vector_id = vector_id or utils.str_to_hash(str(vector))
+        key = self.__namespaced_vector_id(vector_id, namespace=namespace)
+        entry = self.Entry(
+            id=vector_id,
+            vector=vector,
+            meta=meta,
+            namespace=namespace,
+        )
 
         with self.thread_lock:
-            self.entries[self.__namespaced_vector_id(vector_id, namespace=namespace)] = self.Entry(
-                id=vector_id,
-                vector=vector,
-                meta=meta,
-                namespace=namespace,
-            )
+            self.__sync_index()
+            self.__index_entry(key, entry)
+            self.entries[key] = entry
+            self.__mark_index_synced()
+
+            if self.persist_dir is not None:
+                self.__append_upsert_record(key, entry)
 
         if self.persist_file is not None:
-            # TODO: optimize later since it reserializes all entries from memory and stores them in the JSON file
-            #  every time a new vector is inserted
             with open(self.persist_file, "w") as file:
                 self.__save_entries_to_file(file)
 
         return vector_id
 
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        result = []
+
+        with self.thread_lock:
+            self.__sync_index()
+
+            for vector, vector_id, meta in self._zip_vectors(vectors, vector_ids=vector_ids, metas=metas):
+                vector_id = vector_id or utils.str_to_hash(str(vector))
+                key = self.__namespaced_vector_id(vector_id, namespace=namespace)
+                entry = self.Entry(id=vector_id, vector=vector, meta=meta, namespace=namespace)
+
+                self.__index_entry(key, entry)
+                self.entries[key] = entry
+
+                if self.persist_dir is not None:
+                    self.__append_upsert_record(key, entry)
+
+                result.append(vector_id)
+
+            self.__mark_index_synced()
+
+        if self.persist_file is not None:
+            with open(self.persist_file, "w") as file:
+                self.__save_entries_to_file(file)
+
+        return result
+
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        return {
+            vector_id
+            for vector_id in vector_ids
+            if self.__namespaced_vector_id(vector_id, namespace=namespace) in self.entries
+        }
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
-        return self.entries.get(self.__namespaced_vector_id(vector_id, namespace=namespace), None)
+        entry = self.entries.get(self.__namespaced_vector_id(vector_id, namespace=namespace), None)
+
+        return None if entry is None else self.__entry_with_list_vector(entry)
 
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        return [entry for key, entry in self.entries.items() if namespace is None or entry.namespace == namespace]
+        return [
+            self.__entry_with_list_vector(entry)
+            for entry in self.entries.values()
+            if namespace is None or entry.namespace == namespace
+        ]
 
     def query(
         self,
@@ -87,38 +241,476 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         include_vectors: bool = False,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        query_embedding = self.embedding_driver.embed_string(query)
+        """Embeds the query string with the Embedding Driver and searches like `query_vector`."""
+        return self.query_vector(
+            self.embedding_driver.embed_string(query),
+            count=count,
+            namespace=namespace,
+            include_vectors=include_vectors,
+            **kwargs,
+        )
 
-        if namespace:
-            entries = {k: v for (k, v) in self.entries.items() if k.startswith(f"{namespace}-")}
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        if self.relatedness_fn is None:
+            entries_and_relatednesses = self.__query_index(vector, count=count, namespace=namespace)
         else:
-            entries = self.entries
+            entries_and_relatednesses = self.__query_relatedness_fn(
+                self.relatedness_fn, vector, count=count, namespace=namespace
+            )
 
-        entries_and_relatednesses = [
-            (entry, self.relatedness_fn(query_embedding, entry.vector)) for entry in list(entries.values())
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=entry.id,
+                vector=self.__vector_to_list(entry.vector) if include_vectors else [],
+                score=score,
+                meta=entry.meta,
+                namespace=entry.namespace,
+            )
+            for entry, score in entries_and_relatednesses
         ]
 
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> None:
+        key = self.__namespaced_vector_id(vector_id, namespace=namespace)
+
+        with self.thread_lock:
+            if key not in self.entries:
+                return
+
+            self.__sync_index()
+            self.__unindex_entry(key)
+            del self.entries[key]
+            self.__mark_index_synced()
+
+            if self.persist_dir is not None:
+                self.__append_delete_record(key)
+
+        if self.persist_file is not None:
+            with open(self.persist_file, "w") as file:
+                self.__save_entries_to_file(file)
+
+    def flush(self) -> None:
+        """Flushes and fsyncs pending `persist_dir` writes."""
+        with self.thread_lock:
+            self.__fsync_log()
+
+    def compact(self) -> None:
+        """Rewrites `persist_dir` files so that they only contain live entries."""
+        with self.thread_lock:
+            self.__compact_log()
+
+    def close(self) -> None:
+        """Flushes, fsyncs, and closes the `persist_dir` files. They are opened again on the next write."""
+        with self.thread_lock:
+            self.__fsync_log()
+            self.__close_log()
+
+    def __del__(self) -> None:
+        # Files are flushed on close, records that weren't fsynced yet are left to the OS.
+        for file in (getattr(self, "_vectors_file", None), getattr(self, "_log_file", None)):
+            if file is not None:
+                file.close()
+
+    def __query_index(
+        self, query_embedding: list[float], *, count: Optional[int], namespace: Optional[str]
+    ) -> list[tuple[BaseVectorStoreDriver.Entry, float]]:
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+
+        # Scoring stays under the lock, deletes move rows around in the index.
+        with self.thread_lock:
+            self.__sync_index()
+
+            size = len(self._index_keys)
+            matrix = self._index_matrix[:size]
+            norms = self._index_norms[:size]
+
+            if namespace:
+                rows = np.flatnonzero(self._index_namespaces[:size] == namespace)
+                matrix = matrix[rows]
+                norms = norms[rows]
+            else:
+                rows = None
+
+            if len(norms) == 0:
+                return []
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores = (matrix @ query_vector) / (norms * np.linalg.norm(query_vector))
+
+            scores = np.nan_to_num(scores, nan=0.0, posinf=0.0, neginf=0.0)
+
+            if count is not None and count < len(scores):
+                if count <= 0:
+                    return []
+
+                top = np.argpartition(-scores, count - 1)[:count]
+                top = top[np.argsort(-scores[top], kind="stable")]
+            else:
+                top = np.argsort(-scores, kind="stable")
+
+            positions = top if rows is None else rows[top]
+
+            return [(self.entries[self._index_keys[p]], float(scores[t])) for p, t in zip(positions, top)]
+
+    def __query_relatedness_fn(
+        self,
+        relatedness_fn: Callable,
+        query_embedding: list[float],
+        *,
+        count: Optional[int],
+        namespace: Optional[str],
+    ) -> list[tuple[BaseVectorStoreDriver.Entry, float]]:
+        entries = [entry for entry in list(self.entries.values()) if not namespace or entry.namespace == namespace]
+        entries_and_relatednesses = [(entry, relatedness_fn(query_embedding, entry.vector)) for entry in entries]
+
         entries_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
 
-        result = [
-            BaseVectorStoreDriver.Entry(id=er[0].id, vector=er[0].vector, score=er[1], meta=er[0].meta)
-            for er in entries_and_relatednesses
-        ][:count]
+        return entries_and_relatednesses[:count]
+
+    def __sync_index(self) -> None:
+        # `entries` is a public attribute, rebuild the index if it was replaced or modified directly.
+        if self._index_entries is not self.entries or self._index_version != self.__entries_version():
+            self._index_entries = self.entries
+            self._index_version = self.__entries_version()
+            self._index_rows = {}
+            self._index_keys = []
+            self._index_namespaces = np.empty(0, dtype=object)
+            self._index_matrix = np.empty((0, 0), dtype=np.float32)
+            self._index_norms = np.empty(0, dtype=np.float32)
+
+            for key, entry in self.entries.items():
+                self.__index_entry(key, entry)
+
+    def __entries_version(self) -> int:
+        return cast(_VersionedDict, self.entries).version
+
+    def __mark_index_synced(self) -> None:
+        # Called after the driver modifies `entries` and the index together.
+        self._index_version = self.__entries_version()
+
+    def __set_index(self, keys: list[str], namespaces: list[Optional[str]], matrix: np.ndarray) -> None:
+        self._index_entries = self.entries
+        self._index_version = self.__entries_version()
+        self._index_rows = {key: row for row, key in enumerate(keys)}
+        self._index_keys = keys
+        self._index_namespaces = np.empty(len(keys), dtype=object)
+        self._index_namespaces[:] = namespaces
+        self._index_matrix = matrix
+        self._index_norms = np.linalg.norm(matrix, axis=1).astype(np.float32)
+
+    def __index_entry(self, key: str, entry: BaseVectorStoreDriver.Entry) -> None:
+        vector = np.asarray(entry.vector if entry.vector is not None else [], dtype=np.float32)
+        row = self._index_rows.get(key)
+
+        if len(self._index_keys) == 0 and row is None:
+            self._index_matrix = np.empty((0, vector.shape[0]), dtype=np.float32)
+        elif vector.shape[0] != self._index_matrix.shape[1]:
+            raise ValueError(
+                f"Vector dimensions {vector.shape[0]} do not match the store dimensions {self._index_matrix.shape[1]}."
+            )
+
+        if row is None:
+            row = len(self._index_keys)
+
+            if row >= self._index_matrix.shape[0]:
+                self.__grow_index(max(self.INITIAL_INDEX_CAPACITY, row * 2))
+
+            self._index_rows[key] = row
+            self._index_keys.append(key)
+
+        self._index_matrix[row] = vector
+        self._index_norms[row] = np.linalg.norm(vector)
+        self._index_namespaces[row] = entry.namespace
+
+    def __unindex_entry(self, key: str) -> None:
+        # Move the last row into the deleted row so the index stays contiguous.
+        row = self._index_rows.pop(key)
+        last_row = len(self._index_keys) - 1
+        last_key = self._index_keys.pop()
+
+        if row != last_row:
+            self._index_keys[row] = last_key
+            self._index_rows[last_key] = row
+            self._index_matrix[row] = self._index_matrix[last_row]
+            self._index_norms[row] = self._index_norms[last_row]
+            self._index_namespaces[row] = self._index_namespaces[last_row]
+
+        self._index_namespaces[last_row] = None
+
+    def __grow_index(self, capacity: int) -> None:
+        matrix = np.empty((capacity, self._index_matrix.shape[1]), dtype=np.float32)
+        norms = np.empty(capacity, dtype=np.float32)
+        namespaces = np.empty(capacity, dtype=object)
+        size = len(self._index_keys)
+
+        matrix[:size] = self._index_matrix[:size]
+        norms[:size] = self._index_norms[:size]
+        namespaces[:size] = self._index_namespaces[:size]
+
+        self._index_matrix = matrix
+        self._index_norms = norms
+        self._index_namespaces = namespaces
+
+    def __load_log(self) -> None:
+        log_path = self.__persist_path(self.LOG_FILE_NAME)
+
+        if not os.path.isfile(log_path):
+            return
+
+        records = self.__read_log_records(log_path)
+
+        if self._vectors_file_name is None or self._log_dimensions is None:
+            return
+
+        vectors = self.__read_log_vectors(self.__persist_path(self._vectors_file_name))
+        row_count = vectors.shape[0]
+        live_records = {key: record for key, record in records.items() if record["row"] < row_count}
+        keys = list(live_records.keys())
+        rows = [record["row"] for record in live_records.values()]
+        # The index gets its own copy of the rows since deletes move rows around in it.
+        matrix = np.asarray(vectors[rows], dtype=np.float32)
+
+        # Entry vectors are read-only views of the memory-mapped file, so they are only paged in when they are used.
+        self.entries = {
+            key: BaseVectorStoreDriver.Entry(
+                id=record["id"], vector=vectors[record["row"]], meta=record["meta"], namespace=record["namespace"]
+            )
+            for key, record in live_records.items()
+        }
+        self._log_rows = dict(zip(keys, rows))
+        self._log_row_count = row_count
+        self.__set_index(keys, [record["namespace"] for record in live_records.values()], matrix)
+
+        if len(live_records) != len(records):
+            # Vectors whose rows were not durably written are dropped along with their metadata. The log is rewritten
+            # so that their records aren't paired with the vectors that are appended to those rows next.
+            self.__compact_log()
+
+    def __read_log_records(self, log_path: str) -> dict[str, dict]:
+        records: dict[str, dict] = {}
+        valid_size = 0
+
+        with open(log_path, "rb") as file:
+            for line in file:
+                # A partially written trailing record means the process crashed mid-append, drop it.
+                try:
+                    record = loads_json(line) if line.endswith(b"\n") else None
+                except json.JSONDecodeError:
+                    record = None
+
+                if record is None:
+                    break
+
+                valid_size += len(line)
+
+                if record["op"] == "header":
+                    self._log_generation = record["generation"]
+                    self._log_dimensions = record["dimensions"]
+                    self._vectors_file_name = record["vectors_file"]
+                elif record["op"] == "upsert":
+                    records[record["key"]] = record
+                elif record["op"] == "delete":
+                    records.pop(record["key"], None)
+
+        if os.path.getsize(log_path) != valid_size:
+            os.truncate(log_path, valid_size)
+
+        return records
+
+    def __read_log_vectors(self, vectors_path: str) -> np.ndarray:
+        dimensions = int(self._log_dimensions or 0)
+
+        if not os.path.isfile(vectors_path):
+            return np.empty((0, dimensions), dtype=np.float32)
+
+        row_size = dimensions * np.dtype(np.float32).itemsize
+        row_count = os.path.getsize(vectors_path) // row_size
+
+        # A partially written trailing row is dropped.
+        if os.path.getsize(vectors_path) != row_count * row_size:
+            os.truncate(vectors_path, row_count * row_size)
+
+        # Empty files can't be memory-mapped.
+        if row_count == 0:
+            return np.empty((0, dimensions), dtype=np.float32)
 
-        if include_vectors:
-            return result
+        return np.memmap(vectors_path, dtype=np.float32, mode="r", shape=(row_count, dimensions))
+
+    def __append_upsert_record(self, key: str, entry: BaseVectorStoreDriver.Entry) -> None:
+        vector = np.asarray(entry.vector, dtype=np.float32)
+
+        if self._log_dimensions is None:
+            self._log_dimensions = vector.shape[0]
+            self.__write_log_header()
+
+        if key in self._log_rows:
+            # The previous row becomes dead and is reclaimed by compaction.
+            self._log_rows.pop(key)
+
+        row = self._log_row_count
+
+        self.__vectors_file().write(vector.tobytes())
+        self.__append_log_record(
+            {"op": "upsert", "key": key, "id": entry.id, "namespace": entry.namespace, "meta": entry.meta, "row": row}
+        )
+
+        self._log_rows[key] = row
+        self._log_row_count += 1
+
+        self.__maybe_compact_log()
+
+    def __append_delete_record(self, key: str) -> None:
+        if self._log_rows.pop(key, None) is None:
+            return
+
+        self.__append_log_record({"op": "delete", "key": key})
+        self.__maybe_compact_log()
+
+    def __append_log_record(self, record: dict[str, Any]) -> None:
+        self.__log_file().write(json.dumps(record).encode() + b"\n")
+        self._log_pending += 1
+
+        if self._log_pending >= self.fsync_batch_size:
+            self.__fsync_log()
         else:
-            return [
-                BaseVectorStoreDriver.Entry(id=r.id, vector=[], score=r.score, meta=r.meta, namespace=r.namespace)
-                for r in result
-            ]
+            # Hand every record to the OS right away so other readers see it, only fsync in batches.
+            for file in (self._vectors_file, self._log_file):
+                if file is not None:
+                    file.flush()
+
+    def __write_log_header(self) -> None:
+        self._vectors_file_name = f"vectors-{self._log_generation}.f32"
+
+        self.__append_log_record(
+            {
+                "op": "header",
+                "version": self.LOG_FORMAT_VERSION,
+                "generation": self._log_generation,
+                "dimensions": self._log_dimensions,
+                "vectors_file": self._vectors_file_name,
+            }
+        )
+
+    def __fsync_log(self) -> None:
+        # Vectors are synced before metadata so that a durable record never points at a missing row.
+        for file in (self._vectors_file, self._log_file):
+            if file is not None:
+                file.flush()
+                os.fsync(file.fileno())
+
+        self._log_pending = 0
+
+    def __maybe_compact_log(self) -> None:
+        dead_rows = self._log_row_count - len(self._log_rows)
+
+        if dead_rows > 0 and dead_rows >= self._log_row_count * self.compaction_threshold:
+            self.__compact_log()
+
+    def __compact_log(self) -> None:
+        if self.persist_dir is None or self._log_dimensions is None:
+            return
+
+        self.__fsync_log()
+        self.__close_log()
+        self.__sync_index()
+
+        size = len(self._index_keys)
+        old_vectors_file_name = self._vectors_file_name
+        self._log_generation += 1
+        self._vectors_file_name = f"vectors-{self._log_generation}.f32"
+
+        # The new vectors file is written under a new name and the log is atomically replaced last, so a crash at any
+        # point leaves either the old or the new generation intact.
+        with open(self.__persist_path(self._vectors_file_name), "wb") as file:
+            file.write(self._index_matrix[:size].tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+
+        log_path = self.__persist_path(self.LOG_FILE_NAME)
+
+        with open(f"{log_path}.tmp", "wb") as file:
+            header = {
+                "op": "header",
+                "version": self.LOG_FORMAT_VERSION,
+                "generation": self._log_generation,
+                "dimensions": self._log_dimensions,
+                "vectors_file": self._vectors_file_name,
+            }
+
+            file.write(json.dumps(header).encode() + b"\n")
+
+            for row, key in enumerate(self._index_keys):
+                entry = self.entries[key]
+                record = {
+                    "op": "upsert",
+                    "key": key,
+                    "id": entry.id,
+                    "namespace": entry.namespace,
+                    "meta": entry.meta,
+                    "row": row,
+                }
+
+                file.write(json.dumps(record).encode() + b"\n")
+
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(f"{log_path}.tmp", log_path)
+
+        # Entries are pointed at the new vectors file so that the old one isn't kept mapped after it's removed.
+        vectors = self.__read_log_vectors(self.__persist_path(self._vectors_file_name))
+
+        for row, key in enumerate(self._index_keys):
+            self.entries[key].vector = vectors[row]
+
+        if old_vectors_file_name is not None and old_vectors_file_name != self._vectors_file_name:
+            os.remove(self.__persist_path(old_vectors_file_name))
+
+        self._log_rows = {key: row for row, key in enumerate(self._index_keys)}
+        self._log_row_count = size
+
+    def __log_file(self) -> IO[bytes]:
+        if self._log_file is None:
+            self._log_file = open(self.__persist_path(self.LOG_FILE_NAME), "ab")  # noqa: SIM115
+
+        return self._log_file
+
+    def __vectors_file(self) -> IO[bytes]:
+        if self._vectors_file is None:
+            self._vectors_file = open(self.__persist_path(str(self._vectors_file_name)), "ab")  # noqa: SIM115
+
+        return self._vectors_file
+
+    def __close_log(self) -> None:
+        for file in (self._vectors_file, self._log_file):
+            if file is not None:
+                file.close()
+
+        self._vectors_file = None
+        self._log_file = None
+
+    def __persist_path(self, file_name: str) -> str:
+        return os.path.join(str(self.persist_dir), file_name)
+
+    def __vector_to_list(self, vector: Optional[list[float]]) -> Optional[list[float]]:
+        return vector.tolist() if isinstance(vector, np.ndarray) else vector
+
+    def __entry_with_list_vector(self, entry: BaseVectorStoreDriver.Entry) -> BaseVectorStoreDriver.Entry:
+        if not isinstance(entry.vector, np.ndarray):
+            return entry
 
-    def delete_vector(self, vector_id: str) -> NoReturn:
-        raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
+        return dataclasses.replace(entry, vector=self.__vector_to_list(entry.vector))
 
     def __save_entries_to_file(self, json_file: TextIO) -> None:
         with self.thread_lock:
-            serialized_data = {k: asdict(v) for k, v in self.entries.items()}
+            serialized_data = {k: dataclasses.asdict(v) for k, v in self.entries.items()}
 
             json.dump(serialized_data, json_file)
 
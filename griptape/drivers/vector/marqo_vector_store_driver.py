@@ -107,6 +107,31 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         else:
             raise ValueError(f"Failed to upsert text: {response}")
 
+    def upsert_text_artifacts(
+        self,
+        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        *,
+        meta: Optional[dict] = None,
+        **kwargs: Any,
+    ) -> list[str] | dict[str, list[str]]:
+        """Upsert text artifacts into the Marqo index with one `add_documents` request per namespace.
+
+        Args:
+            artifacts: The text artifacts to be indexed, optionally grouped by namespace.
+            meta: An optional dictionary of metadata for the artifacts.
+            kwargs: Additional keyword arguments to pass to the Marqo client.
+
+        Returns:
+            The IDs of the artifacts that were added.
+        """
+        if isinstance(artifacts, list):
+            return self._add_text_artifacts(artifacts, namespace=None, meta=meta, **kwargs)
+        else:
+            return {
+                namespace: self._add_text_artifacts(artifact_list, namespace=namespace, meta=meta, **kwargs)
+                for namespace, artifact_list in artifacts.items()
+            }
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Load a document entry from the Marqo index.
 
@@ -212,6 +237,35 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             for r in results["hits"]
         ]
 
+    def _add_text_artifacts(
+        self, artifacts: list[TextArtifact], *, namespace: Optional[str], meta: Optional[dict] = None, **kwargs: Any
+    ) -> list[str]:
+        if not artifacts:
+            return []
+
+        docs = []
+        for artifact in artifacts:
+            doc = {
+                "_id": utils.str_to_hash(artifact.value),
+                "Description": artifact.value,  # Description will be treated as tensor field
+                "artifact": str(artifact.to_json()),
+                "namespace": namespace,
+            }
+
+            # Non-tensor fields
+            if meta:
+                doc["meta"] = str(meta)
+
+            docs.append(doc)
+
+        response = self.client.index(self.index).add_documents(
+            docs, tensor_fields=["Description", "artifact"], **kwargs
+        )
+        if isinstance(response, dict) and "items" in response and response["items"]:
+            return [item["_id"] for item in response["items"]]
+        else:
+            raise ValueError(f"Failed to upsert text: {response}")
+
     def delete_index(self, name: str) -> dict[str, Any]:
         """Delete an index in the Marqo client.
 
@@ -254,5 +308,5 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         """
         raise NotImplementedError(f"{self.__class__.__name__} does not support upserting a vector.")
 
-    def delete_vector(self, vector_id: str) -> NoReturn:
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
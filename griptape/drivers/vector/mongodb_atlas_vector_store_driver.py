@@ -74,6 +74,46 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             )
         return vector_id
 
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Inserts or updates multiple vectors in the collection with a single bulk write."""
+        pymongo = import_optional_dependency("pymongo")
+        bson = import_optional_dependency("bson")
+
+        operations = []
+        result = []
+        for vector, vector_id, meta in self._zip_vectors(vectors, vector_ids=vector_ids, metas=metas):
+            doc = {self.vector_path: vector, "namespace": namespace, "meta": meta}
+
+            if vector_id is None:
+                object_id = bson.ObjectId()
+                operations.append(pymongo.InsertOne({"_id": object_id, **doc}))
+                result.append(str(object_id))
+            else:
+                operations.append(pymongo.ReplaceOne({"_id": vector_id}, doc, upsert=True))
+                result.append(vector_id)
+
+        if operations:
+            self.get_collection().bulk_write(operations, ordered=False)
+
+        return result
+
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        """Returns the vector IDs that exist in the collection using a single query."""
+        query: dict = {"_id": {"$in": vector_ids}}
+
+        if namespace:
+            query["namespace"] = namespace
+
+        return {str(doc["_id"]) for doc in self.get_collection().find(query, {"_id": 1})}
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Loads a document entry from the MongoDB collection based on the vector ID.
 
@@ -121,18 +161,33 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Embeds the query string with the Embedding Driver and searches like `query_vector`."""
+        return self.query_vector(
+            self.embedding_driver.embed_string(query),
+            count=count,
+            namespace=namespace,
+            include_vectors=include_vectors,
+            **kwargs,
+        )
+
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
         offset: Optional[int] = None,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        """Queries the MongoDB collection for documents that match the provided query string.
+        """Queries the MongoDB collection for documents that match the provided vector.
 
         Results can be customized based on parameters like count, namespace, inclusion of vectors, offset, and index.
         """
         collection = self.get_collection()
 
-        # Using the embedding driver to convert the query string into a vector
-        vector = self.embedding_driver.embed_string(query)
-
         count = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
         offset = offset or 0
 
@@ -171,7 +226,7 @@ class MongoDbAtlasVectorStoreDriver(BaseVectorStoreDriver):
             for doc in collection.aggregate(pipeline)
         ]
 
-    def delete_vector(self, vector_id: str) -> None:
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> None:
         """Deletes the vector from the collection."""
         collection = self.get_collection()
         collection.delete_one({"_id": vector_id})
@@ -68,6 +68,51 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
 
         return response["_id"]
 
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Inserts or updates multiple vectors in OpenSearch with a single bulk request."""
+        rows = self._zip_vectors(vectors, vector_ids=vector_ids, metas=metas)
+
+        if not rows:
+            return []
+
+        body = []
+        for vector, vector_id, meta in rows:
+            doc = {"vector": vector, "namespace": namespace, "metadata": meta}
+            doc.update(kwargs)
+
+            body.append({"index": self._get_bulk_index_action(vector_id or utils.str_to_hash(str(vector)))})
+            body.append(doc)
+
+        response = self.client.bulk(body=body)
+
+        if response.get("errors"):
+            raise RuntimeError(f"Failed to upsert vectors: {response}")
+
+        return [item["index"]["_id"] for item in response["items"]]
+
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        """Returns the vector IDs that exist in OpenSearch, in the optional namespace, using a single multi-get request."""
+        if not vector_ids:
+            return set()
+
+        response = self.client.mget(
+            index=self.index_name, body={"ids": vector_ids}, params={"_source_includes": "namespace"}
+        )
+
+        return {
+            doc["_id"]
+            for doc in response["docs"]
+            if doc.get("found") and (not namespace or doc.get("_source", {}).get("namespace") == namespace)
+        }
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from OpenSearch based on its identifier and optional namespace.
 
@@ -126,11 +171,29 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Embeds the query string with the Embedding Driver and searches like `query_vector`."""
+        return self.query_vector(
+            self.embedding_driver.embed_string(query),
+            count=count,
+            namespace=namespace,
+            include_vectors=include_vectors,
+            **kwargs,
+        )
+
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
         include_metadata: bool = True,
         field_name: str = "vector",
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        """Performs a nearest neighbor search on OpenSearch to find vectors similar to the provided query string.
+        """Performs a nearest neighbor search on OpenSearch to find vectors similar to the provided vector.
 
         Results can be limited using the count parameter and optionally filtered by a namespace.
 
@@ -138,7 +201,6 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
             A list of BaseVectorStoreDriver.Entry objects, each encapsulating the retrieved vector, its similarity score, metadata, and namespace.
         """
         count = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
-        vector = self.embedding_driver.embed_string(query)
         # Base k-NN query
         query_body = {"size": count, "query": {"knn": {field_name: {"vector": vector, "k": count}}}}
 
@@ -165,5 +227,8 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
             for hit in response["hits"]["hits"]
         ]
 
-    def delete_vector(self, vector_id: str) -> NoReturn:
+    def _get_bulk_index_action(self, vector_id: str) -> dict:
+        return {"_index": self.index_name, "_id": vector_id}
+
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
@@ -92,6 +92,46 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
 
             return str(getattr(obj, "id"))
 
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Inserts or updates multiple vectors in the collection with a single `INSERT ... ON CONFLICT` statement."""
+        sqlalchemy_dialects_postgresql = import_optional_dependency("sqlalchemy.dialects.postgresql")
+
+        rows = [
+            {"id": vector_id or str(uuid.uuid4()), "vector": vector, "namespace": namespace, "meta": meta, **kwargs}
+            for vector, vector_id, meta in self._zip_vectors(vectors, vector_ids=vector_ids, metas=metas)
+        ]
+
+        if not rows:
+            return []
+
+        statement = sqlalchemy_dialects_postgresql.insert(self._model)
+        statement = statement.on_conflict_do_update(
+            index_elements=["id"],
+            set_={column: statement.excluded[column] for column in rows[0] if column != "id"},
+        )
+
+        with self.engine.begin() as conn:
+            conn.execute(statement, rows)
+
+        return [str(row["id"]) for row in rows]
+
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        """Returns the vector IDs that exist in the collection using a single query."""
+        sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
+
+        with sqlalchemy_orm.Session(self.engine) as session:
+            results = session.query(self._model.id).filter(self._model.id.in_(vector_ids)).all()
+
+            return {str(result.id) for result in results}
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> BaseVectorStoreDriver.Entry:
         """Retrieves a specific vector entry from the collection based on its identifier and optional namespace."""
         sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
@@ -136,6 +176,26 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         include_vectors: bool = False,
         distance_metric: str = "cosine_distance",
         **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Performs a search on the collection to find vectors similar to the provided query, optionally filtering to only those that match the provided namespace."""
+        return self.query_vector(
+            self.embedding_driver.embed_string(query),
+            count=count,
+            namespace=namespace,
+            include_vectors=include_vectors,
+            distance_metric=distance_metric,
+            **kwargs,
+        )
+
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        distance_metric: str = "cosine_distance",
+        **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
         """Performs a search on the collection to find vectors similar to the provided input vector, optionally filtering to only those that match the provided namespace."""
         sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
@@ -152,8 +212,6 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
         op = distance_metrics[distance_metric]
 
         with sqlalchemy_orm.Session(self.engine) as session:
-            vector = self.embedding_driver.embed_string(query)
-
             # The query should return both the vector and the distance metric score.
             query_result = session.query(self._model, op(vector).label("score")).order_by(op(vector))  # pyright: ignore[reportOptionalCall]
 
@@ -205,5 +263,5 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
 
         return VectorModel
 
-    def delete_vector(self, vector_id: str) -> NoReturn:
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
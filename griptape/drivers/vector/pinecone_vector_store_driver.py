@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 
 @define
 class PineconeVectorStoreDriver(BaseVectorStoreDriver):
+    UPSERT_BATCH_SIZE = 100
+    FETCH_BATCH_SIZE = 1000
+
     api_key: str = field(kw_only=True, metadata={"serializable": True})
     index_name: str = field(kw_only=True, metadata={"serializable": True})
     environment: str = field(kw_only=True, metadata={"serializable": True})
@@ -49,6 +52,37 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
 
         return vector_id
 
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        records = [
+            (vector_id or str_to_hash(str(vector)), vector, meta)
+            for vector, vector_id, meta in self._zip_vectors(vectors, vector_ids=vector_ids, metas=metas)
+        ]
+
+        params: dict[str, Any] = {"namespace": namespace} | kwargs
+
+        for i in range(0, len(records), self.UPSERT_BATCH_SIZE):
+            self.index.upsert(vectors=records[i : i + self.UPSERT_BATCH_SIZE], **params)
+
+        return [record[0] for record in records]
+
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        existing_vector_ids = set()
+
+        for i in range(0, len(vector_ids), self.FETCH_BATCH_SIZE):
+            result = self.index.fetch(ids=vector_ids[i : i + self.FETCH_BATCH_SIZE], namespace=namespace).to_dict()
+
+            existing_vector_ids.update(result["vectors"].keys())
+
+        return existing_vector_ids
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         result = self.index.fetch(ids=[vector_id], namespace=namespace).to_dict()
         vectors = list(result["vectors"].values())
@@ -94,11 +128,27 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
-        include_metadata: bool = True,
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
-        vector = self.embedding_driver.embed_string(query)
+        """Embeds the query string with the Embedding Driver and searches like `query_vector`."""
+        return self.query_vector(
+            self.embedding_driver.embed_string(query),
+            count=count,
+            namespace=namespace,
+            include_vectors=include_vectors,
+            **kwargs,
+        )
 
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        include_metadata: bool = True,
+        **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
         params = {
             "top_k": count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
             "namespace": namespace,
@@ -119,5 +169,5 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
             for r in results["matches"]
         ]
 
-    def delete_vector(self, vector_id: str) -> NoReturn:
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
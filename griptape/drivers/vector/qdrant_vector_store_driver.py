@@ -80,11 +80,12 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
             timeout=self.timeout,
         )
 
-    def delete_vector(self, vector_id: str) -> None:
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> None:
         """Delete a vector from the Qdrant collection based on its ID.
 
         Parameters:
             vector_id (str | id): ID of the vector to delete.
+            namespace (Optional[str]): Unused, vector IDs are unique across namespaces.
         """
         deletion_response = self.client.delete(
             collection_name=self.collection_name,
@@ -101,11 +102,29 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         namespace: Optional[str] = None,
         include_vectors: bool = False,
         **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Embeds the query string with the Embedding Driver and searches like `query_vector`."""
+        return self.query_vector(
+            self.embedding_driver.embed_string(query),
+            count=count,
+            namespace=namespace,
+            include_vectors=include_vectors,
+            **kwargs,
+        )
+
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
         """Query the Qdrant collection based on a query vector.
 
         Parameters:
-            query (str): Query string.
+            vector (list[float]): Query vector.
             count (Optional[int]): Optional number of results to return.
             namespace (Optional[str]): Optional namespace of the vectors.
             include_vectors (bool): Whether to include vectors in the results.
@@ -113,10 +132,8 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             list[BaseVectorStoreDriver.Entry]: List of Entry objects.
         """
-        query_vector = self.embedding_driver.embed_string(query)
-
         # Create a search request
-        request = {"collection_name": self.collection_name, "query_vector": query_vector, "limit": count}
+        request = {"collection_name": self.collection_name, "query_vector": vector, "limit": count}
         request = {k: v for k, v in request.items() if v is not None}
         results = self.client.search(**request)
 
@@ -171,6 +188,61 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         self.client.upsert(collection_name=self.collection_name, points=points)
         return vector_id
 
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        content: Optional[str] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Upsert multiple vectors into the Qdrant collection with a single batch request.
+
+        Parameters:
+            vectors (list[list[float]]): The vectors to be upserted.
+            vector_ids (Optional[list[Optional[str]]]): Optional vector IDs.
+            namespace (Optional[str]): Optional namespace for the vectors.
+            metas (Optional[list[Optional[dict]]]): Optional list of dictionaries containing metadata.
+            content (Optional[str]): The text content to be included in each payload.
+
+        Returns:
+            list[str]: The IDs of the upserted vectors.
+        """
+        rows = self._zip_vectors(vectors, vector_ids=vector_ids, metas=metas)
+        ids = [
+            vector_id if vector_id is not None else str(uuid.uuid5(uuid.NAMESPACE_DNS, str(vector)))
+            for vector, vector_id, _ in rows
+        ]
+
+        points = import_optional_dependency("qdrant_client.http.models").Batch(
+            ids=ids,
+            vectors=[vector for vector, _, _ in rows],
+            payloads=[
+                {**(meta or {}), self.content_payload_key: content} if content else meta or {} for _, _, meta in rows
+            ],
+        )
+
+        self.client.upsert(collection_name=self.collection_name, points=points)
+        return ids
+
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        """Check which vector IDs exist in the Qdrant collection with a single retrieve request.
+
+        Parameters:
+            vector_ids (list[str]): IDs of the vectors to check.
+            namespace (str, optional): Optional namespace of the vectors.
+
+        Returns:
+            set[str]: The IDs that exist in the collection.
+        """
+        results = self.client.retrieve(
+            collection_name=self.collection_name, ids=vector_ids, with_payload=False, with_vectors=False
+        )
+
+        return {str(result.id) for result in results}
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Load a vector entry from the Qdrant collection based on its ID.
 
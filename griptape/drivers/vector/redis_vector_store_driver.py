@@ -7,6 +7,7 @@ import numpy as np
 from attrs import define, field
 
 from griptape.drivers import BaseVectorStoreDriver
+from griptape.schemas.codec import loads_json
 from griptape.utils import import_optional_dependency, str_to_hash
 from griptape.utils.decorators import lazy_property
 
@@ -61,21 +62,46 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         """
         vector_id = vector_id or str_to_hash(str(vector))
         key = self._generate_key(vector_id, namespace)
-        bytes_vector = json.dumps(vector).encode("utf-8")
 
-        mapping = {}
-        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
-        mapping["vec_string"] = bytes_vector
+        self.client.hset(key, mapping=self._generate_mapping(vector, namespace=namespace, meta=meta))
 
-        if namespace:
-            mapping["namespace"] = namespace
+        return vector_id
 
-        if meta:
-            mapping["metadata"] = json.dumps(meta)
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Inserts or updates multiple vectors in Redis using a single pipeline round-trip."""
+        result = []
 
-        self.client.hset(key, mapping=mapping)
+        with self.client.pipeline(transaction=False) as pipeline:
+            for vector, vector_id, meta in self._zip_vectors(vectors, vector_ids=vector_ids, metas=metas):
+                vector_id = vector_id or str_to_hash(str(vector))
 
-        return vector_id
+                pipeline.hset(
+                    self._generate_key(vector_id, namespace),
+                    mapping=self._generate_mapping(vector, namespace=namespace, meta=meta),
+                )
+                result.append(vector_id)
+
+            pipeline.execute()
+
+        return result
+
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        """Checks which vector ids exist in Redis using a single pipeline round-trip."""
+        with self.client.pipeline(transaction=False) as pipeline:
+            for vector_id in vector_ids:
+                pipeline.exists(self._generate_key(vector_id, namespace))
+
+            exists = pipeline.execute()
+
+        return {vector_id for vector_id, e in zip(vector_ids, exists) if e}
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from Redis based on its identifier and optional namespace.
@@ -86,7 +112,7 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         key = self._generate_key(vector_id, namespace)
         result = self.client.hgetall(key)
         vector = np.frombuffer(result[b"vector"], dtype=np.float32).tolist()
-        meta = json.loads(result[b"metadata"]) if b"metadata" in result else None
+        meta = loads_json(result[b"metadata"]) if b"metadata" in result else None
 
         return BaseVectorStoreDriver.Entry(id=vector_id, meta=meta, vector=vector, namespace=namespace)
 
@@ -115,6 +141,24 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         namespace: Optional[str] = None,
         include_vectors: bool = False,
         **kwargs,
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        """Embeds the query string with the Embedding Driver and searches like `query_vector`."""
+        return self.query_vector(
+            self.embedding_driver.embed_string(query),
+            count=count,
+            namespace=namespace,
+            include_vectors=include_vectors,
+            **kwargs,
+        )
+
+    def query_vector(
+        self,
+        vector: list[float],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
         """Performs a nearest neighbor search on Redis to find vectors similar to the provided input vector.
 
@@ -125,8 +169,6 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         """
         search_query = import_optional_dependency("redis.commands.search.query")
 
-        vector = self.embedding_driver.embed_string(query)
-
         filter_expression = f"(@namespace:{{{namespace}}})" if namespace else "*"
         query_expression = (
             search_query.Query(f"{filter_expression}=>[KNN {count or 10} @vector $vector as score]")
@@ -142,7 +184,7 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
 
         query_results = []
         for document in results:
-            metadata = json.loads(document.metadata) if hasattr(document, "metadata") else None
+            metadata = loads_json(document.metadata) if hasattr(document, "metadata") else None
             namespace = document.id.split(":")[0] if ":" in document.id else None
             vector_id = document.id.split(":")[1] if ":" in document.id else document.id
             vector_float_list = json.loads(document.vec_string) if include_vectors else None
@@ -161,9 +203,23 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         """Generates a Redis key using the provided vector ID and optionally a namespace."""
         return f"{namespace}:{vector_id}" if namespace else vector_id
 
+    def _generate_mapping(self, vector: list[float], *, namespace: Optional[str], meta: Optional[dict]) -> dict:
+        """Generates the Redis hash mapping for a vector."""
+        mapping = {}
+        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
+        mapping["vec_string"] = json.dumps(vector).encode("utf-8")
+
+        if namespace:
+            mapping["namespace"] = namespace
+
+        if meta:
+            mapping["metadata"] = json.dumps(meta)
+
+        return mapping
+
     def _get_doc_prefix(self, namespace: Optional[str] = None) -> str:
         """Get the document prefix based on the provided namespace."""
         return f"{namespace}:" if namespace else ""
 
-    def delete_vector(self, vector_id: str) -> NoReturn:
+    def delete_vector(self, vector_id: str, *, namespace: Optional[str] = None) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
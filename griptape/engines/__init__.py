@@ -1,16 +1,42 @@
-from .extraction.base_extraction_engine import BaseExtractionEngine
-from .extraction.csv_extraction_engine import CsvExtractionEngine
-from .extraction.json_extraction_engine import JsonExtractionEngine
-from .summary.base_summary_engine import BaseSummaryEngine
-from .summary.prompt_summary_engine import PromptSummaryEngine
-from .image.base_image_generation_engine import BaseImageGenerationEngine
-from .image.prompt_image_generation_engine import PromptImageGenerationEngine
-from .image.variation_image_generation_engine import VariationImageGenerationEngine
-from .image.inpainting_image_generation_engine import InpaintingImageGenerationEngine
-from .image.outpainting_image_generation_engine import OutpaintingImageGenerationEngine
-from .image_query.image_query_engine import ImageQueryEngine
-from .audio.text_to_speech_engine import TextToSpeechEngine
-from .audio.audio_transcription_engine import AudioTranscriptionEngine
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .extraction.base_extraction_engine import BaseExtractionEngine
+    from .extraction.csv_extraction_engine import CsvExtractionEngine
+    from .extraction.json_extraction_engine import JsonExtractionEngine
+    from .summary.base_summary_engine import BaseSummaryEngine
+    from .summary.prompt_summary_engine import PromptSummaryEngine
+    from .image.base_image_generation_engine import BaseImageGenerationEngine
+    from .image.prompt_image_generation_engine import PromptImageGenerationEngine
+    from .image.variation_image_generation_engine import VariationImageGenerationEngine
+    from .image.inpainting_image_generation_engine import InpaintingImageGenerationEngine
+    from .image.outpainting_image_generation_engine import OutpaintingImageGenerationEngine
+    from .image_query.image_query_engine import ImageQueryEngine
+    from .audio.text_to_speech_engine import TextToSpeechEngine
+    from .audio.audio_transcription_engine import AudioTranscriptionEngine
+    from .cache.semantic_cache_engine import SemanticCacheEngine
+
+# Engines are imported on first access so that importing this package doesn't import every optional
+# dependency. Maps each public name to the module that defines it.
+_LAZY_IMPORTS = {
+    "BaseExtractionEngine": ".extraction.base_extraction_engine",
+    "CsvExtractionEngine": ".extraction.csv_extraction_engine",
+    "JsonExtractionEngine": ".extraction.json_extraction_engine",
+    "BaseSummaryEngine": ".summary.base_summary_engine",
+    "PromptSummaryEngine": ".summary.prompt_summary_engine",
+    "BaseImageGenerationEngine": ".image.base_image_generation_engine",
+    "PromptImageGenerationEngine": ".image.prompt_image_generation_engine",
+    "VariationImageGenerationEngine": ".image.variation_image_generation_engine",
+    "InpaintingImageGenerationEngine": ".image.inpainting_image_generation_engine",
+    "OutpaintingImageGenerationEngine": ".image.outpainting_image_generation_engine",
+    "ImageQueryEngine": ".image_query.image_query_engine",
+    "TextToSpeechEngine": ".audio.text_to_speech_engine",
+    "AudioTranscriptionEngine": ".audio.audio_transcription_engine",
+    "SemanticCacheEngine": ".cache.semantic_cache_engine",
+}
 
 __all__ = [
     "BaseSummaryEngine",
@@ -26,4 +52,21 @@ __all__ = [
     "ImageQueryEngine",
     "TextToSpeechEngine",
     "AudioTranscriptionEngine",
+    "SemanticCacheEngine",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+from attrs import Attribute, Factory, define, field
+
+from griptape.configs import Defaults
+from griptape.utils.hash import str_to_hash
+
+if TYPE_CHECKING:
+    from griptape.drivers import BaseVectorStoreDriver
+
+logger = logging.getLogger(Defaults.logging_config.logger_name)
+
+
+@define
+class SemanticCacheEngine:
+    """Caches responses by the meaning of the prompt that they answer.
+
+    Prompts are embedded with the Vector Store Driver's Embedding Driver and stored alongside their responses, so that a
+    later prompt that is similar enough reuses the response. Entries are stored in vector store namespaces, so that
+    prompts are only compared to prompts that share the same namespace.
+
+    Attributes:
+        vector_store_driver: Vector Store Driver to store prompts and their responses in.
+        similarity_threshold: Minimum score of a stored prompt for its response to be reused. Scores are compared as
+            returned by the Vector Store Driver, e.g. the cosine similarity for `LocalVectorStoreDriver`, so higher
+            scores must mean more similar prompts.
+        ttl: Optional number of seconds after which stored responses are no longer reused.
+        candidate_count: Number of most similar stored prompts to consider on each query. Candidates that expired or
+            were invalidated are skipped.
+        namespace_prefix: Prefix of the namespaces that entries are stored in. Used by `invalidate` to only delete
+            entries of this engine when the Vector Store Driver is shared.
+    """
+
+    vector_store_driver: BaseVectorStoreDriver = field(
+        default=Factory(lambda: Defaults.drivers_config.vector_store_driver), kw_only=True
+    )
+    similarity_threshold: float = field(default=0.9, kw_only=True)
+    ttl: Optional[float] = field(default=None, kw_only=True)
+    candidate_count: int = field(default=5, kw_only=True)
+    namespace_prefix: str = field(default="semantic-cache", kw_only=True)
+    _invalidated_at: dict[Optional[str], float] = field(factory=dict, init=False, eq=False)
+    _namespaces: set[str] = field(factory=set, init=False, eq=False)
+    _thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False, eq=False)
+
+    @ttl.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_ttl(self, _: Attribute, ttl: Optional[float]) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+
+    @candidate_count.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_candidate_count(self, _: Attribute, candidate_count: int) -> None:
+        if candidate_count < 1:
+            raise ValueError("candidate_count must be at least 1")
+
+    def get_namespace(self, key: str) -> str:
+        """Returns the namespace of entries scoped by `key`, such as a hash of a system prompt and tools."""
+        return f"{self.namespace_prefix}-{str_to_hash(key)}"
+
+    def embed(self, prompt: str) -> list[float]:
+        """Embeds a prompt with the Vector Store Driver's Embedding Driver.
+
+        The embedding can be passed to both `query` and `upsert`, so that a prompt is only embedded once.
+        """
+        return self.vector_store_driver.embedding_driver.embed_string(prompt)
+
+    def query(
+        self, prompt: str, *, namespace: str, vector: Optional[list[float]] = None
+    ) -> Optional[BaseVectorStoreDriver.Entry]:
+        """Finds the entry of the most similar stored prompt.
+
+        Args:
+            prompt: Prompt to find a stored response for.
+            namespace: Namespace to search in.
+            vector: Optional embedding of the prompt from `embed`. The prompt is embedded if `None`.
+
+        Returns:
+            The entry of the most similar prompt, with its response in `meta["response"]`, or `None` if no unexpired
+                prompt scores at least `similarity_threshold`.
+        """
+        self.__add_namespace(namespace)
+
+        if vector is None:
+            vector = self.embed(prompt)
+
+        try:
+            entries = self.vector_store_driver.query_vector(vector, count=self.candidate_count, namespace=namespace)
+        except NotImplementedError:
+            # Vector Store Drivers that embed queries themselves can only be queried by text.
+            entries = self.vector_store_driver.query(prompt, count=self.candidate_count, namespace=namespace)
+
+        for entry in entries:
+            if entry.score is None or entry.score < self.similarity_threshold:
+                continue
+
+            if self.__is_expired(entry, namespace):
+                # Expired entries are deleted as they are found, where the Vector Store Driver supports it.
+                self.__delete_entry(entry)
+
+                continue
+
+            return entry
+
+        return None
+
+    def upsert(self, prompt: str, response: str, *, namespace: str, vector: Optional[list[float]] = None) -> str:
+        """Stores the response to a prompt, replacing a previous response to the same prompt.
+
+        Args:
+            prompt: Prompt that was answered.
+            response: Response to reuse for similar prompts.
+            namespace: Namespace to store the entry in.
+            vector: Optional embedding of the prompt from `embed`. The prompt is embedded if `None`.
+
+        Returns:
+            The vector id of the entry.
+        """
+        vector_id = self.get_vector_id(prompt, namespace=namespace)
+        self.__add_namespace(namespace)
+
+        return self.vector_store_driver.upsert_vector(
+            self.embed(prompt) if vector is None else vector,
+            vector_id=vector_id,
+            namespace=namespace,
+            meta={"prompt": prompt, "response": response, "created_at": time.time()},
+        )
+
+    def get_vector_id(self, prompt: str, *, namespace: str) -> str:
+        """Returns the vector id of a prompt's entry, which is unique across namespaces."""
+        return str_to_hash(f"{namespace}:{prompt}")
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Stops reusing the responses stored so far.
+
+        Entries are deleted where the Vector Store Driver supports loading and deleting them. Otherwise, a warning is
+        logged and they are only ignored by this engine instance until they are replaced.
+
+        Args:
+            namespace: Namespace to invalidate. Every namespace that this engine instance queried or stored entries in
+                is invalidated if `None`.
+        """
+        self._invalidated_at[namespace] = time.time()
+
+        if namespace is None:
+            with self._thread_lock:
+                namespaces = sorted(self._namespaces)
+        else:
+            namespaces = [namespace] if namespace.startswith(f"{self.namespace_prefix}-") else []
+
+        undeleted_count = 0
+
+        for cache_namespace in namespaces:
+            try:
+                entries = self.vector_store_driver.load_entries(namespace=cache_namespace)
+            except NotImplementedError:
+                logger.warning(
+                    "%s can't load entries, so invalidated semantic cache entries in namespace %s weren't deleted.",
+                    self.vector_store_driver.__class__.__name__,
+                    cache_namespace,
+                )
+
+                continue
+
+            undeleted_count += sum(not self.__delete_entry(entry) for entry in entries)
+
+        if undeleted_count:
+            logger.warning(
+                "%s can't delete entries, so %s invalidated semantic cache entries are only ignored by this engine.",
+                self.vector_store_driver.__class__.__name__,
+                undeleted_count,
+            )
+
+    def __add_namespace(self, namespace: str) -> None:
+        with self._thread_lock:
+            self._namespaces.add(namespace)
+
+    def __is_expired(self, entry: BaseVectorStoreDriver.Entry, namespace: str) -> bool:
+        created_at = (entry.meta or {}).get("created_at")
+
+        if created_at is None:
+            return True
+
+        if self.ttl is not None and time.time() - created_at > self.ttl:
+            return True
+
+        invalidated_at = max(self._invalidated_at.get(None, 0.0), self._invalidated_at.get(namespace, 0.0))
+
+        return created_at <= invalidated_at
+
+    def __delete_entry(self, entry: BaseVectorStoreDriver.Entry) -> bool:
+        try:
+            self.vector_store_driver.delete_vector(entry.id, namespace=entry.namespace)
+        except NotImplementedError:
+            return False
+
+        return True
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 
 @define(kw_only=True)
 class ResponseRagStage(BaseRagStage):
+    futures_executor_name: str = field(default="llm")
     response_modules: list[BaseResponseRagModule] = field()
 
     @property
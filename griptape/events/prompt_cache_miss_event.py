@@ -0,0 +1,7 @@
+from attrs import define
+
+from griptape.events.base_prompt_cache_event import BasePromptCacheEvent
+
+
+@define
+class PromptCacheMissEvent(BasePromptCacheEvent): ...
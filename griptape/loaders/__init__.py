@@ -1,19 +1,40 @@
-from .base_loader import BaseLoader
-from .base_file_loader import BaseFileLoader
+from __future__ import annotations
 
-from .text_loader import TextLoader
-from .pdf_loader import PdfLoader
-from .web_loader import WebLoader
-from .sql_loader import SqlLoader
-from .csv_loader import CsvLoader
-from .email_loader import EmailLoader
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .blob_loader import BlobLoader
+if TYPE_CHECKING:
+    from .base_loader import BaseLoader
+    from .base_file_loader import BaseFileLoader
 
-from .image_loader import ImageLoader
+    from .text_loader import TextLoader
+    from .pdf_loader import PdfLoader
+    from .web_loader import WebLoader
+    from .sql_loader import SqlLoader
+    from .csv_loader import CsvLoader
+    from .email_loader import EmailLoader
 
-from .audio_loader import AudioLoader
+    from .blob_loader import BlobLoader
 
+    from .image_loader import ImageLoader
+
+    from .audio_loader import AudioLoader
+
+# Loaders are imported on first access so that importing this package doesn't import every optional
+# dependency. Maps each public name to the module that defines it.
+_LAZY_IMPORTS = {
+    "BaseLoader": ".base_loader",
+    "BaseFileLoader": ".base_file_loader",
+    "TextLoader": ".text_loader",
+    "PdfLoader": ".pdf_loader",
+    "WebLoader": ".web_loader",
+    "SqlLoader": ".sql_loader",
+    "CsvLoader": ".csv_loader",
+    "EmailLoader": ".email_loader",
+    "BlobLoader": ".blob_loader",
+    "ImageLoader": ".image_loader",
+    "AudioLoader": ".audio_loader",
+}
 
 __all__ = [
     "BaseLoader",
@@ -28,3 +49,19 @@ __all__ = [
     "AudioLoader",
     "BlobLoader",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
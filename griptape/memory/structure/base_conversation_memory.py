@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import bisect
+import itertools
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -25,6 +27,8 @@ class BaseConversationMemory(SerializableMixin, ABC):
     autoload: bool = field(default=True, kw_only=True)
     autoprune: bool = field(default=True, kw_only=True)
     max_runs: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    _empty_stack_token_counts: dict[tuple, int] = field(factory=dict, init=False, eq=False)
+    _prompt_stack_token_count: Optional[tuple[tuple, str, int]] = field(default=None, init=False, eq=False)
 
     def __attrs_post_init__(self) -> None:
         if self.autoload:
@@ -67,31 +71,8 @@ class BaseConversationMemory(SerializableMixin, ABC):
         """
         num_runs_to_fit_in_prompt = len(self.runs)
 
-        if self.autoprune:
-            should_prune = True
-            temp_stack = PromptStack()
-
-            # Try to determine how many Conversation Memory runs we can
-            # fit into the Prompt Stack without exceeding the token limit.
-            while should_prune and num_runs_to_fit_in_prompt > 0:
-                temp_stack.messages = prompt_stack.messages.copy()
-
-                # Add n runs from Conversation Memory.
-                # Where we insert into the Prompt Stack doesn't matter here
-                # since we only care about the total token count.
-                memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
-                temp_stack.messages.extend(memory_inputs)
-
-                # Convert the Prompt Stack into tokens left.
-                tokens_left = prompt_driver.tokenizer.count_input_tokens_left(
-                    prompt_driver.prompt_stack_to_string(temp_stack),
-                )
-                if tokens_left > 0:
-                    # There are still tokens left, no need to prune.
-                    should_prune = False
-                else:
-                    # There were not any tokens left, prune one run and try again.
-                    num_runs_to_fit_in_prompt -= 1
+        if self.autoprune and num_runs_to_fit_in_prompt > 0:
+            num_runs_to_fit_in_prompt = self._count_runs_to_fit_in_prompt(prompt_driver, prompt_stack)
 
         if num_runs_to_fit_in_prompt:
             memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
@@ -101,3 +82,73 @@ class BaseConversationMemory(SerializableMixin, ABC):
                 prompt_stack.messages[index:index] = memory_inputs
 
         return prompt_stack
+
+    def _count_runs_to_fit_in_prompt(self, prompt_driver: BasePromptDriver, prompt_stack: PromptStack) -> int:
+        # Estimate how many of the most recent runs fit from the Prompt Stack's token count and each run's cached token
+        # count, then confirm the estimate with a single token count of the resulting Prompt Stack. Token counts aren't
+        # exactly additive, and subclasses may add messages besides runs, so an estimate that doesn't fit is corrected
+        # by the difference between the counted and estimated tokens and confirmed again.
+        max_input_tokens = prompt_driver.tokenizer.max_input_tokens
+        prompt_stack_token_count = self._count_prompt_stack_tokens(prompt_driver, prompt_stack)
+        # The token count of an empty Prompt Stack is included in every run's token count.
+        empty_stack_token_count = self._count_empty_stack_tokens(prompt_driver)
+        run_token_counts = list(
+            itertools.accumulate(
+                max(0, self._count_run_tokens(prompt_driver, run) - empty_stack_token_count)
+                for run in reversed(self.runs)
+            )
+        )
+        tokens_left = max_input_tokens - prompt_stack_token_count
+        num_runs = bisect.bisect_left(run_token_counts, tokens_left)
+
+        while num_runs > 0:
+            # Where we insert into the Prompt Stack doesn't matter here since we only care about the total token count.
+            temp_stack = PromptStack(messages=[*prompt_stack.messages, *self.to_prompt_stack(num_runs).messages])
+            token_count = prompt_driver.tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(temp_stack))
+
+            if token_count < max_input_tokens:
+                break
+
+            error = token_count - (prompt_stack_token_count + run_token_counts[num_runs - 1])
+            num_runs = min(num_runs - 1, bisect.bisect_left(run_token_counts, tokens_left - error))
+
+        return num_runs
+
+    def _count_prompt_stack_tokens(self, prompt_driver: BasePromptDriver, prompt_stack: PromptStack) -> int:
+        # Structures usually add memory to the same Prompt Stack more than once, such as on each ToolkitTask subtask.
+        key = self._get_token_count_key(prompt_driver)
+        prompt_stack_string = prompt_driver.prompt_stack_to_string(prompt_stack)
+
+        if self._prompt_stack_token_count is None or self._prompt_stack_token_count[:2] != (key, prompt_stack_string):
+            token_count = prompt_driver.tokenizer.count_tokens(prompt_stack_string)
+            self._prompt_stack_token_count = (key, prompt_stack_string, token_count)
+
+        return self._prompt_stack_token_count[2]
+
+    def _count_empty_stack_tokens(self, prompt_driver: BasePromptDriver) -> int:
+        key = self._get_token_count_key(prompt_driver)
+        token_count = self._empty_stack_token_counts.get(key)
+
+        if token_count is None:
+            token_count = prompt_driver.tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(PromptStack()))
+            self._empty_stack_token_counts[key] = token_count
+
+        return token_count
+
+    def _count_run_tokens(self, prompt_driver: BasePromptDriver, run: Run) -> int:
+        # Runs don't change once added, so their token counts are cached on the run for each kind of Prompt Driver.
+        key = self._get_token_count_key(prompt_driver)
+        token_count = run._token_counts.get(key)
+
+        if token_count is None:
+            run_stack = PromptStack()
+            run_stack.add_user_message(run.input)
+            run_stack.add_assistant_message(run.output)
+
+            token_count = prompt_driver.tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(run_stack))
+            run._token_counts[key] = token_count
+
+        return token_count
+
+    def _get_token_count_key(self, prompt_driver: BasePromptDriver) -> tuple:
+        return type(prompt_driver), type(prompt_driver.tokenizer), getattr(prompt_driver.tokenizer, "model", None)
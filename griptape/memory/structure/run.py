@@ -17,3 +17,4 @@ class Run(SerializableMixin):
     meta: Optional[dict] = field(default=None, metadata={"serializable": True})
     input: BaseArtifact = field(metadata={"serializable": True})
     output: BaseArtifact = field(metadata={"serializable": True})
+    _token_counts: dict[tuple, int] = field(factory=dict, init=False, eq=False)
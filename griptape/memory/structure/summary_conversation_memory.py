@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 from typing import TYPE_CHECKING, Optional
 
 from attrs import Factory, define, field
@@ -8,15 +10,28 @@ from attrs import Factory, define, field
 from griptape.common import Message, PromptStack
 from griptape.configs import Defaults
 from griptape.memory.structure import ConversationMemory
+from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
 from griptape.utils import J2
 
 if TYPE_CHECKING:
+    from concurrent import futures
+
     from griptape.drivers import BasePromptDriver
     from griptape.memory.structure import Run
 
 
 @define
-class SummaryConversationMemory(ConversationMemory):
+class SummaryConversationMemory(ConversationMemory, FuturesExecutorMixin):
+    """Conversation Memory that summarizes runs older than `offset`.
+
+    Attributes:
+        offset: Number of most recent runs to keep unsummarized.
+        summarize_in_background: Whether to summarize runs on `futures_executor` instead of blocking `add_run`. Runs
+            added while a summary is being generated are summarized together once it's done, and `to_prompt_stack`
+            includes runs that aren't summarized yet. Use `flush` to wait for pending summaries.
+        futures_executor_name: Name of the shared pool to summarize runs in.
+    """
+
     offset: int = field(default=1, kw_only=True, metadata={"serializable": True})
     prompt_driver: BasePromptDriver = field(
         kw_only=True, default=Factory(lambda: Defaults.drivers_config.prompt_driver)
@@ -28,15 +43,23 @@ class SummaryConversationMemory(ConversationMemory):
         default=Factory(lambda: J2("memory/conversation/summarize_conversation.j2")),
         kw_only=True,
     )
+    summarize_in_background: bool = field(default=False, kw_only=True)
+    futures_executor_name: str = field(default="llm", kw_only=True)
+    _summary_future: Optional[futures.Future] = field(default=None, init=False, eq=False)
+    _summarizing: bool = field(default=False, init=False, eq=False)
+    _summary_lock: threading.RLock = field(default=Factory(lambda: threading.RLock()), init=False, eq=False)
 
     def to_prompt_stack(self, last_n: Optional[int] = None) -> PromptStack:
         stack = PromptStack()
-        if self.summary:
-            stack.add_user_message(self.summary_template_generator.render(summary=self.summary))
 
-        for r in self.unsummarized_runs(last_n):
-            stack.add_user_message(r.input)
-            stack.add_assistant_message(r.output)
+        # The summary and its index are updated together by background summaries.
+        with self._summary_lock:
+            if self.summary:
+                stack.add_user_message(self.summary_template_generator.render(summary=self.summary))
+
+            for r in self.unsummarized_runs(last_n):
+                stack.add_user_message(r.input)
+                stack.add_assistant_message(r.output)
 
         return stack
 
@@ -54,14 +77,68 @@ class SummaryConversationMemory(ConversationMemory):
             return summary_index_runs
 
     def try_add_run(self, run: Run) -> None:
-        super().try_add_run(run)
+        if not self.summarize_in_background:
+            super().try_add_run(run)
+
+            runs_to_summarize = self.__runs_to_summarize()
+
+            if len(runs_to_summarize) > 0:
+                self.summary = self.summarize_runs(self.summary, runs_to_summarize)
+                self.summary_index = 1 + self.runs.index(runs_to_summarize[-1])
+
+            return
 
+        with self._summary_lock:
+            super().try_add_run(run)
+
+            # Runs added while a summary is being generated are picked up by the same background task.
+            submit = not self._summarizing and len(self.__runs_to_summarize()) > 0
+            self._summarizing = self._summarizing or submit
+
+        if submit:
+            self._summary_future = self.futures_executor.submit(self.__summarize_pending_runs)
+
+    def flush(self) -> None:
+        """Waits for runs that are being summarized in the background."""
+        if self._summary_future is not None:
+            self._summary_future.result()
+
+    async def flush_async(self) -> None:
+        """Waits for runs that are being summarized in the background without blocking the event loop."""
+        if self._summary_future is not None:
+            await asyncio.wrap_future(self._summary_future)
+
+    def __runs_to_summarize(self) -> list[Run]:
         unsummarized_runs = self.unsummarized_runs()
-        runs_to_summarize = unsummarized_runs[: max(0, len(unsummarized_runs) - self.offset)]
 
-        if len(runs_to_summarize) > 0:
-            self.summary = self.summarize_runs(self.summary, runs_to_summarize)
-            self.summary_index = 1 + self.runs.index(runs_to_summarize[-1])
+        return unsummarized_runs[: max(0, len(unsummarized_runs) - self.offset)]
+
+    def __summarize_pending_runs(self) -> None:
+        try:
+            while True:
+                with self._summary_lock:
+                    previous_summary = self.summary
+                    runs_to_summarize = self.__runs_to_summarize()
+
+                    # Checked under the same lock as `try_add_run` so that no added run is left unsummarized.
+                    if len(runs_to_summarize) == 0:
+                        self._summarizing = False
+
+                        return
+
+                summary = self.summarize_runs(previous_summary, runs_to_summarize)
+
+                with self._summary_lock:
+                    self.summary = summary
+                    # Runs may have been dropped by `max_runs` while summarizing.
+                    self.summary_index = (
+                        1 + self.runs.index(runs_to_summarize[-1]) if runs_to_summarize[-1] in self.runs else 0
+                    )
+        except BaseException:
+            with self._summary_lock:
+                self._summarizing = False
+
+            raise
 
     def summarize_runs(self, previous_summary: str | None, runs: list[Run]) -> str | None:
         try:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import inspect
+import functools
 from copy import deepcopy
 from typing import Callable, Optional
 
@@ -53,19 +53,14 @@ class ActivityMixin:
         self.allowlist = []
         self.denylist = None
 
-    # This method has to remain a method and can't be decorated with @property because
-    # of the max depth recursion issue in `inspect.getmembers`.
+    # Activities are discovered once per class, the allowlist and denylist are applied on every call.
     def activities(self) -> list[Callable]:
-        methods = []
-
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            allowlist_condition = self.allowlist is None or name in self.allowlist
-            denylist_condition = self.denylist is None or name not in self.denylist
-
-            if getattr(method, "is_activity", False) and allowlist_condition and denylist_condition:
-                methods.append(method)
-
-        return methods
+        return [
+            getattr(self, name)
+            for name in _activity_names(self.__class__)
+            if (self.allowlist is None or name in self.allowlist)
+            and (self.denylist is None or name not in self.denylist)
+        ]
 
     def find_activity(self, name: str) -> Optional[Callable]:
         for activity in self.activities():
@@ -82,7 +77,7 @@ class ActivityMixin:
     def activity_description(self, activity: Callable) -> str:
         if activity is None or not getattr(activity, "is_activity", False):
             raise Exception("This method is not an activity.")
-        return Template(getattr(activity, "config")["description"]).render({"_self": self})
+        return _compile_description(getattr(activity, "config")["description"]).render({"_self": self})
 
     def activity_schema(self, activity: Callable) -> Optional[Schema]:
         if activity is None or not getattr(activity, "is_activity", False):
@@ -91,12 +86,12 @@ class ActivityMixin:
             config_schema = getattr(activity, "config")["schema"]
             if isinstance(config_schema, Callable):
                 config_schema = config_schema(self)
-            else:
-                # Need to deepcopy to avoid modifying the original schema
-                config_schema = deepcopy(getattr(activity, "config")["schema"])
             activity_name = self.activity_name(activity)
 
             if self.extra_schema_properties is not None and activity_name in self.extra_schema_properties:
+                # Need to deepcopy to avoid modifying the original schema
+                if not isinstance(getattr(activity, "config")["schema"], Callable):
+                    config_schema = deepcopy(config_schema)
                 config_schema.schema.update(self.extra_schema_properties[activity_name])
 
             return Schema({"values": config_schema})
@@ -110,3 +105,14 @@ class ActivityMixin:
 
         if not activity or not getattr(activity, "is_activity", False):
             raise ValueError(f"activity {activity_name} is not a valid activity for {tool}")
+
+
+@functools.lru_cache(maxsize=None)
+def _activity_names(cls: type) -> tuple[str, ...]:
+    # Like `inspect.getmembers`, returns names in sorted order without evaluating properties.
+    return tuple(name for name in dir(cls) if getattr(getattr(cls, name, None), "is_activity", False))
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_description(description: str) -> Template:
+    return Template(description)
@@ -5,7 +5,7 @@ from abc import ABC
 from typing import Callable
 
 from attrs import define, field
-from tenacity import Retrying, retry_if_not_exception_type, stop_after_attempt, wait_exponential
+from tenacity import AsyncRetrying, Retrying, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
 
 @define(slots=False)
@@ -24,3 +24,12 @@ class ExponentialBackoffMixin(ABC):
             reraise=True,
             after=self.after_hook,
         )
+
+    def retrying_async(self) -> AsyncRetrying:
+        return AsyncRetrying(
+            wait=wait_exponential(min=self.min_retry_delay, max=self.max_retry_delay),
+            retry=retry_if_not_exception_type(self.ignored_exception_types),
+            stop=stop_after_attempt(self.max_attempts),
+            reraise=True,
+            after=self.after_hook,
+        )
@@ -1,26 +1,54 @@
 from __future__ import annotations
 
 from abc import ABC
-from concurrent import futures
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 from attrs import Factory, define, field
 
+from griptape.utils.futures import FuturesExecutorRegistry
+
+if TYPE_CHECKING:
+    from concurrent import futures
+
 
 @define(slots=False, kw_only=True)
 class FuturesExecutorMixin(ABC):
-    futures_executor_fn: Callable[[], futures.Executor] = field(
-        default=Factory(lambda: lambda: futures.ThreadPoolExecutor()),
-    )
+    """Provides a futures executor for running work concurrently.
+
+    By default the executor is borrowed from the shared `FuturesExecutorRegistry` pool named `futures_executor_name`.
+    Setting `futures_executor_fn` or `futures_executor` gives the object its own executor instead, which is shut down
+    when the object is garbage collected.
+
+    Attributes:
+        futures_executor_name: Name of the shared pool to borrow from.
+        futures_executor_fn: Optional factory for an executor owned by this object.
+    """
 
-    futures_executor: Optional[futures.Executor] = field(
-        default=Factory(lambda self: self.futures_executor_fn(), takes_self=True)
+    futures_executor_name: str = field(default="io")
+    futures_executor_fn: Optional[Callable[[], futures.Executor]] = field(default=None)
+
+    _futures_executor: Optional[futures.Executor] = field(
+        default=Factory(
+            lambda self: self.futures_executor_fn() if self.futures_executor_fn is not None else None, takes_self=True
+        ),
+        alias="futures_executor",
     )
 
+    @property
+    def futures_executor(self) -> futures.Executor:
+        if self._futures_executor is None:
+            return FuturesExecutorRegistry.get_executor(self.futures_executor_name)
+
+        return self._futures_executor
+
+    @futures_executor.setter
+    def futures_executor(self, futures_executor: Optional[futures.Executor]) -> None:
+        self._futures_executor = futures_executor
+
     def __del__(self) -> None:
-        executor = self.futures_executor
+        executor = getattr(self, "_futures_executor", None)
 
-        if executor is not None:
-            self.futures_executor = None
+        if executor is not None and not FuturesExecutorRegistry.is_shared(executor):
+            self._futures_executor = None
 
             executor.shutdown(wait=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 from abc import ABC
 from importlib import import_module
@@ -8,6 +9,7 @@ from typing import TYPE_CHECKING, Generic, Optional, TypeVar, cast
 from attrs import Factory, define, field
 
 from griptape.schemas.base_schema import BaseSchema
+from griptape.schemas.codec import dump_obj, load_obj, loads_json
 
 if TYPE_CHECKING:
     from marshmallow import Schema
@@ -36,26 +38,17 @@ class SerializableMixin(Generic[T]):
             subclass_name: An optional subclass name. Required if the class is abstract.
             module_name: An optional module name. Defaults to the class's module.
         """
-        if ABC in cls.__bases__:
-            if subclass_name is None:
-                raise ValueError(f"Type field is required for abstract class: {cls.__name__}")
-
-            module_name = module_name or cls.__module__
-            subclass_cls = cls._import_cls_rec(module_name, subclass_name)
-
-            schema_class = BaseSchema.from_attrs_cls(subclass_cls)
-        else:
-            schema_class = BaseSchema.from_attrs_cls(cls)
-
-        return schema_class()
+        return BaseSchema.from_attrs_cls(cls._resolve_cls(subclass_name, module_name=module_name))()
 
     @classmethod
     def from_dict(cls: type[T], data: dict) -> T:
-        return cast(T, cls.get_schema(subclass_name=data.get("type"), module_name=data.get("module_name")).load(data))
+        schema = BaseSchema.get_shared_schema(cls._resolve_cls(data.get("type"), module_name=data.get("module_name")))
+
+        return cast(T, load_obj(schema, data))
 
     @classmethod
-    def from_json(cls: type[T], data: str) -> T:
-        return cls.from_dict(json.loads(data))
+    def from_json(cls: type[T], data: str | bytes) -> T:
+        return cls.from_dict(loads_json(data))
 
     def __str__(self) -> str:
         return json.dumps(self.to_dict())
@@ -64,16 +57,36 @@ class SerializableMixin(Generic[T]):
         return json.dumps(self.to_dict())
 
     def to_dict(self) -> dict:
-        schema = BaseSchema.from_attrs_cls(self.__class__)
+        schema = BaseSchema.get_shared_schema(self.__class__)
+
+        return dict(dump_obj(schema, self))
+
+    @classmethod
+    def _resolve_cls(cls, subclass_name: Optional[str] = None, *, module_name: Optional[str] = None) -> type:
+        """Resolves the class to (de)serialize with, importing the subclass if the class is abstract.
 
-        return dict(schema().dump(self))
+        Args:
+            subclass_name: An optional subclass name. Required if the class is abstract.
+            module_name: An optional module name. Defaults to the class's module.
+
+        Returns:
+            The class itself, or the subclass if the class is abstract.
+        """
+        if ABC in cls.__bases__:
+            if subclass_name is None:
+                raise ValueError(f"Type field is required for abstract class: {cls.__name__}")
+
+            return cls._import_cls_rec(module_name or cls.__module__, subclass_name)
+        else:
+            return cls
 
     @classmethod
+    @functools.lru_cache(maxsize=None)  # noqa: B019
     def _import_cls_rec(cls, module_name: str, class_name: str) -> type:
         """Imports a class given a module name and class name.
 
         Will recursively traverse up the module's path until it finds a
-        package that it can import `class_name` from.
+        package that it can import `class_name` from. Found classes are cached.
 
         Args:
             module_name: The module name.
@@ -18,23 +18,58 @@ class BaseSchema(Schema):
 
     DATACLASS_TYPE_MAPPING = {**Schema.TYPE_MAPPING, dict: fields.Dict, bytes: Bytes, Any: fields.Raw}
 
+    _schema_classes: dict[tuple[type, type], type] = {}
+    _schema_instances: dict[tuple[type, type], Schema] = {}
+
     @classmethod
     def from_attrs_cls(cls, attrs_cls: type) -> type:
         """Generate a Schema from an attrs class.
 
+        Schemas are generated once per attrs class and reused on subsequent calls.
+
+        Args:
+            attrs_cls: An attrs class.
+        """
+        key = (cls, attrs_cls)
+        schema_class = cls._schema_classes.get(key)
+
+        if schema_class is None:
+            schema_class = cls._generate_schema_cls(attrs_cls)
+            cls._schema_classes[key] = schema_class
+
+        return schema_class
+
+    @classmethod
+    def get_shared_schema(cls, attrs_cls: type) -> Schema:
+        """Get a Schema instance for an attrs class that is shared between callers.
+
+        The instance is reused across calls to avoid re-instantiating the Schema's fields, so it must not be mutated.
+
         Args:
             attrs_cls: An attrs class.
         """
+        key = (cls, attrs_cls)
+        schema = cls._schema_instances.get(key)
+
+        if schema is None:
+            schema = cls.from_attrs_cls(attrs_cls)()
+            cls._schema_instances[key] = schema
+
+        return schema
+
+    @classmethod
+    def _generate_schema_cls(cls, attrs_cls: type) -> type:
         from marshmallow import post_load
 
         from griptape.mixins.serializable_mixin import SerializableMixin
 
-        class SubSchema(cls):
-            @post_load
-            def make_obj(self, data: Any, **kwargs) -> Any:
-                return attrs_cls(**data)
-
         if issubclass(attrs_cls, SerializableMixin):
+
+            class SubSchema(cls):
+                @post_load
+                def make_obj(self, data: Any, **kwargs) -> Any:
+                    return attrs_cls(**data)
+
             cls._resolve_types(attrs_cls)
             return SubSchema.from_dict(
                 {
@@ -150,6 +185,7 @@ class BaseSchema(Schema):
             attrs_cls: An attrs class.
         """
         from collections.abc import Sequence
+        from concurrent import futures
         from typing import Any
 
         from griptape.artifacts import BaseArtifact
@@ -163,6 +199,7 @@ class BaseSchema(Schema):
         )
         from griptape.drivers import (
             BaseAudioTranscriptionDriver,
+            BaseCacheDriver,
             BaseConversationMemoryDriver,
             BaseEmbeddingDriver,
             BaseImageGenerationDriver,
@@ -172,6 +209,7 @@ class BaseSchema(Schema):
             BaseTextToSpeechDriver,
             BaseVectorStoreDriver,
         )
+        from griptape.engines import SemanticCacheEngine
         from griptape.events import EventListener
         from griptape.memory import TaskMemory
         from griptape.memory.structure import BaseConversationMemory, Run
@@ -180,7 +218,7 @@ class BaseSchema(Schema):
         from griptape.tasks import BaseTask
         from griptape.tokenizers import BaseTokenizer
         from griptape.tools import BaseTool
-        from griptape.utils import import_optional_dependency, is_dependency_installed
+        from griptape.utils import RateLimiter, import_optional_dependency, is_dependency_installed
 
         attrs.resolve_types(
             attrs_cls,
@@ -192,9 +230,12 @@ class BaseSchema(Schema):
                 "BaseVectorStoreDriver": BaseVectorStoreDriver,
                 "BaseTextToSpeechDriver": BaseTextToSpeechDriver,
                 "BaseAudioTranscriptionDriver": BaseAudioTranscriptionDriver,
+                "BaseCacheDriver": BaseCacheDriver,
                 "BaseConversationMemoryDriver": BaseConversationMemoryDriver,
                 "BaseRulesetDriver": BaseRulesetDriver,
                 "BaseImageGenerationDriver": BaseImageGenerationDriver,
+                "SemanticCacheEngine": SemanticCacheEngine,
+                "RateLimiter": RateLimiter,
                 "BaseArtifact": BaseArtifact,
                 "PromptStack": PromptStack,
                 "EventListener": EventListener,
@@ -209,6 +250,7 @@ class BaseSchema(Schema):
                 "Reference": Reference,
                 "Run": Run,
                 "Sequence": Sequence,
+                "futures": futures,
                 "TaskMemory": TaskMemory,
                 "State": BaseTask.State,
                 "BaseConversationMemory": BaseConversationMemory,
@@ -222,6 +264,9 @@ class BaseSchema(Schema):
                 "Anthropic": import_optional_dependency("anthropic").Anthropic
                 if is_dependency_installed("anthropic")
                 else Any,
+                "AsyncClient": import_optional_dependency("anthropic").AsyncClient
+                if is_dependency_installed("anthropic")
+                else Any,
                 "BedrockClient": import_optional_dependency("mypy_boto3_bedrock").BedrockClient
                 if is_dependency_installed("mypy_boto3_bedrock")
                 else Any,
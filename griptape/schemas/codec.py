@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import functools
+import json
+import math
+import re
+from collections.abc import Mapping
+from typing import Any, Callable
+
+from marshmallow import INCLUDE, RAISE, Schema, ValidationError, fields, missing
+from marshmallow.decorators import POST_DUMP, POST_LOAD, PRE_DUMP, PRE_LOAD, VALIDATES, VALIDATES_SCHEMA
+
+from griptape.schemas.base_schema import BaseSchema
+from griptape.schemas.polymorphic_schema import PolymorphicSchema
+from griptape.schemas.union_field import Union as UnionField
+
+# Deserializers for values that already have the field's native type. Anything else returns `missing` and is
+# deserialized by the field.
+LEAF_DECODERS: dict[type, Callable[[Any], Any]] = {
+    fields.String: lambda value: value if type(value) is str else missing,
+    fields.Integer: lambda value: value if type(value) is int else missing,
+    fields.Float: lambda value: value if type(value) is float and math.isfinite(value) else missing,
+    fields.Boolean: lambda value: value if type(value) is bool else missing,
+    fields.Dict: lambda value: dict(value) if type(value) is dict else missing,
+    fields.Raw: lambda value: value if value is not None else missing,
+}
+ENCODER_ATTRIBUTE = "_griptape_encoder"
+DECODER_ATTRIBUTE = "_griptape_decoder"
+
+
+def dump_obj(schema: Schema, obj: Any) -> Any:
+    """Serializes an object with a Schema generated by `BaseSchema.from_attrs_cls`.
+
+    Produces the same result as `schema.dump(obj)`. The Schema's fields are compiled into a single function on first
+    use, which skips Marshmallow's per-field bookkeeping for nested, list, and union fields. Schemas with dump hooks are
+    dumped with Marshmallow.
+
+    Args:
+        schema: A long-lived Schema instance, such as one returned by `BaseSchema.get_shared_schema`.
+        obj: The object to serialize.
+    """
+    return _get_encoder(schema)(obj)
+
+
+def load_obj(schema: Schema, data: Any) -> Any:
+    """Deserializes data with a Schema generated by `BaseSchema.from_attrs_cls`.
+
+    Produces the same result as `schema.load(data)` using a compiled function like `dump_obj`. Invalid data is loaded
+    again with Marshmallow so that the same `ValidationError` is raised.
+
+    Args:
+        schema: A long-lived Schema instance, such as one returned by `BaseSchema.get_shared_schema`.
+        data: The data to deserialize.
+    """
+    try:
+        return _get_decoder(schema)(data)
+    except ValidationError:
+        return schema.load(data)
+
+
+def loads_json(data: str | bytes) -> Any:
+    """Parses a JSON document with `orjson` if it is installed, falling back to `json.loads`.
+
+    Documents `orjson` would parse differently, like ones with `NaN` or integers outside the 64-bit range, are parsed by
+    `json.loads`.
+
+    Args:
+        data: The JSON document.
+    """
+    return _get_json_loads()(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_json_loads() -> Callable[[str | bytes], Any]:
+    from griptape.utils import import_optional_dependency, is_dependency_installed
+
+    if not is_dependency_installed("orjson"):
+        return json.loads
+
+    orjson = import_optional_dependency("orjson")
+    # orjson parses integers outside the 64-bit range as floats, so documents with integer tokens of 19 or more digits
+    # are left to json. Digits of floats, like the mantissas of vectors, aren't integer tokens.
+    long_integer = re.compile(r"(?<![\d.eE+-])-?\d{19,}(?![\d.eE])")
+    long_integer_bytes = re.compile(rb"(?<![\d.eE+-])-?\d{19,}(?![\d.eE])")
+
+    def loads(data: str | bytes) -> Any:
+        if (long_integer if isinstance(data, str) else long_integer_bytes).search(data):
+            return json.loads(data)
+
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    return loads
+
+
+def _get_encoder(schema: Schema) -> Callable[[Any], Any]:
+    encoder = getattr(schema, ENCODER_ATTRIBUTE, None)
+
+    if encoder is None:
+        encoder = _compile_encoder(schema)
+        setattr(schema, ENCODER_ATTRIBUTE, encoder)
+
+    return encoder
+
+
+def _get_decoder(schema: Schema) -> Callable[[Any], Any]:
+    decoder = getattr(schema, DECODER_ATTRIBUTE, None)
+
+    if decoder is None:
+        decoder = _compile_decoder(schema)
+        setattr(schema, DECODER_ATTRIBUTE, decoder)
+
+    return decoder
+
+
+def _is_compilable(schema: Schema) -> bool:
+    return (
+        isinstance(schema, BaseSchema)
+        and not isinstance(schema, PolymorphicSchema)
+        and not schema.many
+        and not schema.partial
+        and not getattr(schema, "context", None)
+        and _has_marshmallow_internals(schema)
+        and all(field.attribute is None or "." not in field.attribute for field in schema.fields.values())
+    )
+
+
+def _is_polymorphic(schema: Schema) -> bool:
+    return type(schema) is PolymorphicSchema and not schema.many and not getattr(schema, "context", None)
+
+
+def _has_marshmallow_internals(schema: Schema) -> bool:
+    # The compiled functions read the Schema's hooks and whether its fields look up attributes, which aren't public.
+    # Schemas of Marshmallow versions that changed them are dumped and loaded with Marshmallow.
+    return isinstance(getattr(schema, "_hooks", None), Mapping) and all(
+        isinstance(getattr(field, "_CHECK_ATTRIBUTE", None), bool) for field in schema.fields.values()
+    )
+
+
+def _compile_encoder(schema: Schema) -> Callable[[Any], Any]:
+    if not _is_compilable(schema) or schema._hooks[PRE_DUMP] or schema._hooks[POST_DUMP]:
+        return schema.dump
+
+    dict_class = schema.dict_class
+    get_attribute = schema.get_attribute
+    entries = [
+        (
+            attr_name,
+            field.data_key if field.data_key is not None else attr_name,
+            field.attribute if field.attribute is not None else attr_name,
+            field,
+            # Fields that customize how values are looked up are serialized as is.
+            _compile_value_encoder(field)
+            if type(field).serialize is fields.Field.serialize and type(field).get_value is fields.Field.get_value
+            else None,
+        )
+        for attr_name, field in schema.dump_fields.items()
+    ]
+
+    def encode(obj: Any) -> Any:
+        # Marshmallow looks up keys before attributes on objects that support item access.
+        getitem = hasattr(obj, "__getitem__")
+        result = dict_class()
+
+        for attr_name, key, attribute, field, encode_value in entries:
+            if encode_value is None:
+                value = field.serialize(attr_name, obj, accessor=get_attribute)
+
+                if value is not missing:
+                    result[key] = value
+                continue
+
+            if field._CHECK_ATTRIBUTE:
+                value = get_attribute(obj, attribute, missing) if getitem else getattr(obj, attribute, missing)
+
+                if value is missing:
+                    default = field.dump_default
+                    value = default() if callable(default) else default
+
+                    if value is missing:
+                        continue
+            else:
+                value = None
+
+            result[key] = encode_value(value, attr_name, obj)
+
+        return result
+
+    return encode
+
+
+def _compile_value_encoder(field: fields.Field) -> Callable[[Any, str, Any], Any]:
+    field_type = type(field)
+
+    if field_type is fields.Nested and not field.many:
+        if _is_polymorphic(field.schema):
+            return _compile_polymorphic_encoder(field.schema)
+        elif _is_compilable(field.schema):
+            return _compile_nested_encoder(field.schema)
+    elif field_type is fields.List:
+        return _compile_list_encoder(field)
+    elif field_type is UnionField:
+        return _compile_union_encoder(field)
+
+    return field._serialize
+
+
+def _compile_polymorphic_encoder(schema: PolymorphicSchema) -> Callable[[Any, str, Any], Any]:
+    def encode_polymorphic(value: Any, attr: str, obj: Any) -> Any:
+        if value is None:
+            return None
+
+        result = dump_obj(BaseSchema.get_shared_schema(value.__class__), value)
+        result[schema.type_field] = value.__class__.__name__
+
+        return result
+
+    return encode_polymorphic
+
+
+def _compile_nested_encoder(schema: Schema) -> Callable[[Any, str, Any], Any]:
+    def encode_nested(value: Any, attr: str, obj: Any) -> Any:
+        return None if value is None else dump_obj(schema, value)
+
+    return encode_nested
+
+
+def _compile_list_encoder(field: fields.List) -> Callable[[Any, str, Any], Any]:
+    encode_item = _compile_value_encoder(field.inner)
+
+    def encode_list(value: Any, attr: str, obj: Any) -> Any:
+        return None if value is None else [encode_item(item, attr, obj) for item in value]
+
+    return encode_list
+
+
+def _compile_union_encoder(field: UnionField) -> Callable[[Any, str, Any], Any]:
+    candidates = [_compile_value_encoder(candidate) for candidate in field._candidate_fields]
+
+    if field._reverse_serialize_candidates:
+        candidates.reverse()
+
+    def encode_union(value: Any, attr: str, obj: Any) -> Any:
+        for encode_candidate in candidates:
+            try:
+                return encode_candidate(value, attr, obj)
+            except (TypeError, ValueError):
+                pass
+
+        # Let the field raise its usual error.
+        return field._serialize(value, attr, obj)
+
+    return encode_union
+
+
+def _compile_decoder(schema: Schema) -> Callable[[Any], Any]:
+    hooks = schema._hooks
+
+    if (
+        not _is_compilable(schema)
+        or schema.unknown == RAISE
+        or hooks[PRE_LOAD]
+        or hooks[VALIDATES]
+        or hooks[VALIDATES_SCHEMA]
+    ):
+        return schema.load
+
+    if any(hook_many or kwargs.get("pass_original") for _, hook_many, kwargs in hooks[POST_LOAD]):
+        return schema.load
+
+    dict_class = schema.dict_class
+    include_unknown = schema.unknown == INCLUDE
+    post_loads = [getattr(schema, attr_name) for attr_name, _, _ in hooks[POST_LOAD]]
+    entries = [
+        (
+            field.data_key if field.data_key is not None else attr_name,
+            field.attribute if field.attribute is not None else attr_name,
+            field,
+            _compile_value_decoder(field),
+        )
+        for attr_name, field in schema.load_fields.items()
+    ]
+    keys = {key for key, *_ in entries}
+
+    def decode(data: Any) -> Any:
+        if not isinstance(data, Mapping):
+            return schema.load(data)
+
+        result = dict_class()
+
+        for key, attribute, field, decode_value in entries:
+            raw_value = data.get(key, missing)
+            value = (
+                field.deserialize(raw_value, key, data) if raw_value is missing else decode_value(raw_value, key, data)
+            )
+
+            if value is not missing:
+                result[attribute] = value
+
+        if include_unknown:
+            for key in set(data) - keys:
+                result[key] = data[key]
+
+        for post_load in post_loads:
+            result = post_load(result, many=False, partial=schema.partial)
+
+        return result
+
+    return decode
+
+
+def _compile_value_decoder(field: fields.Field) -> Callable[[Any, Any, Any], Any]:
+    field_type = type(field)
+
+    if field.validators:
+        return field.deserialize
+    elif field_type is fields.Nested and not field.many and field.unknown is None:
+        if _is_polymorphic(field.schema):
+            return _compile_polymorphic_decoder(field)
+        elif _is_compilable(field.schema):
+            return _compile_nested_decoder(field)
+    elif field_type is fields.List:
+        return _compile_list_decoder(field)
+    elif field_type is UnionField:
+        return _compile_union_decoder(field)
+    elif (
+        field_type in LEAF_DECODERS
+        and not getattr(field, "key_field", None)
+        and not getattr(field, "value_field", None)
+    ):
+        return _compile_leaf_decoder(field)
+
+    return field.deserialize
+
+
+def _compile_polymorphic_decoder(field: fields.Nested) -> Callable[[Any, Any, Any], Any]:
+    schema = field.schema
+
+    def decode_polymorphic(value: Any, attr: Any, data: Any) -> Any:
+        if not isinstance(value, Mapping) or value.get(schema.type_field) is None:
+            return field.deserialize(value, attr, data)
+
+        value = dict(value)
+        data_type = value.pop(schema.type_field)
+        inner_class = schema.inner_class._resolve_cls(data_type, module_name=value.get("module_name"))
+
+        return load_obj(BaseSchema.get_shared_schema(inner_class), value)
+
+    return decode_polymorphic
+
+
+def _compile_nested_decoder(field: fields.Nested) -> Callable[[Any, Any, Any], Any]:
+    schema = field.schema
+
+    def decode_nested(value: Any, attr: Any, data: Any) -> Any:
+        if not isinstance(value, Mapping):
+            return field.deserialize(value, attr, data)
+
+        return load_obj(schema, value)
+
+    return decode_nested
+
+
+def _compile_list_decoder(field: fields.List) -> Callable[[Any, Any, Any], Any]:
+    decode_item = _compile_value_decoder(field.inner)
+
+    def decode_list(value: Any, attr: Any, data: Any) -> Any:
+        if type(value) is not list:
+            return field.deserialize(value, attr, data)
+
+        return [decode_item(item, None, None) for item in value]
+
+    return decode_list
+
+
+def _compile_union_decoder(field: UnionField) -> Callable[[Any, Any, Any], Any]:
+    candidates = [_compile_value_decoder(candidate) for candidate in field._candidate_fields]
+
+    def decode_union(value: Any, attr: Any, data: Any) -> Any:
+        if value is None:
+            return field.deserialize(value, attr, data)
+
+        for decode_candidate in candidates:
+            try:
+                return decode_candidate(value, attr, data)
+            except ValidationError:
+                pass
+
+        # Let the field raise its usual error.
+        return field.deserialize(value, attr, data)
+
+    return decode_union
+
+
+def _compile_leaf_decoder(field: fields.Field) -> Callable[[Any, Any, Any], Any]:
+    decode_native = LEAF_DECODERS[type(field)]
+
+    def decode_leaf(value: Any, attr: Any, data: Any) -> Any:
+        result = decode_native(value)
+
+        return field.deserialize(value, attr, data) if result is missing else result
+
+    return decode_leaf
@@ -58,14 +58,7 @@ class PolymorphicSchema(BaseSchema):
         if not obj_type:
             return (None, {"_schema": f"Unknown object class: {obj.__class__.__name__}"})
 
-        type_schema = BaseSchema.from_attrs_cls(obj.__class__)
-
-        if not type_schema:
-            return None, {"_schema": f"Unsupported object type: {obj_type}"}
-
-        schema = type_schema if isinstance(type_schema, Schema) else type_schema()
-
-        schema.context.update(getattr(self, "context", {}))
+        schema = self._get_type_schema(obj.__class__)
 
         result = schema.dump(obj, many=False, **kwargs)
 
@@ -116,15 +109,21 @@ class PolymorphicSchema(BaseSchema):
         if data_type is None:
             raise ValidationError({self.type_field: ["Missing data for required field."]})
 
-        type_schema = self.inner_class.get_schema(data_type, module_name=data.get("module_name"))
-        if not type_schema:
-            raise ValidationError({self.type_field: [f"Unsupported value: {data_type}"]})
+        schema = self._get_type_schema(self.inner_class._resolve_cls(data_type, module_name=data.get("module_name")))
 
-        schema = type_schema if isinstance(type_schema, Schema) else type_schema()
+        return schema.load(data, many=False, partial=partial, unknown=unknown, **kwargs)
 
-        schema.context.update(getattr(self, "context", {}))
+    def _get_type_schema(self, attrs_cls: type) -> Schema:
+        """Returns the Schema for a concrete type, sharing it between calls unless this Schema has a context."""
+        context = getattr(self, "context", {})
 
-        return schema.load(data, many=False, partial=partial, unknown=unknown, **kwargs)
+        if context:
+            schema = BaseSchema.from_attrs_cls(attrs_cls)()
+            schema.context.update(context)
+
+            return schema
+        else:
+            return BaseSchema.get_shared_schema(attrs_cls)
 
     def validate(self, data: Any, *, many: Any = None, partial: Any = None) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
         try:
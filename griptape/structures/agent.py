@@ -59,11 +59,11 @@ class Agent(Structure):
         return self.tasks[0]
 
     def add_task(self, task: BaseTask) -> BaseTask:
-        self._tasks.clear()
+        self._clear_tasks()
 
         task.preprocess(self)
 
-        self._tasks.append(task)
+        self._append_task(task)
 
         return task
 
@@ -77,3 +77,9 @@ class Agent(Structure):
         self.task.execute()
 
         return self
+
+    @observable
+    async def try_run_async(self, *args) -> Agent:
+        await self.task.execute_async()
+
+        return self
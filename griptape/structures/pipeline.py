@@ -24,7 +24,7 @@ class Pipeline(Structure):
             self.output_task.child_ids.append(task.id)
             task.parent_ids.append(self.output_task.id)
 
-        self._tasks.append(task)
+        self._append_task(task)
 
         return task
 
@@ -44,7 +44,7 @@ class Pipeline(Structure):
         parent_task.child_ids.append(task.id)
 
         parent_index = self.tasks.index(parent_task)
-        self._tasks.insert(parent_index + 1, task)
+        self._insert_task(parent_index + 1, task)
 
         return task
 
@@ -54,6 +54,18 @@ class Pipeline(Structure):
 
         return self
 
+    @observable
+    async def try_run_async(self, *args) -> Pipeline:
+        task = self.input_task
+
+        while task is not None:
+            if isinstance(await task.execute_async(), ErrorArtifact) and self.fail_fast:
+                break
+
+            task = next(iter(task.children), None)
+
+        return self
+
     def context(self, task: BaseTask) -> dict[str, Any]:
         context = super().context(task)
 
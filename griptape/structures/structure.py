@@ -13,6 +13,7 @@ from griptape.memory.meta import MetaMemory
 from griptape.memory.structure import ConversationMemory, Run
 from griptape.mixins.rule_mixin import RuleMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.utils.futures import run_in_executor
 
 if TYPE_CHECKING:
     from griptape.artifacts import BaseArtifact
@@ -38,10 +39,13 @@ class Structure(ABC, RuleMixin, SerializableMixin):
     meta_memory: MetaMemory = field(default=Factory(lambda: MetaMemory()), kw_only=True)
     fail_fast: bool = field(default=True, kw_only=True, metadata={"serializable": True})
     _execution_args: tuple = ()
+    _flat_tasks: Optional[list[BaseTask]] = field(default=None, init=False, eq=False)
+    _task_index: dict[str, BaseTask] = field(factory=dict, init=False, eq=False)
+    _indexed_tasks_count: int = field(default=0, init=False, eq=False)
 
     def __attrs_post_init__(self) -> None:
         tasks = self._tasks.copy()
-        self._tasks.clear()
+        self._clear_tasks()
         self.add_tasks(*tasks)
 
     def __add__(self, other: BaseTask | list[BaseTask | list[BaseTask]]) -> list[BaseTask]:
@@ -49,14 +53,7 @@ class Structure(ABC, RuleMixin, SerializableMixin):
 
     @property
     def tasks(self) -> list[BaseTask]:
-        tasks = []
-
-        for task in self._tasks:
-            if isinstance(task, list):
-                tasks.extend(task)
-            else:
-                tasks.append(task)
-        return tasks
+        return self.__get_flat_tasks().copy()
 
     @property
     def execution_args(self) -> tuple:
@@ -64,11 +61,15 @@ class Structure(ABC, RuleMixin, SerializableMixin):
 
     @property
     def input_task(self) -> Optional[BaseTask]:
-        return self.tasks[0] if self.tasks else None
+        tasks = self.__get_flat_tasks()
+
+        return tasks[0] if tasks else None
 
     @property
     def output_task(self) -> Optional[BaseTask]:
-        return self.tasks[-1] if self.tasks else None
+        tasks = self.__get_flat_tasks()
+
+        return tasks[-1] if tasks else None
 
     @property
     def output(self) -> BaseArtifact:
@@ -96,10 +97,9 @@ class Structure(ABC, RuleMixin, SerializableMixin):
         raise ValueError(f"Task with id {task_id} doesn't exist.")
 
     def try_find_task(self, task_id: str) -> Optional[BaseTask]:
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        self.__get_flat_tasks()
+
+        return self._task_index.get(task_id)
 
     def add_tasks(self, *tasks: BaseTask | list[BaseTask]) -> list[BaseTask]:
         added_tasks = []
@@ -137,6 +137,22 @@ class Structure(ABC, RuleMixin, SerializableMixin):
                 if task.id not in child.parent_ids:
                     child.parent_ids.append(task.id)
 
+    def _append_task(self, task: BaseTask) -> None:
+        flat_tasks = self.__get_flat_tasks()
+
+        self._tasks.append(task)
+        flat_tasks.append(task)
+        self._task_index.setdefault(task.id, task)
+        self._indexed_tasks_count += 1
+
+    def _insert_task(self, index: int, task: BaseTask) -> None:
+        self._tasks.insert(index, task)
+        self._flat_tasks = None
+
+    def _clear_tasks(self) -> None:
+        self._tasks.clear()
+        self._flat_tasks = None
+
     @observable
     def before_run(self, args: Any) -> None:
         self._execution_args = args
@@ -184,3 +200,41 @@ class Structure(ABC, RuleMixin, SerializableMixin):
 
     @abstractmethod
     def try_run(self, *args) -> Structure: ...
+
+    @observable
+    async def run_async(self, *args) -> Structure:
+        """Asynchronous version of `run`, for running many Structures concurrently in one event loop."""
+        self.before_run(args)
+
+        result = await self.try_run_async(*args)
+
+        self.after_run()
+
+        return result
+
+    async def try_run_async(self, *args) -> Structure:
+        """Asynchronous version of `try_run`.
+
+        Structures should override this method to run their Tasks with `BaseTask.execute_async`. By default,
+        `try_run` runs in the shared `llm` pool of `FuturesExecutorRegistry`.
+        """
+        return await run_in_executor(self.try_run, *args)
+
+    def __get_flat_tasks(self) -> list[BaseTask]:
+        # Tasks added to _tasks directly instead of through add_task are picked up by the length check.
+        if self._flat_tasks is None or self._indexed_tasks_count != len(self._tasks):
+            flat_tasks = []
+
+            for task in self._tasks:
+                if isinstance(task, list):
+                    flat_tasks.extend(task)
+                else:
+                    flat_tasks.append(task)
+
+            self._task_index = {}
+            for task in flat_tasks:
+                self._task_index.setdefault(task.id, task)
+            self._flat_tasks = flat_tasks
+            self._indexed_tasks_count = len(self._tasks)
+
+        return self._flat_tasks
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures as futures
-from typing import TYPE_CHECKING, Any, Optional
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from attrs import define
+from attrs import Attribute, define, field
 from graphlib import TopologicalSorter
 
 from griptape.artifacts import ErrorArtifact
@@ -18,6 +20,23 @@ if TYPE_CHECKING:
 
 @define
 class Workflow(Structure, FuturesExecutorMixin):
+    """A Structure that runs its Tasks as a directed acyclic graph.
+
+    Each Task is submitted to the futures executor as soon as its last parent finishes.
+
+    Attributes:
+        futures_executor_name: Name of the shared pool that runs the Tasks.
+        max_concurrency: Maximum number of Tasks that may run at the same time. Unlimited if `None`.
+    """
+
+    futures_executor_name: str = field(default="llm", kw_only=True)
+    max_concurrency: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+
+    @max_concurrency.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_max_concurrency(self, _: Attribute, max_concurrency: Optional[int]) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
     @property
     def input_task(self) -> Optional[BaseTask]:
         return self.order_tasks()[0] if self.tasks else None
@@ -44,7 +63,7 @@ class Workflow(Structure, FuturesExecutorMixin):
 
         task.preprocess(self)
 
-        self._tasks.append(task)
+        self._append_task(task)
 
         return task
 
@@ -94,29 +113,59 @@ class Workflow(Structure, FuturesExecutorMixin):
         last_parent_index = self.__link_task_to_parents(task, parent_tasks)
 
         # Insert the new task once, just after the last parent task
-        self._tasks.insert(last_parent_index + 1, task)
+        self._insert_task(last_parent_index + 1, task)
 
         return task
 
     @observable
     def try_run(self, *args) -> Workflow:
+        sorter = TopologicalSorter(self.to_graph())
+        sorter.prepare()
+
+        ready_task_ids: deque[str] = deque()
+        futures_list: dict[futures.Future, BaseTask] = {}
         exit_loop = False
 
-        while not self.is_finished() and not exit_loop:
-            futures_list = {}
-            ordered_tasks = self.order_tasks()
+        while sorter.is_active() and not exit_loop:
+            self.__submit_ready_tasks(
+                sorter, ready_task_ids, futures_list, lambda task: self.futures_executor.submit(task.execute)
+            )
 
-            for task in ordered_tasks:
-                if task.can_execute():
-                    future = self.futures_executor.submit(task.execute)
-                    futures_list[future] = task
+            if not futures_list:
+                continue
 
-            # Wait for all tasks to complete
-            for future in futures.as_completed(futures_list):
-                if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
-                    exit_loop = True
+            # Wait for any task to complete so that its children can be submitted right away
+            done, _ = futures.wait(futures_list, return_when=futures.FIRST_COMPLETED)
 
-                    break
+            exit_loop = self.__finish_tasks(sorter, futures_list, done)
+
+        return self
+
+    @observable
+    async def try_run_async(self, *args) -> Workflow:
+        sorter = TopologicalSorter(self.to_graph())
+        sorter.prepare()
+
+        ready_task_ids: deque[str] = deque()
+        asyncio_tasks: dict[asyncio.Task, BaseTask] = {}
+        exit_loop = False
+
+        try:
+            while sorter.is_active() and not exit_loop:
+                self.__submit_ready_tasks(
+                    sorter, ready_task_ids, asyncio_tasks, lambda task: asyncio.ensure_future(task.execute_async())
+                )
+
+                if not asyncio_tasks:
+                    continue
+
+                done, _ = await asyncio.wait(asyncio_tasks, return_when=asyncio.FIRST_COMPLETED)
+
+                exit_loop = self.__finish_tasks(sorter, asyncio_tasks, done)
+        finally:
+            # Only reached with running tasks when failing fast or when the run itself is cancelled
+            for asyncio_task in asyncio_tasks:
+                asyncio_task.cancel()
 
         return self
 
@@ -136,20 +185,49 @@ class Workflow(Structure, FuturesExecutorMixin):
         return context
 
     def to_graph(self) -> dict[str, set[str]]:
-        graph: dict[str, set[str]] = {}
-
-        for key_task in self.tasks:
-            graph[key_task.id] = set()
+        graph: dict[str, set[str]] = {task.id: set() for task in self.tasks}
 
-            for value_task in self.tasks:
-                if key_task.id in value_task.child_ids:
-                    graph[key_task.id].add(value_task.id)
+        for task in self.tasks:
+            for child_id in task.child_ids:
+                if child_id in graph:
+                    graph[child_id].add(task.id)
 
         return graph
 
     def order_tasks(self) -> list[BaseTask]:
         return [self.find_task(task_id) for task_id in TopologicalSorter(self.to_graph()).static_order()]
 
+    def __submit_ready_tasks(
+        self,
+        sorter: TopologicalSorter,
+        ready_task_ids: deque[str],
+        running: dict[Any, BaseTask],
+        submit: Callable[[BaseTask], Any],
+    ) -> None:
+        ready_task_ids.extend(sorter.get_ready())
+
+        while ready_task_ids and (self.max_concurrency is None or len(running) < self.max_concurrency):
+            task = self.find_task(ready_task_ids.popleft())
+
+            if task.is_pending():
+                running[submit(task)] = task
+            else:
+                # Tasks that already ran don't need to run again, but still unblock their children.
+                sorter.done(task.id)
+
+    def __finish_tasks(self, sorter: TopologicalSorter, running: dict[Any, BaseTask], done: set) -> bool:
+        exit_loop = False
+
+        for future in done:
+            task = running.pop(future)
+
+            if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
+                exit_loop = True
+
+            sorter.done(task.id)
+
+        return exit_loop
+
     def __link_task_to_children(self, task: BaseTask, child_tasks: list[BaseTask]) -> None:
         for child_task in child_tasks:
             # Link the new task to the child task
@@ -13,6 +13,7 @@ from griptape.configs import Defaults
 from griptape.events import EventBus, FinishTaskEvent, StartTaskEvent
 from griptape.mixins.futures_executor_mixin import FuturesExecutorMixin
 from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.utils.futures import run_in_executor
 
 if TYPE_CHECKING:
     from griptape.artifacts import BaseArtifact
@@ -101,7 +102,7 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, ABC):
         if self.id not in parent.child_ids:
             parent.child_ids.append(self.id)
 
-        if self.structure is not None and parent not in self.structure.tasks:
+        if self.structure is not None and self.structure.try_find_task(parent.id) is None:
             self.structure.add_task(parent)
 
         return self
@@ -117,7 +118,7 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, ABC):
         if self.id not in child.parent_ids:
             child.parent_ids.append(self.id)
 
-        if self.structure is not None and child not in self.structure.tasks:
+        if self.structure is not None and self.structure.try_find_task(child.id) is None:
             self.structure.add_task(child)
 
         return self
@@ -178,6 +179,25 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, ABC):
 
         return self.output
 
+    async def execute_async(self) -> Optional[BaseArtifact]:
+        """Asynchronous version of `execute`."""
+        try:
+            self.state = BaseTask.State.EXECUTING
+
+            self.before_run()
+
+            self.output = await self.run_async()
+
+            self.after_run()
+        except Exception as e:
+            logger.exception("%s %s\n%s", self.__class__.__name__, self.id, e)
+
+            self.output = ErrorArtifact(str(e), exception=e)
+        finally:
+            self.state = BaseTask.State.FINISHED
+
+        return self.output
+
     def can_execute(self) -> bool:
         return self.state == BaseTask.State.PENDING and all(parent.is_finished() for parent in self.parents)
 
@@ -190,6 +210,14 @@ class BaseTask(FuturesExecutorMixin, SerializableMixin, ABC):
     @abstractmethod
     def run(self) -> BaseArtifact: ...
 
+    async def run_async(self) -> BaseArtifact:
+        """Asynchronous version of `run`.
+
+        Tasks that call drivers should override this method to use their asynchronous APIs. By default, `run` runs in
+        the shared `llm` pool of `FuturesExecutorRegistry`.
+        """
+        return await run_in_executor(self.run)
+
     @property
     def full_context(self) -> dict[str, Any]:
         context = self.context
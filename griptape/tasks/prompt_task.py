@@ -36,7 +36,7 @@ class PromptTask(RuleMixin, BaseTask):
     @property
     def rulesets(self) -> list:
         default_rules = self.rules
-        rulesets = self._rulesets
+        rulesets = self._rulesets.copy()
 
         if self.structure is not None:
             if self.structure._rulesets:
@@ -99,6 +99,15 @@ class PromptTask(RuleMixin, BaseTask):
 
         return message.to_artifact()
 
+    async def run_async(self) -> BaseArtifact:
+        # Subclasses that override `run`, like `ToolkitTask`, fall back to running it in a thread.
+        if type(self).run is not PromptTask.run:
+            return await super().run_async()
+
+        message = await self.prompt_driver.run_async(self.prompt_stack)
+
+        return message.to_artifact()
+
     def _process_task_input(
         self,
         task_input: str | tuple | list | BaseArtifact | Callable[[BaseTask], BaseArtifact],
@@ -40,6 +40,7 @@ class ToolkitTask(PromptTask, ActionsSubtaskOriginMixin):
         kw_only=True,
     )
     response_stop_sequence: str = field(default=RESPONSE_STOP_SEQUENCE, kw_only=True)
+    _system_template_cache: Optional[tuple[list[list], tuple, str]] = field(default=None, init=False, eq=False)
 
     def __attrs_post_init__(self) -> None:
         super().__attrs_post_init__()
@@ -128,16 +129,59 @@ class ToolkitTask(PromptTask, ActionsSubtaskOriginMixin):
         return self
 
     def default_system_template_generator(self, _: PromptTask) -> str:
-        schema = self.actions_schema().json_schema("Actions Schema")
-        schema["minItems"] = 1  # The `schema` library doesn't support `minItems` so we must add it manually.
-
-        return J2("tasks/toolkit_task/system.j2").render(
-            rulesets=J2("rulesets/rulesets.j2").render(rulesets=self.rulesets),
-            action_names=str.join(", ", [tool.name for tool in self.tools]),
-            actions_schema=utils.minify_json(json.dumps(schema)),
-            meta_memory=J2("memory/meta/meta_memory.j2").render(meta_memories=self.meta_memories),
-            use_native_tools=self.prompt_driver.use_native_tools,
-            stop_sequence=self.response_stop_sequence,
+        rulesets = self.rulesets
+        meta_memories = self.meta_memories
+        # The system template is only rendered again when the tools, their activities, the rulesets, or the meta
+        # memories change. Objects are keyed by identity, and the cache keeps references to them so that their ids
+        # can't be reused.
+        cache_key = (
+            tuple(self.__get_tool_cache_key(tool) for tool in self.tools),
+            tuple((ruleset.name, tuple(id(rule) for rule in ruleset.rules)) for ruleset in rulesets),
+            tuple(id(meta_memory) for meta_memory in meta_memories),
+            self.prompt_driver.use_native_tools,
+            self.response_stop_sequence,
+        )
+
+        if self._system_template_cache is None or self._system_template_cache[1] != cache_key:
+            if self.prompt_driver.use_native_tools:
+                # Native tools are sent with the request, so the prompt doesn't include the schema.
+                actions_schema = None
+            else:
+                schema = self.actions_schema().json_schema("Actions Schema")
+                schema["minItems"] = 1  # The `schema` library doesn't support `minItems` so we must add it manually.
+                actions_schema = utils.minify_json(json.dumps(schema))
+
+            self._system_template_cache = (
+                [list(self.tools), [rule for ruleset in rulesets for rule in ruleset.rules], list(meta_memories)],
+                cache_key,
+                J2("tasks/toolkit_task/system.j2").render(
+                    rulesets=J2("rulesets/rulesets.j2").render(rulesets=rulesets),
+                    meta_memory=J2("memory/meta/meta_memory.j2").render(meta_memories=meta_memories),
+                    action_names=str.join(", ", [tool.name for tool in self.tools]),
+                    actions_schema=actions_schema,
+                    use_native_tools=self.prompt_driver.use_native_tools,
+                    stop_sequence=self.response_stop_sequence,
+                ),
+            )
+
+        return self._system_template_cache[2]
+
+    def __get_tool_cache_key(self, tool: BaseTool) -> tuple:
+        return (
+            id(tool),
+            tool.name,
+            None if tool.allowlist is None else tuple(tool.allowlist),
+            None if tool.denylist is None else tuple(tool.denylist),
+            repr(tool.extra_schema_properties),
+            # Only descriptions that are templates and schemas that are built from the tool's state can change without
+            # one of the above changing, so only they are rendered.
+            tuple(
+                (
+                    tool.activity_description(activity) if "{" in getattr(activity, "config")["description"] else None,
+                    repr(tool.activity_schema(activity)) if callable(getattr(activity, "config")["schema"]) else None,
+                )
+                for activity in tool.activities()
+            ),
         )
 
     def default_assistant_subtask_template_generator(self, subtask: ActionsSubtask) -> str:
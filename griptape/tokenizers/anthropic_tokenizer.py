@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 from attrs import Factory, define, field
 
-from griptape.tokenizers import BaseTokenizer
+from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
+from griptape.tokenizers.base_tokenizer import memoize_count_tokens
 from griptape.utils import import_optional_dependency
+from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
     from anthropic import Anthropic
@@ -13,13 +16,52 @@ if TYPE_CHECKING:
 
 @define()
 class AnthropicTokenizer(BaseTokenizer):
+    """Anthropic Tokenizer.
+
+    Attributes:
+        offline: Estimate token counts with `offline_tokenizer` instead of using the Anthropic client.
+        offline_tokenizer: Local tokenizer used to estimate token counts when `offline` is set.
+        offline_token_ratio: Average number of Anthropic tokens per `offline_tokenizer` token.
+        offline_safety_margin: Fraction added on top of estimated token counts so that they rarely undercount.
+        client: Optionally provide custom `anthropic.Anthropic` client.
+    """
+
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {"claude-3": 200000, "claude-2.1": 200000, "claude": 100000}
     MODEL_PREFIXES_TO_MAX_OUTPUT_TOKENS = {"claude": 4096}
+    # Measured against the Anthropic client's tokenizer on English prose and Python source.
+    DEFAULT_OFFLINE_TOKEN_RATIO = 1.15
+    DEFAULT_OFFLINE_SAFETY_MARGIN = 0.1
 
-    client: Anthropic = field(
-        default=Factory(lambda: import_optional_dependency("anthropic").Anthropic()),
+    offline: bool = field(default=False, kw_only=True)
+    offline_tokenizer: BaseTokenizer = field(
+        default=Factory(lambda: OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)),
         kw_only=True,
     )
+    offline_token_ratio: float = field(default=DEFAULT_OFFLINE_TOKEN_RATIO, kw_only=True)
+    offline_safety_margin: float = field(default=DEFAULT_OFFLINE_SAFETY_MARGIN, kw_only=True)
+    _client: Anthropic = field(default=None, kw_only=True, alias="client")
+
+    @lazy_property()
+    def client(self) -> Anthropic:
+        return import_optional_dependency("anthropic").Anthropic()
 
+    @memoize_count_tokens
     def count_tokens(self, text: str) -> int:
+        if self.offline:
+            return math.ceil(
+                self.offline_tokenizer.count_tokens(text) * self.offline_token_ratio * (1 + self.offline_safety_margin)
+            )
+
         return self.client.count_tokens(text)
+
+    def _get_token_count_cache_scope(self) -> tuple:
+        if not self.offline:
+            return (False,)
+
+        return (
+            True,
+            type(self.offline_tokenizer),
+            getattr(self.offline_tokenizer, "model", None),
+            self.offline_token_ratio,
+            self.offline_safety_margin,
+        )
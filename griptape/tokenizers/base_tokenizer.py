@@ -1,13 +1,50 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Optional, TypeVar
 
 from attrs import Factory, define, field
 
+T = TypeVar("T", bound=Callable[..., int])
+
+
+def memoize_count_tokens(func: T) -> T:
+    """Memoizes a tokenizer's `count_tokens` for string inputs when its `token_count_cache_size` is set."""
+
+    @functools.wraps(func)
+    def wrapper(self: BaseTokenizer, text: Any, *args, **kwargs) -> int:
+        if args or kwargs or not self.token_count_cache_size or not isinstance(text, str):
+            return func(self, text, *args, **kwargs)
+
+        token_count = self._get_cached_token_count(text)
+
+        if token_count is None:
+            token_count = func(self, text)
+            self._set_cached_token_count(text, token_count)
+
+        return token_count
+
+    return wrapper  # pyright: ignore[reportReturnType]
+
 
 @define()
 class BaseTokenizer(ABC):
+    """Base Tokenizer.
+
+    Attributes:
+        model: Tokenizer model.
+        stop_sequences: Stop sequences.
+        max_input_tokens: Maximum number of input tokens. Defaults to the model's limit.
+        max_output_tokens: Maximum number of output tokens. Defaults to the model's limit.
+        token_count_cache_size: Maximum number of token counts to memoize, keyed by a hash of the text.
+            Defaults to 0, which disables memoization.
+    """
+
     DEFAULT_MAX_INPUT_TOKENS = 4096
     DEFAULT_MAX_OUTPUT_TOKENS = 1000
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {}
@@ -17,6 +54,9 @@ class BaseTokenizer(ABC):
     stop_sequences: list[str] = field(default=Factory(list), kw_only=True)
     max_input_tokens: int = field(kw_only=True, default=None)
     max_output_tokens: int = field(kw_only=True, default=None)
+    token_count_cache_size: int = field(default=0, kw_only=True)
+    _token_count_cache: OrderedDict[tuple, int] = field(factory=OrderedDict, init=False, eq=False)
+    _token_count_cache_lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False)
 
     def __attrs_post_init__(self) -> None:
         if hasattr(self, "model"):
@@ -45,6 +85,53 @@ class BaseTokenizer(ABC):
     @abstractmethod
     def count_tokens(self, text: str) -> int: ...
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Counts the tokens of multiple texts.
+
+        Tokenizers that can count many texts more efficiently than one at a time should override this method.
+
+        Args:
+            texts: Texts to count tokens for.
+
+        Returns:
+            Token counts in the same order as `texts`.
+        """
+        return [self.count_tokens(text) for text in texts]
+
+    def _get_cached_token_count(self, text: str) -> Optional[int]:
+        key = self.__get_token_count_cache_key(text)
+
+        with self._token_count_cache_lock:
+            token_count = self._token_count_cache.get(key)
+
+            if token_count is not None:
+                self._token_count_cache.move_to_end(key)
+
+        return token_count
+
+    def _set_cached_token_count(self, text: str, token_count: int) -> None:
+        key = self.__get_token_count_cache_key(text)
+
+        with self._token_count_cache_lock:
+            self._token_count_cache[key] = token_count
+            self._token_count_cache.move_to_end(key)
+
+            while len(self._token_count_cache) > self.token_count_cache_size:
+                self._token_count_cache.popitem(last=False)
+
+    def _get_token_count_cache_scope(self) -> tuple:
+        """Returns the settings besides the model that token counts depend on.
+
+        Memoized token counts are only reused while these settings are the same.
+        """
+        return ()
+
+    def __get_token_count_cache_key(self, text: str) -> tuple:
+        return (
+            self._get_token_count_cache_scope(),
+            hashlib.blake2b(text.encode(errors="surrogatepass"), digest_size=16).digest(),
+        )
+
     def _default_max_input_tokens(self) -> int:
         tokens = next((v for k, v in self.MODEL_PREFIXES_TO_MAX_INPUT_TOKENS.items() if self.model.startswith(k)), None)
 
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from attrs import define, field
 
 from griptape.tokenizers import BaseTokenizer
+from griptape.tokenizers.base_tokenizer import memoize_count_tokens
 
 if TYPE_CHECKING:
     from cohere import Client
@@ -17,5 +18,6 @@ class CohereTokenizer(BaseTokenizer):
 
     client: Client = field(kw_only=True)
 
+    @memoize_count_tokens
     def count_tokens(self, text: str) -> int:
         return len(self.client.tokenize(text=text, model=self.model).tokens)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
-from attrs import define, field
+from attrs import Factory, define, field
 
-from griptape.tokenizers import BaseTokenizer
+from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
+from griptape.tokenizers.base_tokenizer import memoize_count_tokens
 from griptape.utils import import_optional_dependency
 from griptape.utils.decorators import lazy_property
 
@@ -14,10 +16,30 @@ if TYPE_CHECKING:
 
 @define()
 class GoogleTokenizer(BaseTokenizer):
+    """Google Tokenizer.
+
+    Attributes:
+        api_key: Google API key.
+        offline: Estimate token counts of strings with `offline_tokenizer` instead of calling the Gemini API.
+        offline_tokenizer: Local tokenizer used to estimate token counts when `offline` is set.
+        offline_token_ratio: Average number of Gemini tokens per `offline_tokenizer` token.
+        offline_safety_margin: Fraction added on top of estimated token counts so that they rarely undercount.
+        client: Optionally provide custom `GenerativeModel` client.
+    """
+
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {"gemini": 30720}
     MODEL_PREFIXES_TO_MAX_OUTPUT_TOKENS = {"gemini": 2048}
+    DEFAULT_OFFLINE_TOKEN_RATIO = 1.0
+    DEFAULT_OFFLINE_SAFETY_MARGIN = 0.1
 
     api_key: str = field(kw_only=True, metadata={"serializable": True})
+    offline: bool = field(default=False, kw_only=True)
+    offline_tokenizer: BaseTokenizer = field(
+        default=Factory(lambda: OpenAiTokenizer(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)),
+        kw_only=True,
+    )
+    offline_token_ratio: float = field(default=DEFAULT_OFFLINE_TOKEN_RATIO, kw_only=True)
+    offline_safety_margin: float = field(default=DEFAULT_OFFLINE_SAFETY_MARGIN, kw_only=True)
     _client: GenerativeModel = field(default=None, kw_only=True, alias="client", metadata={"serializable": False})
 
     @lazy_property()
@@ -27,5 +49,23 @@ class GoogleTokenizer(BaseTokenizer):
 
         return genai.GenerativeModel(self.model)
 
+    @memoize_count_tokens
     def count_tokens(self, text: str) -> int:
+        if self.offline and isinstance(text, str):
+            return math.ceil(
+                self.offline_tokenizer.count_tokens(text) * self.offline_token_ratio * (1 + self.offline_safety_margin)
+            )
+
         return self.client.count_tokens(text).total_tokens
+
+    def _get_token_count_cache_scope(self) -> tuple:
+        if not self.offline:
+            return (False,)
+
+        return (
+            True,
+            type(self.offline_tokenizer),
+            getattr(self.offline_tokenizer, "model", None),
+            self.offline_token_ratio,
+            self.offline_safety_margin,
+        )
@@ -1,23 +1,28 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 from attrs import Factory, define, field
 
 from griptape.tokenizers import BaseTokenizer
+from griptape.tokenizers.base_tokenizer import memoize_count_tokens
 from griptape.utils import import_optional_dependency
 
 if TYPE_CHECKING:
     from transformers import PreTrainedTokenizerBase
 
 
+@functools.lru_cache(maxsize=None)
+def get_pretrained_tokenizer(model: str) -> PreTrainedTokenizerBase:
+    """Returns the pretrained Hugging Face tokenizer for a model, shared by every tokenizer in the process."""
+    return import_optional_dependency("transformers").AutoTokenizer.from_pretrained(model)
+
+
 @define()
 class HuggingFaceTokenizer(BaseTokenizer):
     tokenizer: PreTrainedTokenizerBase = field(
-        default=Factory(
-            lambda self: import_optional_dependency("transformers").AutoTokenizer.from_pretrained(self.model),
-            takes_self=True,
-        ),
+        default=Factory(lambda self: get_pretrained_tokenizer(self.model), takes_self=True),
         kw_only=True,
     )
     max_input_tokens: int = field(
@@ -26,5 +31,6 @@ class HuggingFaceTokenizer(BaseTokenizer):
     )
     max_output_tokens: int = field(default=4096, kw_only=True)
 
+    @memoize_count_tokens
     def count_tokens(self, text: str) -> int:
         return len(self.tokenizer.encode(text))
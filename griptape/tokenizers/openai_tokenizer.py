@@ -1,12 +1,25 @@
 from __future__ import annotations
 
+import functools
 import logging
+import os
 from typing import Optional
 
 import tiktoken
 from attrs import Factory, define, field
 
 from griptape.tokenizers import BaseTokenizer
+from griptape.tokenizers.base_tokenizer import memoize_count_tokens
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoding_for_model(model: str) -> tiktoken.Encoding:
+    """Returns the tiktoken encoding for a model, shared by every tokenizer in the process.
+
+    Raises:
+        KeyError: If tiktoken does not know the model.
+    """
+    return tiktoken.encoding_for_model(model)
 
 
 @define()
@@ -18,6 +31,8 @@ class OpenAiTokenizer(BaseTokenizer):
     DEFAULT_MAX_TOKENS = 2049
     DEFAULT_MAX_OUTPUT_TOKENS = 4096
     TOKEN_OFFSET = 8
+    # tiktoken's threaded batch encoder only pays off for texts long enough to outweigh the thread pool overhead.
+    MIN_BATCH_ENCODE_CHARACTERS = 1000
 
     # https://platform.openai.com/docs/models/gpt-4-and-gpt-4-turbo
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {
@@ -56,7 +71,7 @@ class OpenAiTokenizer(BaseTokenizer):
     @property
     def encoding(self) -> tiktoken.Encoding:
         try:
-            return tiktoken.encoding_for_model(self.model)
+            return get_encoding_for_model(self.model)
         except KeyError:
             return tiktoken.get_encoding(self.DEFAULT_ENCODING)
 
@@ -77,6 +92,7 @@ class OpenAiTokenizer(BaseTokenizer):
         else:
             return tokens
 
+    @memoize_count_tokens
     def count_tokens(self, text: str | list[dict], model: Optional[str] = None) -> int:  # noqa: C901
         """Handles the special case of ChatML.
 
@@ -87,7 +103,7 @@ class OpenAiTokenizer(BaseTokenizer):
             model = model or self.model
 
             try:
-                encoding = tiktoken.encoding_for_model(model)
+                encoding = get_encoding_for_model(model)
             except KeyError:
                 logging.warning("model not found. Using cl100k_base encoding.")
 
@@ -140,3 +156,31 @@ class OpenAiTokenizer(BaseTokenizer):
             return num_tokens
         else:
             return len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        token_counts: list[Optional[int]] = [
+            self._get_cached_token_count(text) if self.token_count_cache_size else None for text in texts
+        ]
+        missing_indices = [i for i, token_count in enumerate(token_counts) if token_count is None]
+
+        if missing_indices:
+            missing_texts = [texts[i] for i in missing_indices]
+            encoding = self.encoding
+            allowed_special = set(self.stop_sequences)
+
+            if (
+                len(missing_texts) > 1
+                and (os.cpu_count() or 1) > 1
+                and sum(map(len, missing_texts)) >= self.MIN_BATCH_ENCODE_CHARACTERS * len(missing_texts)
+            ):
+                encoded = encoding.encode_batch(missing_texts, allowed_special=allowed_special)
+            else:
+                encoded = [encoding.encode(text, allowed_special=allowed_special) for text in missing_texts]
+
+            for i, tokens in zip(missing_indices, encoded):
+                token_counts[i] = len(tokens)
+
+                if self.token_count_cache_size:
+                    self._set_cached_token_count(texts[i], len(tokens))
+
+        return [token_count or 0 for token_count in token_counts]
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Optional
 from attrs import Factory, define, field
 
 from griptape.tokenizers import BaseTokenizer
+from griptape.tokenizers.base_tokenizer import memoize_count_tokens
 from griptape.utils import import_optional_dependency
 
 if TYPE_CHECKING:
@@ -30,5 +31,6 @@ class VoyageAiTokenizer(BaseTokenizer):
         kw_only=True,
     )
 
+    @memoize_count_tokens
     def count_tokens(self, text: str) -> int:
         return self.client.count_tokens([text])
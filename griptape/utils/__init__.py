@@ -6,6 +6,8 @@ from .python_runner import PythonRunner
 from .command_runner import CommandRunner
 from .chat import Chat
 from .futures import execute_futures_dict, execute_futures_list, execute_futures_list_dict
+from .futures import FuturesExecutorRegistry, SharedFuturesExecutor
+from .rate_limiter import RateLimiter, RateLimiterRegistry
 from .token_counter import TokenCounter
 from .dict_utils import remove_null_values_in_dict_recursively, dict_merge, remove_key_in_dict_recursively
 from .hash import str_to_hash
@@ -37,6 +39,10 @@ __all__ = [
     "execute_futures_dict",
     "execute_futures_list",
     "execute_futures_list_dict",
+    "FuturesExecutorRegistry",
+    "SharedFuturesExecutor",
+    "RateLimiter",
+    "RateLimiterRegistry",
     "TokenCounter",
     "remove_null_values_in_dict_recursively",
     "dict_merge",
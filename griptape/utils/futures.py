@@ -1,7 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
+import os
+import threading
 from concurrent import futures
-from typing import TypeVar
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+from attrs import Factory, define, field
+
+from griptape.mixins.singleton_mixin import SingletonMixin
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
 
 T = TypeVar("T")
 
@@ -22,3 +34,177 @@ def execute_futures_list_dict(fs_dict: dict[str, list[futures.Future[T]]]) -> di
     execute_futures_list([item for sublist in fs_dict.values() for item in sublist])
 
     return {key: [f.result() for f in fs] for key, fs in fs_dict.items()}
+
+
+class SharedFuturesExecutor(futures.ThreadPoolExecutor):
+    """Bounded thread pool that is shared by every object borrowing it from `FuturesExecutorRegistry`.
+
+    Work submitted from a thread of any shared pool while this pool is saturated runs inline on the submitting
+    thread, so that workers waiting on nested work can't exhaust the pool and deadlock. Use `submit_concurrently` for
+    work that must not block the submitting thread.
+    """
+
+    __worker_thread = threading.local()
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        super().__init__(
+            max_workers=max_workers, thread_name_prefix=f"griptape-{name}", initializer=self.__mark_worker_thread
+        )
+
+        self.name = name
+        self.__pending = 0
+        self.__pending_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self.__pending
+
+    def submit(self, fn: Callable[..., T], /, *args, **kwargs) -> futures.Future[T]:
+        return self.__submit(fn, args, kwargs, run_inline=True)
+
+    def submit_concurrently(self, fn: Callable[..., T], /, *args, **kwargs) -> futures.Future[T]:
+        """Submits work that must not run on the submitting thread.
+
+        Unlike `submit`, work submitted from a thread of any shared pool while this pool is saturated runs on a separate
+        overflow thread instead of inline, so that callers that wait on several futures with a timeout aren't blocked
+        by one of them.
+        """
+        return self.__submit(fn, args, kwargs, run_inline=False)
+
+    def __submit(self, fn: Callable[..., T], args: tuple, kwargs: dict, *, run_inline: bool) -> futures.Future[T]:
+        with self.__pending_lock:
+            overflow = self.__pending >= self._max_workers and getattr(self.__worker_thread, "value", False)
+
+            if not overflow:
+                self.__pending += 1
+
+        if overflow:
+            future = futures.Future()
+
+            if run_inline:
+                self.__run(future, fn, args, kwargs)
+            else:
+                threading.Thread(
+                    target=self.__run_overflow,
+                    args=(future, fn, args, kwargs),
+                    name=f"griptape-{self.name}-overflow",
+                    daemon=True,
+                ).start()
+
+            return future
+
+        try:
+            future = super().submit(fn, *args, **kwargs)
+        except BaseException:
+            self.__release()
+
+            raise
+
+        future.add_done_callback(lambda _: self.__release())
+
+        return future
+
+    def __release(self) -> None:
+        with self.__pending_lock:
+            self.__pending -= 1
+
+    @staticmethod
+    def __run(future: futures.Future[T], fn: Callable[..., T], args: tuple, kwargs: dict) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    @classmethod
+    def __run_overflow(cls, future: futures.Future[T], fn: Callable[..., T], args: tuple, kwargs: dict) -> None:
+        # Work nested in overflow work runs inline too, like on the pool's own threads.
+        cls.__mark_worker_thread()
+        cls.__run(future, fn, args, kwargs)
+
+    @classmethod
+    def __mark_worker_thread(cls) -> None:
+        cls.__worker_thread.value = True
+
+
+@define
+class _FuturesExecutorRegistry(SingletonMixin):
+    """Process-wide registry of named, size-bounded thread pools.
+
+    Attributes:
+        max_workers: Maximum number of threads per pool name. `io` is meant for network and disk bound work, `cpu` for
+            CPU bound work, and `llm` for calls to LLM providers, including Tasks that make them.
+    """
+
+    max_workers: dict[str, int] = field(
+        default=Factory(lambda: {"io": 32, "cpu": os.cpu_count() or 1, "llm": 64}), kw_only=True
+    )
+    _executors: dict[str, SharedFuturesExecutor] = field(factory=dict, kw_only=True, alias="_executors")
+    _thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), alias="_thread_lock")
+
+    def get_executor(self, name: str) -> SharedFuturesExecutor:
+        with self._thread_lock:
+            if name not in self._executors:
+                if name not in self.max_workers:
+                    raise ValueError(f"Futures executor {name} doesn't exist.")
+
+                self._executors[name] = SharedFuturesExecutor(name, self.max_workers[name])
+
+            return self._executors[name]
+
+    def set_max_workers(self, name: str, max_workers: int) -> None:
+        """Sets the size of a pool, creating the pool name if needed.
+
+        A pool that already exists is replaced on next use. Work already submitted to it still runs to completion.
+        """
+        with self._thread_lock:
+            self.max_workers[name] = max_workers
+            executor = self._executors.pop(name, None)
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def is_shared(self, executor: futures.Executor) -> bool:
+        return isinstance(executor, SharedFuturesExecutor)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shuts down every pool. Pools are created again the next time they are used."""
+        with self._thread_lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+
+        for executor in executors:
+            executor.shutdown(wait=wait)
+
+
+FuturesExecutorRegistry = _FuturesExecutorRegistry()
+
+
+async def run_in_executor(fn: Callable[..., T], *args, executor_name: str = "llm", **kwargs) -> T:
+    """Runs a blocking function in a shared pool without blocking the event loop.
+
+    Args:
+        fn: Function to run.
+        *args: Positional arguments for `fn`.
+        executor_name: Name of the `FuturesExecutorRegistry` pool to run `fn` in.
+        **kwargs: Keyword arguments for `fn`.
+
+    Returns:
+        The return value of `fn`.
+    """
+    context = contextvars.copy_context()
+
+    return await asyncio.get_running_loop().run_in_executor(
+        FuturesExecutorRegistry.get_executor(executor_name), functools.partial(context.run, fn, *args, **kwargs)
+    )
+
+
+async def iterate_in_executor(iterable: Iterable[T], *, executor_name: str = "llm") -> AsyncIterator[T]:
+    """Iterates over a blocking iterable in a shared pool without blocking the event loop."""
+    iterator = iter(iterable)
+    sentinel = object()
+
+    while (item := await run_in_executor(next, iterator, sentinel, executor_name=executor_name)) is not sentinel:
+        yield item
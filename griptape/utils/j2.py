@@ -1,29 +1,62 @@
 from __future__ import annotations
 
-from typing import Optional
+import functools
+from typing import TYPE_CHECKING, Optional
 
 from attrs import Factory, define, field
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from .paths import abs_path
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 
 @define(frozen=True)
 class J2:
+    """Renders Jinja2 templates.
+
+    By default, J2 instances share a single `Environment` per `templates_dir` and `bytecode_cache_dir`, so templates
+    are loaded and compiled once per process. Templates rendered with `render_from_string` are compiled once per
+    source string and environment.
+
+    Attributes:
+        template_name: Name of the template in `templates_dir` to render with `render`.
+        templates_dir: Directory to load templates from.
+        bytecode_cache_dir: Optional directory for caching compiled templates across processes.
+        environment: Jinja2 Environment. Shared environments should not be modified.
+    """
+
     template_name: Optional[str] = field(default=None)
     templates_dir: str = field(default=abs_path("templates"), kw_only=True)
+    bytecode_cache_dir: Optional[str] = field(default=None, kw_only=True)
     environment: Environment = field(
         default=Factory(
-            lambda self: Environment(loader=FileSystemLoader(self.templates_dir), trim_blocks=True, lstrip_blocks=True),
+            lambda self: J2.get_shared_environment(self.templates_dir, bytecode_cache_dir=self.bytecode_cache_dir),
             takes_self=True,
         ),
         kw_only=True,
     )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_shared_environment(templates_dir: str, *, bytecode_cache_dir: Optional[str] = None) -> Environment:
+        return Environment(
+            loader=FileSystemLoader(templates_dir),
+            bytecode_cache=FileSystemBytecodeCache(bytecode_cache_dir) if bytecode_cache_dir is not None else None,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+
     def render(self, **kwargs) -> str:
         if self.template_name is None:
             raise ValueError("template_name is required.")
         return self.environment.get_template(self.template_name).render(kwargs).rstrip()
 
     def render_from_string(self, value: str, **kwargs) -> str:
-        return self.environment.from_string(value).render(kwargs)
+        return _compile_string(self.environment, value).render(kwargs)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_string(environment: Environment, source: str) -> Template:
+    return environment.from_string(source)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+
+from attrs import Attribute, Factory, define, field, fields
+
+from griptape.mixins.singleton_mixin import SingletonMixin
+
+
+@define
+class RateLimiter:
+    """Client-side limiter of requests and tokens per minute, using a token bucket for each.
+
+    Each request reserves capacity in the order it arrives and then waits until the buckets have refilled enough to
+    cover it, so that callers queue instead of exceeding the provider's limits and retrying. Buckets start full and
+    refill continuously.
+
+    Attributes:
+        requests_per_minute: Optional maximum number of requests per minute.
+        tokens_per_minute: Optional maximum number of tokens per minute. Requests estimated to use more tokens than
+            a full bucket holds are counted as using a full bucket, so that they can still be sent.
+        burst_seconds: Seconds worth of capacity that the buckets hold and that can be used at once. Lower it for
+            providers that enforce their per-minute limits over shorter windows.
+        request_count: Number of requests that acquired capacity.
+        wait_count: Number of requests that had to wait for capacity.
+        total_wait_time: Seconds spent waiting for capacity, summed across requests.
+        max_wait_time: Longest time in seconds that a request waited for capacity.
+    """
+
+    requests_per_minute: Optional[float] = field(default=None, kw_only=True)
+    tokens_per_minute: Optional[float] = field(default=None, kw_only=True)
+    burst_seconds: float = field(default=60.0, kw_only=True)
+    request_count: int = field(default=0, init=False)
+    wait_count: int = field(default=0, init=False)
+    total_wait_time: float = field(default=0.0, init=False)
+    max_wait_time: float = field(default=0.0, init=False)
+    _available_requests: float = field(default=0.0, init=False, eq=False)
+    _available_tokens: float = field(default=0.0, init=False, eq=False)
+    _refilled_at: float = field(default=Factory(lambda: time.monotonic()), init=False, eq=False)
+    _thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False, eq=False)
+
+    @requests_per_minute.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_requests_per_minute(self, _: Attribute, requests_per_minute: Optional[float]) -> None:
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be greater than 0")
+
+    @tokens_per_minute.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_tokens_per_minute(self, _: Attribute, tokens_per_minute: Optional[float]) -> None:
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be greater than 0")
+
+    @burst_seconds.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_burst_seconds(self, _: Attribute, burst_seconds: float) -> None:
+        if burst_seconds <= 0:
+            raise ValueError("burst_seconds must be greater than 0")
+
+    def __attrs_post_init__(self) -> None:
+        self._available_requests = self.__capacity(self.requests_per_minute)
+        self._available_tokens = self.__capacity(self.tokens_per_minute)
+
+    @property
+    def average_wait_time(self) -> float:
+        """Average time in seconds that requests waited for capacity, including requests that didn't wait."""
+        return self.total_wait_time / self.request_count if self.request_count else 0.0
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Waits until a request may be sent.
+
+        Args:
+            tokens: Estimated number of tokens that the request uses.
+
+        Returns:
+            Seconds waited.
+        """
+        wait_time = self.reserve(tokens)
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+        return wait_time
+
+    async def acquire_async(self, tokens: int = 0) -> float:
+        """Asynchronous version of `acquire` that waits without blocking the event loop."""
+        wait_time = self.reserve(tokens)
+
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        return wait_time
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserves capacity for a request without waiting.
+
+        Args:
+            tokens: Estimated number of tokens that the request uses.
+
+        Returns:
+            Seconds to wait before sending the request.
+        """
+        with self._thread_lock:
+            self.__refill()
+
+            wait_time = 0.0
+
+            if self.requests_per_minute is not None:
+                self._available_requests -= 1
+                wait_time = max(wait_time, -self._available_requests * 60 / self.requests_per_minute)
+
+            if self.tokens_per_minute is not None:
+                self._available_tokens -= min(tokens, self.__capacity(self.tokens_per_minute))
+                wait_time = max(wait_time, -self._available_tokens * 60 / self.tokens_per_minute)
+
+            self.request_count += 1
+
+            if wait_time > 0:
+                self.wait_count += 1
+                self.total_wait_time += wait_time
+                self.max_wait_time = max(self.max_wait_time, wait_time)
+
+        if wait_time > 0:
+            from griptape.configs import Defaults
+
+            logging.getLogger(Defaults.logging_config.logger_name).debug("Rate limit reached, waiting %.2fs", wait_time)
+
+        return wait_time
+
+    def set_limits(self, *, requests_per_minute: Optional[float], tokens_per_minute: Optional[float]) -> None:
+        """Changes the limits, keeping the capacity that was already used."""
+        with self._thread_lock:
+            self.__refill()
+
+            self.validate_requests_per_minute(fields(RateLimiter).requests_per_minute, requests_per_minute)
+            self.validate_tokens_per_minute(fields(RateLimiter).tokens_per_minute, tokens_per_minute)
+
+            self._available_requests += self.__capacity(requests_per_minute) - self.__capacity(self.requests_per_minute)
+            self._available_tokens += self.__capacity(tokens_per_minute) - self.__capacity(self.tokens_per_minute)
+            self.requests_per_minute = requests_per_minute
+            self.tokens_per_minute = tokens_per_minute
+
+    def __refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+
+        if self.requests_per_minute is not None:
+            self._available_requests = min(
+                self.__capacity(self.requests_per_minute),
+                self._available_requests + elapsed * self.requests_per_minute / 60,
+            )
+
+        if self.tokens_per_minute is not None:
+            self._available_tokens = min(
+                self.__capacity(self.tokens_per_minute), self._available_tokens + elapsed * self.tokens_per_minute / 60
+            )
+
+    def __capacity(self, per_minute: Optional[float]) -> float:
+        return (per_minute or 0.0) * self.burst_seconds / 60
+
+
+@define
+class _RateLimiterRegistry(SingletonMixin):
+    """Process-wide registry of Rate Limiters keyed by provider and model.
+
+    Drivers that are given the same Rate Limiter share its limits, e.g. every Prompt Driver and Embedding Driver that
+    calls the same model with the same organization's API key.
+    """
+
+    _rate_limiters: dict[tuple[str, Optional[str]], RateLimiter] = field(
+        factory=dict, kw_only=True, alias="_rate_limiters"
+    )
+    _thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), alias="_thread_lock")
+
+    def get_rate_limiter(
+        self,
+        provider: str,
+        model: Optional[str] = None,
+        *,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ) -> RateLimiter:
+        """Returns the Rate Limiter of a provider and model, creating it if needed.
+
+        Args:
+            provider: Name of the provider, e.g. `openai`.
+            model: Name of the model. Use `None` for limits that are shared by every model of the provider.
+            requests_per_minute: Requests per minute to create the Rate Limiter with, or to change its limits to.
+            tokens_per_minute: Tokens per minute to create the Rate Limiter with, or to change its limits to.
+
+        Returns:
+            The Rate Limiter, which is the same object for every call with the same provider and model.
+        """
+        with self._thread_lock:
+            rate_limiter = self._rate_limiters.get((provider, model))
+
+            if rate_limiter is None:
+                rate_limiter = RateLimiter(requests_per_minute=requests_per_minute, tokens_per_minute=tokens_per_minute)
+                self._rate_limiters[(provider, model)] = rate_limiter
+            elif requests_per_minute is not None or tokens_per_minute is not None:
+                rate_limiter.set_limits(
+                    requests_per_minute=requests_per_minute
+                    if requests_per_minute is not None
+                    else rate_limiter.requests_per_minute,
+                    tokens_per_minute=tokens_per_minute
+                    if tokens_per_minute is not None
+                    else rate_limiter.tokens_per_minute,
+                )
+
+            return rate_limiter
+
+    def clear(self) -> None:
+        """Removes every Rate Limiter. Drivers that were given one keep using it."""
+        with self._thread_lock:
+            self._rate_limiters.clear()
+
+
+RateLimiterRegistry = _RateLimiterRegistry()
@@ -0,0 +1,107 @@
+"""Chunking benchmark for `BaseChunker` implementations.
+
+Compares the level-by-level chunking engine against the previous recursive implementation and checks that both
+produce identical chunks.
+
+Usage:
+    python -m tests.benchmarks.bench_chunkers [--paragraphs 100 1000] [--max-tokens 256]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from typing import Optional
+
+from griptape.chunkers import BaseChunker, ChunkSeparator, MarkdownChunker, PdfChunker, TextChunker
+from tests.benchmarks.utils import report, timeit
+
+WORDS = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit", "sed", "do", "2024", "foo-bar"]
+
+
+def baseline_chunk(chunker: BaseChunker, chunk: str, current_separator: Optional[ChunkSeparator] = None) -> list[str]:
+    # Recursive chunking that re-tokenizes every chunk and sub-split, as done before the level-by-level engine.
+    token_count = chunker.tokenizer.count_tokens(chunk)
+
+    if token_count <= chunker.max_tokens:
+        return [chunk]
+
+    balance_index = -1
+    balance_diff = float("inf")
+    tokens_count = 0
+    half_token_count = token_count // 2
+    separators = (
+        chunker.separators[chunker.separators.index(current_separator) :] if current_separator else chunker.separators
+    )
+
+    for separator in separators:
+        subchunks = list(filter(None, chunk.split(separator.value)))
+
+        if len(subchunks) > 1:
+            for index, subchunk in enumerate(subchunks):
+                subchunk = separator.value + subchunk if separator.is_prefix else subchunk + separator.value
+                tokens_count += chunker.tokenizer.count_tokens(subchunk)
+
+                if abs(tokens_count - half_token_count) < balance_diff:
+                    balance_index = index
+                    balance_diff = abs(tokens_count - half_token_count)
+
+            if separator.is_prefix:
+                first_subchunk = separator.value + separator.value.join(subchunks[: balance_index + 1])
+                second_subchunk = separator.value + separator.value.join(subchunks[balance_index + 1 :])
+            else:
+                first_subchunk = separator.value.join(subchunks[: balance_index + 1]) + separator.value
+                second_subchunk = separator.value.join(subchunks[balance_index + 1 :])
+
+            return baseline_chunk(chunker, first_subchunk.strip(), separator) + baseline_chunk(
+                chunker, second_subchunk.strip(), separator
+            )
+
+    midpoint = len(chunk) // 2
+
+    return baseline_chunk(chunker, chunk[:midpoint]) + baseline_chunk(chunker, chunk[midpoint:])
+
+
+def generate_document(paragraphs: int, *, markdown: bool = False, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    blocks = []
+
+    for i in range(paragraphs):
+        sentences = [
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 25))).capitalize() + rng.choice([".", "!", "?"])
+            for _ in range(rng.randint(1, 12))
+        ]
+        block = rng.choice([" ", "  ", "\n"]).join(sentences)
+
+        if markdown and i % 4 == 0:
+            block = f"{'#' * rng.randint(2, 4)} Section {i}\n\n{block}"
+
+        blocks.append(block)
+
+    return rng.choice(["\n\n", "\n\n\n"]).join(blocks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paragraphs", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--max-tokens", type=int, default=256)
+    args = parser.parse_args()
+
+    for chunker_class in [TextChunker, PdfChunker, MarkdownChunker]:
+        chunker = chunker_class(max_tokens=args.max_tokens)
+
+        for paragraphs in args.paragraphs:
+            text = generate_document(paragraphs, markdown=chunker_class is MarkdownChunker)
+            expected = baseline_chunk(chunker, text)
+
+            if [chunk.value for chunk in chunker.chunk(text)] != expected:
+                raise AssertionError(f"{chunker_class.__name__} chunks differ from the baseline.")
+
+            baseline = timeit(lambda: baseline_chunk(chunker, text), repeat=3)  # noqa: B023
+            optimized = timeit(lambda: chunker.chunk(text), repeat=3)  # noqa: B023
+
+            report(f"{chunker_class.__name__} {len(text):,} chars", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Autoprune benchmark for `BaseConversationMemory.add_to_prompt_stack`.
+
+Compares fitting conversation memory into a Prompt Stack with cached run token counts against pruning one run at a
+time and counting the tokens of the whole Prompt Stack after each run, as done before. Each step adds a run and builds
+the Prompt Stack again, like a long-running chat.
+
+Usage:
+    python -m tests.benchmarks.bench_conversation_memory [--runs 50 100] [--max-input-tokens 2048]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from griptape.artifacts import TextArtifact
+from griptape.common import PromptStack
+from griptape.memory.structure import BaseConversationMemory, ConversationMemory, Run
+from griptape.tokenizers import OpenAiTokenizer
+from tests.benchmarks.utils import report, timeit
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+def baseline_add_to_prompt_stack(
+    memory: BaseConversationMemory, prompt_driver: MockPromptDriver, prompt_stack: PromptStack
+) -> PromptStack:
+    # Prunes one run at a time and counts the tokens of the whole Prompt Stack each time.
+    num_runs_to_fit_in_prompt = len(memory.runs)
+    temp_stack = PromptStack()
+
+    while num_runs_to_fit_in_prompt > 0:
+        temp_stack.messages = [*prompt_stack.messages, *memory.to_prompt_stack(num_runs_to_fit_in_prompt).messages]
+
+        if prompt_driver.tokenizer.count_input_tokens_left(prompt_driver.prompt_stack_to_string(temp_stack)) > 0:
+            break
+        num_runs_to_fit_in_prompt -= 1
+
+    if num_runs_to_fit_in_prompt:
+        prompt_stack.messages.extend(memory.to_prompt_stack(num_runs_to_fit_in_prompt).messages)
+
+    return prompt_stack
+
+
+def chat(runs: int, prompt_driver: MockPromptDriver, add_to_prompt_stack) -> list[int]:
+    memory = ConversationMemory(autoload=False, conversation_memory_driver=None)
+    lengths = []
+
+    for i in range(runs):
+        memory.try_add_run(
+            Run(
+                input=TextArtifact(f"Question {i}: what happened in chapter {i} of the story? " * 4),
+                output=TextArtifact(f"Answer {i}: in chapter {i}, the lazy dog finally wakes up. " * 8),
+            )
+        )
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_message("You are a helpful assistant.")
+        prompt_stack.add_user_message(f"Question {i + 1}")
+
+        lengths.append(len(add_to_prompt_stack(memory, prompt_driver, prompt_stack).messages))
+
+    return lengths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, nargs="+", default=[50, 100])
+    parser.add_argument("--max-input-tokens", type=int, default=2048)
+    args = parser.parse_args()
+
+    prompt_driver = MockPromptDriver(
+        tokenizer=OpenAiTokenizer(model="gpt-4", max_input_tokens=args.max_input_tokens, token_count_cache_size=0)
+    )
+
+    for runs in args.runs:
+        expected = chat(runs, prompt_driver, baseline_add_to_prompt_stack)
+
+        # The estimate can be one run short of the baseline with tokenizers that merge tokens across messages.
+        actual = chat(runs, prompt_driver, BaseConversationMemory.add_to_prompt_stack)
+
+        if any(
+            not expected_length - 2 <= length <= expected_length for length, expected_length in zip(actual, expected)
+        ):
+            raise AssertionError("Pruned Prompt Stacks differ from the baseline by more than one run.")
+
+        baseline = timeit(lambda: chat(runs, prompt_driver, baseline_add_to_prompt_stack), repeat=3)  # noqa: B023
+        optimized = timeit(
+            lambda: chat(runs, prompt_driver, BaseConversationMemory.add_to_prompt_stack),  # noqa: B023
+            repeat=3,
+        )
+
+        report(f"{runs} runs", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
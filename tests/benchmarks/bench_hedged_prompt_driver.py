@@ -0,0 +1,82 @@
+"""Tail latency benchmark for `HedgedPromptDriver`.
+
+Runs prompts one after another against simulated providers whose latency has a long tail: most requests are fast,
+but some are several times slower. Compares hedging across two such Prompt Drivers against using the first one only.
+Reports the total time, the median latency, and the 99th percentile latency.
+
+Usage:
+    python -m tests.benchmarks.bench_hedged_prompt_driver [--prompts 200] [--latency 0.01] [--tail 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from griptape.common import PromptStack
+from griptape.drivers import BasePromptDriver, HedgedPromptDriver
+from tests.benchmarks.utils import report
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+def provider(seed: int, latency: float, tail: float, tail_ratio: float) -> MockPromptDriver:
+    rng = random.Random(seed)
+
+    def mock_output(prompt_stack: PromptStack) -> str:
+        time.sleep(tail if rng.random() < tail_ratio else latency)
+
+        return f"Answer to {prompt_stack.messages[-1].to_text()}"
+
+    return MockPromptDriver(mock_output=mock_output)
+
+
+def run(prompt_driver: BasePromptDriver, prompts: int) -> tuple[list[str], list[float]]:
+    outputs = []
+    latencies = []
+
+    for i in range(prompts):
+        prompt_stack = PromptStack()
+        prompt_stack.add_user_message(f"Question {i}")
+
+        start = time.perf_counter()
+        outputs.append(prompt_driver.run(prompt_stack).value)
+        latencies.append(time.perf_counter() - start)
+
+    return outputs, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prompts", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--tail", type=float, default=0.2)
+    parser.add_argument("--tail-ratio", type=float, default=0.05)
+    args = parser.parse_args()
+
+    baseline_outputs, baseline = run(provider(0, args.latency, args.tail, args.tail_ratio), args.prompts)
+    optimized_outputs, optimized = run(
+        HedgedPromptDriver(
+            prompt_drivers=[
+                provider(0, args.latency, args.tail, args.tail_ratio),
+                provider(1, args.latency, args.tail, args.tail_ratio),
+            ],
+            hedge_percentile=90,
+            hedge_delay=args.latency * 2,
+            min_latency_samples=10,
+        ),
+        args.prompts,
+    )
+
+    if optimized_outputs != baseline_outputs:
+        raise AssertionError("Hedged outputs differ from the unhedged outputs.")
+
+    report(f"{args.prompts} prompts total", sum(baseline), sum(optimized))
+    report("p50 latency", float(np.percentile(baseline, 50)), float(np.percentile(optimized, 50)))
+    report("p99 latency", float(np.percentile(baseline, 99)), float(np.percentile(optimized, 99)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Template rendering benchmark for `J2`.
+
+Compares rendering a `PromptTask` system prompt and its templated input with shared environments and compiled template
+caches against creating an `Environment` per `J2` and compiling every template on each render, as done before.
+
+Usage:
+    python -m tests.benchmarks.bench_j2 [--repeat 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from jinja2 import Environment, FileSystemLoader
+
+from griptape.rules import Rule, Ruleset
+from griptape.tasks import PromptTask
+from griptape.utils import J2
+from tests.benchmarks.utils import report, timeit
+
+
+def baseline_j2(template_name: str | None = None) -> J2:
+    # Creates an Environment per J2 instance, as done before environments were shared.
+    return J2(
+        template_name,
+        environment=Environment(loader=FileSystemLoader(J2().templates_dir), trim_blocks=True, lstrip_blocks=True),
+    )
+
+
+def baseline_render(task: PromptTask) -> None:
+    baseline_j2("tasks/prompt_task/system.j2").render(
+        rulesets=baseline_j2("rulesets/rulesets.j2").render(rulesets=task.rulesets)
+    )
+    baseline_j2().environment.from_string(task._input).render(task.full_context)
+
+
+def render(task: PromptTask) -> None:
+    task.generate_system_template(task)
+    task.input  # noqa: B018
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    task = PromptTask(
+        "Answer the question about {{ topic }} in one sentence.",
+        context={"topic": "templates"},
+        rulesets=[Ruleset("default", rules=[Rule("Be concise."), Rule("Cite sources.")])],
+    )
+    render(task)
+
+    baseline = timeit(lambda: [baseline_render(task) for _ in range(args.repeat)], repeat=3)
+    optimized = timeit(lambda: [render(task) for _ in range(args.repeat)], repeat=3)
+
+    report(f"prompt task x {args.repeat}", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
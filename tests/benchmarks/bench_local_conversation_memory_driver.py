@@ -0,0 +1,76 @@
+"""Store and load benchmark for `LocalConversationMemoryDriver`.
+
+Compares storing every run of a long-running chat with `persist_dir`, which appends new runs to a JSON Lines log,
+against `persist_file`, which rewrites the whole conversation on every store. Also compares loading the most recent runs
+with a tail read of the log against parsing the whole `persist_file`.
+
+Usage:
+    python -m tests.benchmarks.bench_local_conversation_memory_driver [--runs 200 500] [--max-runs 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers import LocalConversationMemoryDriver
+from griptape.memory.structure import Run
+from tests.benchmarks.utils import report, timeit
+
+
+def chat(memory_driver: LocalConversationMemoryDriver, runs: list[Run]) -> None:
+    memory_driver.load()
+
+    for i in range(1, len(runs) + 1):
+        memory_driver.store(runs[:i], {"runs": i})
+
+    memory_driver.load()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, nargs="+", default=[200, 500])
+    parser.add_argument("--max-runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for count in args.runs:
+        runs = [
+            Run(
+                input=TextArtifact(f"Question {i}: what happened in chapter {i} of the story? " * 4),
+                output=TextArtifact(f"Answer {i}: in chapter {i}, the lazy dog finally wakes up. " * 8),
+            )
+            for i in range(count)
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            persist_file = str(Path(temp_dir) / "memory.json")
+            persist_dir = str(Path(temp_dir) / "memory")
+
+            baseline = timeit(
+                lambda: chat(LocalConversationMemoryDriver(persist_file=persist_file), runs),  # noqa: B023
+                repeat=3,
+            )
+            optimized = timeit(
+                lambda: chat(LocalConversationMemoryDriver(persist_dir=persist_dir), runs),  # noqa: B023
+                repeat=3,
+            )
+
+            report(f"store {count} runs", baseline, optimized)
+
+            expected = [run.id for run in LocalConversationMemoryDriver(persist_file=persist_file).load()[0]]
+            tail_driver = LocalConversationMemoryDriver(persist_dir=persist_dir, max_runs=args.max_runs)
+
+            if [run.id for run in tail_driver.load()[0]] != expected[-args.max_runs :]:
+                raise AssertionError("Loaded runs differ from the baseline.")
+
+            file_driver = LocalConversationMemoryDriver(persist_file=persist_file)
+            baseline = timeit(file_driver.load, repeat=5)
+            optimized = timeit(tail_driver.load, repeat=5)
+
+            report(f"load last {args.max_runs} of {count} runs", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
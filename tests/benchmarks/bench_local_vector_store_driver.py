@@ -0,0 +1,58 @@
+"""Query-time benchmark for `LocalVectorStoreDriver`.
+
+Usage:
+    python -m tests.benchmarks.bench_local_vector_store_driver [--sizes 10000 100000 1000000] [--dimensions 256]
+"""
+
+from __future__ import annotations
+
+import argparse
+import operator
+from functools import partial
+
+import numpy as np
+from numpy import dot
+from numpy.linalg import norm
+
+from griptape.drivers import LocalVectorStoreDriver
+from tests.benchmarks.utils import report, timeit
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+def baseline_query(driver: LocalVectorStoreDriver, query_vector: list[float], count: int) -> list:
+    # Per-entry scoring followed by a full sort, as done before the vectorized index.
+    query_array = np.asarray(query_vector)
+    entries_and_relatednesses = [
+        (entry, dot(query_array, entry.vector) / (norm(query_array) * norm(entry.vector)))
+        for entry in list(driver.entries.values())
+    ]
+    entries_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
+
+    return entries_and_relatednesses[:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--dimensions", type=int, default=256)
+    parser.add_argument("--count", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    query_vector = rng.standard_normal(args.dimensions, dtype=np.float32).tolist()
+
+    for size in args.sizes:
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(mock_output=lambda _: query_vector))
+        vectors = rng.standard_normal((size, args.dimensions), dtype=np.float32)
+
+        for i, vector in enumerate(vectors):
+            driver.upsert_vector(vector, vector_id=str(i))
+
+        baseline = timeit(partial(baseline_query, driver, query_vector, args.count), repeat=1)
+        optimized = timeit(partial(driver.query, "foo", count=args.count))
+
+        report(f"query {size:,} x {args.dimensions}", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
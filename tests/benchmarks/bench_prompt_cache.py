@@ -0,0 +1,72 @@
+"""Prompt response cache benchmark for `BasePromptDriver`.
+
+Compares running the same Prompt Stacks repeatedly, like a regression suite, with a `cache_driver` against calling the
+Prompt Driver every time. The Prompt Driver sleeps to simulate LLM latency. Reports both an in-memory
+`LocalCacheDriver` and an on-disk `SqliteCacheDriver`.
+
+Usage:
+    python -m tests.benchmarks.bench_prompt_cache [--prompts 20] [--repeat 5] [--latency 0.02]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from griptape.common import PromptStack
+from griptape.drivers import BaseCacheDriver, LocalCacheDriver, SqliteCacheDriver
+from tests.benchmarks.utils import report, timeit
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+def suite(prompts: int, repeat: int, latency: float, cache_driver: Optional[BaseCacheDriver]) -> list[str]:
+    def mock_output(prompt_stack: PromptStack) -> str:
+        time.sleep(latency)
+
+        return f"Answer to {prompt_stack.messages[-1].to_text()}"
+
+    prompt_driver = MockPromptDriver(mock_output=mock_output, temperature=0, cache_driver=cache_driver)
+    outputs = []
+
+    for _ in range(repeat):
+        for i in range(prompts):
+            prompt_stack = PromptStack()
+            prompt_stack.add_system_message("You are a helpful assistant. Answer in one sentence.")
+            prompt_stack.add_user_message(f"Question {i}: what happened in chapter {i} of the story?")
+
+            outputs.append(prompt_driver.run(prompt_stack).value)
+
+    return outputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prompts", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    expected = suite(args.prompts, args.repeat, args.latency, None)
+    baseline = timeit(lambda: suite(args.prompts, args.repeat, args.latency, None), repeat=3)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, cache_driver_fn in [
+            ("local", LocalCacheDriver),
+            ("sqlite", lambda: SqliteCacheDriver(path=str(Path(temp_dir) / f"{time.perf_counter_ns()}.db"))),
+        ]:
+            if suite(args.prompts, args.repeat, args.latency, cache_driver_fn()) != expected:
+                raise AssertionError("Cached outputs differ from the uncached outputs.")
+
+            optimized = timeit(
+                lambda: suite(args.prompts, args.repeat, args.latency, cache_driver_fn()),  # noqa: B023
+                repeat=3,
+            )
+
+            report(f"{name} {args.prompts} prompts x {args.repeat}", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
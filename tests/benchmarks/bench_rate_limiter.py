@@ -0,0 +1,110 @@
+"""Fan-out benchmark for `RateLimiter`.
+
+Runs many prompts concurrently against a simulated provider that rejects requests over its requests-per-second limit,
+like a Workflow fanning out Prompt Tasks against one organization. Compares sharing a `RateLimiter` between the Prompt
+Drivers against retrying rejected requests with `ExponentialBackoffMixin` only. Reports the time to finish every
+prompt, the slowest prompt, and the number of rejected requests.
+
+Usage:
+    python -m tests.benchmarks.bench_rate_limiter [--prompts 50] [--limit 10] [--latency 0.05]
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from concurrent import futures
+from typing import Optional
+
+from griptape.common import PromptStack
+from griptape.utils import RateLimiter
+from tests.benchmarks.utils import report
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+class Provider:
+    """Token bucket of `limit` requests per second that rejects requests once it's empty."""
+
+    def __init__(self, limit: int, latency: float) -> None:
+        self.limit = limit
+        self.latency = latency
+        self.available = float(limit)
+        self.refilled_at = time.monotonic()
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def complete(self, prompt_stack: PromptStack) -> str:
+        with self.lock:
+            now = time.monotonic()
+            self.available = min(self.limit, self.available + (now - self.refilled_at) * self.limit)
+            self.refilled_at = now
+
+            if self.available < 1:
+                self.rejected += 1
+
+                raise Exception("429 Too Many Requests")
+
+            self.available -= 1
+
+        time.sleep(self.latency)
+
+        return f"Answer to {prompt_stack.messages[-1].to_text()}"
+
+
+def fan_out(prompts: int, limit: int, latency: float, *, rate_limiter: Optional[RateLimiter]) -> dict:
+    provider = Provider(limit, latency)
+
+    def run(i: int) -> tuple[str, float]:
+        start = time.perf_counter()
+        prompt_driver = MockPromptDriver(
+            mock_output=provider.complete,
+            min_retry_delay=0.5,
+            max_retry_delay=2,
+            max_attempts=20,
+            after_hook=lambda _: None,
+            rate_limiter=rate_limiter,
+        )
+        prompt_stack = PromptStack()
+        prompt_stack.add_user_message(f"Question {i}")
+
+        return prompt_driver.run(prompt_stack).value, time.perf_counter() - start
+
+    start = time.perf_counter()
+
+    with futures.ThreadPoolExecutor(max_workers=prompts) as executor:
+        results = list(executor.map(run, range(prompts)))
+
+    return {
+        "outputs": [output for output, _ in results],
+        "elapsed": time.perf_counter() - start,
+        "slowest": max(elapsed for _, elapsed in results),
+        "rejected": provider.rejected,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prompts", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    baseline = fan_out(args.prompts, args.limit, args.latency, rate_limiter=None)
+    optimized = fan_out(
+        args.prompts,
+        args.limit,
+        args.latency,
+        rate_limiter=RateLimiter(requests_per_minute=args.limit * 60, burst_seconds=1),
+    )
+
+    if optimized["outputs"] != baseline["outputs"]:
+        raise AssertionError("Rate limited outputs differ from the retried outputs.")
+
+    report(f"{args.prompts} prompts, {args.limit} requests/s", baseline["elapsed"], optimized["elapsed"])
+    report("slowest prompt", baseline["slowest"], optimized["slowest"])
+    print(f"{'rejected requests':<40} baseline {baseline['rejected']:>12}  optimized {optimized['rejected']:>12}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
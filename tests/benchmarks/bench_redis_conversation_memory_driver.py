@@ -0,0 +1,82 @@
+"""Store benchmark for `RedisConversationMemoryDriver`, run against `fakeredis`.
+
+Compares storing every run of a long-running chat as elements of a Redis list, appending only new runs, against
+writing the whole serialized conversation to a hash field on every store, as done before. Also reports the bytes sent
+to Redis by each.
+
+Usage:
+    python -m tests.benchmarks.bench_redis_conversation_memory_driver [--runs 200 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Any
+from unittest import mock
+
+import fakeredis
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers import RedisConversationMemoryDriver
+from griptape.memory.structure import Run
+from tests.benchmarks.utils import report, timeit
+
+
+def baseline_store(self: RedisConversationMemoryDriver, runs: list[Run], metadata: dict[str, Any]) -> None:
+    self.client.hset(self.index, self.conversation_id, json.dumps(self._to_params_dict(runs, metadata)))
+
+
+def chat(runs: list[Run]) -> tuple[list[str], int]:
+    client = fakeredis.FakeRedis()
+    memory_driver = RedisConversationMemoryDriver(host="localhost", port=6379, index="bench", client=client)
+    sent_bytes = 0
+    connection_class = client.connection_pool.connection_class
+    original_send = connection_class.send_packed_command
+
+    def send_packed_command(connection: Any, command: Any, *args, **kwargs) -> None:
+        nonlocal sent_bytes
+
+        sent_bytes += sum(map(len, [command] if isinstance(command, bytes) else command))
+        original_send(connection, command, *args, **kwargs)
+
+    with mock.patch.object(connection_class, "send_packed_command", send_packed_command):
+        memory_driver.load()
+
+        for i in range(1, len(runs) + 1):
+            memory_driver.store(runs[:i], {"foo": "bar"})
+
+    return [run.id for run in memory_driver.load()[0]], sent_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, nargs="+", default=[200, 500])
+    args = parser.parse_args()
+
+    for count in args.runs:
+        runs = [
+            Run(
+                input=TextArtifact(f"Question {i}: what happened in chapter {i} of the story? " * 4),
+                output=TextArtifact(f"Answer {i}: in chapter {i}, the lazy dog finally wakes up. " * 8),
+            )
+            for i in range(count)
+        ]
+
+        with mock.patch.object(RedisConversationMemoryDriver, "store", baseline_store):
+            expected, baseline_bytes = chat(runs)
+            baseline = timeit(lambda: chat(runs), repeat=3)  # noqa: B023
+
+        run_ids, optimized_bytes = chat(runs)
+
+        if run_ids != expected:
+            raise AssertionError("Loaded runs differ from the baseline.")
+
+        optimized = timeit(lambda: chat(runs), repeat=3)  # noqa: B023
+
+        report(f"store {count} runs", baseline, optimized)
+        print(f"{'':<40} baseline {baseline_bytes:>10} bytes  optimized {optimized_bytes:>10} bytes")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
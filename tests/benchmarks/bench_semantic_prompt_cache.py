@@ -0,0 +1,89 @@
+"""Semantic prompt cache benchmark for `BasePromptDriver`.
+
+Compares answering questions that are rephrased by users with a `semantic_cache_engine` against calling the Prompt
+Driver every time. Rephrasings share a topic word, which the mock Embedding Driver maps to the same direction, so they
+miss an exact-match `cache_driver`. The Prompt Driver sleeps to simulate LLM latency.
+
+Usage:
+    python -m tests.benchmarks.bench_semantic_prompt_cache [--topics 20] [--rephrasings 5] [--latency 0.02]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Optional
+
+from griptape.common import PromptStack
+from griptape.drivers import LocalVectorStoreDriver
+from griptape.engines import SemanticCacheEngine
+from tests.benchmarks.utils import report, timeit
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+TEMPLATES = [
+    "What happened in {topic}?",
+    "Can you summarize {topic}?",
+    "Tell me about {topic}.",
+    "Give me a recap of {topic}.",
+    "What was {topic} about?",
+]
+
+
+def suite(topics: int, rephrasings: int, latency: float, *, semantic_cache: bool) -> list[str]:
+    def mock_output(prompt_stack: PromptStack) -> str:
+        time.sleep(latency)
+
+        return f"Answer about {topic_of(prompt_stack.messages[-1].to_text())}"
+
+    def topic_of(text: str) -> str:
+        return next(word.strip("?.") for word in text.split() if word.startswith("chapter-"))
+
+    def embed(text: str) -> list[float]:
+        # One-hot by topic, so that rephrasings of a question have a cosine similarity of 1.
+        vector = [0.0] * topics
+        vector[int(topic_of(text).split("-")[1])] = 1.0
+
+        return vector
+
+    semantic_cache_engine: Optional[SemanticCacheEngine] = (
+        SemanticCacheEngine(
+            vector_store_driver=LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(mock_output=embed))
+        )
+        if semantic_cache
+        else None
+    )
+    prompt_driver = MockPromptDriver(mock_output=mock_output, semantic_cache_engine=semantic_cache_engine)
+    outputs = []
+
+    for template in TEMPLATES[:rephrasings]:
+        for i in range(topics):
+            prompt_stack = PromptStack()
+            prompt_stack.add_system_message("You are a helpful assistant. Answer in one sentence.")
+            prompt_stack.add_user_message(template.format(topic=f"chapter-{i}"))
+
+            outputs.append(prompt_driver.run(prompt_stack).value)
+
+    return outputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--topics", type=int, default=20)
+    parser.add_argument("--rephrasings", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    if suite(args.topics, args.rephrasings, args.latency, semantic_cache=True) != suite(
+        args.topics, args.rephrasings, args.latency, semantic_cache=False
+    ):
+        raise AssertionError("Cached outputs differ from the uncached outputs.")
+
+    baseline = timeit(lambda: suite(args.topics, args.rephrasings, args.latency, semantic_cache=False), repeat=3)
+    optimized = timeit(lambda: suite(args.topics, args.rephrasings, args.latency, semantic_cache=True), repeat=3)
+
+    report(f"{args.topics} topics x {args.rephrasings} rephrasings", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
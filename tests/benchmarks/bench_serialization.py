@@ -0,0 +1,114 @@
+"""Serialization benchmark for `SerializableMixin`.
+
+Compares `to_dict`/`from_dict` round trips with cached schemas against regenerating the Marshmallow schemas and
+re-importing polymorphic types on every call, as done before schemas were cached. Also compares `to_json`/`from_json`
+round trips through the compiled codec against Marshmallow's `dump`/`load` with the same cached schemas, and checks that
+both produce identical JSON.
+
+Usage:
+    python -m tests.benchmarks.bench_serialization [--repeat 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from griptape.artifacts import ListArtifact, TextArtifact
+from griptape.common import PromptStack
+from griptape.events import FinishPromptEvent, FinishTaskEvent, StartPromptEvent
+from griptape.memory.structure import Run
+from griptape.mixins.serializable_mixin import SerializableMixin
+from griptape.schemas import BaseSchema
+from tests.benchmarks.utils import report, timeit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@contextlib.contextmanager
+def uncached_schemas() -> Iterator[None]:
+    import_cls_rec = SerializableMixin.__dict__["_import_cls_rec"].__func__.__wrapped__
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(
+            mock.patch.object(
+                BaseSchema, "from_attrs_cls", classmethod(lambda cls, attrs_cls: cls._generate_schema_cls(attrs_cls))
+            )
+        )
+        stack.enter_context(
+            mock.patch.object(
+                BaseSchema, "get_shared_schema", classmethod(lambda cls, attrs_cls: cls.from_attrs_cls(attrs_cls)())
+            )
+        )
+        stack.enter_context(mock.patch.object(SerializableMixin, "_import_cls_rec", classmethod(import_cls_rec)))
+
+        yield
+
+
+def round_trip(objects: list[SerializableMixin]) -> None:
+    for obj in objects:
+        type(obj).from_dict(obj.to_dict())
+
+
+def baseline_json_round_trip(objects: list[SerializableMixin]) -> None:
+    # Dumps and loads with Marshmallow and the json module, as done before the compiled codec.
+    for obj in objects:
+        schema = BaseSchema.get_shared_schema(type(obj))
+
+        schema.load(json.loads(json.dumps(schema.dump(obj))))
+
+
+def json_round_trip(objects: list[SerializableMixin]) -> None:
+    for obj in objects:
+        type(obj).from_json(obj.to_json())
+
+
+def generate_objects() -> dict[str, list[SerializableMixin]]:
+    artifact = TextArtifact("The quick brown fox jumps over the lazy dog.", meta={"source": "benchmark"})
+    prompt_stack = PromptStack()
+    prompt_stack.add_system_message("You are a helpful assistant.")
+    prompt_stack.add_user_message(artifact)
+
+    return {
+        "artifacts": [artifact, ListArtifact([artifact, TextArtifact("foo")])],
+        "events": [
+            StartPromptEvent(model="gpt-4o", prompt_stack=prompt_stack),
+            FinishPromptEvent(model="gpt-4o", input_token_count=10, output_token_count=20, result="bar"),
+            FinishTaskEvent(
+                task_id="task", task_parent_ids=[], task_child_ids=[], task_input=artifact, task_output=artifact
+            ),
+        ],
+        "runs": [Run(input=artifact, output=TextArtifact("The lazy dog sleeps."), meta={"foo": "bar"})],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for name, objects in generate_objects().items():
+        round_trip(objects)
+
+        with uncached_schemas():
+            baseline = timeit(lambda: [round_trip(objects) for _ in range(args.repeat)], repeat=3)  # noqa: B023
+        optimized = timeit(lambda: [round_trip(objects) for _ in range(args.repeat)], repeat=3)  # noqa: B023
+
+        report(f"{name} x {args.repeat}", baseline, optimized)
+
+        for obj in objects:
+            if json.dumps(BaseSchema.get_shared_schema(type(obj)).dump(obj)) != obj.to_json():
+                raise AssertionError(f"{type(obj).__name__} JSON differs from the Marshmallow output.")
+
+        baseline = timeit(lambda: [baseline_json_round_trip(objects) for _ in range(args.repeat)], repeat=3)  # noqa: B023
+        optimized = timeit(lambda: [json_round_trip(objects) for _ in range(args.repeat)], repeat=3)  # noqa: B023
+
+        report(f"{name} json x {args.repeat}", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Bookkeeping benchmark for `Structure`.
+
+Compares task lookups through the id index against the previous linear scans over a freshly flattened task list, for
+structures with thousands of Tasks.
+
+Usage:
+    python -m tests.benchmarks.bench_structures [--tasks 1000 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Optional
+
+from griptape.structures import Structure, Workflow
+from griptape.tasks import BaseTask, PromptTask
+from tests.benchmarks.utils import report, timeit
+
+
+def baseline_find_task(structure: Structure, task_id: str) -> Optional[BaseTask]:
+    # Flattens the task list and scans it on every lookup, as done before the id index.
+    tasks = []
+
+    for task in structure._tasks:
+        if isinstance(task, list):
+            tasks.extend(task)
+        else:
+            tasks.append(task)
+
+    for task in tasks:
+        if task.id == task_id:
+            return task
+    return None
+
+
+def resolve_parents_and_children(structure: Structure, find_task) -> None:
+    for task in structure.tasks:
+        [find_task(parent_id) for parent_id in task.parent_ids]
+        [find_task(child_id) for child_id in task.child_ids]
+
+
+def generate_workflow(tasks: int) -> Workflow:
+    workflow = Workflow(conversation_memory=None)
+    previous = workflow.add_task(PromptTask(id="task-0"))
+
+    for i in range(1, tasks):
+        task = workflow.add_task(PromptTask(id=f"task-{i}"))
+        previous.add_child(task)
+
+        if i % 10 == 0:
+            previous = task
+
+    return workflow
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1000, 5000])
+    args = parser.parse_args()
+
+    for tasks in args.tasks:
+        workflow = generate_workflow(tasks)
+
+        baseline = timeit(
+            lambda: resolve_parents_and_children(workflow, lambda task_id: baseline_find_task(workflow, task_id)),  # noqa: B023
+            repeat=1,
+        )
+        optimized = timeit(lambda: resolve_parents_and_children(workflow, workflow.find_task), repeat=3)  # noqa: B023
+
+        report(f"Workflow {tasks:,} tasks parents/children", baseline, optimized)
+
+        baseline = timeit(lambda: [baseline_find_task(workflow, task.id) for task in workflow.tasks], repeat=1)  # noqa: B023
+        optimized = timeit(lambda: [workflow.find_task(task.id) for task in workflow.tasks], repeat=3)  # noqa: B023
+
+        report(f"Workflow {tasks:,} tasks find_task", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Run latency benchmark for `SummaryConversationMemory`.
+
+Compares the time an `Agent` takes to return from each run when runs are summarized in the background against
+summarizing them before `run()` returns, as done before. The Prompt Driver sleeps to simulate LLM latency.
+
+Usage:
+    python -m tests.benchmarks.bench_summary_conversation_memory [--runs 20] [--latency 0.05]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from griptape.memory.structure import SummaryConversationMemory
+from griptape.structures import Agent
+from tests.benchmarks.utils import report, timeit
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+def chat(runs: int, latency: float, *, summarize_in_background: bool) -> tuple[str, list[str]]:
+    def mock_output(_) -> str:
+        time.sleep(latency)
+
+        return "mock output"
+
+    prompt_driver = MockPromptDriver(mock_output=mock_output)
+    memory = SummaryConversationMemory(
+        offset=2, prompt_driver=prompt_driver, summarize_in_background=summarize_in_background
+    )
+    agent = Agent(prompt_driver=prompt_driver, conversation_memory=memory)
+
+    for i in range(runs):
+        agent.run(f"Question {i}")
+
+    memory.flush()
+
+    return str(memory.summary), [run.input.value for run in memory.unsummarized_runs()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    if chat(args.runs, args.latency, summarize_in_background=True) != chat(
+        args.runs, args.latency, summarize_in_background=False
+    ):
+        raise AssertionError("Summarized memory differs from the synchronous summary.")
+
+    baseline = timeit(lambda: chat(args.runs, args.latency, summarize_in_background=False), repeat=3)
+    optimized = timeit(lambda: chat(args.runs, args.latency, summarize_in_background=True), repeat=3)
+
+    report(f"{args.runs} runs x {args.latency * 1000:.0f}ms latency", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
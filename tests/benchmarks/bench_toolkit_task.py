@@ -0,0 +1,109 @@
+"""System prompt benchmark for `ToolkitTask`.
+
+Compares building the `ToolkitTask` system prompt on every step, with cached activity discovery and a cached actions
+schema, against discovering activities with `inspect.getmembers`, compiling activity descriptions, deep-copying
+activity schemas, and regenerating the actions schema on every step, as done before.
+
+Usage:
+    python -m tests.benchmarks.bench_toolkit_task [--tools 20] [--steps 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import inspect
+import json
+from copy import deepcopy
+from typing import TYPE_CHECKING, Callable, Optional
+from unittest import mock
+
+from jinja2 import Template
+from schema import Schema
+
+from griptape import utils
+from griptape.mixins.activity_mixin import ActivityMixin
+from griptape.structures import Agent
+from griptape.tasks import ToolkitTask
+from griptape.utils import J2
+from tests.benchmarks.utils import report, timeit
+from tests.mocks.mock_tool.tool import MockTool
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def baseline_activities(self: ActivityMixin) -> list[Callable]:
+    return [
+        method
+        for name, method in inspect.getmembers(self, predicate=inspect.ismethod)
+        if getattr(method, "is_activity", False)
+        and (self.allowlist is None or name in self.allowlist)
+        and (self.denylist is None or name not in self.denylist)
+    ]
+
+
+def baseline_activity_description(self: ActivityMixin, activity: Callable) -> str:
+    return Template(getattr(activity, "config")["description"]).render({"_self": self})
+
+
+def baseline_activity_schema(self: ActivityMixin, activity: Callable) -> Optional[Schema]:
+    config_schema = getattr(activity, "config")["schema"]
+
+    if config_schema is None:
+        return None
+
+    config_schema = config_schema(self) if callable(config_schema) else deepcopy(config_schema)
+
+    return Schema({"values": config_schema})
+
+
+def baseline_system_template(task: ToolkitTask) -> str:
+    # Regenerates the actions schema on every call, as done before the system prompt was cached.
+    schema = task.actions_schema().json_schema("Actions Schema")
+    schema["minItems"] = 1
+
+    return J2("tasks/toolkit_task/system.j2").render(
+        rulesets=J2("rulesets/rulesets.j2").render(rulesets=task.rulesets),
+        action_names=str.join(", ", [tool.name for tool in task.tools]),
+        actions_schema=utils.minify_json(json.dumps(schema)),
+        meta_memory=J2("memory/meta/meta_memory.j2").render(meta_memories=task.meta_memories),
+        use_native_tools=task.prompt_driver.use_native_tools,
+        stop_sequence=task.response_stop_sequence,
+    )
+
+
+@contextlib.contextmanager
+def uncached_activities() -> Iterator[None]:
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch.object(ActivityMixin, "activities", baseline_activities))
+        stack.enter_context(mock.patch.object(ActivityMixin, "activity_description", baseline_activity_description))
+        stack.enter_context(mock.patch.object(ActivityMixin, "activity_schema", baseline_activity_schema))
+
+        yield
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tools", type=int, default=20)
+    parser.add_argument("--steps", type=int, default=20)
+    args = parser.parse_args()
+
+    tools = [MockTool(name=f"MockTool{i}", install_dependencies_on_init=False) for i in range(args.tools)]
+    task = ToolkitTask("test", tools=tools)
+    Agent().add_task(task)
+
+    with uncached_activities():
+        expected = baseline_system_template(task)
+        baseline = timeit(lambda: [baseline_system_template(task) for _ in range(args.steps)], repeat=3)
+
+    if task.generate_system_template(task) != expected:
+        raise AssertionError("System prompt differs from the uncached system prompt.")
+
+    optimized = timeit(lambda: [task.generate_system_template(task) for _ in range(args.steps)], repeat=3)
+
+    report(f"{args.tools} tools x {args.steps} steps", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Scheduling benchmark for `Workflow`.
+
+Compares the ready-queue scheduler against the previous wave-based loop on a layered DAG whose Tasks sleep for
+uneven amounts of time, so that a slow Task in one wave would otherwise hold back the children of its fast siblings.
+
+Usage:
+    python -m tests.benchmarks.bench_workflow [--tasks 1000] [--width 50] [--max-delay 0.02]
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures as futures
+import logging
+import random
+import time
+
+from griptape.artifacts import ErrorArtifact, TextArtifact
+from griptape.configs import Defaults
+from griptape.structures import Workflow
+from griptape.tasks import BaseTask, CodeExecutionTask
+from tests.benchmarks.utils import report, timeit
+
+
+def baseline_run(workflow: Workflow) -> Workflow:
+    # Wave-based loop that re-sorts the graph and waits for every submitted Task, as done before the ready queue.
+    exit_loop = False
+
+    while not workflow.is_finished() and not exit_loop:
+        futures_list = {}
+
+        for task in workflow.order_tasks():
+            if task.can_execute():
+                futures_list[workflow.futures_executor.submit(task.execute)] = task
+
+        for future in futures.as_completed(futures_list):
+            if isinstance(future.result(), ErrorArtifact) and workflow.fail_fast:
+                exit_loop = True
+
+                break
+
+    return workflow
+
+
+def generate_workflow(tasks: int, width: int, max_delay: float, *, seed: int = 0) -> Workflow:
+    rng = random.Random(seed)
+    layers: list[list[BaseTask]] = []
+
+    for i in range(tasks):
+        if i % width == 0:
+            layers.append([])
+
+        delay = rng.uniform(0, max_delay)
+        parents = rng.sample(layers[-2], k=min(2, len(layers[-2]))) if len(layers) > 1 else []
+        task = CodeExecutionTask(
+            run_fn=lambda _, delay=delay: time.sleep(delay) or TextArtifact(delay),
+            parent_ids=[parent.id for parent in parents],
+        )
+        layers[-1].append(task)
+
+    workflow = Workflow(tasks=[task for layer in layers for task in layer], conversation_memory=None)
+    workflow.resolve_relationships()
+
+    return workflow
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--width", type=int, default=50)
+    parser.add_argument("--max-delay", type=float, default=0.02)
+    args = parser.parse_args()
+
+    logging.getLogger(Defaults.logging_config.logger_name).setLevel(logging.WARNING)
+
+    workflow = generate_workflow(args.tasks, args.width, args.max_delay)
+    workflow.futures_executor = futures.ThreadPoolExecutor(max_workers=args.width)
+
+    def run(fn) -> None:
+        for task in workflow.tasks:
+            task.reset()
+        fn()
+
+        if not workflow.is_finished():
+            raise AssertionError("Not every Task finished.")
+
+    baseline = timeit(lambda: run(lambda: baseline_run(workflow)), repeat=3)
+    optimized = timeit(lambda: run(workflow.try_run), repeat=3)
+
+    report(f"Workflow {args.tasks:,} tasks, width {args.width}", baseline, optimized)
+
+
+if __name__ == "__main__":
+    main()
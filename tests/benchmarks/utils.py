@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Callable
+
+
+def timeit(fn: Callable[[], object], *, repeat: int = 5) -> float:
+    """Returns the median wall time of `fn` in seconds."""
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+def report(name: str, baseline: float, optimized: float) -> None:
+    speedup = baseline / optimized if optimized else float("inf")
+
+    print(f"{name:<40} baseline {baseline * 1000:>10.2f}ms  optimized {optimized * 1000:>10.2f}ms  {speedup:>8.1f}x")  # noqa: T201
@@ -1,3 +1,5 @@
+from collections import Counter
+
 import pytest
 
 from griptape.artifacts import TextArtifact
@@ -108,6 +110,27 @@ class TestTextChunker:
         assert chunks[6].value.endswith(" foo-5")
         assert chunks[7].value.endswith(" foo-16")
 
+    def test_chunk_tokenizes_each_string_once(self, chunker, mocker):
+        text = "".join(
+            [
+                gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, "! "),
+                "\n\n",
+                gen_paragraph(MAX_TOKENS * 3, chunker.tokenizer, ". "),
+            ]
+        )
+        count_tokens_batch = mocker.spy(type(chunker.tokenizer), "count_tokens_batch")
+
+        chunker.chunk(text)
+
+        counted = Counter(text for call in count_tokens_batch.call_args_list for text in call.args[1])
+        assert counted
+        assert max(counted.values()) == 1
+
+    def test_chunk_with_zero_max_tokens(self):
+        chunks = TextChunker(max_tokens=0).chunk("foo bar")
+
+        assert [chunk.value for chunk in chunks] == ["f", "o", "o", "b", "a", "r"]
+
     def test_chunk_with_max_tokens(self, chunker):
         with pytest.raises(ValueError):
             TextChunker(max_tokens=-1)
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import call
 
 import pytest
@@ -123,6 +124,27 @@ class TestObservable:
             ]
         )
 
+    def test_observable_coroutine_function(self, observe_spy, mocker):
+        from griptape.common import observable
+
+        observe_async_spy = mocker.spy(observability.Observability, "observe_async")
+
+        class Foo:
+            @observable(tags=["Foo.bar()"])
+            async def bar(self, *args, **kwargs):
+                return args[0]
+
+        foo = Foo()
+
+        assert asyncio.run(foo.bar("a")) == "a"
+
+        original_bar = foo.bar.__wrapped__
+
+        assert observe_spy.call_count == 0
+        observe_async_spy.assert_called_once_with(
+            Observable.Call(func=original_bar, instance=foo, args=("a",), decorator_kwargs={"tags": ["Foo.bar()"]})
+        )
+
     def test_observable_method_no_parenthesis(self, observe_spy):
         from griptape.common import observable
 
@@ -239,3 +261,21 @@ class TestObservable:
                 ),
             ]
         )
+
+    def test_observable_method_bound_per_instance(self, observe_spy):
+        from griptape.common import observable
+
+        class Foo:
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+            @observable
+            def bar(self):
+                return self.name
+
+        foo_bar = Foo("foo").bar
+        baz_bar = Foo("baz").bar
+
+        assert foo_bar() == "foo"
+        assert baz_bar() == "baz"
+        assert Foo.bar is Foo.bar
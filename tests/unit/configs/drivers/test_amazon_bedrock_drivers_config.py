@@ -28,6 +28,8 @@ class TestAmazonBedrockDriversConfig:
             "conversation_memory_driver": {
                 "type": "LocalConversationMemoryDriver",
                 "persist_file": None,
+                "persist_dir": None,
+                "max_runs": None,
             },
             "embedding_driver": {"model": "amazon.titan-embed-text-v1", "type": "AmazonBedrockTitanEmbeddingDriver"},
             "image_generation_driver": {
@@ -88,6 +90,8 @@ class TestAmazonBedrockDriversConfig:
             "conversation_memory_driver": {
                 "type": "LocalConversationMemoryDriver",
                 "persist_file": None,
+                "persist_dir": None,
+                "max_runs": None,
             },
             "embedding_driver": {"model": "amazon.titan-embed-text-v1", "type": "AmazonBedrockTitanEmbeddingDriver"},
             "image_generation_driver": {
@@ -48,6 +48,8 @@ class TestAnthropicDriversConfig:
             "conversation_memory_driver": {
                 "type": "LocalConversationMemoryDriver",
                 "persist_file": None,
+                "persist_dir": None,
+                "max_runs": None,
             },
             "ruleset_driver": {
                 "type": "LocalRulesetDriver",
@@ -39,6 +39,8 @@ class TestAzureOpenAiDriversConfig:
             "conversation_memory_driver": {
                 "type": "LocalConversationMemoryDriver",
                 "persist_file": None,
+                "persist_dir": None,
+                "max_runs": None,
             },
             "embedding_driver": {
                 "base_url": None,
@@ -16,6 +16,8 @@ class TestCohereDriversConfig:
             "conversation_memory_driver": {
                 "type": "LocalConversationMemoryDriver",
                 "persist_file": None,
+                "persist_dir": None,
+                "max_runs": None,
             },
             "text_to_speech_driver": {"type": "DummyTextToSpeechDriver"},
             "audio_transcription_driver": {"type": "DummyAudioTranscriptionDriver"},
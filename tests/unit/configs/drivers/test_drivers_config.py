@@ -22,6 +22,8 @@ class TestDriversConfig:
             "conversation_memory_driver": {
                 "type": "LocalConversationMemoryDriver",
                 "persist_file": None,
+                "persist_dir": None,
+                "max_runs": None,
             },
             "embedding_driver": {"type": "DummyEmbeddingDriver"},
             "image_generation_driver": {"type": "DummyImageGenerationDriver"},
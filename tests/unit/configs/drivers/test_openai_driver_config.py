@@ -31,6 +31,8 @@ class TestOpenAiDriversConfig:
             "conversation_memory_driver": {
                 "type": "LocalConversationMemoryDriver",
                 "persist_file": None,
+                "persist_dir": None,
+                "max_runs": None,
             },
             "embedding_driver": {
                 "base_url": None,
@@ -0,0 +1,88 @@
+from concurrent import futures
+
+import pytest
+
+from griptape.drivers import LocalCacheDriver
+
+
+class TestLocalCacheDriver:
+    @pytest.fixture()
+    def driver(self):
+        return LocalCacheDriver()
+
+    def test_get_set(self, driver):
+        driver.set("foo", b"bar")
+
+        assert driver.get("foo") == b"bar"
+        assert driver.get("baz") is None
+        assert driver.hits == 1
+        assert driver.misses == 1
+        assert driver.hit_rate == 0.5
+
+    def test_get_many_set_many(self, driver):
+        driver.set_many({"foo": b"1", "bar": b"2"})
+
+        assert driver.get_many(["foo", "bar", "baz"]) == {"foo": b"1", "bar": b"2"}
+        assert driver.hits == 2
+        assert driver.misses == 1
+
+    def test_counts_concurrent_lookups(self, driver):
+        driver.set("foo", b"bar")
+
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: driver.get_many(["foo", "baz"]), range(1000)))
+
+        assert driver.hits == 1000
+        assert driver.misses == 1000
+
+    def test_evicts_least_recently_used(self):
+        driver = LocalCacheDriver(max_size=8)
+
+        driver.set("a", b"111")
+        driver.set("b", b"222")
+        driver.get("a")
+        driver.set("c", b"333")
+
+        assert driver.get("a") == b"111"
+        assert driver.get("b") is None
+        assert driver.get("c") == b"333"
+        assert driver.size == 8
+
+    def test_skips_items_larger_than_max_size(self):
+        driver = LocalCacheDriver(max_size=4)
+
+        driver.set("a", b"1")
+        driver.set("b", b"too large")
+
+        assert driver.get("a") == b"1"
+        assert driver.get("b") is None
+
+    def test_overwrite(self, driver):
+        driver.set("foo", b"bar")
+        driver.set("foo", b"bazz")
+
+        assert driver.get("foo") == b"bazz"
+        assert driver.size == 7
+
+    def test_delete(self, driver):
+        driver.set("foo", b"bar")
+        driver.delete("foo")
+        driver.delete("baz")
+
+        assert driver.get("foo") is None
+        assert driver.size == 0
+
+    def test_clear(self, driver):
+        driver.set_many({"foo": b"1", "bar": b"2"})
+        driver.clear()
+
+        assert driver.get_many(["foo", "bar"]) == {}
+        assert driver.size == 0
+
+    def test_reset_stats(self, driver):
+        driver.get("foo")
+        driver.reset_stats()
+
+        assert driver.hits == 0
+        assert driver.misses == 0
+        assert driver.hit_rate == 0.0
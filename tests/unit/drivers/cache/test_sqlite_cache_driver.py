@@ -0,0 +1,62 @@
+import pytest
+
+from griptape.drivers import SqliteCacheDriver
+
+
+class TestSqliteCacheDriver:
+    @pytest.fixture()
+    def path(self, tmp_path):
+        return str(tmp_path / "cache" / "cache.db")
+
+    @pytest.fixture()
+    def driver(self, path):
+        driver = SqliteCacheDriver(path=path)
+
+        yield driver
+
+        driver.close()
+
+    def test_get_set(self, driver):
+        driver.set("foo", b"bar")
+
+        assert driver.get("foo") == b"bar"
+        assert driver.get("baz") is None
+        assert driver.hits == 1
+        assert driver.misses == 1
+
+    def test_get_many_set_many(self, driver):
+        items = {f"key-{i}": str(i).encode() for i in range(SqliteCacheDriver.QUERY_BATCH_SIZE + 10)}
+        driver.set_many(items)
+
+        assert driver.get_many([*items.keys(), "missing"]) == items
+
+    def test_shared_between_connections(self, driver, path):
+        driver.set("foo", b"bar")
+
+        other_driver = SqliteCacheDriver(path=path)
+
+        assert other_driver.get("foo") == b"bar"
+
+        other_driver.set("foo", b"baz")
+
+        assert driver.get("foo") == b"baz"
+
+        other_driver.close()
+
+    def test_delete(self, driver):
+        driver.set("foo", b"bar")
+        driver.delete("foo")
+
+        assert driver.get("foo") is None
+
+    def test_clear(self, driver):
+        driver.set_many({"foo": b"1", "bar": b"2"})
+        driver.clear()
+
+        assert driver.get_many(["foo", "bar"]) == {}
+
+    def test_close(self, driver):
+        driver.set("foo", b"bar")
+        driver.close()
+
+        assert driver.get("foo") == b"bar"
@@ -0,0 +1,56 @@
+import pytest
+
+from griptape.drivers import LocalCacheDriver, SqliteCacheDriver, TieredCacheDriver
+
+
+class TestTieredCacheDriver:
+    @pytest.fixture()
+    def memory_driver(self):
+        return LocalCacheDriver()
+
+    @pytest.fixture()
+    def disk_driver(self, tmp_path):
+        driver = SqliteCacheDriver(path=str(tmp_path / "cache.db"))
+
+        yield driver
+
+        driver.close()
+
+    @pytest.fixture()
+    def driver(self, memory_driver, disk_driver):
+        return TieredCacheDriver(cache_drivers=[memory_driver, disk_driver])
+
+    def test_set_writes_to_all_tiers(self, driver, memory_driver, disk_driver):
+        driver.set("foo", b"bar")
+
+        assert memory_driver.get("foo") == b"bar"
+        assert disk_driver.get("foo") == b"bar"
+
+    def test_get_backfills_faster_tiers(self, driver, memory_driver, disk_driver):
+        disk_driver.set("foo", b"bar")
+
+        assert driver.get("foo") == b"bar"
+        assert memory_driver.get("foo") == b"bar"
+        assert driver.hits == 1
+
+    def test_get_many(self, driver, memory_driver, disk_driver):
+        memory_driver.set("foo", b"1")
+        disk_driver.set("bar", b"2")
+
+        assert driver.get_many(["foo", "bar", "baz"]) == {"foo": b"1", "bar": b"2"}
+        assert driver.hits == 2
+        assert driver.misses == 1
+        assert disk_driver.get_many(["foo"]) == {}
+
+    def test_delete(self, driver, memory_driver, disk_driver):
+        driver.set("foo", b"bar")
+        driver.delete("foo")
+
+        assert memory_driver.get("foo") is None
+        assert disk_driver.get("foo") is None
+
+    def test_clear(self, driver, memory_driver, disk_driver):
+        driver.set("foo", b"bar")
+        driver.clear()
+
+        assert driver.get("foo") is None
@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 import pytest
@@ -7,7 +8,7 @@ from griptape.drivers import AmazonBedrockCohereEmbeddingDriver
 
 class TestAmazonBedrockCohereEmbeddingDriver:
     @pytest.fixture(autouse=True)
-    def _mock_session(self, mocker):
+    def mock_client(self, mocker):
         fake_embeddings = '{"embeddings": [[0, 1, 0]] }'
 
         mock_session_class = mocker.patch("boto3.Session")
@@ -21,8 +22,16 @@ class TestAmazonBedrockCohereEmbeddingDriver:
         mock_session_object.client.return_value = mock_client
         mock_session_class.return_value = mock_session_object
 
+        return mock_client
+
     def test_init(self):
         assert AmazonBedrockCohereEmbeddingDriver()
 
     def test_try_embed_chunk(self):
         assert AmazonBedrockCohereEmbeddingDriver().try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self, mock_client):
+        mock_client.invoke_model.return_value.get().read.return_value = '{"embeddings": [[0, 1, 0], [1, 0, 0]] }'
+
+        assert AmazonBedrockCohereEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert json.loads(mock_client.invoke_model.call_args.kwargs["body"])["texts"] == ["foo", "bar"]
@@ -1,8 +1,11 @@
-from unittest.mock import patch
+import asyncio
+from unittest.mock import Mock, patch
 
 import pytest
 
 from griptape.artifacts import TextArtifact
+from griptape.drivers import LocalCacheDriver
+from griptape.utils import RateLimiter
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -21,6 +24,19 @@ class TestBaseEmbeddingDriver:
 
         assert embedding == [0, 1]
 
+    def test_embed_string_async(self, driver):
+        assert asyncio.run(driver.embed_string_async("foobar")) == [0, 1]
+
+    def test_embed_long_string_async(self, driver):
+        assert asyncio.run(driver.embed_string_async("foobar" * 5000)) == [0, 1]
+
+    def test_embed_string_async_cache(self, driver):
+        driver.cache_driver = LocalCacheDriver()
+
+        assert asyncio.run(driver.embed_string_async("foobar")) == driver.embed_string("foobar")
+        assert driver.cache_driver.hits == 1
+        assert driver.cache_driver.misses == 1
+
     def test_embed_long_string(self, driver):
         embedding = driver.embed_string("foobar" * 5000)
 
@@ -41,3 +57,161 @@ class TestBaseEmbeddingDriver:
             driver.embed_string("foobar")
 
         assert e.value.args[0] == "nope"
+
+    def test_embed_strings(self, driver):
+        driver.mock_output = lambda chunk: [len(chunk)]
+
+        assert driver.embed_strings(["a", "bb", "ccc"]) == [[1], [2], [3]]
+
+    def test_embed_strings_empty(self, driver):
+        assert driver.embed_strings([]) == []
+
+    def test_embed_strings_respects_max_batch_size(self, driver):
+        driver.max_batch_size = 2
+        driver.try_embed_chunks = Mock(side_effect=lambda chunks: [[len(chunk)] for chunk in chunks])
+
+        embeddings = driver.embed_strings(["a", "bb", "ccc", "dddd", "eeeee"])
+
+        assert embeddings == [[1], [2], [3], [4], [5]]
+        assert [call.args[0] for call in driver.try_embed_chunks.call_args_list] == [
+            ["a", "bb"],
+            ["ccc", "dddd"],
+            ["eeeee"],
+        ]
+
+    def test_embed_strings_respects_max_batch_tokens(self, driver):
+        driver.max_batch_size = 100
+        driver.max_batch_tokens = 5
+        driver.try_embed_chunks = Mock(side_effect=lambda chunks: [[len(chunk)] for chunk in chunks])
+
+        embeddings = driver.embed_strings(["a", "bb", "ccc", "dddddd", "e"])
+
+        assert embeddings == [[1], [2], [3], [6], [1]]
+        assert [call.args[0] for call in driver.try_embed_chunks.call_args_list] == [
+            ["a", "bb"],
+            ["ccc"],
+            ["dddddd"],
+            ["e"],
+        ]
+
+    def test_embed_strings_embeds_long_strings_separately(self, driver):
+        driver.max_batch_size = 100
+        long_string = "foobar" * 5000
+
+        embeddings = driver.embed_strings(["foo", long_string, "bar"])
+
+        assert embeddings[0] == [0, 1]
+        assert embeddings[1] == [0, 1]
+        assert embeddings[2] == [0, 1]
+
+    def test_embed_long_string_batches_chunks(self, driver):
+        driver.max_batch_size = 100
+        driver.try_embed_chunks = Mock(side_effect=lambda chunks: [[0, 1] for _ in chunks])
+
+        embedding = driver.embed_string("foobar" * 5000)
+
+        assert embedding == [0, 1]
+        assert driver.try_embed_chunks.call_count == 1
+
+    def test_embed_strings_retries(self, driver):
+        driver.max_attempts = 2
+        driver.min_retry_delay = 0
+        driver.max_retry_delay = 0
+        driver.try_embed_chunks = Mock(side_effect=[Exception("nope"), [[0, 1]]])
+
+        assert driver.embed_strings(["foobar"]) == [[0, 1]]
+        assert driver.try_embed_chunks.call_count == 2
+
+    def test_embed_strings_throws_on_embedding_count_mismatch(self, driver):
+        driver.max_batch_size = 2
+        driver.try_embed_chunks = Mock(return_value=[[0, 1]])
+
+        with pytest.raises(ValueError, match="Expected 2 embeddings, got 1."):
+            driver.embed_strings(["foo", "bar"])
+
+    def test_embed_strings_deduplicates(self, driver):
+        driver.max_batch_size = 100
+        driver.try_embed_chunks = Mock(side_effect=lambda chunks: [[len(chunk)] for chunk in chunks])
+
+        assert driver.embed_strings(["a", "bb", "a"]) == [[1], [2], [1]]
+        driver.try_embed_chunks.assert_called_once_with(["a", "bb"])
+
+    def test_embed_string_cache(self, driver):
+        driver.cache_driver = LocalCacheDriver()
+        driver.try_embed_chunk = Mock(return_value=[0.5, 1.5])
+
+        assert driver.embed_string("foo") == [0.5, 1.5]
+        assert driver.embed_string("foo") == [0.5, 1.5]
+        assert driver.try_embed_chunk.call_count == 1
+        assert driver.cache_driver.hits == 1
+        assert driver.cache_driver.misses == 1
+
+    def test_embed_strings_cache(self, driver):
+        driver.cache_driver = LocalCacheDriver()
+        driver.max_batch_size = 100
+        driver.mock_output = lambda chunk: [len(chunk)]
+        driver.try_embed_chunks = Mock(side_effect=lambda chunks: [[len(chunk)] for chunk in chunks])
+
+        driver.embed_string("a")
+
+        assert driver.embed_strings(["a", "bb", "ccc"]) == [[1], [2], [3]]
+        assert driver.embed_strings(["ccc", "bb"]) == [[3], [2]]
+        driver.try_embed_chunks.assert_called_once_with(["bb", "ccc"])
+        assert driver.cache_driver.hits == 3
+        assert driver.cache_driver.misses == 3
+
+    def test_cache_is_keyed_by_model(self, driver):
+        driver.cache_driver = LocalCacheDriver()
+        driver.try_embed_chunk = Mock(return_value=[0, 1])
+
+        driver.embed_string("foo")
+        driver.model = "bar"
+        driver.embed_string("foo")
+
+        assert driver.try_embed_chunk.call_count == 2
+
+    def test_embed_string_rate_limiter(self, driver, mocker):
+        mock_acquire = mocker.patch.object(RateLimiter, "acquire", return_value=0.0)
+        driver.rate_limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=1000)
+
+        driver.embed_string("foobar")
+
+        mock_acquire.assert_called_once_with(6)
+
+    def test_embed_string_rate_limiter_without_tokens_per_minute(self, driver, mocker):
+        mock_acquire = mocker.patch.object(RateLimiter, "acquire", return_value=0.0)
+        driver.rate_limiter = RateLimiter(requests_per_minute=60)
+
+        driver.embed_string("foobar")
+
+        mock_acquire.assert_called_once_with(0)
+
+    def test_embed_string_async_rate_limiter(self, driver, mocker):
+        mock_acquire = mocker.patch.object(RateLimiter, "acquire_async", return_value=0.0)
+        driver.rate_limiter = RateLimiter(tokens_per_minute=1000)
+
+        asyncio.run(driver.embed_string_async("foobar"))
+
+        mock_acquire.assert_called_once_with(6)
+
+    def test_embed_strings_rate_limiter(self, driver, mocker):
+        mock_acquire = mocker.patch.object(RateLimiter, "acquire", return_value=0.0)
+        driver.rate_limiter = RateLimiter(tokens_per_minute=1000)
+        driver.max_batch_size = 2
+        driver.max_attempts = 2
+        driver.min_retry_delay = 0
+        driver.max_retry_delay = 0
+        driver.try_embed_chunks = Mock(side_effect=[Exception("nope"), [[0, 1], [0, 1]], [[0, 1]]])
+
+        driver.embed_strings(["a", "bb", "ccc"])
+
+        assert [call.args for call in mock_acquire.call_args_list] == [(3,), (3,), (3,)]
+
+    def test_embed_long_string_rate_limiter(self, driver, mocker):
+        mock_acquire = mocker.patch.object(RateLimiter, "acquire", return_value=0.0)
+        driver.rate_limiter = RateLimiter(tokens_per_minute=100000)
+        driver.max_batch_size = 100
+
+        driver.embed_string("foobar" * 5000)
+
+        mock_acquire.assert_called_once_with(30000)
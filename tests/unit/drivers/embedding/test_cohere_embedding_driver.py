@@ -2,7 +2,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from griptape.drivers import CohereEmbeddingDriver
+from griptape.drivers import CohereEmbeddingDriver, LocalCacheDriver
 
 
 class TestCohereEmbeddingDriver:
@@ -21,3 +21,21 @@ class TestCohereEmbeddingDriver:
         assert CohereEmbeddingDriver(
             model="embed-english-v3.0", api_key="bar", input_type="search_document"
         ).try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self, mock_client):
+        mock_client.embed.return_value = Mock(embeddings=[[0, 1, 0], [1, 0, 0]])
+
+        assert CohereEmbeddingDriver(
+            model="embed-english-v3.0", api_key="bar", input_type="search_document"
+        ).try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_client.embed.call_args.kwargs["texts"] == ["foo", "bar"]
+
+    def test_cache_is_keyed_by_input_type(self, mock_client):
+        cache_driver = LocalCacheDriver()
+
+        for input_type in ["search_document", "search_query", "search_query"]:
+            CohereEmbeddingDriver(
+                model="embed-english-v3.0", api_key="bar", input_type=input_type, cache_driver=cache_driver
+            ).embed_string("foobar")
+
+        assert mock_client.embed.call_count == 2
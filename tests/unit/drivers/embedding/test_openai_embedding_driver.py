@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -30,3 +31,30 @@ class TestOpenAiEmbeddingDriver:
     def test_try_embed_chunk_replaces_newlines_in_older_ada_models(self, model, mock_openai):
         OpenAiEmbeddingDriver(model=model).try_embed_chunk("foo\nbar")
         assert mock_openai.call_args.kwargs["input"] == "foo bar" if model.endswith("001") else "foo\nbar"
+
+    def test_try_embed_chunk_async(self, mocker):
+        mock_create = mocker.patch("openai.AsyncOpenAI").return_value.embeddings.create = AsyncMock(
+            return_value=Mock(data=[Mock(embedding=[1, 0, 0])])
+        )
+
+        assert asyncio.run(OpenAiEmbeddingDriver().try_embed_chunk_async("foobar")) == [1, 0, 0]
+        assert mock_create.await_args.kwargs["input"] == "foobar"
+
+    def test_try_embed_chunks(self, mock_openai):
+        mock_openai.return_value.data = [
+            Mock(index=1, embedding=[1, 0, 0]),
+            Mock(index=0, embedding=[0, 1, 0]),
+        ]
+
+        assert OpenAiEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_openai.call_args.kwargs["input"] == ["foo", "bar"]
+
+    def test_embed_strings(self, mock_openai):
+        mock_openai.side_effect = lambda **kwargs: Mock(
+            data=[Mock(index=i, embedding=[i]) for i in range(len(kwargs["input"]))]
+        )
+
+        embeddings = OpenAiEmbeddingDriver(max_batch_size=2).embed_strings(["foo", "bar", "baz"])
+
+        assert embeddings == [[0], [1], [0]]
+        assert mock_openai.call_count == 2
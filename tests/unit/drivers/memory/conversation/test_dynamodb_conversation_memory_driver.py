@@ -1,9 +1,14 @@
+from __future__ import annotations
+
+import json
+
 import boto3
 import pytest
 from moto import mock_aws
 
+from griptape.artifacts import TextArtifact
 from griptape.drivers import AmazonDynamoDbConversationMemoryDriver
-from griptape.memory.structure import ConversationMemory
+from griptape.memory.structure import ConversationMemory, Run
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask
 from tests.utils.aws import mock_aws_credentials
@@ -149,3 +154,105 @@ class TestDynamoDbConversationMemoryDriver:
 
         assert len(runs) == 2
         assert metadata == {"foo": "bar"}
+
+    def test_invalid_max_runs(self):
+        with pytest.raises(ValueError, match="max_runs must be at least 1"):
+            self.driver(max_runs=0)
+
+    def test_store_run_items(self):
+        runs = self.runs(4)
+        memory_driver = self.driver()
+        memory_driver.load()
+
+        memory_driver.store(runs[:3], {"foo": "bar"})
+        memory_driver.store(runs[1:], {"foo": "baz"})
+
+        items = self.table().query(
+            KeyConditionExpression="entryId = :pk", ExpressionAttributeValues={":pk": self.PARTITION_KEY_VALUE}
+        )["Items"]
+
+        assert [item["sortKey"] for item in items] == [
+            "baz",
+            "baz#run#000000000001",
+            "baz#run#000000000002",
+            "baz#run#000000000003",
+        ]
+        assert items[0][self.VALUE_ATTRIBUTE_KEY] == '{"metadata": {"foo": "baz"}}'
+
+        loaded_runs, metadata = self.driver().load()
+
+        assert [run.id for run in loaded_runs] == [run.id for run in runs[1:]]
+        assert metadata == {"foo": "baz"}
+
+    def test_store_run_items_appends(self, mocker):
+        runs = self.runs(4)
+        memory_driver = self.driver()
+        memory_driver.load()
+        memory_driver.store(runs[:3], {})
+        spy = mocker.spy(memory_driver.table, "batch_writer")
+
+        memory_driver.store(runs, {})
+
+        assert spy.call_count == 1
+        assert [run.id for run in self.driver().load()[0]] == [run.id for run in runs]
+
+    def test_store_run_items_without_load(self):
+        runs = self.runs(3)
+        self.driver().store(runs, {})
+        self.driver().store(runs[:1], {})
+
+        assert [run.id for run in self.driver().load()[0]] == [runs[0].id]
+
+    def test_max_runs(self):
+        runs = self.runs(5)
+        self.driver().store(runs, {})
+
+        memory_driver = self.driver(max_runs=2)
+        loaded_runs, _ = memory_driver.load()
+
+        assert [run.id for run in loaded_runs] == [run.id for run in runs[-2:]]
+
+        new_runs = [*loaded_runs[1:], *self.runs(1)]
+        memory_driver.store(new_runs, {})
+
+        assert [run.id for run in self.driver().load()[0]] == [run.id for run in new_runs]
+
+    def test_load_single_item_with_sort_key(self):
+        runs = self.runs(2)
+        self.table().put_item(
+            Item={
+                self.DYNAMODB_PARTITION_KEY: self.PARTITION_KEY_VALUE,
+                self.DYNAMODB_SORT_KEY: self.SORT_KEY_VALUE,
+                self.VALUE_ATTRIBUTE_KEY: json.dumps(
+                    {"runs": [run.to_dict() for run in runs], "metadata": {"foo": "bar"}}
+                ),
+            }
+        )
+        memory_driver = self.driver()
+
+        loaded_runs, metadata = memory_driver.load()
+
+        assert [run.id for run in loaded_runs] == [run.id for run in runs]
+        assert metadata == {"foo": "bar"}
+
+        memory_driver.store(loaded_runs, metadata)
+
+        assert [run.id for run in self.driver().load()[0]] == [run.id for run in runs]
+
+    def table(self):
+        return boto3.Session(region_name=self.AWS_REGION).resource("dynamodb").Table(self.DYNAMODB_COMPOSITE_TABLE_NAME)
+
+    def driver(self, **kwargs) -> AmazonDynamoDbConversationMemoryDriver:
+        return AmazonDynamoDbConversationMemoryDriver(
+            session=boto3.Session(region_name=self.AWS_REGION),
+            table_name=self.DYNAMODB_COMPOSITE_TABLE_NAME,
+            partition_key=self.DYNAMODB_PARTITION_KEY,
+            value_attribute_key=self.VALUE_ATTRIBUTE_KEY,
+            partition_key_value=self.PARTITION_KEY_VALUE,
+            sort_key=self.DYNAMODB_SORT_KEY,
+            sort_key_value=self.SORT_KEY_VALUE,
+            **kwargs,
+        )
+
+    def runs(self, count: int) -> list[Run]:
+        return [Run(input=TextArtifact(f"input {i}"), output=TextArtifact(f"output {i}")) for i in range(count)]
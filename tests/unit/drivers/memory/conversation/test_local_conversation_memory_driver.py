@@ -1,11 +1,14 @@
+from __future__ import annotations
+
 import contextlib
 import os
 from pathlib import Path
 
 import pytest
 
+from griptape.artifacts import TextArtifact
 from griptape.drivers import LocalConversationMemoryDriver
-from griptape.memory.structure import ConversationMemory
+from griptape.memory.structure import ConversationMemory, Run
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask
 
@@ -79,6 +82,144 @@ class TestLocalConversationMemoryDriver:
         assert autoloaded_memory.runs[0].input.value == "test"
         assert autoloaded_memory.runs[0].output.value == "mock output"
 
+    def test_persist_file_and_persist_dir(self, tmp_path):
+        with pytest.raises(ValueError, match="Only one of persist_file and persist_dir can be set."):
+            LocalConversationMemoryDriver(persist_file=self.MEMORY_FILE_PATH, persist_dir=str(tmp_path))
+
+    def test_invalid_max_runs(self, tmp_path):
+        with pytest.raises(ValueError, match="max_runs must be at least 1"):
+            LocalConversationMemoryDriver(persist_dir=str(tmp_path), max_runs=0)
+
+    def test_store_persist_dir(self, tmp_path):
+        memory_driver = LocalConversationMemoryDriver(persist_dir=str(tmp_path / "memory"))
+        memory = ConversationMemory(conversation_memory_driver=memory_driver, meta={"foo": "bar"})
+        pipeline = Pipeline(conversation_memory=memory)
+
+        pipeline.add_task(PromptTask("test"))
+
+        pipeline.run()
+        log_size = (tmp_path / "memory" / "runs.jsonl").stat().st_size
+        pipeline.run()
+
+        log = (tmp_path / "memory" / "runs.jsonl").read_text()
+
+        assert len(log.splitlines()) == 2
+        assert len(log) == log_size * 2
+        assert (tmp_path / "memory" / "metadata.json").read_text() == '{"foo": "bar"}'
+
+    def test_load_persist_dir(self, tmp_path):
+        memory_driver = LocalConversationMemoryDriver(persist_dir=str(tmp_path))
+        memory = ConversationMemory(conversation_memory_driver=memory_driver, meta={"foo": "bar"})
+        pipeline = Pipeline(conversation_memory=memory)
+
+        pipeline.add_task(PromptTask("test"))
+
+        pipeline.run()
+        pipeline.run()
+
+        runs, metadata = LocalConversationMemoryDriver(persist_dir=str(tmp_path)).load()
+
+        assert [run.id for run in runs] == [run.id for run in memory.runs]
+        assert runs[0].input.value == "test"
+        assert runs[0].output.value == "mock output"
+        assert metadata == {"foo": "bar"}
+
+    def test_load_persist_dir_empty(self, tmp_path):
+        assert LocalConversationMemoryDriver(persist_dir=str(tmp_path)).load() == ([], {})
+
+    def test_load_persist_dir_bad_data(self, tmp_path):
+        (tmp_path / "runs.jsonl").write_text("bad data\n")
+        memory_driver = LocalConversationMemoryDriver(persist_dir=str(tmp_path))
+
+        with pytest.raises(ValueError, match="Unable to load data from"):
+            ConversationMemory(conversation_memory_driver=memory_driver)
+
+    def test_load_persist_dir_partial_record(self, tmp_path):
+        runs = self.__runs(2)
+        memory_driver = LocalConversationMemoryDriver(persist_dir=str(tmp_path))
+        memory_driver.load()
+        memory_driver.store(runs, {})
+        log_size = (tmp_path / "runs.jsonl").stat().st_size
+
+        with open(tmp_path / "runs.jsonl", "a") as file:
+            file.write('{"op": "run", "run": {')
+
+        loaded_runs, _ = LocalConversationMemoryDriver(persist_dir=str(tmp_path)).load()
+
+        assert [run.id for run in loaded_runs] == [run.id for run in runs]
+        assert (tmp_path / "runs.jsonl").stat().st_size == log_size
+
+    @pytest.mark.parametrize("max_runs", [None, 1, 3, 10])
+    @pytest.mark.parametrize("read_block_size", [7, 64 * 1024])
+    def test_load_persist_dir_max_runs(self, tmp_path, mocker, max_runs, read_block_size):
+        mocker.patch.object(LocalConversationMemoryDriver, "READ_BLOCK_SIZE", read_block_size)
+        runs = self.__runs(10)
+        memory_driver = LocalConversationMemoryDriver(persist_dir=str(tmp_path), compaction_threshold=1.0)
+        memory_driver.load()
+
+        for i in range(len(runs)):
+            # Keeps a sliding window of 5 runs, like ConversationMemory's max_runs does.
+            memory_driver.store(runs[max(0, i - 4) : i + 1], {})
+
+        loaded_runs, _ = LocalConversationMemoryDriver(persist_dir=str(tmp_path), max_runs=max_runs).load()
+
+        assert [run.id for run in loaded_runs] == [run.id for run in runs[5:]][-(max_runs or 5) :]
+
+    def test_store_persist_dir_max_runs(self, tmp_path):
+        runs = self.__runs(6)
+        memory_driver = LocalConversationMemoryDriver(persist_dir=str(tmp_path), compaction_threshold=1.0)
+        memory_driver.load()
+        memory_driver.store(runs, {})
+
+        memory_driver = LocalConversationMemoryDriver(persist_dir=str(tmp_path), max_runs=2)
+        loaded_runs, _ = memory_driver.load()
+        memory_driver.store(loaded_runs, {})
+
+        loaded_runs, _ = LocalConversationMemoryDriver(persist_dir=str(tmp_path)).load()
+
+        assert [run.id for run in loaded_runs] == [run.id for run in runs[-2:]]
+
+    def test_store_persist_dir_compaction(self, tmp_path):
+        runs = self.__runs(4)
+        memory_driver = LocalConversationMemoryDriver(persist_dir=str(tmp_path), compaction_threshold=0.5)
+        memory_driver.load()
+        memory_driver.store(runs, {})
+        memory_driver.store(runs[1:], {})
+
+        assert len((tmp_path / "runs.jsonl").read_text().splitlines()) == 5
+
+        memory_driver.store(runs[2:], {})
+
+        assert len((tmp_path / "runs.jsonl").read_text().splitlines()) == 2
+
+        loaded_runs, _ = LocalConversationMemoryDriver(persist_dir=str(tmp_path)).load()
+
+        assert [run.id for run in loaded_runs] == [run.id for run in runs[2:]]
+
+    def test_store_persist_dir_without_load(self, tmp_path):
+        runs = self.__runs(3)
+        LocalConversationMemoryDriver(persist_dir=str(tmp_path)).store(runs, {})
+        LocalConversationMemoryDriver(persist_dir=str(tmp_path)).store(runs[:1], {})
+
+        loaded_runs, _ = LocalConversationMemoryDriver(persist_dir=str(tmp_path)).load()
+
+        assert [run.id for run in loaded_runs] == [runs[0].id]
+
+    def test_store_persist_dir_metadata(self, tmp_path, mocker):
+        memory_driver = LocalConversationMemoryDriver(persist_dir=str(tmp_path))
+        memory_driver.load()
+        spy = mocker.spy(os, "replace")
+
+        memory_driver.store(self.__runs(1), {"foo": "bar"})
+        memory_driver.store(self.__runs(1), {"foo": "bar"})
+        memory_driver.store(self.__runs(1), {"foo": "baz"})
+
+        assert [call.args[1] for call in spy.call_args_list].count(str(tmp_path / "metadata.json")) == 2
+        assert LocalConversationMemoryDriver(persist_dir=str(tmp_path)).load()[1] == {"foo": "baz"}
+
+    def __runs(self, count: int) -> list[Run]:
+        return [Run(input=TextArtifact(f"input {i}"), output=TextArtifact(f"output {i}")) for i in range(count)]
+
     def __delete_file(self, persist_file) -> None:
         with contextlib.suppress(FileNotFoundError):
             os.remove(persist_file)
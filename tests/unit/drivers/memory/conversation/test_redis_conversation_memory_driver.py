@@ -1,7 +1,10 @@
+import fakeredis
 import pytest
 import redis
 
+from griptape.artifacts import TextArtifact
 from griptape.drivers.memory.conversation.redis_conversation_memory_driver import RedisConversationMemoryDriver
+from griptape.memory.structure import Run
 from griptape.memory.structure.base_conversation_memory import BaseConversationMemory
 
 TEST_DATA = '{"runs": [{"input": {"type": "TextArtifact", "value": "Hi There, Hello"}, "output": {"type": "TextArtifact", "value": "Hello! How can I assist you today?"}}], "metadata": {"foo": "bar"}}'
@@ -19,6 +22,8 @@ class TestRedisConversationMemoryDriver:
         mocker.patch.object(redis.StrictRedis, "hset", return_value=None)
         mocker.patch.object(redis.StrictRedis, "keys", return_value=[b"test"])
         mocker.patch.object(redis.StrictRedis, "hget", return_value=TEST_DATA)
+        mocker.patch.object(redis.StrictRedis, "lrange", return_value=[])
+        mocker.patch.object(redis.StrictRedis, "pipeline", return_value=mocker.MagicMock())
 
         fake_redisearch = mocker.MagicMock()
         fake_redisearch.search = mocker.MagicMock(return_value=mocker.MagicMock(docs=[]))
@@ -45,3 +50,90 @@ class TestRedisConversationMemoryDriver:
         runs, metadata = driver.load()
         assert len(runs) == 0
         assert metadata == {}
+
+    def test_invalid_max_runs(self):
+        with pytest.raises(ValueError, match="max_runs must be at least 1"):
+            RedisConversationMemoryDriver(host=HOST, port=PORT, index=INDEX, max_runs=0)
+
+
+class TestRedisConversationMemoryDriverRunList:
+    @pytest.fixture()
+    def client(self):
+        return fakeredis.FakeRedis()
+
+    @pytest.fixture()
+    def runs(self):
+        return [Run(input=TextArtifact(f"input {i}"), output=TextArtifact(f"output {i}")) for i in range(5)]
+
+    def driver(self, client, **kwargs) -> RedisConversationMemoryDriver:
+        return RedisConversationMemoryDriver(
+            host=HOST, port=PORT, index=INDEX, conversation_id=CONVERSATION_ID, client=client, **kwargs
+        )
+
+    def test_store(self, client, runs):
+        driver = self.driver(client)
+        driver.load()
+
+        driver.store(runs[:3], {"foo": "bar"})
+        driver.store(runs[1:4], {"foo": "baz"})
+
+        assert client.llen(driver.runs_key) == 3
+        assert client.hget(INDEX, CONVERSATION_ID) == b'{"metadata": {"foo": "baz"}}'
+
+        loaded_runs, metadata = self.driver(client).load()
+
+        assert [run.id for run in loaded_runs] == [run.id for run in runs[1:4]]
+        assert metadata == {"foo": "baz"}
+
+    def test_store_appends(self, mocker, client, runs):
+        driver = self.driver(client)
+        driver.load()
+        driver.store(runs[:4], {})
+        spy = mocker.spy(redis.client.Pipeline, "rpush")
+
+        driver.store(runs, {})
+
+        assert spy.call_count == 1
+        assert len(spy.call_args.args) == 3
+        assert [run.id for run in self.driver(client).load()[0]] == [run.id for run in runs]
+
+    def test_store_without_load(self, client, runs):
+        self.driver(client).store(runs, {})
+        self.driver(client).store(runs[:2], {})
+
+        assert [run.id for run in self.driver(client).load()[0]] == [run.id for run in runs[:2]]
+
+    def test_store_empty(self, client, runs):
+        driver = self.driver(client)
+        driver.load()
+        driver.store(runs, {})
+        driver.store([], {})
+
+        assert client.exists(driver.runs_key) == 0
+        assert self.driver(client).load() == ([], {})
+
+    def test_max_runs(self, client, runs):
+        self.driver(client).store(runs, {})
+
+        driver = self.driver(client, max_runs=2)
+        loaded_runs, _ = driver.load()
+
+        assert [run.id for run in loaded_runs] == [run.id for run in runs[-2:]]
+
+        driver.store(loaded_runs, {})
+
+        assert [run.id for run in self.driver(client).load()[0]] == [run.id for run in runs[-2:]]
+
+    def test_load_hash(self, client):
+        client.hset(INDEX, CONVERSATION_ID, TEST_DATA)
+        driver = self.driver(client)
+
+        runs, metadata = driver.load()
+
+        assert len(runs) == 1
+        assert metadata == {"foo": "bar"}
+
+        driver.store(runs, metadata)
+
+        assert client.hget(INDEX, CONVERSATION_ID) == b'{"metadata": {"foo": "bar"}}'
+        assert [run.id for run in self.driver(client).load()[0]] == [run.id for run in runs]
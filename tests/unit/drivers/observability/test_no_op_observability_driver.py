@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from griptape.common.observable import Observable
@@ -25,6 +27,13 @@ class TestNoOpObservabilityDriver:
             assert driver.observe(Observable.Call(func=func, instance=None, args=["Hi"])) == "Hi you"
             assert driver.observe(Observable.Call(func=instance.method, instance=instance, args=["Bye"])) == "Bye yous"
 
+    def test_observe_async(self, driver):
+        async def func(word: str):
+            return word + " you"
+
+        with driver:
+            assert asyncio.run(driver.observe_async(Observable.Call(func=func, instance=None, args=["Hi"]))) == "Hi you"
+
     def test_get_span_id(self, driver):
         assert driver.get_span_id() is None
 
@@ -1,13 +1,15 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.trace import StatusCode
 
-from griptape.common import Observable
+from griptape.common import Observable, PromptStack
 from griptape.drivers import OpenTelemetryObservabilityDriver
 from griptape.observability.observability import Observability
 from griptape.structures.agent import Agent
+from tests.mocks.mock_prompt_driver import MockPromptDriver
 from tests.utils.expected_spans import ExpectedSpan, ExpectedSpans
 
 
@@ -176,6 +178,67 @@ class TestOpenTelemetryObservabilityDriver:
         mock_span_exporter.export.assert_called_with(expected_spans)
         mock_span_exporter.export.reset_mock()
 
+    def test_context_manager_observe_async(self, driver, mock_span_exporter):
+        expected_spans = ExpectedSpans(
+            spans=[
+                ExpectedSpan(name="main", parent=None, status_code=StatusCode.OK),
+                ExpectedSpan(name="func()", parent="main", status_code=StatusCode.OK),
+                ExpectedSpan(name="nested()", parent="func()", status_code=StatusCode.OK),
+            ]
+        )
+
+        async def nested(word: str):
+            return word + " you"
+
+        async def func(word: str):
+            await asyncio.sleep(0)
+
+            return await driver.observe_async(Observable.Call(func=nested, args=[word]))
+
+        with driver:
+            assert asyncio.run(driver.observe_async(Observable.Call(func=func, instance=None, args=["Hi"]))) == "Hi you"
+
+        assert mock_span_exporter.export.call_count == 1
+        mock_span_exporter.export.assert_called_with(expected_spans)
+
+    def test_context_manager_observe_async_exception(self, driver, mock_span_exporter):
+        expected_spans = ExpectedSpans(
+            spans=[
+                ExpectedSpan(name="main", parent=None, status_code=StatusCode.ERROR, exception=Exception("Boom func")),
+                ExpectedSpan(
+                    name="func()", parent="main", status_code=StatusCode.ERROR, exception=Exception("Boom func")
+                ),
+            ]
+        )
+
+        async def func(word: str):
+            raise Exception("Boom func")
+
+        with pytest.raises(Exception, match="Boom func"), driver:
+            asyncio.run(driver.observe_async(Observable.Call(func=func, instance=None, args=["Hi"])))
+
+        assert mock_span_exporter.export.call_count == 1
+        mock_span_exporter.export.assert_called_with(expected_spans)
+
+    def test_observability_prompt_driver_run_async(self, driver, mock_span_exporter):
+        expected_spans = ExpectedSpans(
+            spans=[
+                ExpectedSpan(name="main", parent=None, status_code=StatusCode.OK),
+                ExpectedSpan(name="MockPromptDriver.run_async()", parent="main", status_code=StatusCode.OK),
+                ExpectedSpan(
+                    name="MockPromptDriver.try_run_async()",
+                    parent="MockPromptDriver.run_async()",
+                    status_code=StatusCode.OK,
+                ),
+            ]
+        )
+
+        with Observability(observability_driver=driver):
+            asyncio.run(MockPromptDriver().run_async(PromptStack()))
+
+        assert mock_span_exporter.export.call_count == 1
+        mock_span_exporter.export.assert_called_with(expected_spans)
+
     def test_context_manager_observe_adds_tags_attribute(self, driver, mock_span_exporter):
         expected_spans = ExpectedSpans(
             spans=[
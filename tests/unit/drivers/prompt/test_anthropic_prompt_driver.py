@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -196,6 +197,26 @@ class TestAnthropicPromptDriver:
 
         return mock_stream_client
 
+    @pytest.fixture()
+    def mock_async_client(self, mocker, mock_client):
+        mock_async_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_async_client.return_value.messages.create = AsyncMock(
+            return_value=mock_client.return_value.messages.create.return_value
+        )
+
+        return mock_async_client
+
+    @pytest.fixture()
+    def mock_async_stream_client(self, mocker, mock_stream_client):
+        async def stream():
+            for event in mock_stream_client.return_value.messages.create.return_value:
+                yield event
+
+        mock_async_stream_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_async_stream_client.return_value.messages.create = AsyncMock(return_value=stream())
+
+        return mock_async_stream_client
+
     @pytest.fixture(params=[True, False])
     def prompt_stack(self, request):
         prompt_stack = PromptStack()
@@ -372,6 +393,43 @@ class TestAnthropicPromptDriver:
         assert message.usage.input_tokens == 5
         assert message.usage.output_tokens == 10
 
+    def test_try_run_async(self, mock_async_client, prompt_stack, messages):
+        driver = AnthropicPromptDriver(model="claude-3-haiku", api_key="api-key")
+
+        message = asyncio.run(driver.try_run_async(prompt_stack))
+
+        mock_async_client.return_value.messages.create.assert_awaited_once_with(
+            messages=messages,
+            stop_sequences=[],
+            model=driver.model,
+            max_tokens=1000,
+            temperature=0.1,
+            top_p=0.999,
+            top_k=250,
+            tools=self.ANTHROPIC_TOOLS,
+            tool_choice=driver.tool_choice,
+            **{"system": "system-input"} if prompt_stack.system_messages else {},
+        )
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.tag == "mock-id"
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_try_stream_async(self, mock_async_stream_client, prompt_stack):
+        driver = AnthropicPromptDriver(model="claude-3-haiku", api_key="api-key", stream=True)
+
+        async def collect():
+            return [event async for event in driver.try_stream_async(prompt_stack)]
+
+        events = asyncio.run(collect())
+
+        assert mock_async_stream_client.return_value.messages.create.await_args.kwargs["stream"] is True
+        assert events[0].usage.input_tokens == 5
+        assert events[1].content.text == "model-output"
+        assert events[3].content.tag == "mock-id"
+        assert events[4].content.partial_input == '{"foo": "bar"}'
+        assert events[5].usage.output_tokens == 10
+
     @pytest.mark.parametrize("use_native_tools", [True, False])
     def test_try_stream_run(self, mock_stream_client, prompt_stack, messages, use_native_tools):
         # Given
@@ -1,11 +1,27 @@
+import asyncio
+import threading
+
+import pytest
+
 from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.common import Message, PromptStack
-from griptape.events import FinishPromptEvent, StartPromptEvent
+from griptape.drivers import LocalCacheDriver, LocalVectorStoreDriver
+from griptape.engines import SemanticCacheEngine
+from griptape.events import (
+    CompletionChunkEvent,
+    FinishPromptEvent,
+    PromptCacheHitEvent,
+    PromptCacheMissEvent,
+    StartPromptEvent,
+)
 from griptape.events.event_bus import _EventBus
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask, ToolkitTask
+from griptape.utils import RateLimiter
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.mocks.mock_failing_prompt_driver import MockFailingPromptDriver
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.mocks.mock_tool.tool import MockTool
 
 
@@ -45,6 +61,31 @@ class TestBasePromptDriver:
         assert isinstance(result, Message)
         assert result.value == "mock output"
 
+    def test_run_async(self, mocker):
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+
+        result = asyncio.run(MockPromptDriver().run_async(PromptStack(messages=[])))
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert isinstance(result, Message)
+        assert result.value == "mock output"
+        assert [type(event) for event in events] == [StartPromptEvent, FinishPromptEvent]
+
+    def test_run_async_with_stream(self, mocker):
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+
+        result = asyncio.run(MockPromptDriver(stream=True).run_async(PromptStack(messages=[])))
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert result.value == "mock output"
+        assert any(isinstance(event, CompletionChunkEvent) for event in events)
+
+    def test_run_async_retries_failure(self):
+        driver = MockFailingPromptDriver(max_failures=2, max_attempts=1)
+
+        with pytest.raises(Exception, match="failed attempt"):
+            asyncio.run(driver.run_async(PromptStack(messages=[])))
+
     def test_run_with_tools(self, mock_config):
         mock_config.drivers_config.prompt_driver = MockPromptDriver(max_attempts=1, use_native_tools=True)
         pipeline = Pipeline()
@@ -64,3 +105,303 @@ class TestBasePromptDriver:
         output = pipeline.run().output_task.output
         assert isinstance(output, TextArtifact)
         assert output.value == "mock output"
+
+    def test_run_with_cache(self, mocker):
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+        driver = MockPromptDriver(cache_driver=LocalCacheDriver())
+        spy = mocker.spy(driver, "try_run")
+
+        first_result = driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+        second_result = driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert spy.call_count == 1
+        assert second_result.value == first_result.value == "mock output"
+        assert second_result.content[0].artifact.id != first_result.content[0].artifact.id
+        assert not first_result.usage.cache_hit
+        assert second_result.usage.cache_hit
+        assert second_result.usage.total_tokens == 0
+        assert [type(event) for event in events] == [
+            PromptCacheMissEvent,
+            StartPromptEvent,
+            FinishPromptEvent,
+            PromptCacheHitEvent,
+            StartPromptEvent,
+            FinishPromptEvent,
+        ]
+        assert events[0].cache_key == events[3].cache_key
+        assert driver.cache_driver.hits == 1
+        assert driver.cache_driver.misses == 1
+
+    def test_run_with_cache_replays_stream(self, mocker):
+        cache_driver = LocalCacheDriver()
+        MockPromptDriver(cache_driver=cache_driver).run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+        driver = MockPromptDriver(cache_driver=cache_driver, stream=True)
+        spy = mocker.spy(driver, "try_stream")
+
+        result = driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert spy.call_count == 0
+        assert result.value == "mock output"
+        assert [event.token for event in events if isinstance(event, CompletionChunkEvent)] == ["mock output"]
+
+    def test_run_with_cache_replays_action_calls(self, mocker):
+        cache_driver = LocalCacheDriver()
+        prompt_stack = PromptStack(
+            messages=[Message("foo", role=Message.USER_ROLE)], tools=[MockTool(install_dependencies_on_init=False)]
+        )
+        first_result = MockPromptDriver(cache_driver=cache_driver, use_native_tools=True, stream=True).run(prompt_stack)
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+
+        result = MockPromptDriver(cache_driver=cache_driver, use_native_tools=True, stream=True).run(prompt_stack)
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert isinstance(events[0], PromptCacheHitEvent)
+        assert result.content[0].artifact.value.to_dict() == first_result.content[0].artifact.value.to_dict()
+        assert [event.token for event in events if isinstance(event, CompletionChunkEvent)] == [
+            "MockTool.test (mock-tag)",
+            '{"values": {"test": "test-value"}}',
+        ]
+
+    def test_run_async_with_cache(self, mocker):
+        driver = MockPromptDriver(cache_driver=LocalCacheDriver())
+        spy = mocker.spy(driver, "try_run")
+
+        asyncio.run(driver.run_async(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])))
+        result = asyncio.run(driver.run_async(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])))
+
+        assert spy.call_count == 1
+        assert result.value == "mock output"
+
+    def test_run_async_with_cache_off_event_loop(self, mocker):
+        driver = MockPromptDriver(cache_driver=LocalCacheDriver())
+        get_many = mocker.spy(driver.cache_driver, "try_get_many")
+        set_many = mocker.spy(driver.cache_driver, "try_set_many")
+        threads = []
+        get_many.side_effect = lambda *args: threads.append(threading.get_ident()) or {}
+        set_many.side_effect = lambda *args: threads.append(threading.get_ident())
+
+        asyncio.run(driver.run_async(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])))
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+    def test_get_cache_key(self):
+        driver = MockPromptDriver(cache_driver=LocalCacheDriver())
+        tool = MockTool(install_dependencies_on_init=False)
+
+        def key(**kwargs):
+            prompt_stack = PromptStack(tools=kwargs.pop("tools", []))
+            prompt_stack.add_system_message("foo")
+            prompt_stack.add_user_message(kwargs.pop("input", "bar"))
+
+            return MockPromptDriver(cache_driver=LocalCacheDriver(), **kwargs)._get_cache_key(prompt_stack)
+
+        assert MockPromptDriver()._get_cache_key(PromptStack()) is None
+        assert driver._get_cache_key(PromptStack()).startswith("test-model:")
+        assert key() == key()
+        assert key() == key(stream=True)
+        assert key() != key(input="baz")
+        assert key() != key(temperature=0.5)
+        assert key() != key(model="foo")
+        assert key() != key(use_native_tools=True)
+        assert key() != key(tools=[tool])
+        assert key(tools=[tool]) != key(tools=[MockTool(name="Foo", install_dependencies_on_init=False)])
+
+    def test_get_cache_key_serializes_params_once(self, mocker):
+        driver = MockPromptDriver(cache_driver=LocalCacheDriver())
+        prompt_stack = PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])
+        spy = mocker.spy(driver, "to_dict")
+
+        key = driver._get_cache_key(prompt_stack)
+
+        assert driver._get_cache_key(prompt_stack) == key
+        assert spy.call_count == 1
+
+        driver.temperature = 0.5
+
+        assert driver._get_cache_key(prompt_stack) != key
+        assert spy.call_count == 2
+
+    def semantic_cache_engine(self):
+        return SemanticCacheEngine(
+            vector_store_driver=LocalVectorStoreDriver(
+                embedding_driver=MockEmbeddingDriver(
+                    mock_output=lambda text: [1.0, 0.0] if "France" in text else [0.0, 1.0]
+                )
+            )
+        )
+
+    def test_run_with_semantic_cache(self, mocker):
+        driver = MockPromptDriver(
+            mock_output=lambda prompt_stack: f"Answer to {prompt_stack.messages[-1].to_text()}",
+            semantic_cache_engine=self.semantic_cache_engine(),
+        )
+        spy = mocker.spy(driver, "try_run")
+
+        first_result = driver.run(PromptStack(messages=[Message("Capital of France?", role=Message.USER_ROLE)]))
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+        second_result = driver.run(PromptStack(messages=[Message("France's capital?", role=Message.USER_ROLE)]))
+        third_result = driver.run(PromptStack(messages=[Message("Capital of Italy?", role=Message.USER_ROLE)]))
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert spy.call_count == 2
+        assert first_result.value == second_result.value == "Answer to Capital of France?"
+        assert second_result.usage.total_tokens == 0
+        assert second_result.usage.cache_hit
+        assert not third_result.usage.cache_hit
+        assert third_result.value == "Answer to Capital of Italy?"
+        assert [type(event) for event in events] == [
+            PromptCacheHitEvent,
+            StartPromptEvent,
+            FinishPromptEvent,
+            PromptCacheMissEvent,
+            StartPromptEvent,
+            FinishPromptEvent,
+        ]
+
+    def test_run_with_semantic_cache_embeds_once(self, mocker):
+        driver = MockPromptDriver(semantic_cache_engine=self.semantic_cache_engine())
+        embed_string = mocker.spy(driver.semantic_cache_engine.vector_store_driver.embedding_driver, "embed_string")
+
+        driver.run(PromptStack(messages=[Message("Capital of France?", role=Message.USER_ROLE)]))
+
+        assert embed_string.call_count == 1
+        assert len(driver.semantic_cache_engine.vector_store_driver.load_entries()) == 1
+
+    def test_run_with_semantic_cache_after_cache_driver(self, mocker):
+        driver = MockPromptDriver(cache_driver=LocalCacheDriver(), semantic_cache_engine=self.semantic_cache_engine())
+        driver.run(PromptStack(messages=[Message("Capital of France?", role=Message.USER_ROLE)]))
+        mock_query = mocker.spy(SemanticCacheEngine, "query")
+
+        driver.run(PromptStack(messages=[Message("Capital of France?", role=Message.USER_ROLE)]))
+
+        assert mock_query.call_count == 0
+
+    def test_run_with_semantic_cache_skips_action_calls(self, mocker):
+        driver = MockPromptDriver(use_native_tools=True, semantic_cache_engine=self.semantic_cache_engine())
+        prompt_stack = PromptStack(
+            messages=[Message("Capital of France?", role=Message.USER_ROLE)],
+            tools=[MockTool(install_dependencies_on_init=False)],
+        )
+        spy = mocker.spy(driver, "try_run")
+
+        driver.run(prompt_stack)
+        driver.run(prompt_stack)
+
+        assert spy.call_count == 2
+        assert driver.semantic_cache_engine.vector_store_driver.load_entries() == []
+
+    def test_run_async_with_semantic_cache(self, mocker):
+        driver = MockPromptDriver(semantic_cache_engine=self.semantic_cache_engine())
+        spy = mocker.spy(driver, "try_run")
+
+        asyncio.run(driver.run_async(PromptStack(messages=[Message("Capital of France?", role=Message.USER_ROLE)])))
+        result = asyncio.run(
+            driver.run_async(PromptStack(messages=[Message("France's capital?", role=Message.USER_ROLE)]))
+        )
+
+        assert spy.call_count == 1
+        assert result.value == "mock output"
+
+    def test_run_async_with_semantic_cache_off_event_loop(self):
+        # The embedding only finishes once another coroutine has run, which can't happen if it blocks the event loop.
+        other_ran = threading.Event()
+        driver = MockPromptDriver(
+            semantic_cache_engine=SemanticCacheEngine(
+                vector_store_driver=LocalVectorStoreDriver(
+                    embedding_driver=MockEmbeddingDriver(
+                        mock_output=lambda text: [1.0, 0.0] if other_ran.wait(timeout=5) else [0.0, 1.0]
+                    )
+                )
+            )
+        )
+
+        async def run() -> Message:
+            async def other() -> None:
+                other_ran.set()
+
+            result, _ = await asyncio.gather(
+                driver.run_async(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])), other()
+            )
+
+            return result
+
+        assert asyncio.run(run()).value == "mock output"
+        assert [entry.vector for entry in driver.semantic_cache_engine.vector_store_driver.load_entries()] == [
+            [1.0, 0.0]
+        ]
+
+    def test_get_semantic_cache_key(self):
+        tool = MockTool(install_dependencies_on_init=False)
+
+        def key(**kwargs):
+            prompt_stack = PromptStack(tools=kwargs.pop("tools", []))
+            prompt_stack.add_system_message(kwargs.pop("system", "foo"))
+            prompt_stack.add_user_message("bar")
+            prompt_stack.add_assistant_message("baz")
+            prompt_stack.add_user_message(kwargs.pop("input", "qux"))
+
+            return MockPromptDriver(semantic_cache_engine=SemanticCacheEngine(), **kwargs)._get_semantic_cache_key(
+                prompt_stack
+            )
+
+        assert MockPromptDriver()._get_semantic_cache_key(PromptStack()) is None
+        assert key()[1] == "qux"
+        assert key() == key(stream=True)
+        assert key()[0] == key(input="quux")[0]
+        assert key()[0] != key(system="bar")[0]
+        assert key()[0] != key(temperature=0.5)[0]
+        assert key()[0] != key(tools=[tool])[0]
+        assert (
+            MockPromptDriver(semantic_cache_engine=SemanticCacheEngine())._get_semantic_cache_key(
+                PromptStack(messages=[Message("foo", role=Message.ASSISTANT_ROLE)])
+            )
+            is None
+        )
+
+    def test_run_with_rate_limiter(self, mocker):
+        mock_acquire = mocker.patch.object(RateLimiter, "acquire", return_value=0.0)
+        driver = MockFailingPromptDriver(
+            max_failures=1,
+            max_attempts=2,
+            min_retry_delay=0,
+            max_retry_delay=0,
+            max_tokens=100,
+            rate_limiter=RateLimiter(requests_per_minute=60, tokens_per_minute=1000),
+        )
+        prompt_stack = PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])
+
+        driver.run(prompt_stack)
+
+        tokens = driver.tokenizer.count_tokens(driver.prompt_stack_to_string(prompt_stack)) + 100
+        assert [call.args for call in mock_acquire.call_args_list] == [(tokens,), (tokens,)]
+
+    def test_run_with_rate_limiter_without_tokens_per_minute(self, mocker):
+        mock_acquire = mocker.patch.object(RateLimiter, "acquire", return_value=0.0)
+        mock_count_tokens = mocker.spy(MockTokenizer, "count_tokens")
+
+        MockPromptDriver(rate_limiter=RateLimiter(requests_per_minute=60)).run(PromptStack(messages=[]))
+
+        mock_acquire.assert_called_once_with(0)
+        assert mock_count_tokens.call_count == 0
+
+    def test_run_with_rate_limiter_skips_cached_results(self, mocker):
+        mock_acquire = mocker.patch.object(RateLimiter, "acquire", return_value=0.0)
+        driver = MockPromptDriver(cache_driver=LocalCacheDriver(), rate_limiter=RateLimiter(requests_per_minute=60))
+
+        driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+        driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+
+        assert mock_acquire.call_count == 1
+
+    def test_run_async_with_rate_limiter(self, mocker):
+        mock_acquire = mocker.patch.object(RateLimiter, "acquire_async", return_value=0.0)
+        driver = MockPromptDriver(rate_limiter=RateLimiter(tokens_per_minute=1000))
+        prompt_stack = PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])
+
+        asyncio.run(driver.run_async(prompt_stack))
+
+        mock_acquire.assert_called_once_with(len(driver.prompt_stack_to_string(prompt_stack)))
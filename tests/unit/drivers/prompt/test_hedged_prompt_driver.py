@@ -0,0 +1,205 @@
+import asyncio
+import time
+from concurrent import futures
+
+import pytest
+
+from griptape.common import Message, PromptStack
+from griptape.drivers import HedgedPromptDriver
+from griptape.events import CompletionChunkEvent
+from griptape.events.event_bus import _EventBus
+from griptape.utils.futures import FuturesExecutorRegistry
+from tests.mocks.mock_failing_prompt_driver import MockFailingPromptDriver
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+def sleeping_driver(latency: float, output: str) -> MockPromptDriver:
+    def mock_output(_: PromptStack) -> str:
+        time.sleep(latency)
+
+        return output
+
+    return MockPromptDriver(mock_output=mock_output)
+
+
+class TestHedgedPromptDriver:
+    @pytest.fixture()
+    def prompt_stack(self):
+        return PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])
+
+    def test_init(self):
+        driver = HedgedPromptDriver(prompt_drivers=[MockPromptDriver(model="foo"), MockPromptDriver()])
+
+        assert driver.model == "foo"
+        assert driver.tokenizer is driver.prompt_drivers[0].tokenizer
+        assert len(driver.latency_histograms) == 2
+
+    def test_invalid_prompt_drivers(self):
+        with pytest.raises(ValueError, match="prompt_drivers must not be empty"):
+            HedgedPromptDriver(prompt_drivers=[])
+
+    def test_invalid_hedge_percentile(self):
+        with pytest.raises(ValueError, match="hedge_percentile must be between 0 and 100"):
+            HedgedPromptDriver(prompt_drivers=[MockPromptDriver()], hedge_percentile=101)
+
+    def test_invalid_latency_window(self):
+        with pytest.raises(ValueError, match="latency_window must be at least 1"):
+            HedgedPromptDriver(prompt_drivers=[MockPromptDriver()], latency_window=0)
+
+    def test_run(self, prompt_stack, mocker):
+        driver = HedgedPromptDriver(prompt_drivers=[MockPromptDriver(mock_output="foo"), MockPromptDriver()])
+        spy = mocker.spy(driver.prompt_drivers[1], "try_run")
+
+        assert driver.run(prompt_stack).value == "foo"
+        assert spy.call_count == 0
+        assert driver.latency_histograms[0].count == 1
+
+    def test_run_hedges_slow_driver(self, prompt_stack):
+        driver = HedgedPromptDriver(
+            prompt_drivers=[sleeping_driver(0.5, "slow"), sleeping_driver(0.0, "fast")], hedge_delay=0.05
+        )
+
+        start = time.perf_counter()
+        result = driver.run(prompt_stack)
+
+        assert result.value == "fast"
+        assert time.perf_counter() - start < 0.4
+
+    def test_run_without_hedging(self, prompt_stack):
+        driver = HedgedPromptDriver(
+            prompt_drivers=[sleeping_driver(0.1, "slow"), sleeping_driver(0.0, "fast")], hedge_delay=None
+        )
+
+        assert driver.run(prompt_stack).value == "slow"
+
+    def test_run_fails_over(self, prompt_stack):
+        driver = HedgedPromptDriver(
+            prompt_drivers=[MockFailingPromptDriver(max_failures=1), MockPromptDriver(mock_output="foo")],
+            hedge_delay=None,
+        )
+
+        assert driver.run(prompt_stack).value == "foo"
+
+    def test_run_fails_over_on_timeout(self, prompt_stack):
+        driver = HedgedPromptDriver(
+            prompt_drivers=[sleeping_driver(0.5, "slow"), sleeping_driver(0.0, "fast")], hedge_delay=None, timeout=0.05
+        )
+
+        start = time.perf_counter()
+        result = driver.run(prompt_stack)
+
+        assert result.value == "fast"
+        assert time.perf_counter() - start < 0.4
+
+    def test_run_times_out(self, prompt_stack):
+        driver = HedgedPromptDriver(prompt_drivers=[sleeping_driver(0.5, "slow")], timeout=0.05)
+
+        with pytest.raises(TimeoutError, match="Prompt Driver timed out after 0.05s."):
+            driver.run(prompt_stack)
+
+    def test_run_in_saturated_pool(self, prompt_stack):
+        hedging_driver = HedgedPromptDriver(
+            prompt_drivers=[sleeping_driver(0.5, "slow"), sleeping_driver(0.0, "fast")], hedge_delay=0.05
+        )
+        timeout_driver = HedgedPromptDriver(prompt_drivers=[sleeping_driver(0.5, "slow")], timeout=0.05)
+        max_workers = FuturesExecutorRegistry.max_workers["llm"]
+        # The only worker of the shared pool calls `try_run`, so the shared pool would run the requests inline.
+        FuturesExecutorRegistry.set_max_workers("llm", 1)
+
+        try:
+            executor = FuturesExecutorRegistry.get_executor("llm")
+            start = time.perf_counter()
+
+            assert executor.submit(hedging_driver.try_run, prompt_stack).result().value == "fast"
+            assert time.perf_counter() - start < 0.4
+
+            with pytest.raises(TimeoutError, match="Prompt Driver timed out after 0.05s."):
+                executor.submit(timeout_driver.try_run, prompt_stack).result(timeout=0.4)
+        finally:
+            FuturesExecutorRegistry.set_max_workers("llm", max_workers)
+
+    def test_futures_executor_fn(self, prompt_stack):
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        driver = HedgedPromptDriver(prompt_drivers=[MockPromptDriver()], futures_executor_fn=lambda: executor)
+
+        assert driver.futures_executor is executor
+        assert driver.run(prompt_stack).value == "mock output"
+
+    def test_run_raises_last_error(self, prompt_stack):
+        driver = HedgedPromptDriver(
+            prompt_drivers=[MockFailingPromptDriver(max_failures=1), MockFailingPromptDriver(max_failures=1)]
+        )
+
+        with pytest.raises(Exception, match="failed attempt"):
+            driver.run(prompt_stack)
+
+    def test_run_with_stream(self, prompt_stack, mocker):
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+        driver = HedgedPromptDriver(prompt_drivers=[MockPromptDriver(mock_output="foo")], stream=True)
+
+        result = driver.run(prompt_stack)
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert result.value == "foo"
+        assert result.usage.input_tokens == 100
+        assert [event.token for event in events if isinstance(event, CompletionChunkEvent)] == ["foo"]
+
+    def test_run_async_cancels_losing_request(self, prompt_stack):
+        cancelled = []
+
+        async def try_run_async(_: PromptStack) -> Message:
+            try:
+                await asyncio.sleep(0.5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+
+                raise
+
+            return Message("slow", role=Message.ASSISTANT_ROLE)
+
+        slow_driver = MockPromptDriver()
+        slow_driver.try_run_async = try_run_async
+        driver = HedgedPromptDriver(
+            prompt_drivers=[slow_driver, MockPromptDriver(mock_output="fast")], hedge_delay=0.05
+        )
+
+        result = asyncio.run(driver.run_async(prompt_stack))
+
+        assert result.value == "fast"
+        assert cancelled == [True]
+        assert driver.latency_histograms[0].count == 0
+        assert driver.latency_histograms[1].count == 1
+
+    def test_run_async_fails_over(self, prompt_stack):
+        driver = HedgedPromptDriver(
+            prompt_drivers=[MockFailingPromptDriver(max_failures=1), MockPromptDriver(mock_output="foo")],
+            hedge_delay=None,
+        )
+
+        assert asyncio.run(driver.run_async(prompt_stack)).value == "foo"
+
+    def test_get_hedge_delay(self):
+        driver = HedgedPromptDriver(
+            prompt_drivers=[MockPromptDriver(), MockPromptDriver()], hedge_delay=2.0, min_latency_samples=10
+        )
+
+        for latency in range(1, 10):
+            driver.latency_histograms[0].record(latency / 10)
+
+        assert driver.get_hedge_delay(0) == 2.0
+
+        driver.latency_histograms[0].record(1.0)
+
+        assert driver.get_hedge_delay(0) == pytest.approx(0.955)
+        assert driver.get_hedge_delay(1) is None
+
+    def test_latency_histogram(self):
+        histogram = HedgedPromptDriver.LatencyHistogram(window=3)
+
+        assert histogram.percentile(50) is None
+
+        for latency in [10.0, 1.0, 2.0, 3.0]:
+            histogram.record(latency)
+
+        assert histogram.count == 3
+        assert histogram.percentile(50) == 2.0
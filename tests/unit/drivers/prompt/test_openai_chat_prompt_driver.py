@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 import schema
@@ -236,6 +237,24 @@ class TestOpenAiChatPromptDriverFixtureMixin:
         )
         return mock_chat_create
 
+    @pytest.fixture()
+    def mock_async_chat_completion_create(self, mocker, mock_chat_completion_create):
+        mock_async_client = mocker.patch("openai.AsyncOpenAI").return_value
+        mock_async_client.chat.completions.create = AsyncMock(return_value=mock_chat_completion_create.return_value)
+
+        return mock_async_client.chat.completions.create
+
+    @pytest.fixture()
+    def mock_async_chat_completion_stream_create(self, mocker, mock_chat_completion_stream_create):
+        async def stream():
+            for chunk in mock_chat_completion_stream_create.return_value:
+                yield chunk
+
+        mock_async_client = mocker.patch("openai.AsyncOpenAI").return_value
+        mock_async_client.chat.completions.create = AsyncMock(return_value=stream())
+
+        return mock_async_client.chat.completions.create
+
     @pytest.fixture()
     def prompt_stack(self):
         prompt_stack = PromptStack()
@@ -366,6 +385,60 @@ class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
         assert message.value[1].value.path == "test"
         assert message.value[1].value.input == {"foo": "bar"}
 
+    def test_try_run_async(self, mock_async_chat_completion_create, prompt_stack, messages):
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+
+        message = asyncio.run(driver.try_run_async(prompt_stack))
+
+        mock_async_chat_completion_create.assert_awaited_once_with(
+            model=driver.model,
+            temperature=driver.temperature,
+            user=driver.user,
+            messages=messages,
+            seed=driver.seed,
+            tools=self.OPENAI_TOOLS,
+            tool_choice=driver.tool_choice,
+        )
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.tag == "mock-id"
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_try_stream_async(self, mock_async_chat_completion_stream_create, prompt_stack, messages):
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, stream=True)
+
+        async def collect():
+            return [event async for event in driver.try_stream_async(prompt_stack)]
+
+        events = asyncio.run(collect())
+
+        mock_async_chat_completion_stream_create.assert_awaited_once_with(
+            model=driver.model,
+            temperature=driver.temperature,
+            user=driver.user,
+            stream=True,
+            messages=messages,
+            seed=driver.seed,
+            stream_options={"include_usage": True},
+            tools=self.OPENAI_TOOLS,
+            tool_choice=driver.tool_choice,
+        )
+        assert events[0].content.text == "model-output"
+        assert events[1].content.tag == "mock-id"
+        assert events[2].content.partial_input == '{"foo": "bar"}'
+        assert events[3].usage.input_tokens == 5
+        assert events[3].usage.output_tokens == 10
+
+    def test_run_async_with_stream(self, mock_async_chat_completion_stream_create, prompt_stack):
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, stream=True)
+
+        message = asyncio.run(driver.run_async(prompt_stack))
+
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.input == {"foo": "bar"}
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
     def test_try_run_response_format_json_object(self, mock_chat_completion_create, prompt_stack, messages):
         # Given
         driver = OpenAiChatPromptDriver(
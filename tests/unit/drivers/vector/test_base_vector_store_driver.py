@@ -47,6 +47,13 @@ class TestBaseVectorStoreDriver(ABC):
         assert driver.query("foobar")[0].to_artifact().value == "foobar"
         assert driver.query("foobar")[0].id == vector_id
 
+    def test_query_vector(self, driver):
+        vector_id = driver.upsert_text_artifact(TextArtifact("foobar"), namespace="test-namespace")
+
+        assert [entry.id for entry in driver.query_vector([0, 1])] == [vector_id]
+        assert driver.query_vector([0, 1], namespace="bad-namespace") == []
+        assert driver.query_vector([0, 1], include_vectors=True)[0].vector == [0, 1]
+
     def test_load_entry(self, driver):
         vector_id = driver.upsert_text_artifact(TextArtifact("foobar"), namespace="test-namespace")
 
@@ -73,3 +80,37 @@ class TestBaseVectorStoreDriver(ABC):
     def test_does_entry_exist_exception(self, driver):
         with patch.object(driver, "load_entry", side_effect=Exception):
             assert driver.does_entry_exist("does_not_exist") is False
+
+    def test_upsert_vectors(self, driver):
+        vector_ids = driver.upsert_vectors(
+            [[0, 1], [1, 0]], vector_ids=["foo", "bar"], namespace="test", metas=[{"a": 1}, None]
+        )
+
+        assert vector_ids == ["foo", "bar"]
+        assert driver.load_entry("foo", namespace="test").meta == {"a": 1}
+        assert driver.load_entry("bar", namespace="test").vector == [1, 0]
+
+    def test_upsert_vectors_length_mismatch(self, driver):
+        with pytest.raises(ValueError):
+            driver.upsert_vectors([[0, 1], [1, 0]], vector_ids=["foo"])
+
+    def test_find_existing_vector_ids(self, driver):
+        driver.upsert_vectors([[0, 1]], vector_ids=["foo"], namespace="test")
+
+        assert driver.find_existing_vector_ids(["foo", "bar"], namespace="test") == {"foo"}
+        assert driver.find_existing_vector_ids(["foo", "bar"]) == set()
+
+    def test_upsert_text_artifacts_skips_existing(self, driver):
+        driver.upsert_text_artifact(TextArtifact("foo"), namespace="test")
+
+        with patch.object(
+            driver.embedding_driver, "embed_strings", wraps=driver.embedding_driver.embed_strings
+        ) as embed:
+            vector_ids = driver.upsert_text_artifacts(
+                {"test": [TextArtifact("foo"), TextArtifact("bar"), TextArtifact("bar")]}
+            )
+
+        embed.assert_called_once_with(["bar"])
+        assert len(vector_ids["test"]) == 3
+        assert vector_ids["test"][1] == vector_ids["test"][2]
+        assert len(driver.load_entries(namespace="test")) == 2
@@ -28,3 +28,10 @@ class TestDummyVectorStoreDriver:
     def test_query(self, vector_store_driver):
         with pytest.raises(DummyError):
             vector_store_driver.query("foo bar huzzah")
+
+    def test_upsert_vectors(self, vector_store_driver):
+        with pytest.raises(DummyError):
+            vector_store_driver.upsert_vectors([[0, 1]])
+
+    def test_find_existing_vector_ids(self, vector_store_driver):
+        assert vector_store_driver.find_existing_vector_ids(["foo"]) == set()
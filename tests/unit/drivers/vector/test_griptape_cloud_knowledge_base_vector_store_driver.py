@@ -69,3 +69,7 @@ class TestGriptapeCloudVectorStoreDriver:
         assert result[1].meta == self.test_metas[1]
         assert result[0].score == self.test_scores[0]
         assert result[1].score == self.test_scores[1]
+
+    def test_query_vector(self, driver):
+        with pytest.raises(NotImplementedError, match="does not support querying by vector"):
+            driver.query_vector([0.0, 1.0])
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from griptape.artifacts import TextArtifact
@@ -23,6 +25,31 @@ class TestLocalVectorStoreDriver(TestBaseVectorStoreDriver):
         assert len(driver.load_artifacts(namespace="foo")) == 0
         assert len(driver.load_artifacts()) == 2
 
+    def test_upsert_text_artifacts_overridden_upsert_text_artifact(self, driver, mocker):
+        upsert_text_artifact = mocker.patch.object(
+            LocalVectorStoreDriver,
+            "upsert_text_artifact",
+            autospec=True,
+            side_effect=lambda _, artifact, **kwargs: f"custom-{artifact.value}",
+        )
+        embed_strings = mocker.spy(driver.embedding_driver, "embed_strings")
+
+        assert driver.upsert_text_artifacts({"foo": [TextArtifact("bar")]}) == {"foo": ["custom-bar"]}
+        assert upsert_text_artifact.call_args.kwargs["namespace"] == "foo"
+        assert embed_strings.call_count == 0
+
+    def test_upsert_text_artifacts_custom_embedding(self, driver):
+        class CustomTextArtifact(TextArtifact):
+            def generate_embedding(self, driver):
+                self.embedding = [1.0, 0.0]
+
+                return self.embedding
+
+        vector_ids = driver.upsert_text_artifacts([CustomTextArtifact("bar"), TextArtifact("baz")])
+
+        assert driver.load_entry(vector_ids[0]).vector == [1.0, 0.0]
+        assert driver.load_entry(vector_ids[1]).vector == [0, 1]
+
     def test_upsert_text_artifacts_stress_test(self, driver):
         driver.upsert_text_artifacts(
             {
@@ -35,3 +62,98 @@ class TestLocalVectorStoreDriver(TestBaseVectorStoreDriver):
         assert len(driver.query("foo", namespace="test1")) == 1000
         assert len(driver.query("foo", namespace="test2")) == 1000
         assert len(driver.query("foo", namespace="test3")) == 1000
+
+    def test_query_top_k(self):
+        vectors = {"a": [1.0, 0.0], "b": [0.8, 0.6], "c": [0.0, 1.0], "d": [-1.0, 0.0]}
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(mock_output=lambda _: [1.0, 0.0]))
+
+        for vector_id, vector in vectors.items():
+            driver.upsert_vector(vector, vector_id=vector_id)
+
+        result = driver.query("foo", count=2)
+
+        assert [r.id for r in result] == ["a", "b"]
+        assert result[0].score == pytest.approx(1.0)
+        assert result[1].score == pytest.approx(0.8)
+        assert [r.id for r in driver.query("foo")] == ["a", "b", "c", "d"]
+
+    def test_query_namespace_prefix(self, driver):
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test")
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test-2")
+
+        assert [r.namespace for r in driver.query("foo", namespace="test")] == ["test"]
+
+    def test_query_updated_vector(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(mock_output=lambda _: [1.0, 0.0]))
+
+        driver.upsert_vector([1.0, 0.0], vector_id="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="b")
+        driver.upsert_vector([-1.0, 0.0], vector_id="a")
+
+        assert [r.id for r in driver.query("foo")] == ["b", "a"]
+
+    def test_query_replaced_entries(self, driver):
+        driver.upsert_vector([0, 1], vector_id="foo")
+        driver.entries = {"bar": LocalVectorStoreDriver.Entry(id="bar", vector=[0, 1])}
+
+        assert [r.id for r in driver.query("foo")] == ["bar"]
+
+    def test_query_replaced_entry(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(mock_output=lambda _: [1.0, 0.0]))
+
+        driver.upsert_vector([1.0, 0.0], vector_id="a")
+        driver.upsert_vector([0.0, 1.0], vector_id="b")
+        driver.entries["a"] = LocalVectorStoreDriver.Entry(id="a", vector=[-1.0, 0.0])
+
+        assert [r.id for r in driver.query("foo")] == ["b", "a"]
+
+    def test_query_assigned_entries_modified(self, driver):
+        driver.entries = {"foo": LocalVectorStoreDriver.Entry(id="foo", vector=[0, 1])}
+        driver.query("foo")
+        driver.entries.update({"foo": LocalVectorStoreDriver.Entry(id="foo", vector=[1, 0])})
+
+        assert driver.query_vector([1, 0], include_vectors=True)[0].vector == [1.0, 0.0]
+        assert driver.query_vector([1, 0])[0].score == pytest.approx(1.0)
+
+    def test_query_relatedness_fn(self):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), relatedness_fn=lambda x, y: -sum(a * b for a, b in zip(x, y))
+        )
+
+        driver.upsert_vector([0, 1], vector_id="a")
+        driver.upsert_vector([0, 2], vector_id="b")
+
+        assert [r.id for r in driver.query("foo", count=1)] == ["a"]
+
+    def test_upsert_vector_dimensions_mismatch(self, driver):
+        driver.upsert_vector([0, 1], vector_id="a")
+
+        with pytest.raises(ValueError):
+            driver.upsert_vector([0, 1, 2], vector_id="b")
+
+    def test_delete_vector(self, driver):
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test")
+        driver.upsert_vector([1, 0], vector_id="bar")
+        driver.delete_vector("foo", namespace="test")
+        driver.delete_vector("does-not-exist")
+
+        assert list(driver.entries) == ["bar"]
+        assert [r.id for r in driver.query("foo")] == ["bar"]
+
+    def test_query_concurrent_delete(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(mock_output=lambda _: [1.0, 0.0]))
+        scores = {str(i): i / 1000 for i in range(1000)}
+
+        for vector_id, score in scores.items():
+            driver.upsert_vector([score, (1 - score**2) ** 0.5], vector_id=vector_id)
+
+        deleter = threading.Thread(target=lambda: [driver.delete_vector(str(i)) for i in range(0, 1000, 2)])
+        deleter.start()
+
+        while deleter.is_alive():
+            for entry in driver.query("foo", count=10):
+                assert entry.score == pytest.approx(scores[entry.id], abs=1e-6)
+
+        deleter.join()
+
+        assert [entry.id for entry in driver.query("foo", count=2)] == ["999", "997"]
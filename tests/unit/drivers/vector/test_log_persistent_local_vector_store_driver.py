@@ -0,0 +1,181 @@
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers import LocalVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.unit.drivers.vector.test_base_vector_store_driver import TestBaseVectorStoreDriver
+
+
+class TestLogPersistentLocalVectorStoreDriver(TestBaseVectorStoreDriver):
+    @pytest.fixture()
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+
+    @pytest.fixture()
+    def driver(self, temp_dir):
+        return LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+    def test_persistence(self, driver, temp_dir):
+        driver.upsert_text_artifact(TextArtifact("persistent foobar"), namespace="foo")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+        assert new_driver.query("persistent foobar", include_vectors=True)[0].vector == [0, 1]
+        assert new_driver.load_entries(namespace="foo")[0].namespace == "foo"
+
+    def test_persistence_appends(self, driver, temp_dir):
+        driver.upsert_vector([0, 1], vector_id="foo")
+        driver.upsert_vector([1, 0], vector_id="bar")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+        new_driver.upsert_vector([1, 1], vector_id="baz")
+
+        assert sorted(LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir).entries) == [
+            "bar",
+            "baz",
+            "foo",
+        ]
+
+    def test_delete_vector(self, driver, temp_dir):
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="test")
+        driver.upsert_vector([1, 0], vector_id="bar", namespace="test")
+        driver.upsert_vector([1, 1], vector_id="baz", namespace="test")
+        driver.delete_vector("foo", namespace="test")
+
+        assert [r.id for r in driver.query("foo")] == ["baz", "bar"]
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert sorted(new_driver.entries) == ["test-bar", "test-baz"]
+
+    def test_compaction(self, temp_dir):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir, compaction_threshold=0.5
+        )
+
+        for i in range(4):
+            driver.upsert_vector([float(i), 1.0], vector_id=str(i))
+
+        driver.upsert_vector([9.0, 1.0], vector_id="0")
+        driver.delete_vector("1")
+
+        assert sorted(os.listdir(temp_dir)) == ["entries.jsonl", "vectors-0.f32"]
+
+        driver.delete_vector("2")
+
+        assert sorted(os.listdir(temp_dir)) == ["entries.jsonl", "vectors-1.f32"]
+        assert os.path.getsize(os.path.join(temp_dir, "vectors-1.f32")) == 2 * 2 * 4
+
+        driver.upsert_vector([5.0, 1.0], vector_id="5")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert {k: list(v.vector) for k, v in new_driver.entries.items()} == {
+            "0": [9.0, 1.0],
+            "3": [3.0, 1.0],
+            "5": [5.0, 1.0],
+        }
+
+    def test_truncated_record(self, driver, temp_dir):
+        driver.upsert_vector([0, 1], vector_id="foo")
+        driver.upsert_vector([1, 0], vector_id="bar")
+        driver.flush()
+
+        log_path = os.path.join(temp_dir, "entries.jsonl")
+        os.truncate(log_path, os.path.getsize(log_path) - 5)
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert list(new_driver.entries) == ["foo"]
+
+        new_driver.upsert_vector([1, 1], vector_id="baz")
+
+        assert list(LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir).entries) == [
+            "foo",
+            "baz",
+        ]
+
+    def test_truncated_vectors(self, driver, temp_dir):
+        driver.upsert_vector([0, 1], vector_id="foo")
+        driver.upsert_vector([1, 0], vector_id="bar")
+        driver.flush()
+
+        vectors_path = os.path.join(temp_dir, "vectors-0.f32")
+        os.truncate(vectors_path, os.path.getsize(vectors_path) - 4)
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert list(new_driver.entries) == ["foo"]
+
+        new_driver.upsert_vector([1, 1], vector_id="baz")
+
+        entries = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir).entries
+
+        assert {k: list(v.vector) for k, v in entries.items()} == {"foo": [0.0, 1.0], "baz": [1.0, 1.0]}
+
+    def test_memory_maps_vectors(self, driver, temp_dir):
+        driver.upsert_vector([0, 1], vector_id="foo")
+        driver.upsert_vector([1, 0], vector_id="bar")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+
+        assert all(isinstance(entry.vector.base, np.memmap) for entry in new_driver.entries.values())
+        assert [r.id for r in new_driver.query_vector([1, 0])] == ["bar", "foo"]
+
+    def test_compaction_remaps_vectors(self, temp_dir):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir, compaction_threshold=0.5
+        )
+
+        driver.upsert_vector([0, 1], vector_id="foo")
+        driver.upsert_vector([1, 0], vector_id="bar")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir, compaction_threshold=0.5
+        )
+        new_driver.delete_vector("foo")
+
+        assert sorted(os.listdir(temp_dir)) == ["entries.jsonl", "vectors-1.f32"]
+        assert new_driver.entries["bar"].vector.filename == os.path.join(temp_dir, "vectors-1.f32")
+        assert list(new_driver.entries["bar"].vector) == [1.0, 0.0]
+
+    def test_close(self, driver, temp_dir):
+        driver.upsert_vector([0, 1], vector_id="foo")
+        driver.close()
+
+        assert list(LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir).entries) == [
+            "foo"
+        ]
+
+        driver.upsert_vector([1, 0], vector_id="bar")
+        driver.close()
+
+        assert list(LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir).entries) == [
+            "foo",
+            "bar",
+        ]
+
+    def test_load_entry_copies_vector(self, driver, temp_dir):
+        driver.upsert_vector([0, 1], vector_id="foo")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_dir=temp_dir)
+        entry = new_driver.load_entry("foo")
+
+        assert entry is not None
+        assert entry.vector == [0.0, 1.0]
+        assert isinstance(entry.vector, list)
+        assert isinstance(new_driver.load_entries()[0].vector, list)
+
+    def test_persist_file_and_dir(self, temp_dir):
+        with pytest.raises(ValueError):
+            LocalVectorStoreDriver(
+                embedding_driver=MockEmbeddingDriver(),
+                persist_dir=temp_dir,
+                persist_file=os.path.join(temp_dir, "store.json"),
+            )
@@ -117,6 +117,26 @@ class TestMarqoVectorStorageDriver:
         }
         assert result == expected_return_value["items"][0]["_id"]
 
+    def test_upsert_text_artifacts(self, driver, mock_marqo):
+        mock_marqo.index().add_documents.return_value = {
+            "errors": False,
+            "items": [{"_id": "foo", "result": "created", "status": 201}, {"_id": "bar", "result": "created"}],
+        }
+
+        result = driver.upsert_text_artifacts({"test": [TextArtifact("foo"), TextArtifact("bar")]})
+
+        assert result == {"test": ["foo", "bar"]}
+        assert len(mock_marqo.index().add_documents.call_args.args[0]) == 2
+        assert mock_marqo.index().add_documents.call_args.args[0][0]["namespace"] == "test"
+
+    def test_upsert_text_artifacts_meta_and_kwargs(self, driver, mock_marqo):
+        mock_marqo.index().add_documents.return_value = {"errors": False, "items": [{"_id": "foo"}]}
+
+        driver.upsert_text_artifacts([TextArtifact("foo")], meta={"foo": "bar"}, client_batch_size=10)
+
+        assert mock_marqo.index().add_documents.call_args.args[0][0]["meta"] == str({"foo": "bar"})
+        assert mock_marqo.index().add_documents.call_args.kwargs["client_batch_size"] == 10
+
     def test_search(self, driver, mock_marqo):
         results = driver.query("Test query")
         mock_marqo.index().search.assert_called()
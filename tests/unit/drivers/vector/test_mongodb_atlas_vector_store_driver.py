@@ -26,6 +26,23 @@ class TestMongoDbAtlasVectorStoreDriver:
         test_id = driver.upsert_vector(vector, vector_id=vector_id_str)
         assert test_id == vector_id_str
 
+    def test_upsert_vectors(self, driver):
+        vector_ids = driver.upsert_vectors([[0.1, 0.2], [0.3, 0.4]], vector_ids=["foo", None], namespace="test")
+
+        assert vector_ids[0] == "foo"
+        assert len(driver.load_entries(namespace="test")) == 2
+        assert driver.load_entry("foo").vector == [0.1, 0.2]
+
+        driver.upsert_vectors([[0.5, 0.6]], vector_ids=["foo"], namespace="test")
+
+        assert driver.load_entry("foo").vector == [0.5, 0.6]
+
+    def test_find_existing_vector_ids(self, driver):
+        driver.upsert_vectors([[0.1, 0.2]], vector_ids=["foo"], namespace="test")
+
+        assert driver.find_existing_vector_ids(["foo", "bar"]) == {"foo"}
+        assert driver.find_existing_vector_ids(["foo", "bar"], namespace="other") == set()
+
     def test_upsert_text_artifact(self, driver):
         artifact = TextArtifact("foo")
         test_id = driver.upsert_text_artifact(artifact)
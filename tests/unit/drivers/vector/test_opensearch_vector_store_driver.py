@@ -1,9 +1,10 @@
-from unittest.mock import Mock, create_autospec, patch
+from unittest.mock import MagicMock, Mock, create_autospec, patch
 
 import numpy as np
 import pytest
 
 from griptape.drivers import OpenSearchVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
 class TestOpenSearchVectorStoreDriver:
@@ -16,6 +17,55 @@ class TestOpenSearchVectorStoreDriver:
     def test_upsert_vector(self, driver):
         assert driver.upsert_vector([0.1, 0.2, 0.3], vector_id="foo", namespace="company") == "foo"
 
+    def test_upsert_vectors(self):
+        client = MagicMock()
+        client.bulk.return_value = {"errors": False, "items": [{"index": {"_id": "foo"}}, {"index": {"_id": "bar"}}]}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", embedding_driver=MockEmbeddingDriver(), client=client
+        )
+
+        assert driver.upsert_vectors([[0.1], [0.2]], vector_ids=["foo", "bar"], namespace="company") == ["foo", "bar"]
+
+        body = client.bulk.call_args.kwargs["body"]
+
+        assert body[0] == {"index": {"_index": "test", "_id": "foo"}}
+        assert body[1] == {"vector": [0.1], "namespace": "company", "metadata": None}
+        assert len(body) == 4
+
+    def test_upsert_vectors_errors(self):
+        client = MagicMock()
+        client.bulk.return_value = {"errors": True, "items": []}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", embedding_driver=MockEmbeddingDriver(), client=client
+        )
+
+        with pytest.raises(RuntimeError):
+            driver.upsert_vectors([[0.1]], vector_ids=["foo"])
+
+    def test_find_existing_vector_ids(self):
+        client = MagicMock()
+        client.mget.return_value = {"docs": [{"_id": "foo", "found": True}, {"_id": "bar", "found": False}]}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", embedding_driver=MockEmbeddingDriver(), client=client
+        )
+
+        assert driver.find_existing_vector_ids(["foo", "bar"]) == {"foo"}
+
+    def test_find_existing_vector_ids_namespace(self):
+        client = MagicMock()
+        client.mget.return_value = {
+            "docs": [
+                {"_id": "foo", "found": True, "_source": {"namespace": "company"}},
+                {"_id": "bar", "found": True, "_source": {"namespace": "other"}},
+                {"_id": "baz", "found": False},
+            ]
+        }
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", embedding_driver=MockEmbeddingDriver(), client=client
+        )
+
+        assert driver.find_existing_vector_ids(["foo", "bar", "baz"], namespace="company") == {"foo"}
+
     def test_load_entry(self, driver):
         mock_entry = Mock()
         mock_entry.id = "foo2"
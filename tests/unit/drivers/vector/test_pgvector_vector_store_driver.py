@@ -57,6 +57,31 @@ class TestPgVectorVectorStoreDriver:
         mock_session.merge.assert_called_once()
         mock_session.commit.assert_called_once()
 
+    def test_upsert_vectors(self, mock_engine):
+        conn = mock_engine.begin.return_value.__enter__.return_value
+        test_id = str(uuid.uuid4())
+
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        returned_ids = driver.upsert_vectors([[1.0, 2.0], [3.0, 4.0]], vector_ids=[test_id, None], namespace="foo")
+
+        assert returned_ids[0] == test_id
+        assert len(returned_ids) == 2
+        conn.execute.assert_called_once()
+        assert [row["namespace"] for row in conn.execute.call_args.args[1]] == ["foo", "foo"]
+
+    def test_find_existing_vector_ids(self, mock_session, mock_engine):
+        test_id = str(uuid.uuid4())
+        mock_session.query.return_value.filter.return_value.all.return_value = [Mock(id=test_id)]
+
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        assert driver.find_existing_vector_ids([test_id, str(uuid.uuid4())]) == {test_id}
+
     def test_load_entry(self, mock_session, mock_engine):
         test_id = str(uuid.uuid4())
         test_vec = [0.1, 0.2, 0.3]
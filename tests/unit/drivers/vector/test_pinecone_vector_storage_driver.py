@@ -44,6 +44,20 @@ class TestPineconeVectorStorageDriver:
         assert driver.upsert_vector([0, 1, 2], vector_id="foo") == "foo"
         assert isinstance(driver.upsert_vector([0, 1, 2]), str)
 
+    def test_upsert_vectors(self, driver):
+        vector_ids = driver.upsert_vectors([[0, 1, 2]] * 150, vector_ids=[str(i) for i in range(150)], namespace="foo")
+
+        assert vector_ids == [str(i) for i in range(150)]
+        assert driver.index.upsert.call_count == 2
+        assert len(driver.index.upsert.call_args_list[0].kwargs["vectors"]) == 100
+        assert driver.index.upsert.call_args_list[0].kwargs["namespace"] == "foo"
+
+    def test_find_existing_vector_ids(self, driver):
+        driver.index.fetch.return_value.to_dict.return_value = {"vectors": {"foo": {}}, "namespace": "test"}
+
+        assert driver.find_existing_vector_ids(["foo", "bar"], namespace="test") == {"foo"}
+        driver.index.fetch.assert_called_once_with(ids=["foo", "bar"], namespace="test")
+
     def test_upsert_text(self, driver):
         assert driver.upsert_text("foo", vector_id="foo") == "foo"
         assert isinstance(driver.upsert_text("foo"), str)
@@ -83,6 +83,36 @@ class TestQdrantVectorStoreDriver:
             assert results[0].score == 42
             assert results[0].meta == {"foo": "bar"}
 
+    def test_upsert_vectors(self, driver):
+        with patch.object(driver.client, "upsert") as mock_upsert:
+            vector_ids = driver.upsert_vectors(
+                [[0.1, 0.2], [0.3, 0.4]], vector_ids=["foo", None], metas=[{"foo": "bar"}, None]
+            )
+
+            points = mock_upsert.call_args.kwargs["points"]
+
+            mock_upsert.assert_called_once()
+            assert vector_ids == ["foo", str(uuid.uuid5(uuid.NAMESPACE_DNS, str([0.3, 0.4])))]
+            assert points.ids == vector_ids
+            assert points.payloads == [{"foo": "bar"}, {}]
+
+    def test_upsert_vectors_with_content(self, driver):
+        with patch.object(driver.client, "upsert") as mock_upsert:
+            driver.upsert_vectors([[0.1, 0.2], [0.3, 0.4]], metas=[{"foo": "bar"}, None], content="baz")
+
+            assert mock_upsert.call_args.kwargs["points"].payloads == [
+                {"foo": "bar", driver.content_payload_key: "baz"},
+                {driver.content_payload_key: "baz"},
+            ]
+
+    def test_find_existing_vector_ids(self, driver):
+        with patch.object(driver.client, "retrieve", return_value=[MagicMock(id="foo")]) as mock_retrieve:
+            assert driver.find_existing_vector_ids(["foo", "bar"]) == {"foo"}
+
+            mock_retrieve.assert_called_once_with(
+                collection_name=driver.collection_name, ids=["foo", "bar"], with_payload=False, with_vectors=False
+            )
+
     def test_upsert_with_batch(self, driver):
         vector = [0.1, 0.2, 0.3]
         vector_id = str(uuid.uuid4())
@@ -48,6 +48,24 @@ class TestRedisVectorStorageDriver:
             == "some_vector_id"
         )
 
+    def test_upsert_vectors(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value.__enter__.return_value
+
+        assert driver.upsert_vectors(
+            [[1.0, 2.0], [3.0, 4.0]], vector_ids=["foo", "bar"], namespace="some_namespace", metas=[{"a": 1}, None]
+        ) == ["foo", "bar"]
+        assert pipeline.hset.call_count == 2
+        assert pipeline.hset.call_args_list[0].args == ("some_namespace:foo",)
+        pipeline.execute.assert_called_once()
+
+    def test_find_existing_vector_ids(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value.__enter__.return_value
+        pipeline.execute.return_value = [1, 0]
+
+        assert driver.find_existing_vector_ids(["foo", "bar"], namespace="some_namespace") == {"foo"}
+        pipeline.exists.assert_any_call("some_namespace:foo")
+        pipeline.exists.assert_any_call("some_namespace:bar")
+
     def test_load_entry(self, driver, mock_hgetall):
         entry = driver.load_entry("some_vector_id")
         mock_hgetall.assert_called_once_with("some_vector_id")
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import pytest
+
+from griptape.drivers import LocalVectorStoreDriver
+from griptape.engines import SemanticCacheEngine
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+def embed(text: str) -> list[float]:
+    if "France" in text:
+        return [1.0, 0.0]
+    elif "Spain" in text:
+        return [0.8, 0.6]
+    else:
+        return [0.0, 1.0]
+
+
+class TestSemanticCacheEngine:
+    @pytest.fixture()
+    def engine(self):
+        return SemanticCacheEngine(
+            vector_store_driver=LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(mock_output=embed)),
+            similarity_threshold=0.9,
+        )
+
+    def test_invalid_ttl(self):
+        with pytest.raises(ValueError, match="ttl must be greater than 0"):
+            SemanticCacheEngine(ttl=0)
+
+    def test_invalid_candidate_count(self):
+        with pytest.raises(ValueError, match="candidate_count must be at least 1"):
+            SemanticCacheEngine(candidate_count=0)
+
+    def test_get_namespace(self, engine):
+        assert engine.get_namespace("foo") == engine.get_namespace("foo")
+        assert engine.get_namespace("foo") != engine.get_namespace("bar")
+        assert engine.get_namespace("foo").startswith("semantic-cache-")
+
+    def test_query(self, engine):
+        namespace = engine.get_namespace("foo")
+        engine.upsert("What is the capital of France?", "Paris", namespace=namespace)
+
+        entry = engine.query("Which city is the capital of France?", namespace=namespace)
+
+        assert entry is not None
+        assert entry.id == engine.get_vector_id("What is the capital of France?", namespace=namespace)
+        assert entry.meta["response"] == "Paris"
+        assert engine.query("What is the capital of Spain?", namespace=namespace) is None
+        assert engine.query("What is the capital of Italy?", namespace=namespace) is None
+        assert engine.query("What is the capital of France?", namespace=engine.get_namespace("bar")) is None
+
+    def test_upsert_replaces_response(self, engine):
+        namespace = engine.get_namespace("foo")
+        engine.upsert("What is the capital of France?", "Lyon", namespace=namespace)
+        engine.upsert("What is the capital of France?", "Paris", namespace=namespace)
+
+        assert len(engine.vector_store_driver.load_entries(namespace=namespace)) == 1
+        assert engine.query("What is the capital of France?", namespace=namespace).meta["response"] == "Paris"
+
+    def test_query_with_ttl(self, engine, mocker):
+        mock_time = mocker.patch("griptape.engines.cache.semantic_cache_engine.time.time", return_value=100.0)
+        engine.ttl = 10
+        namespace = engine.get_namespace("foo")
+        engine.upsert("What is the capital of France?", "Paris", namespace=namespace)
+
+        mock_time.return_value = 110.0
+        assert engine.query("What is the capital of France?", namespace=namespace) is not None
+
+        mock_time.return_value = 111.0
+        assert engine.query("What is the capital of France?", namespace=namespace) is None
+        assert engine.vector_store_driver.load_entries(namespace=namespace) == []
+
+    def test_invalidate(self, engine):
+        foo_namespace = engine.get_namespace("foo")
+        bar_namespace = engine.get_namespace("bar")
+        engine.upsert("What is the capital of France?", "Paris", namespace=foo_namespace)
+        engine.upsert("What is the capital of France?", "Paris", namespace=bar_namespace)
+        engine.vector_store_driver.upsert_text("What is the capital of France?", namespace="other")
+
+        engine.invalidate(foo_namespace)
+
+        assert engine.query("What is the capital of France?", namespace=foo_namespace) is None
+        assert engine.query("What is the capital of France?", namespace=bar_namespace) is not None
+
+        engine.invalidate()
+
+        assert engine.query("What is the capital of France?", namespace=bar_namespace) is None
+        assert len(engine.vector_store_driver.load_entries(namespace="other")) == 1
+
+    def test_invalidate_loads_engine_namespaces(self, engine, mocker):
+        namespace = engine.get_namespace("foo")
+        engine.upsert("What is the capital of France?", "Paris", namespace=namespace)
+        load_entries = mocker.spy(engine.vector_store_driver, "load_entries")
+
+        engine.invalidate()
+        engine.invalidate("other")
+
+        load_entries.assert_called_once_with(namespace=namespace)
+
+    def test_invalidate_without_deletion(self, engine, mocker):
+        mocker.patch.object(engine.vector_store_driver, "delete_vector", side_effect=NotImplementedError)
+        namespace = engine.get_namespace("foo")
+        engine.upsert("What is the capital of France?", "Paris", namespace=namespace)
+
+        mock_logger = mocker.patch("griptape.engines.cache.semantic_cache_engine.logger")
+
+        engine.invalidate(namespace)
+
+        assert "can't delete entries" in mock_logger.warning.call_args[0][0]
+        assert mock_logger.warning.call_args[0][2] == 1
+        assert len(engine.vector_store_driver.load_entries(namespace=namespace)) == 1
+        assert engine.query("What is the capital of France?", namespace=namespace) is None
+
+        engine.upsert("What is the capital of France?", "Paris", namespace=namespace)
+
+        assert engine.query("What is the capital of France?", namespace=namespace) is not None
+
+    def test_invalidate_without_loading(self, engine, mocker):
+        mocker.patch.object(engine.vector_store_driver, "load_entries", side_effect=NotImplementedError)
+        namespace = engine.get_namespace("foo")
+        engine.upsert("What is the capital of France?", "Paris", namespace=namespace)
+
+        mock_logger = mocker.patch("griptape.engines.cache.semantic_cache_engine.logger")
+
+        engine.invalidate()
+
+        assert "can't load entries" in mock_logger.warning.call_args[0][0]
+        assert engine.query("What is the capital of France?", namespace=namespace) is None
+
+    def test_embed(self, engine):
+        assert engine.embed("What is the capital of France?") == [1.0, 0.0]
+
+    def test_query_and_upsert_with_vector(self, engine, mocker):
+        namespace = engine.get_namespace("foo")
+        embed_string = mocker.spy(engine.vector_store_driver.embedding_driver, "embed_string")
+        vector = engine.embed("What is the capital of France?")
+
+        assert engine.query("What is the capital of France?", namespace=namespace, vector=vector) is None
+        engine.upsert("What is the capital of France?", "Paris", namespace=namespace, vector=vector)
+        assert engine.query("What is the capital of France?", namespace=namespace, vector=vector) is not None
+        assert embed_string.call_count == 1
+
+    def test_query_without_query_vector(self, engine, mocker):
+        namespace = engine.get_namespace("foo")
+        engine.upsert("What is the capital of France?", "Paris", namespace=namespace)
+        entries = engine.vector_store_driver.query("What is the capital of France?", namespace=namespace)
+        mocker.patch.object(engine.vector_store_driver, "query_vector", side_effect=NotImplementedError)
+        query = mocker.patch.object(engine.vector_store_driver, "query", return_value=entries)
+
+        assert engine.query("What is the capital of France?", namespace=namespace).meta["response"] == "Paris"
+        query.assert_called_once_with("What is the capital of France?", count=5, namespace=namespace)
@@ -0,0 +1,15 @@
+import pytest
+
+from griptape.events import PromptCacheMissEvent
+
+
+class TestPromptCacheMissEvent:
+    @pytest.fixture()
+    def prompt_cache_miss_event(self):
+        return PromptCacheMissEvent(model="foo bar", cache_key="foo:bar")
+
+    def test_to_dict(self, prompt_cache_miss_event):
+        assert "timestamp" in prompt_cache_miss_event.to_dict()
+
+        assert prompt_cache_miss_event.to_dict()["model"] == "foo bar"
+        assert prompt_cache_miss_event.to_dict()["cache_key"] == "foo:bar"
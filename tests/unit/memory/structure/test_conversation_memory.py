@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 from griptape.artifacts import TextArtifact
 from griptape.common import PromptStack
 from griptape.memory.structure import BaseConversationMemory, ConversationMemory, Run
@@ -177,3 +179,62 @@ class TestConversationMemory:
         assert prompt_stack.messages[2].content[0].artifact.value == "bar2"
         assert prompt_stack.messages[-2].content[0].artifact.value == "foo"
         assert prompt_stack.messages[-1].content[0].artifact.value == "bar"
+
+    @pytest.mark.parametrize("max_input_tokens", [0, 20, 40, 41, 70, 100, 130, 160, 200])
+    def test_add_to_prompt_stack_autopruning_fits_most_runs(self, max_input_tokens):
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=max_input_tokens))
+        memory = ConversationMemory(
+            autoprune=True,
+            runs=[Run(input=TextArtifact(f"foo{i}" * i), output=TextArtifact(f"bar{i}")) for i in range(1, 6)],
+        )
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_message("fizz")
+
+        # The most recent runs that fit, found by counting the tokens of every possible Prompt Stack.
+        expected = 0
+        for num_runs in range(1, len(memory.runs) + 1):
+            stack = PromptStack(messages=[*prompt_stack.messages, *memory.to_prompt_stack(num_runs).messages])
+
+            if prompt_driver.tokenizer.count_input_tokens_left(prompt_driver.prompt_stack_to_string(stack)) > 0:
+                expected = num_runs
+
+        memory.add_to_prompt_stack(prompt_driver, prompt_stack)
+
+        assert len(prompt_stack.messages) == 1 + expected * 2
+
+    def test_add_to_prompt_stack_autopruning_caches_run_token_counts(self, mocker):
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=100))
+        memory = ConversationMemory(
+            autoprune=True,
+            runs=[Run(input=TextArtifact(f"foo{i}"), output=TextArtifact(f"bar{i}")) for i in range(10)],
+        )
+        spy = mocker.spy(MockTokenizer, "count_tokens")
+
+        memory.add_to_prompt_stack(prompt_driver, PromptStack())
+        spy.reset_mock()
+        memory.add_run(Run(input=TextArtifact("foo10"), output=TextArtifact("bar10")))
+        prompt_stack = memory.add_to_prompt_stack(prompt_driver, PromptStack())
+
+        # The new run and one check of the pruned Prompt Stack.
+        assert spy.call_count == 2
+        assert prompt_stack.messages[-1].content[0].artifact.value == "bar10"
+
+    def test_add_to_prompt_stack_autopruning_corrects_estimate(self, mocker):
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=200))
+        memory = ConversationMemory(
+            autoprune=True,
+            runs=[Run(input=TextArtifact(f"foo{i}"), output=TextArtifact(f"bar{i}")) for i in range(10)],
+        )
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_message("fizz")
+        # Messages cost more tokens the longer the Prompt Stack is, so the estimate from run token counts doesn't fit.
+        count_tokens = mocker.patch.object(
+            MockTokenizer, "count_tokens", side_effect=lambda text: len(text) + text.count("\n\n") ** 2
+        )
+
+        memory.add_to_prompt_stack(prompt_driver, prompt_stack)
+
+        # The Prompt Stack, an empty Prompt Stack, each run, and two checks of the pruned Prompt Stack.
+        assert count_tokens.call_count == 14
+        assert len(prompt_stack.messages) > 1
+        assert prompt_driver.tokenizer.count_input_tokens_left(prompt_driver.prompt_stack_to_string(prompt_stack)) > 0
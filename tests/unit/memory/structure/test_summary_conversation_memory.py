@@ -1,4 +1,6 @@
+import asyncio
 import json
+import threading
 
 from griptape.artifacts import TextArtifact
 from griptape.memory.structure import Run, SummaryConversationMemory
@@ -89,3 +91,96 @@ class TestSummaryConversationMemory:
         pipeline.add_tasks(PromptTask("test"))
 
         assert isinstance(memory.prompt_driver, MockPromptDriver)
+
+    def test_summarize_in_background(self):
+        started = threading.Event()
+        release = threading.Event()
+        prompts = []
+
+        def mock_output(prompt_stack):
+            prompts.append(prompt_stack.messages[0].to_text())
+            started.set()
+            release.wait(timeout=10)
+
+            return f"summary {len(prompts)}"
+
+        memory = SummaryConversationMemory(
+            offset=1, summarize_in_background=True, prompt_driver=MockPromptDriver(mock_output=mock_output)
+        )
+
+        memory.add_run(Run(input=TextArtifact("foo 1"), output=TextArtifact("bar 1")))
+        memory.add_run(Run(input=TextArtifact("foo 2"), output=TextArtifact("bar 2")))
+        assert started.wait(timeout=10)
+
+        memory.add_run(Run(input=TextArtifact("foo 3"), output=TextArtifact("bar 3")))
+        memory.add_run(Run(input=TextArtifact("foo 4"), output=TextArtifact("bar 4")))
+
+        # Runs are kept in the Prompt Stack until their summary is done.
+        assert memory.summary is None
+        assert [message.to_text() for message in memory.to_prompt_stack().messages][::2] == [
+            "foo 1",
+            "foo 2",
+            "foo 3",
+            "foo 4",
+        ]
+
+        release.set()
+        memory.flush()
+
+        # Runs added while summarizing are summarized together.
+        assert len(prompts) == 2
+        assert "foo 1" in prompts[0]
+        assert "foo 2" in prompts[1]
+        assert "foo 3" in prompts[1]
+        assert memory.summary == "summary 2"
+        assert memory.summary_index == 3
+        assert memory.to_prompt_stack().messages[1].to_text() == "foo 4"
+
+    def test_summarize_synchronously(self):
+        memory = SummaryConversationMemory(offset=1)
+
+        memory.add_run(Run(input=TextArtifact("foo 1"), output=TextArtifact("bar 1")))
+        memory.add_run(Run(input=TextArtifact("foo 2"), output=TextArtifact("bar 2")))
+
+        assert memory.summary == "mock output"
+        assert memory.summary_index == 1
+
+    def test_summarize_in_background_max_runs(self):
+        release = threading.Event()
+
+        def mock_output(_):
+            release.wait(timeout=10)
+
+            return "summary"
+
+        memory = SummaryConversationMemory(
+            offset=1, max_runs=2, summarize_in_background=True, prompt_driver=MockPromptDriver(mock_output=mock_output)
+        )
+
+        memory.add_run(Run(input=TextArtifact("foo 1"), output=TextArtifact("bar 1")))
+        memory.add_run(Run(input=TextArtifact("foo 2"), output=TextArtifact("bar 2")))
+        memory.add_run(Run(input=TextArtifact("foo 3"), output=TextArtifact("bar 3")))
+        memory.add_run(Run(input=TextArtifact("foo 4"), output=TextArtifact("bar 4")))
+        release.set()
+        memory.flush()
+
+        assert memory.summary_index == 1
+        assert [run.input.value for run in memory.unsummarized_runs()] == ["foo 4"]
+
+    def test_flush_async(self):
+        memory = SummaryConversationMemory(offset=1, summarize_in_background=True)
+
+        memory.add_run(Run(input=TextArtifact("foo 1"), output=TextArtifact("bar 1")))
+        memory.add_run(Run(input=TextArtifact("foo 2"), output=TextArtifact("bar 2")))
+        asyncio.run(memory.flush_async())
+
+        assert memory.summary == "mock output"
+        assert memory.summary_index == 1
+
+    def test_flush_without_summary(self):
+        memory = SummaryConversationMemory()
+
+        memory.flush()
+        asyncio.run(memory.flush_async())
+
+        assert memory.summary is None
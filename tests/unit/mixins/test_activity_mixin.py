@@ -1,6 +1,7 @@
 import pytest
 from schema import Literal, Optional, Schema
 
+from griptape.mixins.activity_mixin import _activity_names
 from tests.mocks.mock_tool.tool import MockTool
 
 
@@ -122,3 +123,16 @@ class TestActivityMixin:
             "additionalProperties": False,
             "type": "object",
         }
+
+    def test_activities_are_discovered_once_per_class(self, tool):
+        MockTool(install_dependencies_on_init=False).activities()
+        misses = _activity_names.cache_info().misses
+
+        assert tool.activities()[0] == tool.test
+        assert _activity_names.cache_info().misses == misses
+
+    def test_activity_schema_does_not_modify_original(self):
+        tool = MockTool(extra_schema_properties={"test": {Literal("new_property"): str}})
+
+        assert "new_property" in str(tool.activity_schema(tool.test).json_schema("InputSchema"))
+        assert "new_property" not in str(getattr(tool.test, "config")["schema"].json_schema("InputSchema"))
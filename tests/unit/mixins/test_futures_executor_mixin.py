@@ -1,5 +1,6 @@
 from concurrent import futures
 
+from griptape.utils.futures import FuturesExecutorRegistry
 from tests.mocks.mock_futures_executor import MockFuturesExecutor
 
 
@@ -8,3 +9,28 @@ class TestFuturesExecutorMixin:
         executor = futures.ThreadPoolExecutor()
 
         assert MockFuturesExecutor(futures_executor_fn=lambda: executor).futures_executor == executor
+
+    def test_futures_executor_defaults_to_shared_executor(self):
+        first = MockFuturesExecutor()
+        second = MockFuturesExecutor()
+
+        assert first.futures_executor is FuturesExecutorRegistry.get_executor("io")
+        assert second.futures_executor is first.futures_executor
+
+        first.__del__()
+
+        assert not second.futures_executor._shutdown
+
+    def test_futures_executor_name(self):
+        assert MockFuturesExecutor(futures_executor_name="llm").futures_executor is (
+            FuturesExecutorRegistry.get_executor("llm")
+        )
+
+    def test_owned_futures_executor_is_shut_down(self):
+        executor = futures.ThreadPoolExecutor()
+        mixin = MockFuturesExecutor(futures_executor=executor)
+
+        mixin.__del__()
+
+        assert executor._shutdown
+        assert mixin.futures_executor is FuturesExecutorRegistry.get_executor("io")
@@ -29,6 +29,15 @@ class TestRuleMixin:
         assert mixin.rulesets[1].name == "Default Ruleset"
         assert mixin.rulesets[1].rules == [Rule("foo")]
 
+    def test_rulesets_does_not_modify_rulesets(self):
+        ruleset = Ruleset("bar", [Rule("baz")])
+        mixin = RuleMixin(rules=[Rule("foo")], rulesets=[ruleset])
+        task = PromptTask(rules=[Rule("foo")], rulesets=[ruleset])
+
+        assert len(mixin.rulesets) == len(mixin.rulesets) == 2
+        assert len(task.rulesets) == len(task.rulesets) == 2
+        assert mixin._rulesets == task._rulesets == [ruleset]
+
     def test_inherits_structure_rulesets(self):
         # Tests that a task using the mixin inherits rulesets from its structure.
         ruleset1 = Ruleset("foo", [Rule("foo rule")])
@@ -32,6 +32,27 @@ class TestSerializableMixin:
             ToolTask,
         )
 
+    def test_from_dict_abstract_without_type(self):
+        with pytest.raises(ValueError, match="Type field is required"):
+            BaseArtifact.from_dict({"value": "foobar"})
+
+    def test_from_dict_reuses_schema(self, mocker):
+        BaseArtifact.from_dict({"type": "TextArtifact", "value": "foo"})
+        spy = mocker.spy(BaseSchema, "_generate_schema_cls")
+
+        artifact = BaseArtifact.from_dict({"type": "TextArtifact", "value": "bar"})
+
+        assert isinstance(artifact, TextArtifact)
+        assert artifact.value == "bar"
+        assert spy.call_count == 0
+
+    def test_to_dict_reuses_schema(self, mocker):
+        MockSerializable().to_dict()
+        spy = mocker.spy(BaseSchema, "_generate_schema_cls")
+
+        assert MockSerializable(foo="baz").to_dict()["foo"] == "baz"
+        assert spy.call_count == 0
+
     def test_from_json(self):
         assert isinstance(BaseArtifact.from_json('{"type": "TextArtifact", "value": "foobar"}'), TextArtifact)
         assert isinstance(TextArtifact.from_json('{"value": "foobar"}'), TextArtifact)
@@ -45,6 +45,21 @@ class TestBaseSchema:
         with pytest.raises(ValueError):
             BaseSchema.from_attrs_cls(TextLoader)
 
+    def test_from_attrs_cls_cache(self, mocker):
+        spy = mocker.spy(BaseSchema, "_generate_schema_cls")
+        schema_class = BaseSchema.from_attrs_cls(MockSerializable)
+
+        assert BaseSchema.from_attrs_cls(MockSerializable) is schema_class
+        assert PolymorphicSchema.from_attrs_cls(MockSerializable) is not schema_class
+        assert spy.call_count <= 2
+
+    def test_get_shared_schema(self):
+        schema = BaseSchema.get_shared_schema(MockSerializable)
+
+        assert isinstance(schema, BaseSchema.from_attrs_cls(MockSerializable))
+        assert BaseSchema.get_shared_schema(MockSerializable) is schema
+        assert BaseSchema.from_attrs_cls(MockSerializable)() is not schema
+
     def test_get_field_for_type(self):
         assert isinstance(BaseSchema._get_field_for_type(BaseArtifact), fields.Nested)
 
@@ -0,0 +1,141 @@
+import json
+
+import pytest
+from marshmallow import ValidationError, fields, post_dump
+
+from griptape.artifacts import BaseArtifact, BlobArtifact, ListArtifact, TextArtifact
+from griptape.memory.structure import Run
+from griptape.schemas import BaseSchema
+from griptape.schemas.codec import _get_decoder, _get_encoder, _get_json_loads, dump_obj, load_obj, loads_json
+from griptape.utils import is_dependency_installed
+from tests.mocks.mock_serializable import MockSerializable
+
+
+class TestCodec:
+    @pytest.fixture(
+        params=[
+            MockSerializable(),
+            MockSerializable(foo="baz", bar="qux", baz=[1, 2], nested=MockSerializable.NestedMockSerializable()),
+            TextArtifact("foo", meta={"bar": [1, 2.5, None]}),
+            BlobArtifact(b"\x00\x01", name="blob"),
+            ListArtifact([TextArtifact("foo"), BlobArtifact(b"bar")]),
+            Run(input=TextArtifact("foo"), output=TextArtifact("bar"), meta={"baz": "qux"}),
+        ]
+    )
+    def obj(self, request):
+        return request.param
+
+    def test_dump_obj(self, obj):
+        schema = BaseSchema.from_attrs_cls(type(obj))()
+
+        assert json.dumps(dump_obj(schema, obj)) == json.dumps(schema.dump(obj))
+
+    def test_load_obj(self, obj):
+        schema = BaseSchema.from_attrs_cls(type(obj))()
+        data = json.loads(json.dumps(schema.dump(obj)))
+
+        assert load_obj(schema, data).to_json() == schema.load(data).to_json()
+
+    def test_load_obj_converts_values(self):
+        schema = BaseSchema.from_attrs_cls(MockSerializable)()
+
+        assert load_obj(schema, {"baz": ["1", 2]}).baz == [1, 2]
+
+    def test_load_obj_polymorphic(self):
+        schema = BaseSchema.from_attrs_cls(ListArtifact)()
+        artifact = load_obj(schema, {"value": [{"type": "TextArtifact", "value": "foo"}]})
+
+        assert isinstance(artifact.value[0], TextArtifact)
+        assert artifact.value[0].value == "foo"
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"foo": 1},
+            {"baz": ["foo"]},
+            {"nested": "foo"},
+            "foo",
+        ],
+    )
+    def test_load_obj_invalid(self, data):
+        schema = BaseSchema.from_attrs_cls(MockSerializable)()
+
+        with pytest.raises(ValidationError) as expected:
+            schema.load(data)
+        with pytest.raises(ValidationError) as actual:
+            load_obj(schema, data)
+
+        assert actual.value.messages == expected.value.messages
+
+    def test_load_obj_polymorphic_without_type(self):
+        schema = BaseSchema.from_attrs_cls(ListArtifact)()
+
+        with pytest.raises(ValidationError):
+            load_obj(schema, {"value": [{"value": "foo"}]})
+
+    def test_dump_obj_with_hooks(self):
+        class HookSchema(BaseSchema.from_attrs_cls(MockSerializable)):
+            @post_dump
+            def add_hook(self, data, **kwargs):
+                return {**data, "hook": True}
+
+        assert dump_obj(HookSchema(), MockSerializable())["hook"] is True
+
+    @pytest.mark.parametrize("attribute", ["_hooks", "_CHECK_ATTRIBUTE"])
+    def test_without_marshmallow_internals(self, monkeypatch, attribute):
+        class InternalsSchema(BaseSchema.from_attrs_cls(MockSerializable)):
+            pass
+
+        class Hooks:
+            def __getitem__(self, key: str) -> list:
+                return []
+
+        # Marshmallow versions that change these internals are left to Marshmallow.
+        if attribute == "_hooks":
+            monkeypatch.setattr(InternalsSchema, "_hooks", Hooks())
+        else:
+            monkeypatch.setattr(fields.Field, "_CHECK_ATTRIBUTE", 1)
+        schema = InternalsSchema()
+        obj = MockSerializable(foo="baz", nested=MockSerializable.NestedMockSerializable(foo="qux"))
+
+        assert _get_encoder(schema) == schema.dump
+        assert _get_decoder(schema) == schema.load
+        assert dump_obj(schema, obj) == schema.dump(obj)
+
+    def test_loads_json(self):
+        assert loads_json('{"foo": [1, 2.5, null, "bar"]}') == {"foo": [1, 2.5, None, "bar"]}
+        assert loads_json(b'{"foo": "bar"}') == {"foo": "bar"}
+
+    def test_loads_json_falls_back(self):
+        assert loads_json('{"foo": 100000000000000000000000}') == {"foo": 100000000000000000000000}
+        assert loads_json(b"[-9223372036854775809]") == [-9223372036854775809]
+        assert loads_json('"\\ud800"') == "\ud800"
+        assert str(loads_json('{"foo": NaN}')["foo"]) == "nan"
+
+        with pytest.raises(json.JSONDecodeError):
+            loads_json("{")
+
+    def test_loads_json_long_floats(self, mocker):
+        loads = mocker.spy(json, "loads")
+
+        assert loads_json("[0.12345678901234567890123, -1.2345678901234567890e-5]") == [
+            0.12345678901234567890123,
+            -1.2345678901234567890e-5,
+        ]
+        assert loads.call_count == int(not is_dependency_installed("orjson"))
+
+    def test_loads_json_without_orjson(self, mocker):
+        mocker.patch("griptape.utils.is_dependency_installed", return_value=False)
+        _get_json_loads.cache_clear()
+
+        try:
+            assert _get_json_loads() is json.loads
+        finally:
+            _get_json_loads.cache_clear()
+
+    def test_from_json_round_trip(self):
+        artifact = ListArtifact([TextArtifact("foo"), BlobArtifact(b"bar")])
+        loaded = BaseArtifact.from_json(artifact.to_json())
+
+        assert isinstance(loaded, ListArtifact)
+        assert loaded.to_json() == artifact.to_json()
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from griptape.memory import TaskMemory
@@ -123,6 +125,8 @@ class TestAgent:
 
         assert len(agent.tasks) == 1
         assert agent.task == second_task
+        assert agent.try_find_task(first_task.id) is None
+        assert agent.find_task(second_task.id) == second_task
 
     def test_custom_task(self):
         task = PromptTask()
@@ -193,6 +197,17 @@ class TestAgent:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_run_async(self):
+        task = PromptTask("test")
+        agent = Agent(prompt_driver=MockPromptDriver())
+        agent.add_task(task)
+
+        result = asyncio.run(agent.run_async())
+
+        assert result.output_task.output.to_text() == "mock output"
+        assert task.state == BaseTask.State.FINISHED
+        assert len(agent.conversation_memory.runs) == 1
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         agent = Agent(prompt_driver=MockPromptDriver())
@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 import pytest
@@ -246,6 +247,29 @@ class TestPipeline:
         assert [parent.id for parent in third_task.parents] == ["test1"]
         assert [child.id for child in third_task.children] == ["test2"]
 
+    def test_find_task(self):
+        first_task = PromptTask("test1", id="test1")
+        second_task = PromptTask("test2", id="test2")
+        third_task = PromptTask("test3", id="test3")
+        pipeline = Pipeline(tasks=[first_task, second_task])
+
+        pipeline.insert_task(first_task, third_task)
+
+        assert pipeline.find_task("test3") is third_task
+        assert pipeline.tasks == [first_task, third_task, second_task]
+        assert pipeline.try_find_task("test4") is None
+
+        with pytest.raises(ValueError, match="Task with id test4 doesn't exist."):
+            pipeline.find_task("test4")
+
+    def test_tasks_returns_copy(self):
+        task = PromptTask("test")
+        pipeline = Pipeline(tasks=[task])
+
+        pipeline.tasks.clear()
+
+        assert pipeline.tasks == [task]
+
     def test_insert_task_at_end(self):
         first_task = PromptTask("test1", id="test1")
         second_task = PromptTask("test2", id="test2")
@@ -331,6 +355,25 @@ class TestPipeline:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_run_async(self):
+        first_task = PromptTask("test1")
+        second_task = PromptTask("test2")
+        pipeline = Pipeline(tasks=[first_task, second_task])
+
+        result = asyncio.run(pipeline.run_async())
+
+        assert result.output_task.output.to_text() == "mock output"
+        assert first_task.is_finished()
+        assert second_task.is_finished()
+
+    def test_run_async_with_error_artifact(self, error_artifact_task):
+        end_task = PromptTask("end")
+        pipeline = Pipeline(tasks=[error_artifact_task, end_task])
+
+        asyncio.run(pipeline.run_async())
+
+        assert end_task.output is None
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         pipeline = Pipeline()
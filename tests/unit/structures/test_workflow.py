@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import time
 
 import pytest
@@ -372,6 +374,31 @@ class TestWorkflow:
         with pytest.raises(ValueError):
             workflow.insert_tasks(task1, [task2, task3], task4)
 
+    def test_find_task_after_insert(self):
+        task1 = PromptTask("test1", id="task1")
+        task2 = PromptTask("test2", id="task2")
+        task3 = PromptTask("test3", id="task3")
+        task4 = PromptTask("test4", id="task4")
+        workflow = Workflow(tasks=[task1, task4])
+
+        workflow.insert_tasks(task1, [task2, task3], task4)
+
+        assert [workflow.find_task(task_id) for task_id in ["task1", "task2", "task3", "task4"]] == [
+            task1,
+            task2,
+            task3,
+            task4,
+        ]
+        assert task4.parents == [task2, task3]
+
+    def test_find_task_after_direct_append(self):
+        task = PromptTask("test", id="task")
+        workflow = Workflow()
+
+        workflow._tasks.append(task)
+
+        assert workflow.find_task("task") is task
+
     def test_run_topology_1_id_equality(self):
         task1 = PromptTask("test1", id="task1")
         task2 = PromptTask("test2", id="task2")
@@ -767,6 +794,118 @@ class TestWorkflow:
 
         assert workflow.output is not None
 
+    def test_run_starts_children_when_parents_finish(self):
+        finished = []
+
+        def fn(delay):
+            def run(task):
+                time.sleep(delay)
+                finished.append(task.id)
+
+                return TextArtifact(task.id)
+
+            return run
+
+        slow = CodeExecutionTask(run_fn=fn(0.5), id="slow")
+        fast = CodeExecutionTask(run_fn=fn(0), id="fast")
+        fast_child = CodeExecutionTask(run_fn=fn(0), id="fast_child")
+        fast >> fast_child
+        workflow = Workflow(tasks=[slow, fast, fast_child])
+
+        workflow.run()
+
+        assert finished.index("fast_child") < finished.index("slow")
+
+    def test_run_with_max_concurrency(self):
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def fn(task):
+            with lock:
+                running.append(task.id)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(task.id)
+
+            return TextArtifact(task.id)
+
+        tasks = [CodeExecutionTask(run_fn=fn) for _ in range(8)]
+        end_task = CodeExecutionTask(run_fn=fn, parent_ids=[task.id for task in tasks])
+        workflow = Workflow(tasks=[*tasks, end_task], max_concurrency=2)
+
+        workflow.run()
+
+        assert all(task.is_finished() for task in workflow.tasks)
+        assert max(max_running) <= 2
+
+    def test_run_async(self):
+        task1 = PromptTask("prompt1", id="task1")
+        task2 = PromptTask("prompt2", id="task2")
+        task3 = PromptTask("prompt3", id="task3")
+        task4 = PromptTask("prompt4", id="task4")
+        task1.add_children([task2, task3])
+        task4.add_parents([task2, task3])
+        workflow = Workflow(tasks=[task1, task2, task3, task4])
+
+        asyncio.run(workflow.run_async())
+
+        self._validate_topology_1(workflow)
+        assert workflow.output.value == "mock output"
+
+    def test_run_async_with_max_concurrency(self):
+        running = []
+        max_running = []
+
+        def fn(task):
+            running.append(task.id)
+            max_running.append(len(running))
+            time.sleep(0.01)
+            running.remove(task.id)
+
+            return TextArtifact(task.id)
+
+        tasks = [CodeExecutionTask(run_fn=fn) for _ in range(6)]
+        workflow = Workflow(tasks=tasks, max_concurrency=2)
+
+        asyncio.run(workflow.run_async())
+
+        assert all(task.is_finished() for task in tasks)
+        assert max(max_running) <= 2
+
+    def test_run_async_with_error_artifact(self, error_artifact_task, waiting_task):
+        end_task = PromptTask("end")
+        end_task.add_parents([error_artifact_task, waiting_task])
+        workflow = Workflow(tasks=[waiting_task, error_artifact_task, end_task])
+
+        asyncio.run(workflow.run_async())
+
+        assert end_task.output is None
+
+    def test_run_async_raises_on_cycle(self):
+        workflow = Workflow(tasks=[PromptTask(id="a", parent_ids=["b"]), PromptTask(id="b", parent_ids=["a"])])
+
+        with pytest.raises(ValueError, match="nodes are in a cycle"):
+            asyncio.run(workflow.run_async())
+
+    def test_max_concurrency_validation(self):
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+            Workflow(max_concurrency=0)
+
+    def test_run_skips_finished_tasks(self, mocker):
+        task1 = PromptTask("prompt1")
+        task2 = PromptTask("prompt2", parent_ids=[task1.id])
+        workflow = Workflow(tasks=[task1, task2])
+        workflow.resolve_relationships()
+        task1.state = BaseTask.State.FINISHED
+        spy = mocker.spy(PromptTask, "execute")
+
+        workflow.try_run()
+
+        assert [call.args[0] for call in spy.call_args_list] == [task2]
+        assert task2.is_finished()
+
     def test_nested_tasks(self):
         workflow = Workflow(
             tasks=[
@@ -1005,6 +1144,7 @@ class TestWorkflow:
                 "max_runs": workflow.conversation_memory.max_runs,
             },
             "fail_fast": workflow.fail_fast,
+            "max_concurrency": workflow.max_concurrency,
         }
         assert workflow.to_dict() == expected_workflow_dict
 
@@ -1,8 +1,9 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
-from griptape.artifacts import TextArtifact
+from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.events import EventBus
 from griptape.events.event_listener import EventListener
 from griptape.structures import Agent, Workflow
@@ -116,6 +117,22 @@ class TestBaseTask:
 
         assert EventBus.event_listeners[0].handler.call_count == 2
 
+    def test_execute_async(self, task):
+        output = asyncio.run(task.execute_async())
+
+        assert output.to_text() == "foobar"
+        assert task.is_finished()
+        assert EventBus.event_listeners[0].handler.call_count == 2
+
+    def test_execute_async_error(self, task, mocker):
+        mocker.patch.object(type(task), "run", side_effect=ValueError("error"))
+
+        output = asyncio.run(task.execute_async())
+
+        assert isinstance(output, ErrorArtifact)
+        assert output.value == "error"
+        assert task.is_finished()
+
     def test_add_parent(self, task):
         agent = Agent()
         parent = MockTask("parent foobar", id="parent_foobar", structure=agent)
@@ -1,3 +1,5 @@
+import asyncio
+
 from griptape.artifacts.image_artifact import ImageArtifact
 from griptape.artifacts.list_artifact import ListArtifact
 from griptape.artifacts.text_artifact import TextArtifact
@@ -18,6 +20,14 @@ class TestPromptTask:
 
         assert task.run().to_text() == "mock output"
 
+    def test_run_async(self, mocker):
+        task = PromptTask("test")
+        Pipeline().add_task(task)
+        spy = mocker.spy(task.prompt_driver, "try_run_async")
+
+        assert asyncio.run(task.run_async()).to_text() == "mock output"
+        assert spy.call_count == 1
+
     def test_to_text(self):
         task = PromptTask("{{ test }}", context={"test": "test value"})
 
@@ -1,5 +1,8 @@
+from schema import Literal
+
 from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.common import ToolAction
+from griptape.rules import Rule
 from griptape.structures import Agent
 from griptape.tasks import ActionsSubtask, PromptTask, ToolkitTask
 from tests.mocks.mock_tool.tool import MockTool
@@ -376,3 +379,65 @@ class TestToolkitSubtask:
         Agent().add_task(task)
 
         assert task.actions_schema().json_schema("Actions Schema") == self.TARGET_TOOLS_SCHEMA
+
+    def test_system_template_cache(self, mocker):
+        tool = MockTool()
+        task = ToolkitTask("test", tools=[tool])
+        Agent().add_task(task)
+        spy = mocker.spy(task, "actions_schema")
+
+        system_template = task.generate_system_template(task)
+
+        assert task.generate_system_template(task) == system_template
+        assert spy.call_count == 1
+
+        tool.allowlist = ["test"]
+
+        assert task.generate_system_template(task) != system_template
+        assert spy.call_count == 2
+
+        task.tools = [MockTool(name="OtherTool", install_dependencies_on_init=False)]
+
+        assert "OtherTool" in task.generate_system_template(task)
+        assert spy.call_count == 3
+
+        task.rules.append(Rule("foo"))
+
+        assert "foo" in task.generate_system_template(task)
+        assert spy.call_count == 4
+
+    def test_system_template_cache_activity_changes(self, mocker):
+        tool = MockTool()
+        task = ToolkitTask("test", tools=[tool])
+        Agent().add_task(task)
+        spy = mocker.spy(task, "actions_schema")
+
+        task.generate_system_template(task)
+        tool.extra_schema_properties = {"test": {Literal("extra_property"): str}}
+
+        assert "extra_property" in task.generate_system_template(task)
+        assert spy.call_count == 2
+
+        tool.custom_schema = {"custom_property": str}
+
+        assert "custom_property" in task.generate_system_template(task)
+        assert spy.call_count == 3
+
+        mocker.patch.object(MockTool, "foo", return_value="changed state")
+
+        assert "changed state" in task.generate_system_template(task)
+        assert spy.call_count == 4
+
+    def test_system_template_cache_static_activities(self, mocker):
+        tool = MockTool()
+        task = ToolkitTask("test", tools=[tool])
+        Agent().add_task(task)
+
+        task.generate_system_template(task)
+        description_spy = mocker.spy(tool, "activity_description")
+        schema_spy = mocker.spy(tool, "activity_schema")
+        task.generate_system_template(task)
+
+        # Only the templated descriptions and the callable schema are rendered to build the key.
+        assert description_spy.call_count == 4
+        assert schema_spy.call_count == 1
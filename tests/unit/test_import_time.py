@@ -0,0 +1,78 @@
+import ast
+import importlib
+import inspect
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Importing these namespaces took over two seconds when they eagerly imported every driver, tool, loader, and engine.
+# Lazy imports take a few milliseconds, so the budget leaves room for slow and loaded CI machines. The fastest of a few
+# imports is timed, so that compiling bytecode or a busy machine on one of them doesn't fail the test.
+IMPORT_TIME_BUDGET = 1.0
+IMPORT_TIME_ATTEMPTS = 3
+NAMESPACES = ["griptape", "griptape.drivers", "griptape.tools", "griptape.loaders", "griptape.engines"]
+HEAVY_MODULES = ["openai", "anthropic", "boto3", "numpy", "jinja2", "requests"]
+
+
+def run_import(statement: str) -> dict:
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(json.dumps({{'elapsed': elapsed, 'modules': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    return json.loads(result.stdout)
+
+
+class TestImportTime:
+    def test_import_time(self):
+        elapsed = min(run_import(f"import {', '.join(NAMESPACES)}")["elapsed"] for _ in range(IMPORT_TIME_ATTEMPTS))
+
+        assert elapsed < IMPORT_TIME_BUDGET
+
+    def test_import_all_namespaces_is_lazy(self):
+        assert run_import(f"import {', '.join(NAMESPACES)}")["modules"] == []
+
+    @pytest.mark.parametrize("namespace", NAMESPACES)
+    def test_import_is_lazy(self, namespace):
+        assert run_import(f"import {namespace}")["modules"] == []
+
+    def test_attribute_access_imports_module(self):
+        result = run_import("from griptape.drivers import OpenAiChatPromptDriver")
+
+        assert "openai" in result["modules"]
+
+    @pytest.mark.parametrize("namespace", NAMESPACES[1:])
+    def test_all(self, namespace):
+        module = __import__(namespace, fromlist=["__all__"])
+
+        for name in module.__all__:
+            assert getattr(module, name).__name__ == name
+        assert set(module.__all__) <= set(dir(module))
+
+    @pytest.mark.parametrize("namespace", NAMESPACES[1:])
+    def test_lazy_imports(self, namespace):
+        module = importlib.import_module(namespace)
+        type_checking_imports = {}
+
+        for node in ast.walk(ast.parse(inspect.getsource(module))):
+            if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING":
+                for statement in node.body:
+                    assert isinstance(statement, ast.ImportFrom)
+
+                    for alias in statement.names:
+                        type_checking_imports[alias.name] = "." * statement.level + str(statement.module)
+
+        assert type_checking_imports == module._LAZY_IMPORTS
+        assert sorted(module.__all__) == sorted(module._LAZY_IMPORTS)
+
+    def test_unknown_attribute(self):
+        import griptape.drivers
+
+        with pytest.raises(AttributeError, match="has no attribute 'Foo'"):
+            griptape.drivers.Foo  # noqa: B018
@@ -1,6 +1,8 @@
+from unittest.mock import Mock
+
 import pytest
 
-from griptape.tokenizers import AnthropicTokenizer
+from griptape.tokenizers import AnthropicTokenizer, SimpleTokenizer
 
 
 class TestAnthropicTokenizer:
@@ -43,3 +45,41 @@ class TestAnthropicTokenizer:
     )
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
+
+    def test_offline_token_count(self):
+        client = Mock()
+        tokenizer = AnthropicTokenizer(model="claude-3-haiku", offline=True, client=client)
+
+        assert tokenizer.count_tokens("foo bar huzzah") == 7
+        client.count_tokens.assert_not_called()
+
+    def test_offline_token_count_calibration(self):
+        tokenizer = AnthropicTokenizer(
+            model="claude-3-haiku",
+            offline=True,
+            offline_tokenizer=SimpleTokenizer(characters_per_token=1),
+            offline_token_ratio=1.5,
+            offline_safety_margin=0.2,
+            client=Mock(),
+        )
+
+        assert tokenizer.count_tokens("foo bar") == 13
+
+    def test_token_count_cache_offline_toggled(self):
+        client = Mock()
+        client.count_tokens.return_value = 5
+        tokenizer = AnthropicTokenizer(
+            model="claude-3-haiku",
+            offline_tokenizer=SimpleTokenizer(characters_per_token=1),
+            token_count_cache_size=10,
+            client=client,
+        )
+
+        assert tokenizer.count_tokens("foo bar") == 5
+        tokenizer.offline = True
+        assert tokenizer.count_tokens("foo bar") == 9
+        tokenizer.offline_token_ratio = 2
+        assert tokenizer.count_tokens("foo bar") == 16
+        tokenizer.offline = False
+        assert tokenizer.count_tokens("foo bar") == 5
+        client.count_tokens.assert_called_once_with("foo bar")
@@ -12,3 +12,6 @@ class TestBaseTokenizer:
             assert tokenizer.max_output_tokens == 1000
 
             assert "gpt2 not found" in caplog.text
+
+    def test_count_tokens_batch(self):
+        assert MockTokenizer(model="foo").count_tokens_batch(["foo", "", "foo bar"]) == [3, 0, 7]
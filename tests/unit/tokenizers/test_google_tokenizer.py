@@ -4,7 +4,7 @@ import pytest
 
 from griptape.common import PromptStack
 from griptape.common.prompt_stack.messages.message import Message
-from griptape.tokenizers import GoogleTokenizer
+from griptape.tokenizers import GoogleTokenizer, SimpleTokenizer
 
 
 class TestGoogleTokenizer:
@@ -34,3 +34,39 @@ class TestGoogleTokenizer:
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
         assert tokenizer.count_output_tokens_left(["foo", "bar", "huzzah"]) == expected
+
+    def test_offline_token_count(self, mock_generative_model):
+        tokenizer = GoogleTokenizer(model="gemini-pro", api_key="1234", offline=True)
+
+        assert tokenizer.count_tokens("foo bar huzzah") == 6
+        mock_generative_model.return_value.count_tokens.assert_not_called()
+
+    def test_offline_token_count_calibration(self, mock_generative_model):
+        tokenizer = GoogleTokenizer(
+            model="gemini-pro",
+            api_key="1234",
+            offline=True,
+            offline_tokenizer=SimpleTokenizer(characters_per_token=1),
+            offline_token_ratio=0.5,
+            offline_safety_margin=0.5,
+        )
+
+        assert tokenizer.count_tokens("foo bar") == 6
+        mock_generative_model.return_value.count_tokens.assert_not_called()
+
+    def test_token_count_cache_offline_toggled(self, mock_generative_model):
+        tokenizer = GoogleTokenizer(
+            model="gemini-pro",
+            api_key="1234",
+            offline_tokenizer=SimpleTokenizer(characters_per_token=1),
+            token_count_cache_size=10,
+        )
+
+        assert tokenizer.count_tokens("foo bar") == 5
+        tokenizer.offline = True
+        assert tokenizer.count_tokens("foo bar") == 8
+        tokenizer.offline_safety_margin = 0.5
+        assert tokenizer.count_tokens("foo bar") == 11
+        tokenizer.offline = False
+        assert tokenizer.count_tokens("foo bar") == 5
+        mock_generative_model.return_value.count_tokens.assert_called_once_with("foo bar")
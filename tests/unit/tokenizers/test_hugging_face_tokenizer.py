@@ -5,6 +5,7 @@ environ["TRANSFORMERS_VERBOSITY"] = "error"
 import pytest  # noqa: E402
 
 from griptape.tokenizers import HuggingFaceTokenizer  # noqa: E402
+from griptape.tokenizers.huggingface_tokenizer import get_pretrained_tokenizer  # noqa: E402
 
 
 class TestHuggingFaceTokenizer:
@@ -20,3 +21,14 @@ class TestHuggingFaceTokenizer:
 
     def test_output_tokens_left(self, tokenizer):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == 1019
+
+    def test_pretrained_tokenizer_is_shared(self, mocker):
+        get_pretrained_tokenizer.cache_clear()
+        from_pretrained = mocker.patch("transformers.AutoTokenizer.from_pretrained")
+
+        first = HuggingFaceTokenizer(model="foo", max_input_tokens=1024)
+        second = HuggingFaceTokenizer(model="foo", max_input_tokens=1024)
+
+        assert first.tokenizer is second.tokenizer
+        from_pretrained.assert_called_once_with("foo")
+        get_pretrained_tokenizer.cache_clear()
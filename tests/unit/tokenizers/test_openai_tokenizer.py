@@ -105,3 +105,47 @@ class TestOpenAiTokenizer:
     )
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
+
+    def test_encoding_is_shared(self):
+        assert OpenAiTokenizer(model="gpt-4").encoding is OpenAiTokenizer(model="gpt-4").encoding
+
+    def test_count_tokens_batch(self):
+        tokenizer = OpenAiTokenizer(model="gpt-4")
+        texts = ["foo bar huzzah", "", "foo " * 1000, "foo bar huzzah"]
+
+        assert tokenizer.count_tokens_batch(texts) == [tokenizer.count_tokens(text) for text in texts]
+
+    def test_count_tokens_batch_uses_batch_encoder(self, mocker):
+        mocker.patch("os.cpu_count", return_value=4)
+        tokenizer = OpenAiTokenizer(model="gpt-4")
+        encode_batch = mocker.spy(type(tokenizer.encoding), "encode_batch")
+
+        assert tokenizer.count_tokens_batch(["foo " * 1000, "bar " * 1000]) == [1001, 1001]
+        assert encode_batch.call_count == 1
+
+    def test_token_count_cache(self, mocker):
+        tokenizer = OpenAiTokenizer(model="gpt-4", token_count_cache_size=2)
+        encode = mocker.spy(type(tokenizer.encoding), "encode")
+
+        assert tokenizer.count_tokens("foo bar huzzah") == 5
+        assert tokenizer.count_tokens("foo bar huzzah") == 5
+        assert tokenizer.count_tokens_batch(["foo bar huzzah", "foo"]) == [5, 1]
+        assert encode.call_count == 2
+
+    def test_token_count_cache_is_bounded(self, mocker):
+        tokenizer = OpenAiTokenizer(model="gpt-4", token_count_cache_size=2)
+        encode = mocker.spy(type(tokenizer.encoding), "encode")
+
+        for text in ["foo", "bar", "baz", "foo"]:
+            tokenizer.count_tokens(text)
+
+        assert encode.call_count == 4
+
+    def test_token_count_cache_disabled_by_default(self, mocker):
+        tokenizer = OpenAiTokenizer(model="gpt-4")
+        encode = mocker.spy(type(tokenizer.encoding), "encode")
+
+        tokenizer.count_tokens("foo")
+        tokenizer.count_tokens("foo")
+
+        assert encode.call_count == 2
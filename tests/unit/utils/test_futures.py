@@ -1,6 +1,10 @@
+import threading
 from concurrent import futures
 
+import pytest
+
 from griptape import utils
+from griptape.utils.futures import FuturesExecutorRegistry, SharedFuturesExecutor
 
 
 class TestFutures:
@@ -35,5 +39,110 @@ class TestFutures:
             assert len(result["test2"]) == 1000
             assert len(result["test3"]) == 1000
 
+    def test_registry_get_executor(self):
+        executor = FuturesExecutorRegistry.get_executor("io")
+
+        assert isinstance(executor, SharedFuturesExecutor)
+        assert executor.name == "io"
+        assert FuturesExecutorRegistry.get_executor("io") is executor
+        assert FuturesExecutorRegistry.get_executor("llm") is not executor
+        assert FuturesExecutorRegistry.is_shared(executor)
+        assert not FuturesExecutorRegistry.is_shared(futures.ThreadPoolExecutor())
+
+    def test_registry_get_missing_executor(self):
+        with pytest.raises(ValueError, match="Futures executor foo doesn't exist."):
+            FuturesExecutorRegistry.get_executor("foo")
+
+    def test_registry_set_max_workers(self):
+        FuturesExecutorRegistry.set_max_workers("test", 2)
+
+        executor = FuturesExecutorRegistry.get_executor("test")
+
+        assert executor._max_workers == 2
+
+        FuturesExecutorRegistry.set_max_workers("test", 3)
+
+        assert FuturesExecutorRegistry.get_executor("test") is not executor
+        assert FuturesExecutorRegistry.get_executor("test")._max_workers == 3
+
+        del FuturesExecutorRegistry.max_workers["test"]
+
+    def test_registry_shutdown(self):
+        executor = FuturesExecutorRegistry.get_executor("io")
+
+        FuturesExecutorRegistry.shutdown()
+
+        with pytest.raises(RuntimeError):
+            executor.submit(self.foobar, "foo")
+        assert FuturesExecutorRegistry.get_executor("io") is not executor
+        assert FuturesExecutorRegistry.get_executor("io").submit(self.foobar, "foo").result() == "foo-bar"
+
+    def test_shared_executor_bounds_threads(self):
+        executor = SharedFuturesExecutor("test", 2)
+        thread_names = set()
+        lock = threading.Lock()
+
+        def fn(i):
+            with lock:
+                thread_names.add(threading.current_thread().name)
+
+            return i
+
+        assert utils.execute_futures_list([executor.submit(fn, i) for i in range(100)]) == list(range(100))
+        assert len(thread_names) <= 2
+        assert all(name.startswith("griptape-test") for name in thread_names)
+        assert executor.pending == 0
+
+        executor.shutdown()
+
+    def test_shared_executor_runs_nested_work_inline_when_saturated(self):
+        executor = SharedFuturesExecutor("test", 1)
+
+        def outer():
+            return executor.submit(self.foobar, threading.current_thread().name).result()
+
+        name = executor.submit(outer).result(timeout=5)
+
+        assert name.startswith("griptape-test")
+        assert name.endswith("-bar")
+
+        executor.shutdown()
+
+    def test_shared_executor_propagates_inline_exceptions(self):
+        executor = SharedFuturesExecutor("test", 1)
+
+        def fail():
+            raise ValueError("foo")
+
+        def outer():
+            return executor.submit(fail).exception()
+
+        assert isinstance(executor.submit(outer).result(timeout=5), ValueError)
+
+        executor.shutdown()
+
+    def test_shared_executor_submits_concurrently_when_saturated(self):
+        executor = SharedFuturesExecutor("test", 1)
+        release = threading.Event()
+
+        def outer():
+            future = executor.submit_concurrently(lambda: release.wait(timeout=5) and threading.current_thread().name)
+            # The submitting worker isn't blocked by the work it submitted.
+            assert not future.done()
+            release.set()
+
+            return future.result(timeout=5)
+
+        assert executor.submit(outer).result(timeout=5) == "griptape-test-overflow"
+
+        executor.shutdown()
+
+    def test_shared_executor_submits_concurrently(self):
+        executor = SharedFuturesExecutor("test", 1)
+
+        assert executor.submit_concurrently(self.foobar, "foo").result(timeout=5) == "foo-bar"
+
+        executor.shutdown()
+
     def foobar(self, foo):
         return f"{foo}-bar"
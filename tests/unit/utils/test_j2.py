@@ -0,0 +1,51 @@
+import pytest
+from jinja2 import Environment, FileSystemBytecodeCache
+
+from griptape.utils import J2
+
+
+class TestJ2:
+    def test_render(self):
+        assert J2("rulesets/rulesets.j2").render(rulesets=[]) == ""
+
+    def test_render_without_template_name(self):
+        with pytest.raises(ValueError, match="template_name is required."):
+            J2().render()
+
+    def test_render_from_string(self):
+        assert J2().render_from_string("{{ foo }} bar", foo="baz") == "baz bar"
+        assert J2().render_from_string("{{ foo }} bar", foo="qux") == "qux bar"
+
+    def test_shared_environment(self, tmp_path):
+        assert J2().environment is J2("rulesets/rulesets.j2").environment
+        assert J2(templates_dir=str(tmp_path)).environment is J2(templates_dir=str(tmp_path)).environment
+        assert J2(templates_dir=str(tmp_path)).environment is not J2().environment
+
+    def test_compiled_template_cache(self, mocker, tmp_path):
+        (tmp_path / "foo.j2").write_text("{{ foo }}")
+        spy = mocker.spy(J2(templates_dir=str(tmp_path)).environment, "_parse")
+
+        assert J2("foo.j2", templates_dir=str(tmp_path)).render(foo="bar") == "bar"
+        assert J2("foo.j2", templates_dir=str(tmp_path)).render(foo="baz") == "baz"
+        assert spy.call_count == 1
+
+        assert J2(templates_dir=str(tmp_path)).render_from_string("{{ foo }} bar", foo="bar") == "bar bar"
+        assert J2(templates_dir=str(tmp_path)).render_from_string("{{ foo }} bar", foo="baz") == "baz bar"
+        assert spy.call_count == 2
+
+    def test_compiled_string_cache_per_environment(self):
+        environment = Environment()
+        environment.globals["foo"] = "bar"
+
+        assert J2(environment=environment).render_from_string("{{ foo }}") == "bar"
+        assert J2().render_from_string("{{ foo }}") == ""
+
+    def test_bytecode_cache(self, tmp_path):
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        (templates_dir / "foo.j2").write_text("{{ foo }}")
+        j2 = J2("foo.j2", templates_dir=str(templates_dir), bytecode_cache_dir=str(tmp_path))
+
+        assert isinstance(j2.environment.bytecode_cache, FileSystemBytecodeCache)
+        assert j2.render(foo="bar") == "bar"
+        assert any(path.name.startswith("__jinja2_") for path in tmp_path.iterdir())
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import threading
+
+import pytest
+
+from griptape.configs import Defaults
+from griptape.utils import RateLimiter, RateLimiterRegistry
+
+
+class TestRateLimiter:
+    @pytest.fixture()
+    def mock_time(self, mocker):
+        return mocker.patch("griptape.utils.rate_limiter.time.monotonic", return_value=0.0)
+
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self, mocker):
+        return mocker.patch("griptape.utils.rate_limiter.time.sleep")
+
+    def test_invalid_requests_per_minute(self):
+        with pytest.raises(ValueError, match="requests_per_minute must be greater than 0"):
+            RateLimiter(requests_per_minute=0)
+
+    def test_invalid_tokens_per_minute(self):
+        with pytest.raises(ValueError, match="tokens_per_minute must be greater than 0"):
+            RateLimiter(tokens_per_minute=-1)
+
+    def test_invalid_burst_seconds(self):
+        with pytest.raises(ValueError, match="burst_seconds must be greater than 0"):
+            RateLimiter(burst_seconds=0)
+
+    def test_acquire_without_limits(self, mock_sleep):
+        rate_limiter = RateLimiter()
+
+        assert [rate_limiter.acquire(1000) for _ in range(100)] == [0.0] * 100
+        assert mock_sleep.call_count == 0
+
+    def test_acquire_requests(self, mock_time, mock_sleep):
+        rate_limiter = RateLimiter(requests_per_minute=60)
+
+        wait_times = [rate_limiter.acquire() for _ in range(62)]
+
+        assert wait_times[:60] == [0.0] * 60
+        assert wait_times[60:] == pytest.approx([1.0, 2.0])
+        assert [call.args[0] for call in mock_sleep.call_args_list] == pytest.approx([1.0, 2.0])
+        assert rate_limiter.request_count == 62
+        assert rate_limiter.wait_count == 2
+        assert rate_limiter.total_wait_time == pytest.approx(3.0)
+        assert rate_limiter.max_wait_time == pytest.approx(2.0)
+        assert rate_limiter.average_wait_time == pytest.approx(3.0 / 62)
+
+    def test_acquire_refills(self, mock_time):
+        rate_limiter = RateLimiter(requests_per_minute=60)
+
+        for _ in range(60):
+            rate_limiter.acquire()
+
+        mock_time.return_value = 10.0
+
+        assert [rate_limiter.acquire() for _ in range(11)][-1] == pytest.approx(1.0)
+
+        mock_time.return_value = 1000.0
+
+        assert [rate_limiter.acquire() for _ in range(60)] == [0.0] * 60
+
+    def test_acquire_tokens(self, mock_time):
+        rate_limiter = RateLimiter(tokens_per_minute=600)
+
+        assert rate_limiter.acquire(500) == 0.0
+        assert rate_limiter.acquire(200) == pytest.approx(10.0)
+        assert rate_limiter.acquire(1000) == pytest.approx(70.0)
+
+    def test_acquire_requests_and_tokens(self, mock_time):
+        rate_limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=6000)
+
+        assert rate_limiter.acquire(10) == 0.0
+        assert rate_limiter.acquire(10) == pytest.approx(60.0)
+
+    def test_acquire_with_burst_seconds(self, mock_time):
+        rate_limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=600, burst_seconds=1)
+
+        assert [rate_limiter.acquire() for _ in range(11)] == pytest.approx([0.0] * 10 + [0.1])
+
+        mock_time.return_value = 1000.0
+
+        assert rate_limiter.acquire(100) == pytest.approx(0.0)
+        assert rate_limiter.acquire(100) == pytest.approx(1.0)
+
+    def test_acquire_async(self, mock_time, mocker):
+        mock_sleep = mocker.patch("griptape.utils.rate_limiter.asyncio.sleep")
+        rate_limiter = RateLimiter(requests_per_minute=60)
+
+        wait_times = [asyncio.run(rate_limiter.acquire_async()) for _ in range(61)]
+
+        assert wait_times[-1] == pytest.approx(1.0)
+        assert mock_sleep.call_count == 1
+
+    def test_acquire_concurrently(self, mock_time):
+        rate_limiter = RateLimiter(requests_per_minute=60)
+        wait_times = []
+        threads = [threading.Thread(target=lambda: wait_times.append(rate_limiter.acquire())) for _ in range(120)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(wait_times) == pytest.approx([0.0] * 60 + [float(i) for i in range(1, 61)])
+
+    def test_acquire_logs_with_griptape_logger(self, mock_time, caplog):
+        rate_limiter = RateLimiter(requests_per_minute=60, burst_seconds=1)
+
+        with caplog.at_level(logging.DEBUG, logger=Defaults.logging_config.logger_name):
+            rate_limiter.acquire()
+            rate_limiter.acquire()
+
+        assert [record.name for record in caplog.records] == [Defaults.logging_config.logger_name]
+
+    def test_set_limits(self, mock_time):
+        rate_limiter = RateLimiter(requests_per_minute=60)
+
+        for _ in range(60):
+            rate_limiter.acquire()
+
+        rate_limiter.set_limits(requests_per_minute=120, tokens_per_minute=None)
+
+        assert [rate_limiter.acquire() for _ in range(61)][-1] == pytest.approx(0.5)
+
+        with pytest.raises(ValueError, match="requests_per_minute must be greater than 0"):
+            rate_limiter.set_limits(requests_per_minute=0, tokens_per_minute=None)
+
+
+class TestRateLimiterRegistry:
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        RateLimiterRegistry.clear()
+
+        yield
+
+        RateLimiterRegistry.clear()
+
+    def test_get_rate_limiter(self):
+        rate_limiter = RateLimiterRegistry.get_rate_limiter("openai", "gpt-4o", requests_per_minute=500)
+
+        assert RateLimiterRegistry.get_rate_limiter("openai", "gpt-4o") is rate_limiter
+        assert RateLimiterRegistry.get_rate_limiter("openai", "gpt-4o-mini") is not rate_limiter
+        assert RateLimiterRegistry.get_rate_limiter("openai") is not rate_limiter
+        assert RateLimiterRegistry.get_rate_limiter("anthropic", "gpt-4o") is not rate_limiter
+        assert rate_limiter.requests_per_minute == 500
+        assert rate_limiter.tokens_per_minute is None
+
+    def test_get_rate_limiter_changes_limits(self):
+        rate_limiter = RateLimiterRegistry.get_rate_limiter("openai", "gpt-4o", requests_per_minute=500)
+
+        RateLimiterRegistry.get_rate_limiter("openai", "gpt-4o", tokens_per_minute=30000)
+
+        assert rate_limiter.requests_per_minute == 500
+        assert rate_limiter.tokens_per_minute == 30000
+
+    def test_get_rate_limiter_rejects_zero_limits(self):
+        rate_limiter = RateLimiterRegistry.get_rate_limiter("openai", "gpt-4o", requests_per_minute=500)
+
+        with pytest.raises(ValueError, match="requests_per_minute must be greater than 0"):
+            RateLimiterRegistry.get_rate_limiter("openai", "gpt-4o", requests_per_minute=0)
+
+        assert rate_limiter.requests_per_minute == 500
+
+    def test_clear(self):
+        rate_limiter = RateLimiterRegistry.get_rate_limiter("openai", "gpt-4o")
+
+        RateLimiterRegistry.clear()
+
+        assert RateLimiterRegistry.get_rate_limiter("openai", "gpt-4o") is not rate_limiter